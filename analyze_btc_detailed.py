@@ -17,6 +17,8 @@ import ccxt
 import pandas as pd
 import numpy as np
 
+from src.core import indicators
+
 def calculate_zlema(series: pd.Series, period: int) -> pd.Series:
     """Zero Lag EMA 계산"""
     ema1 = series.ewm(span=period, adjust=False).mean()
@@ -47,20 +49,12 @@ async def analyze_in_detail():
     df['macd'] = zlema_12 - zlema_26
     df['signal'] = df['macd'].ewm(span=9, adjust=False).mean()
     
-    # Ichimoku 계산
-    high_9 = df['high'].rolling(9).max()
-    low_9 = df['low'].rolling(9).min()
-    df['tenkan'] = (high_9 + low_9) / 2
-    
-    high_26 = df['high'].rolling(26).max()
-    low_26 = df['low'].rolling(26).min()
-    df['kijun'] = (high_26 + low_26) / 2
-    
-    df['senkou_a'] = ((df['tenkan'] + df['kijun']) / 2).shift(26)
-    
-    high_52 = df['high'].rolling(52).max()
-    low_52 = df['low'].rolling(52).min()
-    df['senkou_b'] = ((high_52 + low_52) / 2).shift(26)
+    # Ichimoku 계산 (선행스팬은 26 캔들 앞으로)
+    cloud = indicators.ichimoku(df['high'], df['low'], 9, 26, 52, 26)
+    df['tenkan'] = cloud['tenkan_sen']
+    df['kijun'] = cloud['kijun_sen']
+    df['senkou_a'] = cloud['senkou_span_a']
+    df['senkou_b'] = cloud['senkou_span_b']
     
     df['cloud_top'] = df[['senkou_a', 'senkou_b']].max(axis=1)
     df['cloud_bottom'] = df[['senkou_a', 'senkou_b']].min(axis=1)
@@ -11,6 +11,8 @@ import yfinance as yf
 import streamlit as st
 from abc import ABC, abstractmethod
 
+from src.core import indicators as indicator_lib
+
 
 class DataSource(ABC):
     """Base class for data sources."""
@@ -225,11 +227,11 @@ class DataManager:
         
         for indicator in indicators:
             if indicator == 'SMA_20':
-                df['sma_20'] = df['close'].rolling(window=20).mean()
+                df['sma_20'] = indicator_lib.sma(df['close'], 20)
             elif indicator == 'SMA_50':
-                df['sma_50'] = df['close'].rolling(window=50).mean()
+                df['sma_50'] = indicator_lib.sma(df['close'], 50)
             elif indicator == 'EMA_20':
-                df['ema_20'] = df['close'].ewm(span=20, adjust=False).mean()
+                df['ema_20'] = indicator_lib.ema(df['close'], 20)
             elif indicator == 'RSI':
                 df['rsi'] = self._calculate_rsi(df['close'])
             elif indicator == 'MACD':
@@ -242,13 +244,8 @@ class DataManager:
         return df
     
     def _calculate_rsi(self, prices: pd.Series, period: int = 14) -> pd.Series:
-        """Calculate RSI indicator."""
-        delta = prices.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
-        return rsi
+        """Calculate RSI indicator (Wilder, same as the live strategies)."""
+        return pd.Series(indicator_lib.rsi(prices, period), index=prices.index)
     
     def _calculate_macd(
         self,
@@ -258,12 +255,9 @@ class DataManager:
         signal: int = 9
     ) -> Tuple[pd.Series, pd.Series, pd.Series]:
         """Calculate MACD indicator."""
-        ema_fast = prices.ewm(span=fast, adjust=False).mean()
-        ema_slow = prices.ewm(span=slow, adjust=False).mean()
-        macd = ema_fast - ema_slow
-        macd_signal = macd.ewm(span=signal, adjust=False).mean()
-        macd_hist = macd - macd_signal
-        return macd, macd_signal, macd_hist
+        result = indicator_lib.macd(prices, fast, slow, signal)
+        return tuple(pd.Series(result[column], index=prices.index)
+                     for column in ('macd', 'macd_signal', 'macd_hist'))
     
     def _calculate_bollinger_bands(
         self,
@@ -272,21 +266,14 @@ class DataManager:
         std_dev: float = 2
     ) -> Tuple[pd.Series, pd.Series, pd.Series]:
         """Calculate Bollinger Bands."""
-        middle = prices.rolling(window=period).mean()
-        std = prices.rolling(window=period).std()
-        upper = middle + (std * std_dev)
-        lower = middle - (std * std_dev)
-        return upper, middle, lower
+        result = indicator_lib.bbands(prices, period, std_dev)
+        return tuple(pd.Series(result[column], index=prices.index)
+                     for column in ('bb_upper', 'bb_middle', 'bb_lower'))
     
     def _calculate_atr(self, data: pd.DataFrame, period: int = 14) -> pd.Series:
-        """Calculate Average True Range."""
-        high_low = data['high'] - data['low']
-        high_close = abs(data['high'] - data['close'].shift())
-        low_close = abs(data['low'] - data['close'].shift())
-        
-        true_range = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-        atr = true_range.rolling(window=period).mean()
-        return atr
+        """Calculate Average True Range (Wilder, same as the live strategies)."""
+        atr = indicator_lib.atr(data['high'], data['low'], data['close'], period)
+        return pd.Series(atr, index=data.index)
 
 
 # Create global instance
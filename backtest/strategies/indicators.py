@@ -2,15 +2,18 @@
 Technical Indicators Library
 
 This module provides a comprehensive collection of technical indicators
-optimized for performance using NumPy vectorization.
+optimized for performance using NumPy vectorization. Indicators shared with
+the live strategies delegate to ``src.core.indicators`` so that backtests
+and live trading use the same math.
 """
 
 import numpy as np
 import pandas as pd
 from typing import Tuple, Optional, Union
-from numba import jit
 import warnings
 
+from src.core import indicators as lib
+
 warnings.filterwarnings('ignore', category=RuntimeWarning)
 
 
@@ -36,13 +39,7 @@ class Indicators:
         Returns:
             Array of SMA values
         """
-        if isinstance(data, pd.Series):
-            return data.rolling(window=period).mean().values
-        
-        sma = np.full_like(data, np.nan, dtype=float)
-        for i in range(period - 1, len(data)):
-            sma[i] = np.mean(data[i - period + 1:i + 1])
-        return sma
+        return lib.sma(data, period)
     
     @staticmethod
     def ema(data: Union[np.ndarray, pd.Series], period: int) -> np.ndarray:
@@ -56,17 +53,7 @@ class Indicators:
         Returns:
             Array of EMA values
         """
-        if isinstance(data, pd.Series):
-            return data.ewm(span=period, adjust=False).mean().values
-        
-        alpha = 2 / (period + 1)
-        ema = np.full_like(data, np.nan, dtype=float)
-        ema[0] = data[0]
-        
-        for i in range(1, len(data)):
-            ema[i] = alpha * data[i] + (1 - alpha) * ema[i-1]
-        
-        return ema
+        return lib.ema(data, period)
     
     @staticmethod
     def wma(data: Union[np.ndarray, pd.Series], period: int) -> np.ndarray:
@@ -80,13 +67,7 @@ class Indicators:
         Returns:
             Array of WMA values
         """
-        weights = np.arange(1, period + 1)
-        wma = np.full_like(data, np.nan, dtype=float)
-        
-        for i in range(period - 1, len(data)):
-            wma[i] = np.dot(data[i - period + 1:i + 1], weights) / weights.sum()
-        
-        return wma
+        return lib.wma(data, period)
     
     @staticmethod
     def zlema(data: Union[np.ndarray, pd.Series], period: int) -> np.ndarray:
@@ -100,10 +81,7 @@ class Indicators:
         Returns:
             Array of ZLEMA values
         """
-        ema1 = Indicators.ema(data, period)
-        ema2 = Indicators.ema(ema1, period)
-        zlema = 2 * ema1 - ema2
-        return zlema
+        return lib.zlema(data, period)
     
     @staticmethod
     def hma(data: Union[np.ndarray, pd.Series], period: int) -> np.ndarray:
@@ -117,16 +95,7 @@ class Indicators:
         Returns:
             Array of HMA values
         """
-        half_period = period // 2
-        sqrt_period = int(np.sqrt(period))
-        
-        wma_half = Indicators.wma(data, half_period)
-        wma_full = Indicators.wma(data, period)
-        
-        raw_hma = 2 * wma_half - wma_full
-        hma = Indicators.wma(raw_hma, sqrt_period)
-        
-        return hma
+        return lib.hma(data, period)
     
     # Momentum Indicators
     
@@ -142,35 +111,7 @@ class Indicators:
         Returns:
             Array of RSI values
         """
-        if isinstance(data, pd.Series):
-            delta = data.diff()
-            gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-            loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-            rs = gain / loss
-            rsi = 100 - (100 / (1 + rs))
-            return rsi.values
-        
-        deltas = np.diff(data)
-        rsi = np.full_like(data, np.nan, dtype=float)
-        
-        gains = np.where(deltas > 0, deltas, 0)
-        losses = np.where(deltas < 0, -deltas, 0)
-        
-        avg_gain = np.mean(gains[:period])
-        avg_loss = np.mean(losses[:period])
-        
-        for i in range(period, len(data)):
-            if i > period:
-                avg_gain = (avg_gain * (period - 1) + gains[i-1]) / period
-                avg_loss = (avg_loss * (period - 1) + losses[i-1]) / period
-            
-            if avg_loss != 0:
-                rs = avg_gain / avg_loss
-                rsi[i] = 100 - (100 / (1 + rs))
-            else:
-                rsi[i] = 100
-        
-        return rsi
+        return lib.rsi(data, period)
     
     @staticmethod
     def macd(data: Union[np.ndarray, pd.Series], 
@@ -189,14 +130,8 @@ class Indicators:
         Returns:
             Tuple of (MACD line, Signal line, Histogram)
         """
-        ema_fast = Indicators.ema(data, fast_period)
-        ema_slow = Indicators.ema(data, slow_period)
-        
-        macd_line = ema_fast - ema_slow
-        signal_line = Indicators.ema(macd_line, signal_period)
-        histogram = macd_line - signal_line
-        
-        return macd_line, signal_line, histogram
+        result = lib.macd(data, fast_period, slow_period, signal_period)
+        return result['macd'], result['macd_signal'], result['macd_hist']
     
     @staticmethod
     def zlmacd(data: Union[np.ndarray, pd.Series],
@@ -215,14 +150,8 @@ class Indicators:
         Returns:
             Tuple of (ZL MACD line, Signal line, Histogram)
         """
-        zlema_fast = Indicators.zlema(data, fast_period)
-        zlema_slow = Indicators.zlema(data, slow_period)
-        
-        zlmacd_line = zlema_fast - zlema_slow
-        signal_line = Indicators.ema(zlmacd_line, signal_period)
-        histogram = zlmacd_line - signal_line
-        
-        return zlmacd_line, signal_line, histogram
+        result = lib.zlmacd(data, fast_period, slow_period, signal_period)
+        return result['zlmacd'], result['zlmacd_signal'], result['zlmacd_hist']
     
     @staticmethod
     def stochastic(high: np.ndarray, low: np.ndarray, close: np.ndarray,
@@ -271,17 +200,7 @@ class Indicators:
         Returns:
             Array of ATR values
         """
-        tr = np.zeros_like(close)
-        tr[0] = high[0] - low[0]
-        
-        for i in range(1, len(close)):
-            hl = high[i] - low[i]
-            hc = abs(high[i] - close[i-1])
-            lc = abs(low[i] - close[i-1])
-            tr[i] = max(hl, hc, lc)
-        
-        atr = Indicators.sma(tr, period)
-        return atr
+        return lib.atr(high, low, close, period)
     
     @staticmethod
     def bollinger_bands(data: Union[np.ndarray, pd.Series], 
@@ -298,19 +217,8 @@ class Indicators:
         Returns:
             Tuple of (Upper band, Middle band, Lower band)
         """
-        middle = Indicators.sma(data, period)
-        
-        if isinstance(data, pd.Series):
-            std = data.rolling(window=period).std().values
-        else:
-            std = np.full_like(data, np.nan, dtype=float)
-            for i in range(period - 1, len(data)):
-                std[i] = np.std(data[i - period + 1:i + 1])
-        
-        upper = middle + (std * std_dev)
-        lower = middle - (std * std_dev)
-        
-        return upper, middle, lower
+        result = lib.bbands(data, period, std_dev)
+        return result['bb_upper'], result['bb_middle'], result['bb_lower']
     
     # Trend Indicators
     
@@ -328,29 +236,7 @@ class Indicators:
         Returns:
             Array of ADX values
         """
-        # Calculate directional movement
-        up_move = high[1:] - high[:-1]
-        down_move = low[:-1] - low[1:]
-        
-        pos_dm = np.where((up_move > down_move) & (up_move > 0), up_move, 0)
-        neg_dm = np.where((down_move > up_move) & (down_move > 0), down_move, 0)
-        
-        # Add zero at beginning to match array length
-        pos_dm = np.concatenate([[0], pos_dm])
-        neg_dm = np.concatenate([[0], neg_dm])
-        
-        # Calculate ATR
-        atr = Indicators.atr(high, low, close, period)
-        
-        # Calculate directional indicators
-        pos_di = 100 * Indicators.sma(pos_dm, period) / atr
-        neg_di = 100 * Indicators.sma(neg_dm, period) / atr
-        
-        # Calculate ADX
-        dx = np.abs(pos_di - neg_di) / (pos_di + neg_di) * 100
-        adx = Indicators.sma(dx, period)
-        
-        return adx
+        return lib.adx(high, low, close, period)['adx']
     
     @staticmethod
     def ichimoku(high: np.ndarray, low: np.ndarray,
@@ -374,27 +260,12 @@ class Indicators:
         Returns:
             Dictionary with Ichimoku components
         """
-        def donchian_middle(high_data, low_data, period):
-            middle = np.full(len(high_data), np.nan)
-            for i in range(period - 1, len(high_data)):
-                period_high = np.max(high_data[i - period + 1:i + 1])
-                period_low = np.min(low_data[i - period + 1:i + 1])
-                middle[i] = (period_high + period_low) / 2
-            return middle
-        
-        # Calculate components
-        tenkan_sen = donchian_middle(high, low, tenkan_period)
-        kijun_sen = donchian_middle(high, low, kijun_period)
-        
-        # Senkou Span A (shifted forward)
-        senkou_span_a = (tenkan_sen + kijun_sen) / 2
-        senkou_span_a = np.roll(senkou_span_a, cloud_shift)
-        senkou_span_a[:cloud_shift] = np.nan
-        
-        # Senkou Span B (shifted forward)
-        senkou_span_b = donchian_middle(high, low, senkou_b_period)
-        senkou_span_b = np.roll(senkou_span_b, cloud_shift)
-        senkou_span_b[:cloud_shift] = np.nan
+        # Tenkan / Kijun / Senkou Span A, B (spans shifted forward by cloud_shift)
+        cloud = lib.ichimoku(high, low, tenkan_period, kijun_period, senkou_b_period, cloud_shift)
+        tenkan_sen = cloud['tenkan_sen']
+        kijun_sen = cloud['kijun_sen']
+        senkou_span_a = cloud['senkou_span_a']
+        senkou_span_b = cloud['senkou_span_b']
         
         # Chikou Span (shifted backward)
         chikou_span = np.roll(high, -chikou_shift)
@@ -4,13 +4,14 @@
 import pandas as pd
 import numpy as np
 import ccxt
-import pandas_ta as ta
 from datetime import datetime, timedelta
 import time
 import os
 import pickle
 import hashlib
 
+from src.core import indicators
+
 
 class DataFetcher:
     """데이터 수집 및 지표 계산 클래스"""
@@ -28,9 +29,10 @@ class DataFetcher:
     
     def calculate_donchian_channel(self, df: pd.DataFrame, period: int = 20) -> pd.DataFrame:
         """Donchian Channel 계산"""
-        df['dc_upper'] = df['high'].rolling(period).max()
-        df['dc_lower'] = df['low'].rolling(period).min()
-        df['dc_middle'] = (df['dc_upper'] + df['dc_lower']) / 2
+        channel = indicators.donchian(df['high'], df['low'], period)
+        df['dc_upper'] = channel['dc_upper']
+        df['dc_lower'] = channel['dc_lower']
+        df['dc_middle'] = channel['dc_middle']
         
         # 추세 판단
         df['dc_trend'] = np.where(df['close'] > df['dc_middle'], 1, -1)
@@ -216,32 +218,31 @@ class DataFetcher:
         
         # 4H indicators
         df_4h = self.calculate_donchian_channel(df_4h, params['dc_period'])
-        df_4h['ma50'] = ta.sma(df_4h['close'], 50)
-        df_4h['ma200'] = ta.sma(df_4h['close'], 200)
+        df_4h['ma50'] = indicators.sma(df_4h['close'], 50)
+        df_4h['ma200'] = indicators.sma(df_4h['close'], 200)
         
         # 15m indicators
         print("  Calculating 15m indicators...")
         df_15m = self.calculate_donchian_channel(df_15m, params['dc_period'])
         
         # ADX/DI
-        adx_data = ta.adx(df_15m['high'], df_15m['low'], df_15m['close'], length=14)
-        if adx_data is not None:
-            df_15m['adx'] = adx_data['ADX_14']
-            df_15m['plus_di'] = adx_data['DMP_14']
-            df_15m['minus_di'] = adx_data['DMN_14']
+        adx_data = indicators.adx(df_15m['high'], df_15m['low'], df_15m['close'], 14)
+        df_15m['adx'] = adx_data['adx']
+        df_15m['plus_di'] = adx_data['plus_di']
+        df_15m['minus_di'] = adx_data['minus_di']
         
         # RSI
-        df_15m['rsi'] = ta.rsi(df_15m['close'], length=14)
+        df_15m['rsi'] = indicators.rsi(df_15m['close'], 14)
         
         # EMA
-        df_15m['ema12'] = ta.ema(df_15m['close'], 12)
+        df_15m['ema12'] = indicators.ema(df_15m['close'], 12, presma=True)
         df_15m['ema_distance'] = abs(df_15m['close'] - df_15m['ema12']) / df_15m['close']
         
         # ATR
-        df_15m['atr'] = ta.atr(df_15m['high'], df_15m['low'], df_15m['close'], length=14)
+        df_15m['atr'] = indicators.atr(df_15m['high'], df_15m['low'], df_15m['close'], 14)
         
         # Volume
-        df_15m['volume_ma'] = df_15m['volume'].rolling(window=20).mean()
+        df_15m['volume_ma'] = indicators.sma(df_15m['volume'], 20)
         df_15m['volume_ratio'] = df_15m['volume'] / df_15m['volume_ma']
         
         # Swing High/Low
@@ -9,6 +9,8 @@ from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 import ta
 
+from src.core import indicators
+
 
 class EMAVolatilityStrategy:
     """EMA 크로스오버 + TFPE 보완 전략
@@ -83,9 +85,10 @@ class EMAVolatilityStrategy:
         df['rsi'] = ta.momentum.RSIIndicator(close=df['close'], window=self.rsi_period).rsi()
         
         # Donchian Channel 계산 (20기간)
-        df['dc_upper'] = df['high'].rolling(window=20).max()
-        df['dc_lower'] = df['low'].rolling(window=20).min()
-        df['dc_middle'] = (df['dc_upper'] + df['dc_lower']) / 2
+        channel = indicators.donchian(df['high'], df['low'], 20)
+        df['dc_upper'] = channel['dc_upper']
+        df['dc_lower'] = channel['dc_lower']
+        df['dc_middle'] = channel['dc_middle']
         
         # 가격 위치 (0~1)
         df['price_position'] = (df['close'] - df['dc_lower']) / (df['dc_upper'] - df['dc_lower'])
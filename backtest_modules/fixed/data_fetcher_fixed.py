@@ -4,13 +4,15 @@
 import pandas as pd
 import numpy as np
 import ccxt
-import pandas_ta as ta
 from datetime import datetime, timedelta
 import time
 import os
 import pickle
 import hashlib
 
+from src.core import indicators
+from src.core.kline_decoder import concat_klines, decode_klines, dedupe_sorted, to_frame
+
 
 class DataFetcherFixed:
     """개선된 데이터 수집 및 지표 계산 클래스"""
@@ -32,9 +34,10 @@ class DataFetcherFixed:
         df = df.copy()
         
         # Donchian Channel 계산
-        df['dc_upper'] = df['high'].rolling(period).max()
-        df['dc_lower'] = df['low'].rolling(period).min()
-        df['dc_middle'] = (df['dc_upper'] + df['dc_lower']) / 2
+        channel = indicators.donchian(df['high'], df['low'], period)
+        df['dc_upper'] = channel['dc_upper']
+        df['dc_lower'] = channel['dc_lower']
+        df['dc_middle'] = channel['dc_middle']
         
         # NaN 처리 - forward fill 후 backward fill
         df['dc_upper'] = df['dc_upper'].ffill().bfill()
@@ -150,7 +153,8 @@ class DataFetcherFixed:
             # Fetch 4H data
             print("📊 Fetching 4H data...")
             since_4h = int(fetch_start.timestamp() * 1000)
-            all_4h_data = []
+            all_4h_data = []  # 페이지별 디코딩 배열
+            fetched_4h = 0
             retry_count = 0
             max_retries = 3
             
@@ -162,12 +166,14 @@ class DataFetcherFixed:
                     if not ohlcv:
                         break
                     
-                    all_4h_data.extend(ohlcv)
-                    since_4h = ohlcv[-1][0] + 1
+                    chunk = decode_klines(ohlcv)
+                    all_4h_data.append(chunk)
+                    fetched_4h += len(chunk)
+                    since_4h = int(chunk.open_time[-1]) + 1
                     retry_count = 0
                     
-                    if len(all_4h_data) % 5000 == 0:
-                        print(f"  Progress: {len(all_4h_data)} 4H candles fetched...")
+                    if fetched_4h % 5000 == 0:
+                        print(f"  Progress: {fetched_4h} 4H candles fetched...")
                     
                 except Exception as e:
                     retry_count += 1
@@ -181,15 +187,14 @@ class DataFetcherFixed:
                 print("❌ No 4H data fetched")
                 return None, None
             
-            df_4h = pd.DataFrame(all_4h_data, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-            df_4h['timestamp'] = pd.to_datetime(df_4h['timestamp'], unit='ms')
-            df_4h = df_4h.drop_duplicates(subset=['timestamp']).sort_values('timestamp')
-            df_4h.set_index('timestamp', inplace=True)
+            df_4h = to_frame(dedupe_sorted(concat_klines(all_4h_data)),
+                             index_name='timestamp', include_timestamp=False)
             
             # Fetch 15m data
             print("📊 Fetching 15m data...")
             since_15m = int(fetch_start.timestamp() * 1000)
-            all_15m_data = []
+            all_15m_data = []  # 페이지별 디코딩 배열
+            fetched_15m = 0
             retry_count = 0
             
             while since_15m < int(end_dt.timestamp() * 1000):
@@ -200,12 +205,14 @@ class DataFetcherFixed:
                     if not ohlcv:
                         break
                     
-                    all_15m_data.extend(ohlcv)
-                    since_15m = ohlcv[-1][0] + 1
+                    chunk = decode_klines(ohlcv)
+                    all_15m_data.append(chunk)
+                    fetched_15m += len(chunk)
+                    since_15m = int(chunk.open_time[-1]) + 1
                     retry_count = 0
                     
-                    if len(all_15m_data) % 10000 == 0:
-                        print(f"  Progress: {len(all_15m_data)} 15m candles fetched...")
+                    if fetched_15m % 10000 == 0:
+                        print(f"  Progress: {fetched_15m} 15m candles fetched...")
                     
                 except Exception as e:
                     retry_count += 1
@@ -219,10 +226,8 @@ class DataFetcherFixed:
                 print("❌ No 15m data fetched")
                 return None, None
             
-            df_15m = pd.DataFrame(all_15m_data, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-            df_15m['timestamp'] = pd.to_datetime(df_15m['timestamp'], unit='ms')
-            df_15m = df_15m.drop_duplicates(subset=['timestamp']).sort_values('timestamp')
-            df_15m.set_index('timestamp', inplace=True)
+            df_15m = to_frame(dedupe_sorted(concat_klines(all_15m_data)),
+                              index_name='timestamp', include_timestamp=False)
             
             # Filter to exact period - 약간의 버퍼 유지
             buffer_start = start_dt - timedelta(days=30)
@@ -260,11 +265,11 @@ class DataFetcherFixed:
         # 4H indicators
         print("  Calculating 4H indicators...")
         df_4h = self.calculate_donchian_channel(df_4h, params['dc_period'])
-        df_4h['ma50'] = ta.sma(df_4h['close'], 50)
-        df_4h['ma200'] = ta.sma(df_4h['close'], 200)
+        df_4h['ma50'] = indicators.sma(df_4h['close'], 50)
+        df_4h['ma200'] = indicators.sma(df_4h['close'], 200)
         
         # 200 EMA 추가 (시장 편향 판단용)
-        df_4h['ema200'] = ta.ema(df_4h['close'], 200)
+        df_4h['ema200'] = indicators.ema(df_4h['close'], 200, presma=True)
         
         # MA/EMA NaN 처리
         df_4h['ma50'] = df_4h['ma50'].ffill().bfill()
@@ -284,29 +289,23 @@ class DataFetcherFixed:
         df_15m = self.calculate_donchian_channel(df_15m, params['dc_period'])
         
         # ADX/DI
-        adx_data = ta.adx(df_15m['high'], df_15m['low'], df_15m['close'], length=14)
-        if adx_data is not None:
-            df_15m['adx'] = adx_data['ADX_14'].fillna(20)  # 기본값 20
-            df_15m['plus_di'] = adx_data['DMP_14'].fillna(0)
-            df_15m['minus_di'] = adx_data['DMN_14'].fillna(0)
-        else:
-            print("⚠️ ADX calculation failed, using defaults")
-            df_15m['adx'] = 20
-            df_15m['plus_di'] = 0
-            df_15m['minus_di'] = 0
+        adx_data = indicators.adx(df_15m['high'], df_15m['low'], df_15m['close'], 14)
+        df_15m['adx'] = np.nan_to_num(adx_data['adx'], nan=20)  # 기본값 20
+        df_15m['plus_di'] = np.nan_to_num(adx_data['plus_di'], nan=0)
+        df_15m['minus_di'] = np.nan_to_num(adx_data['minus_di'], nan=0)
         
         # RSI
-        df_15m['rsi'] = ta.rsi(df_15m['close'], length=14)
+        df_15m['rsi'] = indicators.rsi(df_15m['close'], 14)
         df_15m['rsi'] = df_15m['rsi'].fillna(50)  # 중립값
         
         # EMA
-        df_15m['ema12'] = ta.ema(df_15m['close'], 12)
+        df_15m['ema12'] = indicators.ema(df_15m['close'], 12, presma=True)
         df_15m['ema12'] = df_15m['ema12'].fillna(df_15m['close'])  # close로 대체
         df_15m['ema_distance'] = abs(df_15m['close'] - df_15m['ema12']) / df_15m['close']
         df_15m['ema_distance'] = df_15m['ema_distance'].fillna(0.01)
         
         # ATR
-        df_15m['atr'] = ta.atr(df_15m['high'], df_15m['low'], df_15m['close'], length=14)
+        df_15m['atr'] = indicators.atr(df_15m['high'], df_15m['low'], df_15m['close'], 14)
         # ATR이 NaN인 경우 High-Low의 평균으로 대체
         if df_15m['atr'].isna().any():
             default_atr = (df_15m['high'] - df_15m['low']).rolling(14).mean()
@@ -314,7 +313,7 @@ class DataFetcherFixed:
             df_15m['atr'] = df_15m['atr'].fillna((df_15m['high'] - df_15m['low']).mean())
         
         # Volume
-        df_15m['volume_ma'] = df_15m['volume'].rolling(window=20).mean()
+        df_15m['volume_ma'] = indicators.sma(df_15m['volume'], 20)
         df_15m['volume_ma'] = df_15m['volume_ma'].fillna(df_15m['volume'].mean())
         
         # Volume ratio 안전한 계산
@@ -25,6 +25,10 @@ else:
 # Backtest 모듈 임포트
 sys.path.append(os.path.join(script_dir, 'backtest_modules'))
 sys.path.append(script_dir)
+sys.path.append(os.path.dirname(script_dir))
+
+from src.core import indicators
+from src.core.moving_averages import hma, wma, zlhma
 
 # 디버깅 정보 추가
 print(f"Current directory: {os.getcwd()}")
@@ -148,75 +152,26 @@ class ZLHMAEMACrossStrategy:
     
     def calculate_wma(self, values: pd.Series, period: int) -> pd.Series:
         """Weighted Moving Average 계산"""
-        weights = np.arange(1, period + 1)
-        wma = values.rolling(period).apply(lambda x: np.dot(x, weights) / weights.sum(), raw=True)
-        return wma
+        return wma(values, period)
     
     def calculate_hma(self, df: pd.DataFrame, period: int) -> pd.Series:
-        """Hull Moving Average 계산"""
-        half_length = int(period / 2)
-        sqrt_length = int(np.sqrt(period))
-        
-        # Step 1: Calculate WMA with period/2
-        wma_half = self.calculate_wma(df['close'], half_length)
-        
-        # Step 2: Calculate WMA with full period
-        wma_full = self.calculate_wma(df['close'], period)
-        
-        # Step 3: Calculate 2*WMA(period/2) - WMA(period)
-        raw_hma = 2 * wma_half - wma_full
-        
-        # Step 4: Calculate WMA of the raw HMA with sqrt(period)
-        hma = self.calculate_wma(raw_hma, sqrt_length)
-        
-        return hma
+        """Hull Moving Average 계산 - WMA(2*WMA(n/2) - WMA(n), sqrt(n))"""
+        return hma(df['close'], period)
     
     def calculate_zlhma(self, df: pd.DataFrame, period: int) -> pd.Series:
-        """Zero Lag Hull Moving Average 계산"""
-        # Step 1: Calculate standard HMA
-        hma = self.calculate_hma(df, period)
-        
-        # Step 2: Calculate the lag
-        lag = int((period - 1) / 2)
-        
-        # Step 3: Calculate Zero Lag HMA
-        # ZLHMA = HMA + (HMA - HMA[lag])
-        zlhma = hma + (hma - hma.shift(lag))
-        
-        return zlhma
+        """Zero Lag Hull Moving Average 계산 - HMA + (HMA - HMA[lag])"""
+        return zlhma(df['close'], period)
     
     def calculate_ema(self, df: pd.DataFrame, period: int) -> pd.Series:
         """Exponential Moving Average 계산"""
-        return df['close'].ewm(span=period, adjust=False).mean()
+        return pd.Series(indicators.ema(df['close'], period), index=df.index)
     
     def calculate_adx(self, df: pd.DataFrame, period: int = 14) -> pd.DataFrame:
-        """ADX (Average Directional Index) 계산"""
-        # True Range 계산
-        high_low = df['high'] - df['low']
-        high_close = abs(df['high'] - df['close'].shift(1))
-        low_close = abs(df['low'] - df['close'].shift(1))
-        
-        df['tr'] = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-        
-        # Directional Movement 계산
-        df['dm_plus'] = np.where(
-            (df['high'] - df['high'].shift(1)) > (df['low'].shift(1) - df['low']),
-            np.maximum(df['high'] - df['high'].shift(1), 0), 0
-        )
-        df['dm_minus'] = np.where(
-            (df['low'].shift(1) - df['low']) > (df['high'] - df['high'].shift(1)),
-            np.maximum(df['low'].shift(1) - df['low'], 0), 0
-        )
-        
-        # Smoothed indicators
-        atr = df['tr'].rolling(period).mean()
-        di_plus = 100 * (df['dm_plus'].rolling(period).mean() / atr)
-        di_minus = 100 * (df['dm_minus'].rolling(period).mean() / atr)
-        
-        # ADX 계산
-        dx = 100 * abs(di_plus - di_minus) / (di_plus + di_minus)
-        df['adx'] = dx.rolling(period).mean()
-        
+        """ADX (Average Directional Index) 계산 - 실전 전략과 같은 Wilder 평활"""
+        result = indicators.adx(df['high'], df['low'], df['close'], period)
+        df['adx'] = result['adx']
+        df['plus_di'] = result['plus_di']
+        df['minus_di'] = result['minus_di']
         return df
     
     def check_entry_conditions(self, df: pd.DataFrame, index: int, position_type: str) -> dict:
@@ -700,11 +655,7 @@ class ZLHMAEMACrossStrategy:
         df = self.calculate_adx(df, self.adx_period)  # ADX
         
         # ATR 계산 추가
-        high_low = df['high'] - df['low']
-        high_close = abs(df['high'] - df['close'].shift(1))
-        low_close = abs(df['low'] - df['close'].shift(1))
-        tr = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-        df['atr'] = tr.rolling(self.atr_period).mean()
+        df['atr'] = indicators.atr(df['high'], df['low'], df['close'], self.atr_period)
         
         # 초기화
         self.capital = self.initial_capital
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+공유 지표 캐시 벤치마크
+캔들 완성마다 여러 전략이 같은 심볼의 15분봉 지표를 계산하는 상황을 재현해
+캐시 없이(전략마다 계산) / 공유 캐시 사용 시 캔들당 소요 시간을 비교한다.
+
+사용법:
+    python scripts/benchmark_indicator_cache.py [--symbols 10] [--strategies 3] [--bars 1344] [--candles 20]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.indicator_cache import IndicatorCache
+from src.strategies.momentum_strategy import MomentumStrategy
+from src.strategies.tfpe_strategy import TFPEStrategy
+
+
+def make_frame(bars: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 30000 + np.cumsum(rng.normal(0, 40, bars))
+    open_ = np.concatenate([[close[0]], close[:-1]])
+    return pd.DataFrame({
+        'open': open_,
+        'high': np.maximum(open_, close) + rng.uniform(0, 25, bars),
+        'low': np.minimum(open_, close) - rng.uniform(0, 25, bars),
+        'close': close,
+        'volume': rng.uniform(1, 100, bars),
+    }, index=pd.date_range('2024-01-01', periods=bars, freq='15min', name='datetime'))
+
+
+# 전략별 15분봉 지표 요청 (calculate_indicators + add_donchian_indicators)
+REQUESTS = {
+    TFPEStrategy: [('adx', {'length': 14}), ('rsi', {'length': 14}), ('ema', {'length': 12, 'presma': True}),
+                   ('atr', {'length': 14}), ('volume_ma', {'length': 20}), ('donchian', {'length': 20})],
+    MomentumStrategy: [('adx', {'length': 14}), ('atr', {'length': 14}), ('volume_ma', {'length': 20}),
+                       ('donchian', {'length': 20})],
+}
+
+
+def make_strategies(count: int, cache):
+    """TFPE / Momentum 을 번갈아 count 개 (생성자 없이 지표 계산에 필요한 속성만)"""
+    strategies = []
+    for i in range(count):
+        if i % 2 == 0:
+            strategy = object.__new__(TFPEStrategy)
+            strategy.momentum_lookback = 20
+        else:
+            strategy = object.__new__(MomentumStrategy)
+        strategy.indicator_cache = cache
+        strategy.dc_period = 20
+        strategies.append(strategy)
+    return strategies
+
+
+def run(frames, strategies, candles: int, bars: int, indicators_only: bool = False) -> float:
+    """캔들당 평균 소요 시간 (ms) - 캔들마다 모든 전략이 모든 심볼 지표 계산
+
+    indicators_only=True 면 DataFrame 컬럼 대입 없이 전략이 요청하는 지표 계산만 측정
+    """
+    elapsed = 0.0
+    for step in range(candles):
+        for symbol, frame in frames.items():
+            window = frame.iloc[step:step + bars]
+            for strategy in strategies:
+                df = window.copy()
+                df.attrs.update(symbol=symbol, interval='15m')
+                start = time.perf_counter()
+                if indicators_only:
+                    for name, params in REQUESTS[type(strategy)]:
+                        strategy.indicator(df, name, **params)
+                else:
+                    df = strategy.calculate_indicators(df)
+                    strategy.add_donchian_indicators(df)
+                elapsed += time.perf_counter() - start
+    return elapsed / candles * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='공유 지표 캐시 벤치마크')
+    parser.add_argument('--symbols', type=int, default=10, help='심볼 수')
+    parser.add_argument('--strategies', type=int, default=3, help='심볼당 전략 수')
+    parser.add_argument('--bars', type=int, default=1344, help='조회 캔들 수')
+    parser.add_argument('--candles', type=int, default=20, help='반복할 캔들 완성 수')
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)  # 전략 디버그 로그 제외
+
+    frames = {f'SYM{i}USDT': make_frame(args.bars + args.candles, i) for i in range(args.symbols)}
+    print(f"심볼 {args.symbols}개 x 전략 {args.strategies}개 / 캔들 {args.bars}개 조회")
+    print("=" * 54)
+
+    for label, indicators_only in (('지표 계산', True), ('지표 단계 전체', False)):
+        baseline = run(frames, make_strategies(args.strategies, None), args.candles, args.bars, indicators_only)
+        cache = IndicatorCache(max_entries=4096)
+        cached = run(frames, make_strategies(args.strategies, cache), args.candles, args.bars, indicators_only)
+        stats = cache.get_stats()
+
+        print(f"[{label}]")
+        print(f"  {'캐시 없음':<10}{baseline:>10.1f} ms / 캔들")
+        print(f"  {'공유 캐시':<10}{cached:>10.1f} ms / 캔들  ({baseline / cached:.1f}x)")
+        print(f"  적중률 {stats['hit_rate']:.1%} (적중 {stats['hits']} / 계산 {stats['misses']})")
+
+if __name__ == '__main__':
+    main()
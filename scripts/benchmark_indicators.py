@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+통합 지표 라이브러리 벤치마크
+등록된 지표(src.core.indicators.INDICATORS)마다 기본 파라미터로 계산 시간을 재고,
+pandas_ta 에 같은 지표가 있으면 소요 시간 / 최대 오차를 함께 출력한다.
+
+사용법:
+    python scripts/benchmark_indicators.py [--bars 100000] [--repeat 3]
+"""
+
+import argparse
+import os
+import sys
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.indicators import INDICATORS, compute
+
+# pandas_ta 비교 대상: 이름 -> (pandas_ta 계산, 비교할 출력 키)
+with warnings.catch_warnings():
+    warnings.simplefilter('ignore')
+    try:
+        import pandas_ta as ta
+    except ImportError:
+        ta = None
+
+REFERENCES = {
+    'sma': (lambda df: ta.sma(df['close'], 20), None),
+    'rma': (lambda df: ta.rma(df['close'], 14), None),
+    'wma': (lambda df: ta.wma(df['close'], 20), None),
+    'hma': (lambda df: ta.hma(df['close'], 20), None),
+    'rsi': (lambda df: ta.rsi(df['close'], 14), None),
+    'true_range': (lambda df: ta.true_range(df['high'], df['low'], df['close']), None),
+    'atr': (lambda df: ta.atr(df['high'], df['low'], df['close'], 14), None),
+    'adx': (lambda df: ta.adx(df['high'], df['low'], df['close'], 14)['ADX_14'], 'adx'),
+    'donchian': (lambda df: ta.donchian(df['high'], df['low'], 20, 20)['DCU_20_20'], 'dc_upper'),
+}
+
+
+def make_frame(bars: int, seed: int = 42) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 30000 + np.cumsum(rng.normal(0, 40, bars))
+    open_ = np.concatenate([[close[0]], close[:-1]])
+    return pd.DataFrame({
+        'high': np.maximum(open_, close) + rng.uniform(0, 25, bars),
+        'low': np.minimum(open_, close) - rng.uniform(0, 25, bars),
+        'close': close,
+        'volume': rng.uniform(1, 100, bars),
+    })
+
+
+def timed(func, repeat: int):
+    """최소 소요 시간 (ms)과 마지막 결과"""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='통합 지표 라이브러리 벤치마크')
+    parser.add_argument('--bars', type=int, default=100_000, help='캔들 수')
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수 (최소 시간 사용)')
+    args = parser.parse_args()
+
+    frame = make_frame(args.bars)
+    columns = {name: frame[name].to_numpy() for name in frame.columns}
+    print(f"캔들 {args.bars:,}개")
+    print("=" * 62)
+    print(f"{'지표':<12}{'라이브러리':>12}{'pandas_ta':>14}{'최대 오차':>14}")
+
+    for name in INDICATORS:
+        elapsed, result = timed(lambda: compute(name, columns), args.repeat)
+        reference = REFERENCES.get(name) if ta is not None else None
+        if reference is None:
+            print(f"{name:<12}{elapsed:>9.2f} ms")
+            continue
+        func, key = reference
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            ref_elapsed, expected = timed(lambda: func(frame), args.repeat)
+        actual = result[key] if key else result
+        max_error = np.nanmax(np.abs(actual - np.asarray(expected, dtype=float)))
+        print(f"{name:<12}{elapsed:>9.2f} ms{ref_elapsed:>11.2f} ms{max_error:>14.2e}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+WMA / HMA / ZLHMA 계산 벤치마크
+기존 방식(rolling(period).apply(lambda ...) - 캔들마다 파이썬 콜백)과
+src.core.moving_averages 합성곱 방식의 소요 시간 / 최대 오차를 비교한다.
+
+사용법:
+    python scripts/benchmark_moving_averages.py [--bars 100000] [--period 14] [--repeat 3]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.moving_averages import hma, wma, zlhma
+
+
+def legacy_wma(values: pd.Series, period: int) -> pd.Series:
+    """변경 전 구현 (비교 기준)"""
+    weights = np.arange(1, period + 1)
+    return values.rolling(period).apply(lambda x: np.dot(x, weights) / weights.sum(), raw=True)
+
+
+def legacy_hma(values: pd.Series, period: int) -> pd.Series:
+    raw_hma = 2 * legacy_wma(values, int(period / 2)) - legacy_wma(values, period)
+    return legacy_wma(raw_hma, int(np.sqrt(period)))
+
+
+def legacy_zlhma(values: pd.Series, period: int) -> pd.Series:
+    hma_values = legacy_hma(values, period)
+    return hma_values + (hma_values - hma_values.shift(int((period - 1) / 2)))
+
+
+def timed(func, values: pd.Series, period: int, repeat: int):
+    """최소 소요 시간 (초)과 마지막 결과"""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(values, period)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='WMA / HMA / ZLHMA 계산 벤치마크')
+    parser.add_argument('--bars', type=int, default=100_000, help='캔들 수')
+    parser.add_argument('--period', type=int, default=14, help='기간')
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수 (최소 시간 사용)')
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    close = pd.Series(30000 + np.cumsum(rng.normal(0, 40, args.bars)))
+    print(f"캔들 {args.bars:,}개 / 기간 {args.period}")
+    print("=" * 66)
+    print(f"{'지표':<7}{'rolling.apply':>16}{'합성곱':>14}{'속도 향상':>12}{'최대 오차':>14}")
+
+    for name, legacy, vectorized in (('WMA', legacy_wma, wma), ('HMA', legacy_hma, hma),
+                                     ('ZLHMA', legacy_zlhma, zlhma)):
+        legacy_time, expected = timed(legacy, close, args.period, args.repeat)
+        vector_time, actual = timed(vectorized, close, args.period, args.repeat)
+        max_error = np.nanmax(np.abs(actual.to_numpy() - expected.to_numpy()))
+        print(f"{name:<7}{legacy_time * 1000:>13.1f} ms{vector_time * 1000:>11.2f} ms"
+              f"{legacy_time / vector_time:>11.0f}x{max_error:>14.2e}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+이동 최댓값 / 최솟값 벤치마크
+pandas rolling(length).max() 와 src.core.rolling_extrema (van Herk / Gil-Werman) 배치 계산,
+스트리밍 단조 덱(RollingExtremum) 의 캔들당 갱신 시간을 비교한다.
+
+사용법:
+    python scripts/benchmark_rolling_extrema.py [--bars 100000] [--lengths 9 20 26 52] [--repeat 5]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.rolling_extrema import rolling_max_array
+from src.core.streaming_indicators import RollingExtremum
+
+
+def timed(func, repeat: int):
+    """최소 소요 시간 (초)과 마지막 결과"""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def stream(values: np.ndarray, length: int) -> np.ndarray:
+    extremum = RollingExtremum(length, maximum=True)
+    return np.array([extremum.update(x) for x in values], dtype=float)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='이동 최댓값 / 최솟값 벤치마크')
+    parser.add_argument('--bars', type=int, default=100_000, help='캔들 수')
+    parser.add_argument('--lengths', type=int, nargs='+', default=[9, 20, 26, 52], help='윈도우 크기')
+    parser.add_argument('--repeat', type=int, default=5, help='반복 횟수 (최소 시간 사용)')
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    high = 30000 + np.cumsum(rng.normal(0, 40, args.bars))
+    print(f"캔들 {args.bars:,}개")
+    print("=" * 72)
+    print(f"{'기간':<6}{'pandas':>12}{'블록 분해':>14}{'속도 향상':>12}{'스트리밍/캔들':>16}{'최대 오차':>12}")
+
+    for length in args.lengths:
+        pandas_time, expected = timed(lambda: pd.Series(high).rolling(length).max().to_numpy(), args.repeat)
+        block_time, actual = timed(lambda: rolling_max_array(high, length), args.repeat)
+        stream_time, streamed = timed(lambda: stream(high, length), 1)
+        max_error = max(np.nanmax(np.abs(actual - expected)), np.nanmax(np.abs(streamed - expected)))
+        print(f"{length:<6}{pandas_time * 1000:>9.2f} ms{block_time * 1000:>11.2f} ms"
+              f"{pandas_time / block_time:>11.1f}x{stream_time / args.bars * 1e6:>13.2f} us{max_error:>12.1e}")
+
+
+if __name__ == '__main__':
+    main()
@@ -34,20 +34,17 @@ async def emergency_close_all():
         print("취소되었습니다.")
         return
     
-    for pos in active:
-        try:
-            symbol = pos['symbol']
-            amount = float(pos['positionAmt'])
-            
-            # 반대 주문으로 청산
-            if amount > 0:
-                await api.create_market_order(symbol, 'SELL', abs(amount))
+    try:
+        # 반대 주문으로 청산 (배치 주문, 요청당 5개)
+        results = await api.close_positions([pos['symbol'] for pos in active])
+        
+        for symbol, result in results.items():
+            if result:
+                print(f"✅ {symbol} 청산 완료")
             else:
-                await api.create_market_order(symbol, 'BUY', abs(amount))
-            
-            print(f"✅ {symbol} 청산 완료")
-        except Exception as e:
-            print(f"❌ {symbol} 청산 실패: {e}")
+                print(f"❌ {symbol} 청산 실패")
+    finally:
+        await api.cleanup()
 
 if __name__ == "__main__":
     asyncio.run(emergency_close_all())
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+시세 재생 - 실시간 신호 경로 재현 / 처리량 벤치마크
+네트워크 없이 RealtimePriceMonitor -> 캔들 완성 스케줄러 / RealtimeSignalProcessor 경로에
+백테스트 캐시 pickle, 시세 기록 세그먼트, 또는 합성 캔들을 재생한다.
+
+사용법:
+    # 백테스트 캐시 (심볼=경로, 기준 인터벌)
+    python scripts/replay_market_data.py --pickle BTCUSDT=cache_data/BTCUSDT_15m.pkl --base-interval 15m
+    # 실거래 수신 기록 재현 (실시간 배속)
+    python scripts/replay_market_data.py --recording data/recordings --start-day 20240105 --speed 1
+    # 합성 데이터 처리량 측정 (최대 속도)
+    python scripts/replay_market_data.py --synthetic 20 --hours 6
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.candle_close_monitor import CandleCloseScheduler
+from src.core.realtime_price_monitor import RealtimePriceMonitor
+from src.core.realtime_signal_processor import RealtimeSignalProcessor
+from src.core.simulator import ReplayDriver, ReplayMarket, market_events, recording_events
+
+
+class ReplayStrategy:
+    """신호 체크 요청만 세는 전략 자리 (주문 없음)"""
+
+    def __init__(self):
+        self.entry_checks = 0
+
+    async def _check_new_entry(self, symbol: str):
+        self.entry_checks += 1
+
+
+class NoPositions:
+    def is_position_exist(self, symbol: str) -> bool:
+        return False
+
+
+def build_events(args):
+    if args.recording:
+        return recording_events(args.recording, args.symbols, args.start_day, args.end_day)
+
+    if args.pickle:
+        paths = dict(item.split('=', 1) for item in args.pickle)
+        market = ReplayMarket.from_cache_pickles(paths, base_interval=args.base_interval,
+                                                 warmup_bars=args.warmup_bars)
+    else:
+        symbols = [f"SYM{i:03d}USDT" for i in range(args.synthetic)]
+        bars = args.warmup_bars + int(args.hours * 60) + 1
+        market = ReplayMarket.synthetic(symbols, base_interval='1m', bars=bars,
+                                        warmup_bars=args.warmup_bars, seed=42)
+
+    start_ms = None
+    if args.hours:
+        first = max(int(k.open_time[0]) for k in market.candles.values())
+        start_ms = first + market.warmup_bars * market.base_ms
+    end_ms = start_ms + int(args.hours * 3_600_000) if start_ms is not None else None
+    return market_events(market, args.symbols, intervals=('1m', '15m'),
+                         start_ms=start_ms, end_ms=end_ms, step_ms=args.step_ms)
+
+
+async def run(args):
+    monitor = RealtimePriceMonitor(None)
+    scheduler = CandleCloseScheduler(None, price_monitor=monitor)
+    strategy = ReplayStrategy()
+    processor = RealtimeSignalProcessor(strategy, NoPositions())
+    monitor.on('price_update', processor.on_price_update)
+    monitor.on('kline_closed', processor.on_kline_closed)
+
+    closes = []
+    driver = ReplayDriver(monitor, speed=args.speed or None)
+    events = build_events(args)
+
+    # 전략처럼 심볼별 15분봉 완성 구독 (첫 이벤트에서 심볼 확인)
+    def on_close(symbol, interval, candle_time):
+        closes.append((symbol, candle_time))
+
+    def subscribed(stream_events):
+        known = set()
+        for event in stream_events:
+            symbol = event.stream.partition('@')[0].upper()
+            if symbol not in known:
+                known.add(symbol)
+                scheduler.subscribe(symbol, '15m', on_close)
+            yield event
+
+    stats = await driver.run(subscribed(events), limit=args.limit)
+
+    print("=" * 60)
+    print("시세 재생 결과")
+    print("=" * 60)
+    if stats['sim_start_ms'] is not None:
+        start = datetime.fromtimestamp(stats['sim_start_ms'] / 1000)
+        end = datetime.fromtimestamp(stats['sim_end_ms'] / 1000)
+        print(f"재생 구간       : {start:%Y-%m-%d %H:%M:%S} ~ {end:%Y-%m-%d %H:%M:%S}")
+    print(f"이벤트          : {stats['events']:,}개 ({stats['wall_seconds']:.2f}초)")
+    print(f"처리량          : {stats['events_per_second']:,.0f} events/sec ({stats['speedup']:,.0f}x 실시간)")
+    print(f"15분봉 완성     : {len(closes)}건 (스케줄러 {scheduler.stats['stream_closes']}건)")
+    signal_stats = processor.get_stats()
+    print(f"가격 업데이트   : {signal_stats['price_updates']:,}건")
+    print(f"신호 체크       : 구간 {signal_stats['zone_checks']:,}건 / 전체 {signal_stats['full_checks']:,}건 "
+          f"/ 진입 체크 {strategy.entry_checks:,}건")
+    dispatch = monitor.dispatcher.get_stats()
+    print(f"디스패치        : {dispatch}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='시세 재생 (실시간 신호 경로)')
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument('--pickle', action='append', metavar='SYMBOL=PATH',
+                        help='백테스트 캐시 캔들 pickle (여러 번 지정 가능)')
+    source.add_argument('--recording', help='MarketRecorder 기록 디렉토리')
+    source.add_argument('--synthetic', type=int, default=5, help='합성 데이터 심볼 수')
+    parser.add_argument('--base-interval', default='15m', help='pickle 캔들 인터벌')
+    parser.add_argument('--warmup-bars', type=int, default=200, help='재생 전 과거 캔들 수')
+    parser.add_argument('--symbols', nargs='*', help='재생할 심볼 (기본: 전체)')
+    parser.add_argument('--start-day', help='기록 재생 시작일 (YYYYMMDD)')
+    parser.add_argument('--end-day', help='기록 재생 종료일 (YYYYMMDD)')
+    parser.add_argument('--hours', type=float, default=2.0, help='캔들 재생 시간 (시간)')
+    parser.add_argument('--step-ms', type=int, default=1000, help='캔들 재생 틱 간격 (ms)')
+    parser.add_argument('--speed', type=float, default=0, help='재생 배속 (0 = 최대 속도)')
+    parser.add_argument('--limit', type=int, help='최대 이벤트 수')
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,190 @@
+# src/core/api_telemetry.py
+"""
+거래소 REST 호출 텔레메트리
+엔드포인트별 지연 히스토그램(p50/p95/p99), 오류 코드별 카운터,
+호출자(전략/계좌)별 가중치 사용량을 기록한다.
+
+호출자 태그는 contextvars 로 전달되므로 전략 루프에서 api_caller() 로 한 번 감싸면
+그 안에서 만들어진 태스크와 하위 호출까지 같은 태그가 적용된다.
+"""
+
+import bisect
+import contextvars
+import math
+import time
+import weakref
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Dict, List, Optional, Tuple
+
+# 태그가 없는 호출 (포지션 동기화, 모니터링 등)
+SYSTEM_CALLER = 'system'
+
+# 살아있는 텔레메트리 인스턴스 (계좌별 BinanceAPI 마다 1개)
+_instances: 'weakref.WeakSet[ApiTelemetry]' = weakref.WeakSet()
+
+_current_caller: contextvars.ContextVar[Optional[Tuple[str, Optional[str]]]] = \
+    contextvars.ContextVar('api_caller', default=None)
+
+
+@contextmanager
+def api_caller(strategy: str, account: Optional[str] = None):
+    """현재 컨텍스트의 REST 호출을 strategy/account 로 태그"""
+    token = _current_caller.set((strategy, account))
+    try:
+        yield
+    finally:
+        _current_caller.reset(token)
+
+
+def current_caller() -> Optional[Tuple[str, Optional[str]]]:
+    """현재 호출자 태그 (strategy, account)"""
+    return _current_caller.get()
+
+
+def _latency_bounds(start_ms: float = 1.0, end_ms: float = 60000.0, factor: float = 1.25) -> List[float]:
+    """로그 간격 버킷 상한 (ms) - 상대 오차 약 25% 이내"""
+    count = int(math.ceil(math.log(end_ms / start_ms, factor))) + 1
+    return [start_ms * factor ** i for i in range(count)]
+
+
+class LatencyHistogram:
+    """고정 버킷 지연 히스토그램
+
+    기록은 bisect 1회(O(log 버킷 수)), 메모리는 호출 수와 무관하게 일정하다.
+    백분위는 해당 버킷 상한으로 근사한다 (관측 최대값을 넘지 않음).
+    """
+
+    BOUNDS = _latency_bounds()
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BOUNDS) + 1)  # 마지막은 상한 초과
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, latency_ms: float):
+        self.counts[bisect.bisect_left(self.BOUNDS, latency_ms)] += 1
+        self.count += 1
+        self.total_ms += latency_ms
+        if latency_ms > self.max_ms:
+            self.max_ms = latency_ms
+
+    def percentile(self, q: float) -> float:
+        """q 백분위 (0~100) 근사값 (ms)"""
+        if self.count == 0:
+            return 0.0
+        rank = max(1, int(math.ceil(self.count * q / 100)))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                if index >= len(self.BOUNDS):
+                    return self.max_ms
+                return min(self.BOUNDS[index], self.max_ms)
+        return self.max_ms
+
+    def summary(self) -> Dict:
+        return {
+            'count': self.count,
+            'avg_ms': round(self.total_ms / self.count, 2) if self.count else 0.0,
+            'p50_ms': round(self.percentile(50), 2),
+            'p95_ms': round(self.percentile(95), 2),
+            'p99_ms': round(self.percentile(99), 2),
+            'max_ms': round(self.max_ms, 2)
+        }
+
+
+class ApiTelemetry:
+    """REST 호출 텔레메트리 (BinanceAPI 인스턴스당 1개)"""
+
+    def __init__(self, account: str = 'MAIN', window: int = 60):
+        """
+        Args:
+            account: 태그에 계좌가 없을 때 사용할 계좌 이름
+            window: 호출자별 최근 가중치 집계 윈도우 (초, 거래소 가중치 윈도우와 동일)
+        """
+        self.account = account
+        self.window = window
+        self.latency: Dict[str, LatencyHistogram] = {}
+        self.errors: Dict[str, Dict[str, int]] = {}  # endpoint -> {code: count}
+        self.weight_total: Dict[str, int] = {}
+        self._weight_recent: Dict[str, Deque[List[int]]] = {}  # key -> [[초, 가중치], ...]
+        _instances.add(self)
+
+    def _caller_key(self) -> str:
+        caller = _current_caller.get()
+        if caller is None:
+            return f"{SYSTEM_CALLER}@{self.account}"
+        strategy, account = caller
+        return f"{strategy}@{account or self.account}"
+
+    def record_weight(self, weight: int, now: Optional[float] = None):
+        """레이트 리미터에서 차감한 가중치를 현재 호출자에 귀속"""
+        key = self._caller_key()
+        self.weight_total[key] = self.weight_total.get(key, 0) + weight
+        now_sec = int(time.time() if now is None else now)
+        buckets = self._weight_recent.setdefault(key, deque())
+        if buckets and buckets[-1][0] == now_sec:
+            buckets[-1][1] += weight
+        else:
+            buckets.append([now_sec, weight])
+            self._expire(buckets, now_sec)
+
+    def _expire(self, buckets: Deque[List[int]], now_sec: int):
+        while buckets and buckets[0][0] <= now_sec - self.window:
+            buckets.popleft()
+
+    def recent_weight(self, key: str, now: Optional[float] = None) -> int:
+        """최근 window 초 동안 호출자가 사용한 가중치"""
+        buckets = self._weight_recent.get(key)
+        if not buckets:
+            return 0
+        self._expire(buckets, int(time.time() if now is None else now))
+        return sum(weight for _, weight in buckets)
+
+    def record_call(self, endpoint: str, latency_ms: float, error_code: Optional[str] = None):
+        """REST 호출 1건 기록 (성공/실패 모두)"""
+        histogram = self.latency.get(endpoint)
+        if histogram is None:
+            histogram = self.latency[endpoint] = LatencyHistogram()
+        histogram.record(latency_ms)
+        if error_code is not None:
+            codes = self.errors.setdefault(endpoint, {})
+            codes[error_code] = codes.get(error_code, 0) + 1
+
+    def snapshot(self) -> Dict:
+        """대시보드/텔레그램 용 요약
+
+        대시보드 스레드에서도 호출되므로 딕셔너리는 복사본을 순회한다.
+        """
+        now = time.time()
+        latency = dict(self.latency)
+        errors = dict(self.errors)
+        weight_total = dict(self.weight_total)
+        return {
+            'endpoints': {endpoint: histogram.summary()
+                          for endpoint, histogram in sorted(latency.items())},
+            'errors': {endpoint: dict(codes) for endpoint, codes in errors.items()},
+            'weight_window_seconds': self.window,
+            'weight_by_caller': {
+                key: {'total': total, 'recent': self.recent_weight(key, now)}
+                for key, total in sorted(weight_total.items(), key=lambda item: -item[1])
+            }
+        }
+
+
+def telemetry_snapshot() -> Dict[str, Dict]:
+    """모든 계좌의 텔레메트리 요약 {account: snapshot}
+
+    대시보드/텔레그램이 단일/멀티 계좌 구성과 무관하게 같은 방식으로 조회한다.
+    """
+    snapshots = {}
+    for telemetry in sorted(list(_instances), key=lambda t: t.account):
+        key = telemetry.account
+        suffix = 2
+        while key in snapshots:
+            key = f"{telemetry.account}#{suffix}"
+            suffix += 1
+        snapshots[key] = telemetry.snapshot()
+    return snapshots
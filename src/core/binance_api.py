@@ -1,35 +1,134 @@
 # src/core/binance_api.py
 import asyncio
 import logging
-from typing import Dict, List, Optional, Tuple, Any
-from decimal import Decimal, ROUND_DOWN
+from typing import Dict, List, Optional, Tuple, Any, Awaitable, Callable
+from decimal import Decimal
 from datetime import datetime, timedelta
 import pandas as pd
-from binance.client import Client
 from binance.exceptions import BinanceAPIException
+from urllib.parse import urlencode
 import aiohttp
+import hashlib
+import hmac
 import json
+import os
 import time
+from yarl import URL
+
+from src.core.api_telemetry import ApiTelemetry
+from src.core.kline_decoder import KlineArrays, decode_klines, empty_klines, to_frame
+from src.core.symbol_spec import SymbolSpec, compile_symbol_spec, load_spec_cache, save_spec_cache
 
 logger = logging.getLogger(__name__)
 
-class ImprovedRateLimiter:
-    """개선된 레이트 리미터 - 이벤트 루프 오류 수정"""
+class SlidingWindowCounter:
+    """초 단위 버킷 기반 슬라이딩 윈도우 카운터
+    
+    버킷 배열과 누적 합계를 유지하므로 조회/기록이 O(1) (경과 초 수만큼 분할 상환).
+    거래소 헤더로 보고된 사용량은 같은 고정 윈도우(분/10초) 안에서 하한으로 적용된다.
+    """
+    
+    def __init__(self, limit: int, window: int):
+        self.limit = limit
+        self.window = window  # seconds
+        self._buckets = [0] * window
+        self._head: Optional[int] = None  # 마지막으로 반영된 초
+        self.total = 0
+        
+        # 거래소 보고 사용량 (고정 윈도우 기준)
+        self._server_used = 0
+        self._server_epoch: Optional[int] = None
+    
+    def _advance(self, now_sec: int):
+        """만료된 버킷 비우기"""
+        if self._head is None:
+            self._head = now_sec
+            return
+        
+        elapsed = now_sec - self._head
+        if elapsed <= 0:
+            return
+        
+        if elapsed >= self.window:
+            self._buckets = [0] * self.window
+            self.total = 0
+        else:
+            for sec in range(self._head + 1, now_sec + 1):
+                idx = sec % self.window
+                self.total -= self._buckets[idx]
+                self._buckets[idx] = 0
+        self._head = now_sec
+    
+    def used(self, now: float) -> int:
+        """현재 윈도우 사용량 (로컬 기록과 거래소 보고값 중 큰 값)"""
+        now_sec = int(now)
+        self._advance(now_sec)
+        if self._server_epoch == now_sec // self.window:
+            return max(self.total, self._server_used)
+        return self.total
+    
+    def add(self, weight: int, now: float):
+        """사용량 기록"""
+        now_sec = int(now)
+        self._advance(now_sec)
+        self._buckets[now_sec % self.window] += weight
+        self.total += weight
+        if self._server_epoch == now_sec // self.window:
+            self._server_used += weight
+    
+    def sync(self, server_used: int, now: float):
+        """거래소 헤더 값으로 보정"""
+        self._server_epoch = int(now) // self.window
+        self._server_used = server_used
+    
+    def seconds_until_available(self, weight: int, now: float) -> float:
+        """weight 만큼 여유가 생길 때까지 남은 시간"""
+        if self._server_epoch == int(now) // self.window and self._server_used + weight > self.limit:
+            # 거래소 고정 윈도우는 경계에서 초기화됨
+            return (self._server_epoch + 1) * self.window - now
+        
+        needed = self.total + weight - self.limit
+        if needed <= 0:
+            return 0.0
+        
+        # 오래된 버킷부터 만료 시점 계산 (대기 경로에서만 실행)
+        now_sec = int(now)
+        freed = 0
+        for offset in range(self.window):
+            sec = now_sec - self.window + 1 + offset
+            freed += self._buckets[sec % self.window]
+            if freed >= needed:
+                return sec + self.window - now
+        return self.window - (now - now_sec)
+
+
+class SlidingWindowRateLimiter:
+    """거래소 가중치/주문 수 레이트 리미터
+    
+    요청 가중치(1분)와 주문 수(10초, 1분)를 별도 예산으로 관리하고,
+    응답 헤더(X-MBX-USED-WEIGHT-1M, X-MBX-ORDER-COUNT-*)로 실사용량을 동기화한다.
+    같은 IP를 공유하는 다른 계좌/프로세스의 사용량도 헤더를 통해 반영된다.
+    """
     
-    def __init__(self, max_requests: int = 1200, window: int = 60):
+    def __init__(self, max_requests: int = 1200, window: int = 60,
+                 max_orders_10s: int = 300, max_orders_1m: int = 1200):
         self.max_requests = max_requests
         self.window = window  # seconds
-        self.requests = {}  # {timestamp: count}
-        self.lock = asyncio.Lock()
         
-        # 정리 태스크 상태
-        self._cleanup_task = None
-        self._is_running = False
+        self.weight_counter = SlidingWindowCounter(max_requests, window)
+        self.order_counters = {
+            '10S': SlidingWindowCounter(max_orders_10s, 10),
+            '1M': SlidingWindowCounter(max_orders_1m, 60),
+        }
+        
+        # 429/418 응답 시 Retry-After 까지 차단
+        self._blocked_until = 0.0
         
         # 더 정확한 가중치 설정
         self.endpoint_weights = {
             'futures_klines': 5,
             'futures_order': 1,
+            'futures_batch_orders': 5,
             'futures_cancel_order': 1,
             'futures_account': 5,
             'futures_position_risk': 1,
@@ -38,119 +137,138 @@ class ImprovedRateLimiter:
             'futures_exchange_info': 40,
             'futures_change_leverage': 1,
             'futures_change_margin_type': 1,
+            'futures_listen_key': 1,
         }
         
-        logger.debug("ImprovedRateLimiter 초기화 (이벤트 루프 없이)")
+        # 주문 수 예산을 소모하는 엔드포인트
+        self.order_endpoints = {'futures_order', 'futures_batch_orders'}
+        
+        # 호출자별 가중치 기록 (BinanceAPI 가 연결)
+        self.telemetry: Optional[ApiTelemetry] = None
+        
+        logger.debug("SlidingWindowRateLimiter 초기화")
     
     async def start(self):
-        """레이트 리미터 시작 (비동기 컨텍스트에서만 호출)"""
-        if not self._is_running:
-            self._is_running = True
-            self._cleanup_task = asyncio.create_task(self._periodic_cleanup())
-            logger.debug("레이트 리미터 정리 태스크 시작")
+        """레이트 리미터 시작 (버킷 방식이라 정리 태스크 불필요)"""
+        pass
     
     async def stop(self):
         """레이트 리미터 중지"""
-        self._is_running = False
-        if self._cleanup_task and not self._cleanup_task.done():
-            self._cleanup_task.cancel()
-            try:
-                await self._cleanup_task
-            except asyncio.CancelledError:
-                pass
-            logger.debug("레이트 리미터 정리 태스크 중지")
-    
-    async def _periodic_cleanup(self):
-        """주기적으로 오래된 요청 기록 정리"""
-        while self._is_running:
-            try:
-                await asyncio.sleep(30)  # 30초마다 정리
-                async with self.lock:
-                    current_time = time.time()
-                    cutoff_time = current_time - self.window
-                    
-                    # 오래된 기록 제거
-                    old_timestamps = [ts for ts in self.requests if ts < cutoff_time]
-                    for ts in old_timestamps:
-                        del self.requests[ts]
-                    
-                    if old_timestamps:
-                        logger.debug(f"레이트 리미터: {len(old_timestamps)}개 오래된 기록 정리")
-                        
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"레이트 리미터 정리 중 오류: {e}")
-                await asyncio.sleep(60)
+        pass
     
-    async def acquire(self, endpoint: str = 'default', count: int = 1):
-        """레이트 리밋 체크 및 대기"""
-        weight = self.endpoint_weights.get(endpoint, 1) * count
+    def _wait_time(self, weight: int, orders: int, now: float) -> float:
+        """필요한 대기 시간 (0이면 즉시 가능)"""
+        wait = max(0.0, self._blocked_until - now)
+        if self.weight_counter.used(now) + weight > self.weight_counter.limit:
+            wait = max(wait, self.weight_counter.seconds_until_available(weight, now))
+        if orders:
+            for counter in self.order_counters.values():
+                if counter.used(now) + orders > counter.limit:
+                    wait = max(wait, counter.seconds_until_available(orders, now))
+        return wait
+    
+    @staticmethod
+    def kline_weight(limit: int) -> int:
+        """klines 요청 가중치 (limit 구간별)"""
+        if limit < 100:
+            return 1
+        if limit < 500:
+            return 2
+        if limit <= 1000:
+            return 5
+        return 10
+    
+    async def acquire(self, endpoint: str = 'default', count: int = 1,
+                      weight: Optional[int] = None, orders: Optional[int] = None):
+        """레이트 리밋 체크 및 대기
         
-        async with self.lock:
-            current_time = time.time()
-            current_window_start = current_time - self.window
+        Args:
+            endpoint: 엔드포인트 이름 (가중치 테이블 키)
+            count: 요청 수
+            weight: 요청당 가중치 직접 지정 (limit 에 따라 가중치가 달라지는 경우)
+            orders: 주문 수 직접 지정 (배치 주문처럼 요청 1회에 여러 주문인 경우)
+        """
+        weight = (weight if weight is not None else self.endpoint_weights.get(endpoint, 1)) * count
+        if orders is None:
+            orders = count if endpoint in self.order_endpoints else 0
+        
+        while True:
+            now = time.time()
+            wait_time = self._wait_time(weight, orders, now)
+            if wait_time <= 0:
+                break
             
-            # 현재 윈도우의 요청 수 계산
-            current_requests = sum(
-                req_count for timestamp, req_count in self.requests.items()
-                if timestamp >= current_window_start
+            logger.warning(
+                f"레이트 리밋 도달 ({self.weight_counter.used(now)}/{self.max_requests}). "
+                f"{wait_time:.1f}초 대기... (endpoint: {endpoint}, weight: {weight})"
             )
-            
-            # 리밋 체크
-            if current_requests + weight > self.max_requests:
-                # 가장 오래된 요청 찾기
-                oldest_timestamp = min(
-                    ts for ts in self.requests if ts >= current_window_start
-                )
-                wait_time = self.window - (current_time - oldest_timestamp) + 0.1
-                
-                if wait_time > 0:
-                    logger.warning(
-                        f"레이트 리밋 도달 ({current_requests}/{self.max_requests}). "
-                        f"{wait_time:.1f}초 대기... (endpoint: {endpoint}, weight: {weight})"
-                    )
-                    await asyncio.sleep(wait_time)
-                    
-                    # 대기 후 다시 정리
-                    current_time = time.time()
-                    current_window_start = current_time - self.window
-                    
-                    # 오래된 요청 제거
-                    self.requests = {
-                        ts: count for ts, count in self.requests.items()
-                        if ts >= current_window_start
-                    }
-            
-            # 요청 기록
-            self.requests[current_time] = weight
+            await asyncio.sleep(wait_time + 0.05)
+        
+        # 체크와 기록 사이에 await 가 없으므로 원자적으로 처리됨
+        self.weight_counter.add(weight, now)
+        if orders:
+            for counter in self.order_counters.values():
+                counter.add(orders, now)
+        if self.telemetry is not None:
+            self.telemetry.record_weight(weight, now)
+    
+    def update_from_headers(self, headers):
+        """응답 헤더로 사용량 동기화"""
+        now = time.time()
+        used_weight = headers.get('X-MBX-USED-WEIGHT-1M')
+        if used_weight is not None:
+            self.weight_counter.sync(int(used_weight), now)
+        
+        for interval, counter in self.order_counters.items():
+            order_count = headers.get(f'X-MBX-ORDER-COUNT-{interval}')
+            if order_count is not None:
+                counter.sync(int(order_count), now)
+    
+    def on_rate_limited(self, retry_after: Optional[float]):
+        """429/418 응답 처리 - Retry-After 동안 모든 요청 보류"""
+        delay = float(retry_after) if retry_after else float(self.window)
+        self._blocked_until = max(self._blocked_until, time.time() + delay)
+        logger.warning(f"거래소 레이트 리밋 응답 - {delay:.0f}초간 요청 보류")
     
     def get_current_usage(self) -> Tuple[int, int]:
         """현재 사용량 반환 (used, limit)"""
-        current_time = time.time()
-        current_window_start = current_time - self.window
-        
-        current_requests = sum(
-            req_count for timestamp, req_count in self.requests.items()
-            if timestamp >= current_window_start
-        )
-        
-        return current_requests, self.max_requests
+        return self.weight_counter.used(time.time()), self.max_requests
+    
+    def get_order_usage(self) -> Dict[str, Tuple[int, int]]:
+        """주문 수 사용량 반환 {interval: (used, limit)}"""
+        now = time.time()
+        return {
+            interval: (counter.used(now), counter.limit)
+            for interval, counter in self.order_counters.items()
+        }
 
 class BinanceAPI:
     """바이낸스 API 클라이언트 - 이벤트 루프 오류 수정"""
     
-    def __init__(self, api_key: str, secret_key: str, testnet: bool = False):
+    # batchOrders 요청당 최대 주문 수
+    BATCH_ORDER_LIMIT = 5
+    
+    def __init__(self, api_key: str, secret_key: str, testnet: bool = False,
+                 read_cache_ttl: float = 1.0, spec_cache_dir: str = 'state',
+                 exchange_info_ttl: float = 3600, account_name: str = 'MAIN'):
+        """
+        Args:
+            read_cache_ttl: 계정/포지션 조회 결과 재사용 허용 시간 (초, 0이면 동시 요청 병합만)
+            spec_cache_dir: 심볼 규격 디스크 캐시 디렉토리
+            exchange_info_ttl: 거래소 정보 갱신 주기 (초)
+            account_name: 텔레메트리 호출자 태그에 사용할 계좌 이름
+        """
         self.api_key = api_key
         self.secret_key = secret_key
         self.testnet = testnet
         
-        # 동기 클라이언트 (python-binance)
-        self.client: Optional[Client] = None
-        
-        # 비동기 세션 (aiohttp)
+        # 비동기 세션 (aiohttp) - 모든 REST 호출이 이 세션을 공유
         self.session: Optional[aiohttp.ClientSession] = None
         
+        # 서명 요청 설정
+        self.recv_window = 5000
+        self.time_offset = 0  # 서버 시간 - 로컬 시간 (ms)
+        
         # API 엔드포인트
         if testnet:
             self.base_url = "https://testnet.binancefuture.com"
@@ -159,12 +277,36 @@ class BinanceAPI:
             self.base_url = "https://fapi.binance.com"
             self.ws_url = "wss://fstream.binance.com"
         
-        # 심볼 정보 캐시
-        self.symbol_info_cache = {}
+        # 환경변수로 엔드포인트를 지정하면 해당 서버 사용 (로컬 거래소 시뮬레이터 등)
+        rest_override = os.getenv('BINANCE_FUTURES_REST_URL')
+        ws_override = os.getenv('BINANCE_FUTURES_WS_URL')
+        if rest_override:
+            self.base_url = rest_override.rstrip('/')
+        if ws_override:
+            self.ws_url = ws_override.rstrip('/')
+        
+        # 심볼 주문 규격 (exchangeInfo 필터 사전 컴파일, 디스크 캐시)
+        self.symbol_specs: Dict[str, SymbolSpec] = {}
         self.exchange_info_last_update = None
+        self.exchange_info_ttl = exchange_info_ttl
+        spec_file = 'symbol_specs_testnet.json' if testnet else 'symbol_specs.json'
+        # 다른 서버의 규격이 실거래 캐시를 덮어쓰지 않도록 엔드포인트 지정 시 디스크 캐시 미사용
+        self.spec_cache_path = None if rest_override else os.path.join(spec_cache_dir, spec_file)
         
         # 레이트 리밋 관리 (초기화만 하고 start는 나중에)
-        self.rate_limiter = ImprovedRateLimiter()
+        self.rate_limiter = SlidingWindowRateLimiter()
+        
+        # 엔드포인트별 지연/오류, 호출자별 가중치 텔레메트리
+        self.account_name = account_name
+        self.telemetry = ApiTelemetry(account_name, window=self.rate_limiter.window)
+        self.rate_limiter.telemetry = self.telemetry
+        
+        # 조회 요청 병합 (single-flight) 및 단기 캐시
+        self.read_cache_ttl = read_cache_ttl
+        self._inflight_reads: Dict[str, asyncio.Future] = {}
+        self._read_cache: Dict[str, Tuple[float, Any]] = {}
+        self._read_generation = 0  # 주문 등 상태 변경 시 증가
+        self.read_stats = {'hits': 0, 'coalesced': 0, 'misses': 0}
         
         self.is_connected = False
         
@@ -173,21 +315,24 @@ class BinanceAPI:
     async def initialize(self) -> bool:
         """API 초기화 및 연결 확인"""
         try:
-            # 동기 클라이언트 초기화
-            self.client = Client(
-                api_key=self.api_key,
-                api_secret=self.secret_key
-            )
-            
-            # 비동기 세션 생성
+            # 비동기 세션 생성 (keep-alive 커넥션 풀)
             timeout = aiohttp.ClientTimeout(total=30)
-            self.session = aiohttp.ClientSession(timeout=timeout)
+            connector = aiohttp.TCPConnector(
+                limit=50,
+                ttl_dns_cache=300,
+                keepalive_timeout=60
+            )
+            self.session = aiohttp.ClientSession(
+                timeout=timeout,
+                connector=connector,
+                headers={'X-MBX-APIKEY': self.api_key}
+            )
             
             # 레이트 리미터 시작 (이제 이벤트 루프가 있음)
             await self.rate_limiter.start()
             
-            # 연결 테스트
-            server_time = await self.get_server_time()
+            # 연결 테스트 + 서명 타임스탬프 보정
+            server_time = await self.sync_time()
             if not server_time:
                 raise Exception("서버 시간 조회 실패")
             
@@ -214,7 +359,10 @@ class BinanceAPI:
                     positions = await self.get_positions()
                     if not positions:
                         # API 호출로 포지션 모드 변경
-                        self.client.futures_change_position_mode(dualSidePosition=False)
+                        await self._request(
+                            'POST', '/fapi/v1/positionSide/dual',
+                            {'dualSidePosition': False}, signed=True
+                        )
                         logger.info("✅ 포지션 모드를 One-way로 변경 성공")
                     else:
                         logger.warning("⚠️ 활성 포지션이 있어 포지션 모드를 변경할 수 없습니다.")
@@ -238,21 +386,167 @@ class BinanceAPI:
                 await self.rate_limiter.stop()
             return False
     
+    @staticmethod
+    def _format_param(value: Any) -> str:
+        """요청 파라미터 문자열 변환 (지수 표기/파이썬 bool 방지)"""
+        if isinstance(value, bool):
+            return 'true' if value else 'false'
+        if isinstance(value, float):
+            return format(Decimal(str(value)), 'f')
+        return str(value)
+    
+    def _sign(self, query: str) -> str:
+        """HMAC-SHA256 서명"""
+        return hmac.new(
+            self.secret_key.encode('utf-8'), query.encode('utf-8'), hashlib.sha256
+        ).hexdigest()
+    
+    async def _request(self, method: str, path: str, params: Optional[Dict] = None,
+                       signed: bool = False, raw: bool = False) -> Any:
+        """aiohttp 기반 REST 요청
+        
+        동기 클라이언트 대신 공유 세션으로 요청하므로 이벤트 루프를 막지 않고,
+        여러 호출이 동시에 진행될 수 있다. 서명 요청이 -1021(타임스탬프가
+        recvWindow 밖)로 거부되면 서버 시간으로 보정값을 갱신한 뒤 한 번만 재시도한다.
+        
+        Args:
+            raw: True 면 JSON 파싱 없이 응답 텍스트 반환 (전용 디코더 사용 시)
+        
+        Raises:
+            BinanceAPIException: 거래소가 오류 응답을 반환한 경우
+        """
+        try:
+            return await self._send(method, path, params, signed, raw)
+        except BinanceAPIException as e:
+            if not signed or e.code != -1021:
+                raise
+            logger.warning(f"타임스탬프 범위 오류 (-1021), 서버 시간 재동기화: {method} {path}")
+            if not await self.sync_time():
+                raise
+            return await self._send(method, path, params, signed, raw)
+    
+    async def _send(self, method: str, path: str, params: Optional[Dict],
+                    signed: bool, raw: bool) -> Any:
+        """단일 REST 요청 전송 (서명, 헤더 기반 리미터 동기화, 텔레메트리 기록)"""
+        if self.session is None or self.session.closed:
+            raise RuntimeError("API 세션이 초기화되지 않았습니다")
+        
+        items = [(k, self._format_param(v)) for k, v in (params or {}).items() if v is not None]
+        if signed:
+            items.append(('recvWindow', str(self.recv_window)))
+            items.append(('timestamp', str(int(time.time() * 1000) + self.time_offset)))
+        query = urlencode(items)
+        if signed:
+            query = f"{query}&signature={self._sign(query)}"
+        
+        url = f"{self.base_url}{path}"
+        if method in ('GET', 'DELETE'):
+            request_kwargs = {'url': URL(f"{url}?{query}" if query else url, encoded=True)}
+        else:
+            request_kwargs = {
+                'url': URL(url, encoded=True),
+                'data': query,
+                'headers': {'Content-Type': 'application/x-www-form-urlencoded'}
+            }
+        
+        endpoint = f"{method} {path}"
+        started = time.perf_counter()
+        error_code = None
+        try:
+            async with self.session.request(method, **request_kwargs) as response:
+                text = await response.text()
+                self.rate_limiter.update_from_headers(response.headers)
+                if response.status in (418, 429):
+                    self.rate_limiter.on_rate_limited(response.headers.get('Retry-After'))
+                if response.status >= 400:
+                    exception = BinanceAPIException(response, response.status, text)
+                    error_code = str(exception.code or response.status)
+                    raise exception
+                return text if raw else json.loads(text)
+        except BinanceAPIException:
+            raise
+        except Exception as e:
+            # 타임아웃/연결 오류는 예외 타입으로 집계
+            error_code = type(e).__name__
+            raise
+        finally:
+            self.telemetry.record_call(endpoint, (time.perf_counter() - started) * 1000, error_code)
+    
     async def get_server_time(self) -> Optional[int]:
         """서버 시간 조회"""
         try:
-            response = self.client.get_server_time()
+            response = await self._request('GET', '/fapi/v1/time')
             return response['serverTime']
         except Exception as e:
             logger.error(f"서버 시간 조회 실패: {e}")
             return None
     
-    async def get_account_info(self) -> Optional[Dict]:
-        """계정 정보 조회"""
+    async def sync_time(self) -> Optional[int]:
+        """서버 시간으로 서명 타임스탬프 보정값 갱신 (실패 시 None)"""
+        server_time = await self.get_server_time()
+        if not server_time:
+            return None
+        
+        self.time_offset = server_time - int(time.time() * 1000)
+        if abs(self.time_offset) > 1000:
+            logger.warning(f"로컬 시간 오차: {self.time_offset}ms (서명 시 보정)")
+        return server_time
+    
+    async def _single_flight(self, key: str, fetch: Callable[[], Awaitable[Any]],
+                             max_age: Optional[float] = None) -> Any:
+        """동일 조회 요청 병합
+        
+        진행 중인 요청이 있으면 그 결과를 함께 기다리고, max_age 이내의 결과는 재사용한다.
+        요청은 별도 태스크로 실행되므로 먼저 호출한 쪽이 취소되어도 다른 호출자에게 영향이 없다.
+        """
+        max_age = self.read_cache_ttl if max_age is None else max_age
+        cached = self._read_cache.get(key)
+        if cached and time.monotonic() - cached[0] <= max_age:
+            self.read_stats['hits'] += 1
+            return cached[1]
+        
+        task = self._inflight_reads.get(key)
+        if task is None:
+            self.read_stats['misses'] += 1
+            task = asyncio.ensure_future(fetch())
+            self._inflight_reads[key] = task
+            generation = self._read_generation
+            task.add_done_callback(lambda t: self._on_read_done(key, generation, t))
+        else:
+            self.read_stats['coalesced'] += 1
+        
+        return await asyncio.shield(task)
+    
+    def _on_read_done(self, key: str, generation: int, task: asyncio.Future):
+        """병합 요청 완료 처리 - 성공 결과만 캐시"""
+        if self._inflight_reads.get(key) is task:
+            del self._inflight_reads[key]
+        if task.cancelled() or task.exception() is not None:
+            return
+        # 요청 도중 주문이 실행됐다면 이전 상태일 수 있으므로 캐시하지 않음
+        if generation == self._read_generation:
+            self._read_cache[key] = (time.monotonic(), task.result())
+    
+    def invalidate_read_cache(self):
+        """계정/포지션 캐시 무효화 (주문, 레버리지 변경 후)"""
+        self._read_generation += 1
+        self._read_cache.clear()
+    
+    async def _fetch_account_info(self) -> Dict:
+        """계정 정보 요청 (병합 대상)"""
+        await self.rate_limiter.acquire('futures_account')
+        return await self._request('GET', '/fapi/v2/account', signed=True)
+    
+    async def get_account_info(self, max_age: Optional[float] = None) -> Optional[Dict]:
+        """계정 정보 조회 (동시 호출은 한 번의 요청으로 병합)
+        
+        Args:
+            max_age: 캐시 허용 시간 (초). None 이면 read_cache_ttl, 0 이면 새로 조회
+        """
         try:
-            await self.rate_limiter.acquire('futures_account')
-            account = self.client.futures_account()
-            return account
+            account = await self._single_flight('account', self._fetch_account_info, max_age)
+            # 호출자가 수정해도 공유 결과가 바뀌지 않도록 얕은 복사
+            return dict(account)
         except Exception as e:
             logger.error(f"계정 정보 조회 실패: {e}")
             return None
@@ -268,55 +562,78 @@ class BinanceAPI:
             logger.error(f"잔고 조회 실패: {e}")
             return 0.0
     
-    async def load_exchange_info(self) -> bool:
-        """거래소 정보 로드 (심볼 정보 캐싱)"""
+    async def load_exchange_info(self, force: bool = False) -> bool:
+        """거래소 정보 로드 (심볼 규격 컴파일)
+        
+        디스크 캐시가 유효하면 exchangeInfo(가중치 40) 요청을 생략하고,
+        갱신 시에는 필터가 바뀐 심볼만 교체한다.
+        """
         try:
-            # 캐시 유효성 체크 (1시간)
-            if self.exchange_info_last_update:
-                if datetime.now() - self.exchange_info_last_update < timedelta(hours=1):
+            # 최초 로드 시 디스크 캐시 사용
+            if not self.symbol_specs and not force and self.spec_cache_path:
+                specs, updated_at = load_spec_cache(self.spec_cache_path)
+                if specs:
+                    self.symbol_specs = specs
+                    self.exchange_info_last_update = datetime.fromtimestamp(updated_at)
+                    logger.info(f"심볼 규격 캐시 로드: {len(specs)}개 심볼")
+            
+            # 캐시 유효성 체크
+            if self.exchange_info_last_update and not force:
+                if datetime.now() - self.exchange_info_last_update < timedelta(seconds=self.exchange_info_ttl):
                     return True
             
             await self.rate_limiter.acquire('futures_exchange_info')
-            exchange_info = self.client.futures_exchange_info()
-            
-            self.symbol_info_cache.clear()
+            exchange_info = await self._request('GET', '/fapi/v1/exchangeInfo')
             
+            trading = {}
             for symbol_info in exchange_info['symbols']:
                 if symbol_info['status'] == 'TRADING':
-                    symbol = symbol_info['symbol']
-                    
-                    # 필요한 정보만 추출
-                    self.symbol_info_cache[symbol] = {
-                        'symbol': symbol,
-                        'baseAsset': symbol_info['baseAsset'],
-                        'quoteAsset': symbol_info['quoteAsset'],
-                        'pricePrecision': symbol_info['pricePrecision'],
-                        'quantityPrecision': symbol_info['quantityPrecision'],
-                        'filters': {f['filterType']: f for f in symbol_info['filters']}
-                    }
+                    trading[symbol_info['symbol']] = symbol_info
+            
+            # 변경된 심볼만 교체 (조회 중인 규격은 그대로 유지)
+            changed = 0
+            for symbol, symbol_info in trading.items():
+                spec = compile_symbol_spec(symbol_info)
+                if self.symbol_specs.get(symbol) != spec:
+                    self.symbol_specs[symbol] = spec
+                    changed += 1
+            
+            removed = [symbol for symbol in self.symbol_specs if symbol not in trading]
+            for symbol in removed:
+                del self.symbol_specs[symbol]
             
             self.exchange_info_last_update = datetime.now()
-            logger.info(f"거래소 정보 로드 완료: {len(self.symbol_info_cache)}개 심볼")
+            if self.spec_cache_path:
+                save_spec_cache(self.spec_cache_path, self.symbol_specs,
+                                self.exchange_info_last_update.timestamp())
+            logger.info(f"거래소 정보 로드 완료: {len(self.symbol_specs)}개 심볼 "
+                        f"(변경 {changed}, 제거 {len(removed)})")
             return True
             
         except Exception as e:
             logger.error(f"거래소 정보 로드 실패: {e}")
             return False
     
-    async def get_symbol_info(self, symbol: str) -> Optional[Dict]:
-        """심볼 정보 조회"""
-        if symbol in self.symbol_info_cache:
-            return self.symbol_info_cache[symbol]
+    async def get_symbol_spec(self, symbol: str) -> Optional[SymbolSpec]:
+        """심볼 주문 규격 조회"""
+        spec = self.symbol_specs.get(symbol)
+        if spec is not None:
+            return spec
         
         # 캐시에 없으면 재로드
         await self.load_exchange_info()
-        return self.symbol_info_cache.get(symbol)
+        return self.symbol_specs.get(symbol)
+    
+    async def get_symbol_info(self, symbol: str) -> Optional[Dict]:
+        """심볼 정보 조회"""
+        spec = await self.get_symbol_spec(symbol)
+        return spec.to_dict() if spec else None
     
     async def get_current_price(self, symbol: str) -> Optional[float]:
         """현재 가격 조회"""
         try:
             await self.rate_limiter.acquire('futures_ticker')
-            ticker = self.client.futures_symbol_ticker(symbol=symbol)
+            ticker = await self._request('GET', '/fapi/v1/ticker/price', {'symbol': symbol})
             return float(ticker['price'])
         except Exception as e:
             logger.error(f"가격 조회 실패 ({symbol}): {e}")
@@ -325,8 +642,8 @@ class BinanceAPI:
     async def get_multiple_prices(self, symbols: List[str]) -> Dict[str, float]:
         """여러 심볼 가격 배치 조회"""
         try:
-            await self.rate_limiter.acquire('futures_ticker', len(symbols))
-            tickers = self.client.futures_ticker()
+            await self.rate_limiter.acquire('futures_ticker', 2)
+            tickers = await self._request('GET', '/fapi/v1/ticker/price')
             
             prices = {}
             for ticker in tickers:
@@ -339,36 +656,44 @@ class BinanceAPI:
             logger.error(f"배치 가격 조회 실패: {e}")
             return {}
     
-    async def get_klines(self, symbol: str, interval: str, limit: int = 500) -> pd.DataFrame:
-        """캔들스틱 데이터 조회"""
+    async def get_kline_arrays(self, symbol: str, interval: str, limit: int = 500,
+                               start_time: Optional[int] = None) -> KlineArrays:
+        """캔들스틱 조회 - numpy 배열 (open time int64, OHLCV float64)
+        
+        응답 텍스트를 파이썬 리스트로 파싱하지 않고 바로 배열로 디코딩한다.
+        
+        Args:
+            start_time: 시작 시각 (ms, 캔들 open time 기준). 지정 시 이후 캔들만 조회
+        """
         try:
-            # 레이트 리밋 체크
-            await self.rate_limiter.acquire('futures_klines')
+            limit = min(limit, 1500)  # 최대 1500개
             
-            klines = self.client.futures_klines(
-                symbol=symbol,
-                interval=interval,
-                limit=min(limit, 1500)  # 최대 1500개
+            # 레이트 리밋 체크
+            await self.rate_limiter.acquire(
+                'futures_klines', weight=self.rate_limiter.kline_weight(limit)
             )
             
-            if not klines:
-                return pd.DataFrame()
-            
-            # DataFrame 변환
-            df = pd.DataFrame(klines, columns=[
-                'timestamp', 'open', 'high', 'low', 'close', 'volume',
-                'close_time', 'quote_volume', 'trades', 'taker_buy_base',
-                'taker_buy_quote', 'ignore'
-            ])
+            text = await self._request('GET', '/fapi/v1/klines', {
+                'symbol': symbol,
+                'interval': interval,
+                'limit': limit,
+                'startTime': start_time
+            }, raw=True)
+            return decode_klines(text)
             
-            # 데이터 타입 변환
-            for col in ['open', 'high', 'low', 'close', 'volume']:
-                df[col] = pd.to_numeric(df[col])
+        except Exception as e:
+            logger.error(f"캔들스틱 조회 실패 ({symbol}): {e}")
+            return empty_klines()
+    
+    async def get_klines(self, symbol: str, interval: str, limit: int = 500) -> pd.DataFrame:
+        """캔들스틱 데이터 조회 (open/high/low/close/volume/timestamp, datetime 인덱스)"""
+        try:
+            klines = await self.get_kline_arrays(symbol, interval, limit)
             
-            df['datetime'] = pd.to_datetime(df['timestamp'], unit='ms')
-            df.set_index('datetime', inplace=True)
+            if len(klines) == 0:
+                return pd.DataFrame()
             
-            return df
+            return to_frame(klines)
             
         except Exception as e:
             logger.error(f"캔들스틱 조회 실패 ({symbol}): {e}")
@@ -427,40 +752,75 @@ class BinanceAPI:
             logger.error(f"포지션 조회 실패: {e}")
             return []
     
+    async def build_order(self, symbol: str, side: str, quantity: Optional[float] = None,
+                          order_type: str = 'MARKET', price: float = None,
+                          stop_price: float = None, reduce_only: bool = False,
+                          close_position: bool = False,
+                          client_order_id: Optional[str] = None) -> Optional[Dict]:
+        """주문 파라미터 생성 (수량/가격 검증 포함)
+        
+        client_order_id 를 주면 newClientOrderId 로 전송 (사용자 데이터 스트림 주문 이벤트의 c)
+        
+        Returns:
+            /fapi/v1/order, batchOrders 공용 파라미터. 수량이 유효하지 않으면 None
+        """
+        order_params = {
+            'symbol': symbol,
+            'side': side,
+            'type': order_type
+        }
+        
+        if close_position:
+            # 조건부 주문 전체 청산 (수량 불필요, 포지션 진입 전에도 등록 가능)
+            order_params['closePosition'] = True
+        else:
+            quantity = await self.validate_quantity(symbol, quantity)
+            if quantity <= 0:
+                logger.error(f"유효하지 않은 수량: {quantity}")
+                return None
+            order_params['quantity'] = quantity
+            if reduce_only:
+                order_params['reduceOnly'] = True
+        
+        if order_type == 'LIMIT' and price:
+            price = await self.validate_price(symbol, price)
+            order_params['price'] = price
+            order_params['timeInForce'] = 'GTC'
+        
+        if stop_price:
+            order_params['stopPrice'] = await self.validate_price(symbol, stop_price)
+        
+        if order_type == 'MARKET':
+            # 체결가(avgPrice)를 응답으로 받음
+            order_params['newOrderRespType'] = 'RESULT'
+        
+        if client_order_id:
+            order_params['newClientOrderId'] = client_order_id
+        
+        return order_params
+    
     async def place_order(self, symbol: str, side: str, quantity: float, 
                          order_type: str = 'MARKET', price: float = None,
-                         reduce_only: bool = False) -> Optional[Dict]:
+                         reduce_only: bool = False,
+                         client_order_id: Optional[str] = None) -> Optional[Dict]:
         """주문 실행"""
         try:
             # 레이트 리밋 체크
             await self.rate_limiter.acquire('futures_order')
             
             # 수량 검증 및 포맷
-            quantity = await self.validate_quantity(symbol, quantity)
-            if quantity <= 0:
-                logger.error(f"유효하지 않은 수량: {quantity}")
+            order_params = await self.build_order(
+                symbol, side, quantity, order_type, price=price, reduce_only=reduce_only,
+                client_order_id=client_order_id
+            )
+            if not order_params:
                 return None
             
-            # 주문 파라미터
-            order_params = {
-                'symbol': symbol,
-                'side': side,
-                'type': order_type,
-                'quantity': quantity
-            }
-            
-            if reduce_only:
-                order_params['reduceOnly'] = True
-            
-            if order_type == 'LIMIT' and price:
-                price = await self.validate_price(symbol, price)
-                order_params['price'] = price
-                order_params['timeInForce'] = 'GTC'
-            
             # 주문 실행
-            result = self.client.futures_create_order(**order_params)
+            result = await self._request('POST', '/fapi/v1/order', order_params, signed=True)
+            self.invalidate_read_cache()
             
-            logger.info(f"주문 성공: {symbol} {side} {quantity} @ {order_type}")
+            logger.info(f"주문 성공: {symbol} {side} {order_params['quantity']} @ {order_type}")
             logger.debug(f"주문 결과: {result}")
             
             return result
@@ -472,6 +832,116 @@ class BinanceAPI:
             logger.error(f"주문 실패 ({symbol}): {e}")
             return None
     
+    async def place_orders_batch(self, orders: List[Dict]) -> List[Optional[Dict]]:
+        """배치 주문 (/fapi/v1/batchOrders, 요청당 최대 5개)
+        
+        Args:
+            orders: build_order 인자(dict) 목록
+                예: {'symbol': 'BTCUSDT', 'side': 'SELL', 'quantity': 0.01, 'reduce_only': True}
+        
+        Returns:
+            입력 순서대로 주문 결과. 검증/거래소 오류로 실패한 주문은 None
+        """
+        results: List[Optional[Dict]] = [None] * len(orders)
+        
+        # 파라미터 생성 (검증 실패 주문은 제외하고 원래 위치 기억)
+        prepared = []
+        for index, order in enumerate(orders):
+            try:
+                params = await self.build_order(**order)
+            except Exception as e:
+                logger.error(f"배치 주문 파라미터 생성 실패 ({order.get('symbol')}): {e}")
+                params = None
+            if params:
+                prepared.append((index, params))
+        
+        chunks = [prepared[i:i + self.BATCH_ORDER_LIMIT]
+                  for i in range(0, len(prepared), self.BATCH_ORDER_LIMIT)]
+        if not chunks:
+            return results
+        
+        # 묶음끼리는 동시에 전송
+        responses = await asyncio.gather(
+            *(self._send_batch([params for _, params in chunk]) for chunk in chunks),
+            return_exceptions=True
+        )
+        self.invalidate_read_cache()
+        
+        for chunk, response in zip(chunks, responses):
+            if isinstance(response, Exception):
+                message = response.message if isinstance(response, BinanceAPIException) else response
+                logger.error(f"배치 주문 실패 ({len(chunk)}건): {message}")
+                continue
+            for (index, params), result in zip(chunk, response):
+                if 'code' in result and 'orderId' not in result:
+                    logger.error(f"배치 주문 거부: {params['symbol']} {params['side']} "
+                                 f"{params['type']} - {result.get('msg')} ({result['code']})")
+                    continue
+                results[index] = result
+                logger.info(f"주문 성공: {params['symbol']} {params['side']} "
+                            f"{params.get('quantity', 'closePosition')} @ {params['type']}")
+        
+        return results
+    
+    async def _send_batch(self, batch: List[Dict]) -> List[Dict]:
+        """batchOrders 요청 1회"""
+        await self.rate_limiter.acquire('futures_batch_orders', orders=len(batch))
+        payload = json.dumps(
+            [{key: self._format_param(value) for key, value in params.items()} for params in batch],
+            separators=(',', ':')
+        )
+        return await self._request('POST', '/fapi/v1/batchOrders', {'batchOrders': payload}, signed=True)
+    
+    async def cancel_order(self, symbol: str, order_id: int) -> bool:
+        """단일 미체결 주문 취소"""
+        try:
+            await self.rate_limiter.acquire('futures_cancel_order')
+            await self._request('DELETE', '/fapi/v1/order',
+                                {'symbol': symbol, 'orderId': order_id}, signed=True)
+            logger.info(f"주문 취소: {symbol} #{order_id}")
+            return True
+        except Exception as e:
+            logger.error(f"주문 취소 실패 ({symbol} #{order_id}): {e}")
+            return False
+    
+    async def cancel_all_orders(self, symbol: str) -> bool:
+        """심볼의 미체결 주문 전체 취소"""
+        try:
+            await self.rate_limiter.acquire('futures_cancel_order')
+            await self._request('DELETE', '/fapi/v1/allOpenOrders', {'symbol': symbol}, signed=True)
+            logger.info(f"미체결 주문 취소: {symbol}")
+            return True
+        except Exception as e:
+            logger.error(f"주문 취소 실패 ({symbol}): {e}")
+            return False
+    
+    async def close_positions(self, symbols: Optional[List[str]] = None) -> Dict[str, Optional[Dict]]:
+        """여러 포지션 배치 청산 (reduceOnly 시장가)
+        
+        Args:
+            symbols: 청산할 심볼 목록. None 이면 전체 포지션
+        
+        Returns:
+            {symbol: 주문 결과 또는 None}
+        """
+        positions = await self.get_positions()
+        targets = [p for p in positions
+                   if float(p['positionAmt']) != 0 and (symbols is None or p['symbol'] in symbols)]
+        
+        if symbols is not None:
+            for symbol in set(symbols) - {p['symbol'] for p in targets}:
+                logger.warning(f"청산할 포지션 없음: {symbol}")
+        
+        orders = [{
+            'symbol': p['symbol'],
+            'side': 'SELL' if p['side'] == 'LONG' else 'BUY',
+            'quantity': abs(float(p['positionAmt'])),
+            'reduce_only': True
+        } for p in targets]
+        
+        results = await self.place_orders_batch(orders)
+        return {p['symbol']: result for p, result in zip(targets, results)}
+    
     async def close_position(self, symbol: str) -> Optional[Dict]:
         """포지션 청산"""
         try:
@@ -485,7 +955,7 @@ class BinanceAPI:
             
             # 반대 주문으로 청산
             side = 'SELL' if position['side'] == 'LONG' else 'BUY'
-            quantity = position['positionAmt']
+            quantity = abs(position['positionAmt'])
             
             result = await self.place_order(
                 symbol=symbol,
@@ -513,7 +983,11 @@ class BinanceAPI:
             # 레이트 리밋 체크
             await self.rate_limiter.acquire('futures_change_leverage')
             
-            self.client.futures_change_leverage(symbol=symbol, leverage=leverage)
+            await self._request(
+                'POST', '/fapi/v1/leverage',
+                {'symbol': symbol, 'leverage': leverage}, signed=True
+            )
+            self.invalidate_read_cache()
             logger.info(f"레버리지 설정: {symbol} {leverage}x")
             return True
             
@@ -534,7 +1008,10 @@ class BinanceAPI:
             # 레이트 리밋 체크
             await self.rate_limiter.acquire('futures_change_margin_type')
             
-            self.client.futures_change_margin_type(symbol=symbol, marginType=margin_type)
+            await self._request(
+                'POST', '/fapi/v1/marginType',
+                {'symbol': symbol, 'marginType': margin_type}, signed=True
+            )
             logger.info(f"마진 타입 설정: {symbol} {margin_type}")
             return True
             
@@ -550,74 +1027,24 @@ class BinanceAPI:
             return False
     
     async def validate_quantity(self, symbol: str, quantity: float) -> float:
-        """수량 검증 및 포맷팅"""
+        """수량 검증 및 포맷팅 (LOT_SIZE 최소/최대, 스텝 내림)"""
         try:
-            symbol_info = await self.get_symbol_info(symbol)
-            if not symbol_info:
+            spec = await self.get_symbol_spec(symbol)
+            if not spec:
                 return quantity
-            
-            filters = symbol_info.get('filters', {})
-            
-            # LOT_SIZE 필터
-            lot_size = filters.get('LOT_SIZE', {})
-            if lot_size:
-                min_qty = float(lot_size.get('minQty', 0))
-                max_qty = float(lot_size.get('maxQty', float('inf')))
-                step_size = float(lot_size.get('stepSize', 0))
-                
-                # 최소/최대 수량 체크
-                quantity = max(min_qty, min(quantity, max_qty))
-                
-                # 스텝 사이즈 조정
-                if step_size > 0:
-                    decimal_qty = Decimal(str(quantity))
-                    decimal_step = Decimal(str(step_size))
-                    quantity = float(
-                        (decimal_qty / decimal_step).quantize(Decimal('1'), rounding=ROUND_DOWN) * decimal_step
-                    )
-            
-            # 정밀도 적용
-            precision = symbol_info.get('quantityPrecision', 8)
-            quantity = round(quantity, precision)
-            
-            return quantity
+            return spec.quantize_quantity(quantity)
             
         except Exception as e:
             logger.error(f"수량 검증 실패 ({symbol}): {e}")
             return quantity
     
     async def validate_price(self, symbol: str, price: float) -> float:
-        """가격 검증 및 포맷팅"""
+        """가격 검증 및 포맷팅 (PRICE_FILTER 최소/최대, 틱 반올림)"""
         try:
-            symbol_info = await self.get_symbol_info(symbol)
-            if not symbol_info:
+            spec = await self.get_symbol_spec(symbol)
+            if not spec:
                 return price
-            
-            filters = symbol_info.get('filters', {})
-            
-            # PRICE_FILTER
-            price_filter = filters.get('PRICE_FILTER', {})
-            if price_filter:
-                min_price = float(price_filter.get('minPrice', 0))
-                max_price = float(price_filter.get('maxPrice', float('inf')))
-                tick_size = float(price_filter.get('tickSize', 0))
-                
-                # 최소/최대 가격 체크
-                price = max(min_price, min(price, max_price))
-                
-                # 틱 사이즈 조정
-                if tick_size > 0:
-                    decimal_price = Decimal(str(price))
-                    decimal_tick = Decimal(str(tick_size))
-                    price = float(
-                        (decimal_price / decimal_tick).quantize(Decimal('1')) * decimal_tick
-                    )
-            
-            # 정밀도 적용
-            precision = symbol_info.get('pricePrecision', 8)
-            price = round(price, precision)
-            
-            return price
+            return spec.quantize_price(price)
             
         except Exception as e:
             logger.error(f"가격 검증 실패 ({symbol}): {e}")
@@ -631,7 +1058,7 @@ class BinanceAPI:
         """24시간 티커 정보 조회"""
         try:
             await self.rate_limiter.acquire('futures_ticker')
-            ticker = self.client.futures_ticker(symbol=symbol)
+            ticker = await self._request('GET', '/fapi/v1/ticker/24hr', {'symbol': symbol})
             return {
                 'symbol': ticker['symbol'],
                 'priceChange': float(ticker['priceChange']),
@@ -650,7 +1077,9 @@ class BinanceAPI:
         """오더북 조회"""
         try:
             await self.rate_limiter.acquire('futures_order_book')
-            order_book = self.client.futures_order_book(symbol=symbol, limit=limit)
+            order_book = await self._request(
+                'GET', '/fapi/v1/depth', {'symbol': symbol, 'limit': limit}
+            )
             
             return {
                 'bids': [[float(price), float(qty)] for price, qty in order_book['bids']],
@@ -664,6 +1093,7 @@ class BinanceAPI:
     def get_system_stats(self) -> Dict:
         """시스템 통계 반환"""
         usage, limit = self.rate_limiter.get_current_usage()
+        read_total = sum(self.read_stats.values())
         
         return {
             'is_connected': self.is_connected,
@@ -671,10 +1101,21 @@ class BinanceAPI:
             'rate_limit': {
                 'current_usage': usage,
                 'limit': limit,
-                'usage_percent': (usage / limit * 100) if limit > 0 else 0
+                'usage_percent': (usage / limit * 100) if limit > 0 else 0,
+                'orders': {
+                    interval: {'current_usage': used, 'limit': order_limit}
+                    for interval, (used, order_limit) in self.rate_limiter.get_order_usage().items()
+                }
+            },
+            'read_cache': {
+                **self.read_stats,
+                'hit_rate': ((self.read_stats['hits'] + self.read_stats['coalesced']) / read_total * 100
+                             if read_total > 0 else 0),
+                'ttl_seconds': self.read_cache_ttl
             },
+            'telemetry': self.telemetry.snapshot(),
             'cache': {
-                'symbols_cached': len(self.symbol_info_cache),
+                'symbols_cached': len(self.symbol_specs),
                 'last_exchange_info_update': self.exchange_info_last_update.isoformat() if self.exchange_info_last_update else None
             }
         }
@@ -685,7 +1126,7 @@ class BinanceAPI:
         """
         try:
             # API 호출로 포지션 모드 확인
-            result = self.client.futures_get_position_mode()
+            result = await self._request('GET', '/fapi/v1/positionSide/dual', signed=True)
             dual_side_position = result.get('dualSidePosition', False)
             
             mode = 'Hedge' if dual_side_position else 'One-way'
@@ -696,7 +1137,30 @@ class BinanceAPI:
             logger.error(f"포지션 모드 확인 실패: {e}")
             # 기본값은 One-way
             return 'One-way'
-    
+
+    async def create_listen_key(self) -> str:
+        """사용자 데이터 스트림 listenKey 발급 (이미 있으면 같은 키 반환 및 연장)"""
+        await self.rate_limiter.acquire('futures_listen_key')
+        result = await self._request('POST', '/fapi/v1/listenKey')
+        return result['listenKey']
+
+    async def keepalive_listen_key(self) -> None:
+        """listenKey 유효기간 60분 연장
+
+        Raises:
+            BinanceAPIException: 키가 만료된 경우 (-1125)
+        """
+        await self.rate_limiter.acquire('futures_listen_key')
+        await self._request('PUT', '/fapi/v1/listenKey')
+
+    async def close_listen_key(self) -> None:
+        """listenKey 폐기"""
+        try:
+            await self.rate_limiter.acquire('futures_listen_key')
+            await self._request('DELETE', '/fapi/v1/listenKey')
+        except Exception as e:
+            logger.debug(f"listenKey 폐기 실패: {e}")
+
     async def cleanup(self):
         """리소스 정리"""
         try:
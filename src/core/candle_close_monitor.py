@@ -1,144 +1,227 @@
 # src/core/candle_close_monitor.py
 """
-캔들 종가 모니터 - 캔들 완성 즉시 이벤트 발생
+캔들 종가 스케줄러 - 캔들 완성 즉시 이벤트 발생
+거래소 kline 스트림의 완성 플래그(x=true)를 1차 신호로 사용하고,
+스트림이 없거나 늦으면 서버 시간에 맞춘 타이머가 대신 완성 이벤트를 낸다.
+전략은 (심볼, 인터벌) 단위로 구독한다.
 """
 
 import asyncio
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, List, Set, Optional, Callable
-from collections import defaultdict
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from src.core.kline_store import INTERVAL_MS
+from src.core.stream_dispatch import classify_handler
 
 logger = logging.getLogger(__name__)
 
-class CandleCloseMonitor:
-    """15분 캔들 완성을 정확히 감지하는 모니터"""
-    
-    def __init__(self):
+STREAM_SOURCE = 'stream'
+TIMER_SOURCE = 'timer'
+
+
+class CandleCloseScheduler:
+    """(심볼, 인터벌)별 캔들 완성 이벤트 스케줄러
+
+    콜백 시그니처: callback(symbol, interval, candle_time)
+    candle_time 은 완성된 캔들의 종료 시각(= 다음 캔들 시작, 로컬 datetime).
+    """
+
+    def __init__(self, binance_api, price_monitor=None, fallback_delay: float = 3.0):
+        self.binance_api = binance_api
+        self.price_monitor = price_monitor
+        # 스트림이 있으면 경계 후 fallback_delay 초까지 스트림을 기다린 뒤 타이머로 보완
+        self.fallback_delay = fallback_delay if price_monitor else 0.0
+
+        self.callbacks: Dict[Tuple[str, str], List[Tuple[Callable, bool]]] = {}
+        self.last_closed: Dict[Tuple[str, str], int] = {}  # 마지막으로 알린 캔들 종료 시각(ms)
+        self._timer_closed: Dict[str, int] = {}           # 인터벌별 타이머가 처리한 경계
+
         self.is_running = False
-        self.monitored_symbols: Set[str] = set()
-        self.callbacks: Dict[str, List[Callable]] = defaultdict(list)
-        self.last_candle_time: Dict[str, datetime] = {}
-        
-    def add_symbol(self, symbol: str):
-        """모니터링할 심볼 추가"""
-        self.monitored_symbols.add(symbol)
-        logger.info(f"캔들 모니터에 {symbol} 추가됨")
-    
-    def remove_symbol(self, symbol: str):
-        """모니터링 심볼 제거"""
-        self.monitored_symbols.discard(symbol)
-        if symbol in self.last_candle_time:
-            del self.last_candle_time[symbol]
-    
-    def on_candle_close(self, callback: Callable):
-        """캔들 완성 콜백 등록"""
-        self.callbacks['candle_close'].append(callback)
-    
-    async def start(self):
-        """모니터 시작"""
-        self.is_running = True
-        logger.info("캔들 종가 모니터 시작")
-        
-        while self.is_running:
+        self._timer_task: Optional[asyncio.Task] = None
+        self._pending_tasks: Set[asyncio.Task] = set()
+        self._close_event = asyncio.Event()
+
+        self.stats = {
+            'stream_closes': 0,
+            'timer_closes': 0,
+            'duplicates': 0,
+            'last_lag_ms': 0.0,
+            'max_lag_ms': 0.0,
+            'callback_errors': 0,
+        }
+
+        if price_monitor:
+            price_monitor.on('kline_closed', self._on_kline_closed)
+
+    @property
+    def intervals(self) -> Set[str]:
+        return {interval for _, interval in self.callbacks}
+
+    def subscribe(self, symbol: str, interval: str, callback: Callable):
+        """(심볼, 인터벌) 캔들 완성 구독"""
+        if interval not in INTERVAL_MS:
+            raise ValueError(f"지원하지 않는 인터벌: {interval}")
+
+        key = (symbol, interval)
+        is_new = key not in self.callbacks
+        self.callbacks.setdefault(key, []).append(classify_handler(callback))
+
+        if is_new and self.is_running and self.price_monitor:
+            self._spawn(self.price_monitor.watch_kline(symbol, interval))
+        logger.debug(f"캔들 완성 구독: {symbol} {interval}")
+
+    def unsubscribe(self, symbol: str, interval: str, callback: Callable):
+        """구독 해제"""
+        key = (symbol, interval)
+        entries = [entry for entry in self.callbacks.get(key, []) if entry[0] != callback]
+        if entries:
+            self.callbacks[key] = entries
+        else:
+            self.callbacks.pop(key, None)
+            self.last_closed.pop(key, None)
+
+    def server_time_ms(self) -> int:
+        """서버 시간 (로컬 시간 + 서버 시간 오프셋)"""
+        return int(time.time() * 1000) + getattr(self.binance_api, 'time_offset', 0)
+
+    # ---- 완성 신호 ----
+
+    async def _on_kline_closed(self, symbol: str, interval: str, candle_info: Dict):
+        """kline 스트림 완성 캔들 (x=true)"""
+        if (symbol, interval) not in self.callbacks:
+            return
+        open_ms = int(candle_info['time'].timestamp() * 1000)
+        self._emit(symbol, interval, open_ms + INTERVAL_MS[interval], STREAM_SOURCE)
+
+    def _emit(self, symbol: str, interval: str, close_ms: int, source: str) -> bool:
+        """캔들 완성 알림 (같은 캔들은 한 번만)"""
+        key = (symbol, interval)
+        if self.last_closed.get(key, 0) >= close_ms:
+            self.stats['duplicates'] += 1
+            return False
+        self.last_closed[key] = close_ms
+
+        lag_ms = max(0.0, float(self.server_time_ms() - close_ms))
+        self.stats['last_lag_ms'] = lag_ms
+        self.stats['max_lag_ms'] = max(self.stats['max_lag_ms'], lag_ms)
+        self.stats['stream_closes' if source == STREAM_SOURCE else 'timer_closes'] += 1
+
+        candle_time = datetime.fromtimestamp(close_ms / 1000)
+        for callback, is_async in self.callbacks.get(key, ()):
             try:
-                current_time = datetime.now()
-                current_second = current_time.second
-                current_minute = current_time.minute
-                
-                # 15분 캔들이 막 완성된 시점인지 체크 (00, 15, 30, 45분의 0~5초)
-                if current_minute % 15 == 0 and current_second < 5:
-                    candle_time = current_time.replace(second=0, microsecond=0)
-                    
-                    # 각 심볼에 대해 체크
-                    for symbol in self.monitored_symbols.copy():
-                        # 이미 이 캔들을 처리했는지 확인
-                        if symbol not in self.last_candle_time or self.last_candle_time[symbol] < candle_time:
-                            self.last_candle_time[symbol] = candle_time
-                            
-                            # 콜백 실행
-                            await self._trigger_callbacks(symbol, candle_time)
-                    
-                    # 다음 체크까지 대기 (중복 방지)
-                    await asyncio.sleep(10)
+                if is_async:
+                    # 느린 전략이 스트림 수신을 막지 않도록 별도 태스크
+                    self._spawn(callback(symbol, interval, candle_time))
                 else:
-                    # 다음 15분 캔들까지 대기 시간 계산
-                    next_candle_minute = ((current_minute // 15) + 1) * 15
-                    if next_candle_minute >= 60:
-                        next_candle_time = current_time.replace(hour=current_time.hour + 1, minute=0, second=0, microsecond=0)
-                    else:
-                        next_candle_time = current_time.replace(minute=next_candle_minute, second=0, microsecond=0)
-                    
-                    wait_seconds = (next_candle_time - current_time).total_seconds()
-                    
-                    # 최대 60초까지만 대기 (긴 대기 시간 방지)
-                    wait_seconds = min(wait_seconds, 60)
-                    
-                    logger.debug(f"다음 캔들까지 {int(wait_seconds)}초 대기")
-                    await asyncio.sleep(wait_seconds)
-                    
+                    callback(symbol, interval, candle_time)
             except Exception as e:
-                logger.error(f"캔들 모니터 에러: {e}")
-                await asyncio.sleep(1)
-    
-    async def _trigger_callbacks(self, symbol: str, candle_time: datetime):
-        """캔들 완성 콜백 실행"""
-        logger.info(f"📊 {symbol} 15분 캔들 완성: {candle_time.strftime('%H:%M')}")
-        
-        for callback in self.callbacks['candle_close']:
+                self.stats['callback_errors'] += 1
+                logger.error(f"캔들 완성 콜백 에러 ({symbol} {interval}): {e}")
+
+        # 대기 중인 실행 루프 깨우기
+        self._close_event.set()
+        self._close_event = asyncio.Event()
+        return True
+
+    def _spawn(self, coro):
+        task = asyncio.create_task(coro)
+        self._pending_tasks.add(task)
+        task.add_done_callback(self._task_done)
+
+    def _task_done(self, task: asyncio.Task):
+        self._pending_tasks.discard(task)
+        if not task.cancelled() and task.exception():
+            self.stats['callback_errors'] += 1
+            logger.error(f"캔들 완성 콜백 에러: {task.exception()}")
+
+    async def wait_for_close(self, timeout: Optional[float] = None) -> bool:
+        """다음 캔들 완성 이벤트까지 대기 (timeout 이면 False)"""
+        event = self._close_event
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    # ---- 서버 시간 타이머 ----
+
+    def _next_deadline_ms(self, now_ms: int) -> Optional[int]:
+        """가장 가까운 (경계 + 대기) 시각"""
+        delay_ms = int(self.fallback_delay * 1000)
+        deadlines = []
+        for interval in self.intervals:
+            interval_ms = INTERVAL_MS[interval]
+            boundary = (now_ms - delay_ms) // interval_ms * interval_ms
+            if self._timer_closed.get(interval, 0) < boundary:
+                return now_ms  # 아직 처리하지 않은 경계
+            deadlines.append(boundary + interval_ms + delay_ms)
+        return min(deadlines) if deadlines else None
+
+    def _fire_timer(self, now_ms: int):
+        """경계가 지났는데 스트림 완성 신호가 없는 구독을 타이머로 완성 처리"""
+        delay_ms = int(self.fallback_delay * 1000)
+        for interval in self.intervals:
+            interval_ms = INTERVAL_MS[interval]
+            boundary = (now_ms - delay_ms) // interval_ms * interval_ms
+            if self._timer_closed.get(interval, 0) >= boundary:
+                continue
+            first_run = interval not in self._timer_closed
+            self._timer_closed[interval] = boundary
+            if first_run:
+                continue  # 시작 시점 이전 경계는 알리지 않음
+
+            for symbol, key_interval in list(self.callbacks):
+                if key_interval == interval and self.last_closed.get((symbol, interval), 0) < boundary:
+                    if self.price_monitor:
+                        logger.warning(f"캔들 스트림 완성 신호 지연 - 타이머로 처리: {symbol} {interval}")
+                    self._emit(symbol, interval, boundary, TIMER_SOURCE)
+
+    async def _timer_loop(self):
+        while self.is_running:
             try:
-                if asyncio.iscoroutinefunction(callback):
-                    await callback(symbol, candle_time)
-                else:
-                    callback(symbol, candle_time)
+                now_ms = self.server_time_ms()
+                deadline = self._next_deadline_ms(now_ms)
+                if deadline is not None and deadline <= now_ms:
+                    self._fire_timer(now_ms)
+                    continue
+                # 새 구독 / 서버 시간 오프셋 변경을 반영하도록 최대 60초 단위로 재계산
+                wait = 60.0 if deadline is None else (deadline - now_ms) / 1000
+                await asyncio.sleep(min(max(wait, 0.001), 60.0))
+            except asyncio.CancelledError:
+                break
             except Exception as e:
-                logger.error(f"캔들 완성 콜백 에러: {e}")
-    
+                logger.error(f"캔들 스케줄러 타이머 에러: {e}")
+                await asyncio.sleep(1)
+
+    async def start(self):
+        """스케줄러 시작 (스트림 구독 + 타이머 태스크)"""
+        self.is_running = True
+        if self.price_monitor:
+            for symbol, interval in list(self.callbacks):
+                await self.price_monitor.watch_kline(symbol, interval)
+        self._timer_task = asyncio.create_task(self._timer_loop())
+        logger.info(f"캔들 종가 스케줄러 시작: {len(self.callbacks)}개 구독 "
+                    f"({'스트림 + 서버 시간 타이머' if self.price_monitor else '서버 시간 타이머'})")
+
     async def stop(self):
-        """모니터 중지"""
+        """스케줄러 중지"""
         self.is_running = False
-        logger.info("캔들 종가 모니터 중지됨")
-    
-    def get_next_candle_time(self, timeframe_minutes: int = 15) -> datetime:
-        """다음 캔들 시간 계산"""
-        current_time = datetime.now()
-        current_minute = current_time.minute
-        
-        # 다음 timeframe 분 계산
-        next_candle_minute = ((current_minute // timeframe_minutes) + 1) * timeframe_minutes
-        
-        if next_candle_minute >= 60:
-            # 다음 시간으로 넘어가는 경우
-            next_candle_time = current_time.replace(
-                hour=(current_time.hour + 1) % 24,
-                minute=0,
-                second=0,
-                microsecond=0
-            )
-            # 날짜가 바뀔 수 있음
-            if current_time.hour == 23:
-                next_candle_time = next_candle_time + timedelta(days=1)
-        else:
-            next_candle_time = current_time.replace(
-                minute=next_candle_minute,
-                second=0,
-                microsecond=0
-            )
-        
-        return next_candle_time
-    
-    def is_candle_complete(self, candle_time: datetime, timeframe_minutes: int = 15) -> bool:
-        """특정 시간의 캔들이 완성되었는지 확인"""
-        current_time = datetime.now()
-        
-        # 캔들 시간을 timeframe에 맞춰 정규화
-        candle_minute = (candle_time.minute // timeframe_minutes) * timeframe_minutes
-        normalized_candle_time = candle_time.replace(
-            minute=candle_minute,
-            second=0,
-            microsecond=0
-        )
-        
-        # 현재 시간이 캔들 종료 시간보다 크면 완성
-        candle_end_time = normalized_candle_time + timedelta(minutes=timeframe_minutes)
-        return current_time >= candle_end_time
+        tasks = list(self._pending_tasks)
+        if self._timer_task:
+            tasks.append(self._timer_task)
+            self._timer_task = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self.price_monitor:
+            self.price_monitor.off('kline_closed', self._on_kline_closed)
+        logger.info("캔들 종가 스케줄러 중지됨")
+
+    def get_stats(self) -> Dict:
+        return {
+            'subscriptions': len(self.callbacks),
+            'intervals': sorted(self.intervals),
+            **self.stats
+        }
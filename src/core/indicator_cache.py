@@ -0,0 +1,119 @@
+# src/core/indicator_cache.py
+"""
+공유 지표 캐시
+여러 전략 / 분석기가 같은 (심볼, 인터벌) 캔들로 같은 지표를 요청하면 캔들당 한 번만 계산한다.
+
+- 키: (심볼, 인터벌, indicator_key(이름, 파라미터), 캔들 구간, 마지막 캔들)
+  캔들 구간은 (첫 캔들 시간, 캔들 수), 마지막 캔들은 (시간, 입력 컬럼 값) -
+  진행 중 캔들 값이 바뀌거나 조회 길이(limit)가 다르면 별도 항목
+- 결과는 읽기 전용 배열 (여러 출력은 읽기 전용 매핑) 로 모든 요청자가 공유
+- LRU 방식으로 max_entries 개까지 보관
+"""
+
+import logging
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.core import indicators
+
+logger = logging.getLogger(__name__)
+
+
+class IndicatorCache:
+    """(심볼, 인터벌, 지표, 파라미터, 캔들) 키 LRU 지표 캐시"""
+
+    def __init__(self, max_entries: int = 1024):
+        if max_entries < 1:
+            raise ValueError(f"max_entries 는 1 이상이어야 함: {max_entries}")
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[Hashable, Any]' = OrderedDict()
+
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0,
+            'uncached': 0,  # 캔들 시간을 알 수 없어 캐시 없이 계산
+        }
+
+    def get(self, symbol: str, interval: str, name: str, candles: pd.DataFrame, **params):
+        """캐시된 지표 반환 (없으면 계산 후 저장)
+
+        Args:
+            candles: DatetimeIndex 캔들 DataFrame (BaseStrategy.get_klines 결과)
+            params: 지표 파라미터 (indicators.INDICATORS 기본값으로 채움)
+
+        Returns:
+            읽기 전용 배열 또는 {컬럼명: 읽기 전용 배열} 매핑
+        """
+        name_key, param_key = indicators.indicator_key(name, **params)
+        bars = self._bars_key(candles, indicators.INDICATORS[name].inputs)
+        if bars is None:
+            self.stats['uncached'] += 1
+            return indicators.compute(name, candles, **params)
+
+        key = (symbol, interval, name_key, param_key, bars)
+        result = self._entries.get(key)
+        if result is not None:
+            self._entries.move_to_end(key)
+            self.stats['hits'] += 1
+            return result
+
+        self.stats['misses'] += 1
+        result = _freeze(indicators.compute(name, candles, **params))
+        self._entries[key] = result
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats['evictions'] += 1
+        return result
+
+    @staticmethod
+    def _bars_key(candles: pd.DataFrame, inputs: Tuple[str, ...]) -> Optional[Tuple]:
+        """캔들 구간 / 마지막 캔들 식별자 (DatetimeIndex 가 아니면 None)"""
+        index = candles.index
+        if not isinstance(index, pd.DatetimeIndex) or len(index) == 0:
+            return None
+        times = index.asi8
+        last_values = tuple(float(candles[column].to_numpy()[-1]) for column in inputs)
+        return int(times[0]), len(times), int(times[-1]), last_values
+
+    def clear(self):
+        """전체 항목 삭제 (통계 유지)"""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict:
+        """캐시 통계"""
+        requests = self.stats['hits'] + self.stats['misses']
+        return {
+            **self.stats,
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'hit_rate': self.stats['hits'] / requests if requests else 0.0,
+        }
+
+
+def _freeze(result):
+    """계산 결과를 읽기 전용으로 (요청자가 수정해도 캐시 값은 그대로)"""
+    if isinstance(result, dict):
+        return MappingProxyType({column: _freeze(values) for column, values in result.items()})
+    result = np.asarray(result)
+    result.flags.writeable = False
+    return result
+
+
+# 전역 인스턴스
+_indicator_cache: Optional[IndicatorCache] = None
+
+
+def get_indicator_cache(max_entries: int = 1024) -> IndicatorCache:
+    """싱글톤 지표 캐시 반환"""
+    global _indicator_cache
+    if _indicator_cache is None:
+        _indicator_cache = IndicatorCache(max_entries)
+    return _indicator_cache
@@ -0,0 +1,256 @@
+# src/core/indicators.py
+"""
+통합 지표 라이브러리
+실전 전략 / 백테스터가 같은 계산 경로를 쓰도록 지표마다 구현을 하나만 둔다.
+
+- 입력 / 출력: float64 numpy 배열 (Series 를 넘겨도 값만 사용, 여러 출력은 {컬럼명: 배열})
+- Wilder 계열(RSI / ATR / ADX)은 pandas_ta 기본값과 같은 초기값 / 평활 (단순 이동평균 버전 없음)
+- 재귀 평활은 pandas ewm(adjust=False), 이동 창 연산은 pandas rolling / 합성곱 (모두 C 구현),
+  이동 최댓값 / 최솟값은 van Herk / Gil-Werman 블록 분해 (rolling_extrema)
+- 레지스트리: INDICATORS[이름] 에 입력 컬럼 / 기본 파라미터를 등록하고
+  indicator_key(이름, 파라미터) 로 (이름, 정렬된 파라미터) 키를 만든다
+"""
+
+from typing import Any, Callable, Dict, Mapping, NamedTuple, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from src.core.moving_averages import hma_array, wma_array, zlhma_array
+from src.core.rolling_extrema import rolling_max_array, rolling_min_array
+
+ArrayLike = Union[np.ndarray, pd.Series, Sequence[float]]
+IndicatorResult = Union[np.ndarray, Dict[str, np.ndarray]]
+IndicatorKey = Tuple[str, Tuple[Tuple[str, Any], ...]]
+
+
+class IndicatorSpec(NamedTuple):
+    """등록된 지표"""
+    name: str
+    func: Callable[..., IndicatorResult]
+    inputs: Tuple[str, ...]       # 캔들 컬럼 (예: ('high', 'low', 'close'))
+    defaults: Dict[str, Any]      # 기본 파라미터
+
+
+INDICATORS: Dict[str, IndicatorSpec] = {}
+
+
+def register(name: str, inputs: Tuple[str, ...], **defaults):
+    """지표 등록 데코레이터"""
+    def decorator(func):
+        if name in INDICATORS:
+            raise ValueError(f"이미 등록된 지표: {name}")
+        INDICATORS[name] = IndicatorSpec(name, func, inputs, defaults)
+        return func
+    return decorator
+
+
+def indicator_key(name: str, **params) -> IndicatorKey:
+    """(이름, 기본값을 채운 정렬 파라미터) - 같은 계산이면 같은 키"""
+    spec = _spec(name)
+    unknown = set(params) - set(spec.defaults)
+    if unknown:
+        raise ValueError(f"{name} 에 없는 파라미터: {sorted(unknown)}")
+    merged = {**spec.defaults, **params}
+    return name, tuple(sorted(merged.items()))
+
+
+def compute(name: str, candles: Mapping[str, ArrayLike], **params) -> IndicatorResult:
+    """캔들(DataFrame 또는 {컬럼: 배열})에서 등록된 지표 계산"""
+    spec = _spec(name)
+    _, key_params = indicator_key(name, **params)
+    return spec.func(*(candles[column] for column in spec.inputs), **dict(key_params))
+
+
+def _spec(name: str) -> IndicatorSpec:
+    spec = INDICATORS.get(name)
+    if spec is None:
+        raise KeyError(f"등록되지 않은 지표: {name}")
+    return spec
+
+
+def _f64(values: ArrayLike) -> np.ndarray:
+    return np.asarray(values, dtype=np.float64)
+
+
+def _ewm(values: np.ndarray, alpha: float) -> np.ndarray:
+    """adjust=False 지수 평활 (앞쪽 NaN 은 건너뛰고 첫 유효값부터 시작)"""
+    return pd.Series(values).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+
+
+def _presma(values: np.ndarray, length: int) -> np.ndarray:
+    """length 번째 값을 앞 length 개(NaN 제외) 평균으로 바꾸고 그 앞은 NaN (pandas_ta presma)"""
+    seeded = values.copy()
+    if len(seeded) >= length:
+        seeded[length - 1] = np.nanmean(seeded[:length])
+    seeded[:length - 1] = np.nan
+    return seeded
+
+
+# ---- 이동평균 ----
+
+@register('sma', ('close',), length=20)
+def sma(close: ArrayLike, length: int = 20) -> np.ndarray:
+    """단순 이동평균"""
+    return pd.Series(_f64(close)).rolling(length).mean().to_numpy()
+
+
+@register('volume_ma', ('volume',), length=20)
+def volume_ma(volume: ArrayLike, length: int = 20) -> np.ndarray:
+    """거래량 단순 이동평균"""
+    return sma(volume, length)
+
+
+@register('ema', ('close',), length=20, presma=False)
+def ema(close: ArrayLike, length: int = 20, presma: bool = False) -> np.ndarray:
+    """지수 이동평균 (span=length)
+
+    presma=False: 첫 값부터 평활 (ewm(span, adjust=False) - 전략 기본)
+    presma=True: length 번째 값을 SMA 로 시작 (pandas_ta.ema 기본값)
+    """
+    values = _f64(close)
+    if presma:
+        values = _presma(values, length)
+    return _ewm(values, 2.0 / (length + 1))
+
+
+@register('rma', ('close',), length=14)
+def rma(close: ArrayLike, length: int = 14) -> np.ndarray:
+    """Wilder 이동평균 (alpha = 1 / length)"""
+    return _ewm(_f64(close), 1.0 / length)
+
+
+@register('wma', ('close',), length=20)
+def wma(close: ArrayLike, length: int = 20) -> np.ndarray:
+    """선형 가중 이동평균"""
+    return wma_array(_f64(close), length)
+
+
+@register('hma', ('close',), length=20)
+def hma(close: ArrayLike, length: int = 20) -> np.ndarray:
+    """Hull 이동평균"""
+    return hma_array(_f64(close), length)
+
+
+@register('zlhma', ('close',), length=14)
+def zlhma(close: ArrayLike, length: int = 14) -> np.ndarray:
+    """Zero Lag Hull 이동평균"""
+    return zlhma_array(_f64(close), length)
+
+
+@register('zlema', ('close',), length=12)
+def zlema(close: ArrayLike, length: int = 12) -> np.ndarray:
+    """Zero Lag EMA: 2 * EMA - EMA(EMA)"""
+    ema1 = ema(close, length)
+    return 2 * ema1 - ema(ema1, length)
+
+
+# ---- 모멘텀 ----
+
+@register('macd', ('close',), fast=12, slow=26, signal=9)
+def macd(close: ArrayLike, fast: int = 12, slow: int = 26, signal: int = 9) -> Dict[str, np.ndarray]:
+    """MACD (EMA 차이 / 시그널 EMA / 히스토그램)"""
+    line = ema(close, fast) - ema(close, slow)
+    signal_line = ema(line, signal)
+    return {'macd': line, 'macd_signal': signal_line, 'macd_hist': line - signal_line}
+
+
+@register('zlmacd', ('close',), fast=12, slow=26, signal=9)
+def zlmacd(close: ArrayLike, fast: int = 12, slow: int = 26, signal: int = 9) -> Dict[str, np.ndarray]:
+    """Zero Lag MACD (ZLEMA 차이 / 시그널 EMA / 히스토그램)"""
+    line = zlema(close, fast) - zlema(close, slow)
+    signal_line = ema(line, signal)
+    return {'zlmacd': line, 'zlmacd_signal': signal_line, 'zlmacd_hist': line - signal_line}
+
+
+@register('rsi', ('close',), length=14)
+def rsi(close: ArrayLike, length: int = 14) -> np.ndarray:
+    """Wilder RSI (pandas_ta.rsi 기본값 - 상승 / 하락폭 rma)"""
+    delta = np.diff(_f64(close), prepend=np.nan)
+    gain = np.where(delta > 0, delta, 0.0)
+    loss = np.where(delta < 0, -delta, 0.0)
+    gain[:1] = loss[:1] = np.nan
+    gain, loss = rma(gain, length), rma(loss, length)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return 100.0 * gain / (gain + loss)
+
+
+# ---- 변동성 ----
+
+@register('true_range', ('high', 'low', 'close'), prenan=False)
+def true_range(high: ArrayLike, low: ArrayLike, close: ArrayLike, prenan: bool = False) -> np.ndarray:
+    """True Range (첫 캔들은 고가 - 저가, prenan=True 면 NaN)"""
+    high, low, close = _f64(high), _f64(low), _f64(close)
+    prev_close = np.concatenate(([np.nan], close[:-1]))
+    ranges = np.vstack([high - low, np.abs(high - prev_close), np.abs(prev_close - low)])
+    tr = np.nanmax(ranges, axis=0)
+    if prenan and len(tr):
+        tr[0] = np.nan
+    return tr
+
+
+@register('atr', ('high', 'low', 'close'), length=14, prenan=False)
+def atr(high: ArrayLike, low: ArrayLike, close: ArrayLike, length: int = 14,
+        prenan: bool = False) -> np.ndarray:
+    """Wilder ATR (pandas_ta.atr 기본값 - 앞 length 개 TR 평균으로 시작)"""
+    tr = true_range(high, low, close, prenan=prenan)
+    return rma(_presma(tr, length), length)
+
+
+@register('adx', ('high', 'low', 'close'), length=14)
+def adx(high: ArrayLike, low: ArrayLike, close: ArrayLike, length: int = 14) -> Dict[str, np.ndarray]:
+    """Wilder ADX / +DI / -DI (pandas_ta.adx 기본값)"""
+    high, low = _f64(high), _f64(low)
+    atr_ = atr(high, low, close, length, prenan=True)
+    up = np.diff(high, prepend=np.nan)
+    dn = -np.diff(low, prepend=np.nan)
+    pos = np.where((up > dn) & (up > 0), up, 0.0)
+    neg = np.where((dn > up) & (dn > 0), dn, 0.0)
+    pos[:1] = neg[:1] = np.nan
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        plus_di = 100.0 * rma(pos, length) / atr_
+        minus_di = 100.0 * rma(neg, length) / atr_
+        dx = 100.0 * np.abs(plus_di - minus_di) / (plus_di + minus_di)
+    return {'adx': rma(dx, length), 'plus_di': plus_di, 'minus_di': minus_di}
+
+
+@register('bbands', ('close',), length=20, std=2.0)
+def bbands(close: ArrayLike, length: int = 20, std: float = 2.0) -> Dict[str, np.ndarray]:
+    """볼린저 밴드 (표본 표준편차)"""
+    series = pd.Series(_f64(close))
+    middle = series.rolling(length).mean().to_numpy()
+    deviation = series.rolling(length).std().to_numpy() * std
+    return {'bb_upper': middle + deviation, 'bb_middle': middle, 'bb_lower': middle - deviation}
+
+
+# ---- 채널 ----
+
+@register('donchian', ('high', 'low'), length=20)
+def donchian(high: ArrayLike, low: ArrayLike, length: int = 20) -> Dict[str, np.ndarray]:
+    """Donchian 채널 (length 기간 최고가 / 최저가 / 중간값)"""
+    upper = rolling_max_array(high, length)
+    lower = rolling_min_array(low, length)
+    return {'dc_upper': upper, 'dc_middle': (upper + lower) / 2, 'dc_lower': lower}
+
+
+def _shift(values: np.ndarray, periods: int) -> np.ndarray:
+    """periods 만큼 뒤로 밀기 (앞쪽 NaN)"""
+    shifted = np.full(values.shape, np.nan)
+    if periods < len(values):
+        shifted[periods:] = values[:len(values) - periods]
+    return shifted
+
+
+@register('ichimoku', ('high', 'low'), tenkan=9, kijun=26, senkou_b=52, shift=26)
+def ichimoku(high: ArrayLike, low: ArrayLike, tenkan: int = 9, kijun: int = 26, senkou_b: int = 52,
+             shift: int = 26) -> Dict[str, np.ndarray]:
+    """일목균형표 전환선 / 기준선 / 선행스팬 A, B (선행스팬은 shift 만큼 앞으로 - 현재 캔들에 보이는 구름)"""
+    tenkan_sen = donchian(high, low, tenkan)['dc_middle']
+    kijun_sen = donchian(high, low, kijun)['dc_middle']
+    return {
+        'tenkan_sen': tenkan_sen,
+        'kijun_sen': kijun_sen,
+        'senkou_span_a': _shift((tenkan_sen + kijun_sen) / 2, shift),
+        'senkou_span_b': _shift(donchian(high, low, senkou_b)['dc_middle'], shift),
+    }
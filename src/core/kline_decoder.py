@@ -0,0 +1,91 @@
+# src/core/kline_decoder.py
+"""
+캔들 응답 디코더
+REST 응답 텍스트(또는 ccxt OHLCV 리스트)를 float64 OHLCV 배열과 int64 open time 배열로 바로 변환한다.
+DataFrame 은 호출자가 필요할 때만 to_frame 으로 만든다.
+"""
+
+from typing import List, NamedTuple, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+OHLCV_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+
+# JSON 구분 문자 제거용 변환 테이블 ('[', ']', '"' -> 삭제)
+_STRIP_JSON = str.maketrans('', '', '[]"')
+
+
+class KlineArrays(NamedTuple):
+    """디코딩된 캔들"""
+    open_time: np.ndarray  # int64 (ms)
+    ohlcv: np.ndarray      # float64 (n, 5)
+
+    def __len__(self) -> int:
+        return len(self.open_time)
+
+
+def empty_klines() -> KlineArrays:
+    return KlineArrays(np.empty(0, dtype=np.int64), np.empty((0, len(OHLCV_COLUMNS)), dtype=np.float64))
+
+
+def _from_matrix(matrix: np.ndarray) -> KlineArrays:
+    """(n, k>=6) float64 행렬 -> KlineArrays (열 순서: open time, O, H, L, C, V, ...)"""
+    # open time(ms)은 2^53 미만이므로 float64 경유 변환이 정확함
+    open_time = matrix[:, 0].astype(np.int64)
+    ohlcv = np.ascontiguousarray(matrix[:, 1:6])
+    return KlineArrays(open_time, ohlcv)
+
+
+def decode_klines(payload: Union[str, bytes, Sequence[Sequence]]) -> KlineArrays:
+    """캔들 응답 디코딩
+
+    Args:
+        payload: /fapi/v1/klines 응답 텍스트, 또는 이미 파싱된 행 목록
+            (거래소 원본 12열 문자열 행, ccxt fetch_ohlcv 6열 숫자 행 모두 가능)
+    """
+    if isinstance(payload, (str, bytes)):
+        text = payload.decode() if isinstance(payload, bytes) else payload
+        n_rows = text.count('[') - 1  # 바깥 대괄호 제외
+        if n_rows <= 0:
+            return empty_klines()
+        # 구분 문자만 제거하고 C 파서로 숫자를 한 번에 읽음 (행/원소별 파이썬 객체 없음)
+        values = np.fromstring(text.translate(_STRIP_JSON), dtype=np.float64, sep=',')
+        return _from_matrix(values.reshape(n_rows, -1))
+
+    if len(payload) == 0:
+        return empty_klines()
+    return _from_matrix(np.asarray(payload, dtype=np.float64))
+
+
+def dedupe_sorted(klines: KlineArrays) -> KlineArrays:
+    """open time 기준 정렬 및 중복 제거 (페이지 단위 수집 결과 병합용)"""
+    open_time, index = np.unique(klines.open_time, return_index=True)
+    return KlineArrays(open_time, klines.ohlcv[index])
+
+
+def to_frame(klines: KlineArrays, index_name: str = 'datetime',
+             include_timestamp: bool = True) -> pd.DataFrame:
+    """KlineArrays -> DataFrame
+
+    배열 메모리를 공유하지 않도록 연속 메모리 복사 1회로 만든다 (파이썬 객체 변환 없음).
+
+    Args:
+        index_name: DatetimeIndex 이름
+        include_timestamp: open time(ms) 을 timestamp 열로 포함할지 여부
+    """
+    df = pd.DataFrame(np.array(klines.ohlcv), columns=OHLCV_COLUMNS)
+    if include_timestamp:
+        df['timestamp'] = np.array(klines.open_time)
+    df.index = pd.DatetimeIndex(pd.to_datetime(klines.open_time, unit='ms'), name=index_name)
+    return df
+
+
+def concat_klines(chunks: List[KlineArrays]) -> KlineArrays:
+    """여러 페이지 결합"""
+    if not chunks:
+        return empty_klines()
+    return KlineArrays(
+        np.concatenate([chunk.open_time for chunk in chunks]),
+        np.concatenate([chunk.ohlcv for chunk in chunks])
+    )
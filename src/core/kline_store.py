@@ -0,0 +1,281 @@
+# src/core/kline_store.py
+"""
+공유 캔들 저장소
+(symbol, interval) 별 고정 용량 numpy 링 버퍼에 캔들을 유지하고
+WebSocket 완성 캔들(x=true)로 증분 갱신한다. REST 는 초기 히스토리와 누락 구간 보충에만 사용.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Dict, NamedTuple, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.core.kline_decoder import OHLCV_COLUMNS, KlineArrays, to_frame
+
+logger = logging.getLogger(__name__)
+
+# 인터벌별 캔들 길이 (ms)
+INTERVAL_MS = {
+    '1m': 60_000,
+    '3m': 180_000,
+    '5m': 300_000,
+    '15m': 900_000,
+    '30m': 1_800_000,
+    '1h': 3_600_000,
+    '2h': 7_200_000,
+    '4h': 14_400_000,
+    '6h': 21_600_000,
+    '8h': 28_800_000,
+    '12h': 43_200_000,
+    '1d': 86_400_000,
+    '3d': 259_200_000,
+    '1w': 604_800_000,
+}
+
+
+class KlineView(NamedTuple):
+    """링 버퍼의 읽기 전용 뷰 (복사 없음)
+
+    다음 캔들이 기록되기 전까지만 유효하므로 보관이 필요하면 복사해서 사용
+    """
+    open_time: np.ndarray  # int64 (ms)
+    ohlcv: np.ndarray      # float64 (n, 5)
+
+
+class KlineRingBuffer:
+    """고정 용량 캔들 링 버퍼
+
+    각 슬롯을 배열 앞/뒤 절반에 두 번 기록하므로 최근 N개 캔들이 항상
+    연속된 구간이 되어 복사 없이 슬라이스 뷰로 읽을 수 있다.
+    완성 캔들 뒤에 진행 중인 캔들 1개를 함께 보관한다 (REST 응답과 동일한 형태).
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._size = capacity + 1  # 진행 중 캔들 슬롯 포함
+        self._times = np.zeros(2 * self._size, dtype=np.int64)
+        self._values = np.zeros((2 * self._size, len(OHLCV_COLUMNS)), dtype=np.float64)
+        self._next = 0  # 다음 완성 캔들(= 진행 중 캔들) 슬롯
+        self.count = 0  # 보관 중인 완성 캔들 수
+        self.has_forming = False
+
+    def _write(self, slot: int, open_time: int, values):
+        self._times[slot] = open_time
+        self._times[slot + self._size] = open_time
+        self._values[slot] = values
+        self._values[slot + self._size] = values
+
+    def append_closed(self, open_time: int, values):
+        """완성 캔들 추가"""
+        self._write(self._next, open_time, values)
+        self._next = (self._next + 1) % self._size
+        self.count = min(self.count + 1, self.capacity)
+        self.has_forming = False
+
+    def set_forming(self, open_time: int, values):
+        """진행 중 캔들 갱신"""
+        self._write(self._next, open_time, values)
+        self.has_forming = True
+
+    @property
+    def last_closed_time(self) -> Optional[int]:
+        """마지막 완성 캔들 open time (ms)"""
+        if self.count == 0:
+            return None
+        return int(self._times[(self._next - 1) % self._size])
+
+    def view(self, limit: Optional[int] = None, include_forming: bool = True) -> KlineView:
+        """최근 캔들 뷰 (limit 은 진행 중 캔들 포함 행 수)"""
+        forming = 1 if include_forming and self.has_forming else 0
+        n_closed = self.count if limit is None else max(0, min(self.count, limit - forming))
+
+        end = self._next + self._size  # 완성 캔들 구간 끝 (뒤쪽 절반 기준)
+        start = end - n_closed
+        stop = end + forming
+
+        times = self._times[start:stop]
+        values = self._values[start:stop]
+        times.flags.writeable = False
+        values.flags.writeable = False
+        return KlineView(times, values)
+
+    def __len__(self) -> int:
+        return self.count + (1 if self.has_forming else 0)
+
+
+class KlineStore:
+    """(symbol, interval) 별 공유 캔들 저장소
+
+    BinanceAPI.get_klines 와 같은 형태의 DataFrame 을 반환하므로 전략에서 그대로 대체 가능.
+    """
+
+    def __init__(self, binance_api, capacity: int = 1500):
+        self.binance_api = binance_api
+        self.capacity = capacity
+        self.price_monitor = None
+
+        self.buffers: Dict[Tuple[str, str], KlineRingBuffer] = {}
+        self._locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+        self._requested: Dict[Tuple[str, str], int] = {}  # 백필 요청한 최대 행 수
+        self._dirty: set = set()  # 스트림 누락이 감지된 키
+
+        self.stats = {
+            'reads': 0,
+            'full_backfills': 0,
+            'gap_backfills': 0,
+            'stream_updates': 0,
+            'stream_gaps': 0,
+        }
+
+    def attach(self, price_monitor):
+        """RealtimePriceMonitor 연결 - 완성 캔들을 저장소로 전달받음"""
+        self.price_monitor = price_monitor
+        price_monitor.kline_store = self
+
+    # ---- WebSocket 갱신 ----
+
+    def on_kline(self, symbol: str, interval: str, kline: Dict):
+        """WebSocket kline 메시지 반영 (RealtimePriceMonitor._handle_kline 에서 호출)"""
+        key = (symbol, interval)
+        buffer = self.buffers.get(key)
+        if buffer is None or key in self._dirty:
+            return
+
+        interval_ms = INTERVAL_MS[interval]
+        open_time = int(kline['t'])
+        values = (float(kline['o']), float(kline['h']), float(kline['l']),
+                  float(kline['c']), float(kline['v']))
+        last = buffer.last_closed_time
+
+        if last is not None and open_time <= last:
+            return  # 이미 반영된 캔들
+
+        if last is not None and open_time > last + interval_ms:
+            # 연결 끊김 등으로 캔들 누락 - 다음 조회 시 REST 로 보충
+            self._dirty.add(key)
+            self.stats['stream_gaps'] += 1
+            logger.warning(f"캔들 스트림 누락 감지: {symbol} {interval}")
+            return
+
+        if kline['x']:
+            buffer.append_closed(open_time, values)
+            # 다음 캔들 첫 메시지 전까지 종가로 채운 진행 중 캔들 유지
+            close = values[3]
+            buffer.set_forming(open_time + interval_ms, (close, close, close, close, 0.0))
+            self.stats['stream_updates'] += 1
+        else:
+            buffer.set_forming(open_time, values)
+
+    # ---- 조회 ----
+
+    async def get_klines(self, symbol: str, interval: str, limit: int = 500) -> pd.DataFrame:
+        """캔들 DataFrame 조회 (BinanceAPI.get_klines 와 동일한 컬럼/인덱스)"""
+        if interval not in INTERVAL_MS:
+            return await self.binance_api.get_klines(symbol, interval, limit)
+
+        buffer = await self.ensure(symbol, interval, limit)
+        if buffer is None or len(buffer) == 0:
+            return pd.DataFrame()
+
+        self.stats['reads'] += 1
+        # 전략이 DataFrame 을 캔들 간에 보관하므로 링 버퍼와 메모리를 공유하지 않는 복사본
+        return to_frame(buffer.view(limit))
+
+    def view(self, symbol: str, interval: str, limit: Optional[int] = None,
+             include_forming: bool = True) -> Optional[KlineView]:
+        """복사 없는 numpy 뷰 조회 (백필 없이 보관 중인 데이터만)"""
+        buffer = self.buffers.get((symbol, interval))
+        if buffer is None:
+            return None
+        return buffer.view(limit, include_forming)
+
+    async def ensure(self, symbol: str, interval: str, limit: int) -> Optional[KlineRingBuffer]:
+        """limit 행 이상의 최신 데이터 확보 (필요 시 REST 백필)"""
+        key = (symbol, interval)
+        lock = self._locks.setdefault(key, asyncio.Lock())
+
+        async with lock:
+            limit = min(limit, self.capacity)
+            buffer = self.buffers.get(key)
+
+            if buffer is None or self._requested.get(key, 0) < limit:
+                await self._full_backfill(symbol, interval, limit)
+            elif key in self._dirty or self._missing_bars(buffer, interval, self._time_offset()) > 0:
+                await self._gap_backfill(symbol, interval)
+
+            return self.buffers.get(key)
+
+    @staticmethod
+    def _missing_bars(buffer: KlineRingBuffer, interval: str, offset_ms: int = 0) -> int:
+        """현재 시각(서버 시간 보정) 기준 아직 반영되지 않은 완성 캔들 수"""
+        interval_ms = INTERVAL_MS[interval]
+        last = buffer.last_closed_time
+        if last is None:
+            return 0
+        now_ms = int(time.time() * 1000) + offset_ms
+        expected_last = (now_ms // interval_ms - 1) * interval_ms
+        return max(0, (expected_last - last) // interval_ms)
+
+    def _time_offset(self) -> int:
+        """서버 시간 - 로컬 시간 (ms)"""
+        return getattr(self.binance_api, 'time_offset', 0)
+
+    async def _full_backfill(self, symbol: str, interval: str, limit: int):
+        """전체 히스토리 REST 로드"""
+        key = (symbol, interval)
+        klines = await self.binance_api.get_kline_arrays(symbol, interval, limit)
+        if len(klines) == 0:
+            return
+
+        buffer = KlineRingBuffer(self.capacity)
+        self._load_klines(buffer, interval, klines)
+        self.buffers[key] = buffer
+        self._requested[key] = limit
+        self._dirty.discard(key)
+        self.stats['full_backfills'] += 1
+
+        if self.price_monitor:
+            await self.price_monitor.watch_kline(symbol, interval)
+
+    async def _gap_backfill(self, symbol: str, interval: str):
+        """마지막 완성 캔들 이후 구간만 REST 로 보충"""
+        key = (symbol, interval)
+        buffer = self.buffers[key]
+        interval_ms = INTERVAL_MS[interval]
+        start_time = buffer.last_closed_time + interval_ms
+
+        missing = self._missing_bars(buffer, interval, self._time_offset())
+        if missing + 1 > 1500:
+            await self._full_backfill(symbol, interval, self._requested.get(key, self.capacity))
+            return
+
+        klines = await self.binance_api.get_kline_arrays(
+            symbol, interval, limit=missing + 1, start_time=start_time
+        )
+        if len(klines) == 0:
+            return
+
+        self._load_klines(buffer, interval, klines)
+        self._dirty.discard(key)
+        self.stats['gap_backfills'] += 1
+        logger.debug(f"캔들 누락 구간 보충: {symbol} {interval} {len(klines)}개")
+
+    def _load_klines(self, buffer: KlineRingBuffer, interval: str, klines: KlineArrays):
+        """REST 캔들 반영 - 종료 시각이 지나지 않은 캔들은 진행 중 캔들"""
+        now_ms = int(time.time() * 1000) + self._time_offset()
+        interval_ms = INTERVAL_MS[interval]
+        for open_time, values in zip(klines.open_time.tolist(), klines.ohlcv):
+            if open_time + interval_ms <= now_ms:
+                buffer.append_closed(open_time, values)
+            else:
+                buffer.set_forming(open_time, values)
+
+    def get_stats(self) -> Dict:
+        """저장소 통계"""
+        return {
+            'series': len(self.buffers),
+            **self.stats
+        }
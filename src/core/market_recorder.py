@@ -0,0 +1,344 @@
+# src/core/market_recorder.py
+"""
+실시간 시세 기록기
+RealtimePriceMonitor 가 받은 kline / aggTrade / markPrice 메시지를 고정 길이 바이너리 레코드로
+심볼/일(UTC)별 세그먼트 파일에 추가 기록한다. 실거래와 백테스트 결과가 다를 때 봇이 실제로
+받은 입력을 그대로 재생하기 위한 용도.
+
+- 수신 루프는 메시지를 메모리 큐에 넣기만 하고, 인코딩/디스크 쓰기는 백그라운드 스레드에서 처리
+- 날짜가 바뀌어 닫힌 세그먼트는 gzip 으로 압축
+- 일별 디렉토리의 index.json 에 심볼별 세그먼트 파일 / 레코드 수 / 시간 범위 기록
+
+레이아웃: {root_dir}/{YYYYMMDD}/{SYMBOL}.bin[.gz], {root_dir}/{YYYYMMDD}/index.json
+"""
+
+import asyncio
+import gzip
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.core.kline_store import INTERVAL_MS
+
+logger = logging.getLogger(__name__)
+
+# 레코드 종류 (스트림 종류 이름 -> 코드)
+RECORD_KINDS = {
+    'kline': 1,
+    'aggTrade': 2,
+    'markPrice': 3,
+}
+KIND_NAMES = {code: kind for kind, code in RECORD_KINDS.items()}
+
+INTERVAL_CODES = {interval: code for code, interval in enumerate(INTERVAL_MS, 1)}
+INTERVAL_NAMES = {code: interval for interval, code in INTERVAL_CODES.items()}
+
+# flags 비트
+FLAG_CLOSED = 1         # kline 완성 (x)
+FLAG_BUYER_MAKER = 2    # aggTrade 매수자 메이커 (m)
+
+# 고정 길이 72바이트 레코드 (리틀 엔디언)
+# values - kline: O, H, L, C, V / aggTrade: 가격, 수량, 집계 체결 ID / markPrice: 마크, 지수, 펀딩비
+# ref_time - kline: open time / aggTrade: 체결 시각 / markPrice: 다음 펀딩 시각
+RECORD_DTYPE = np.dtype([
+    ('kind', 'u1'),
+    ('flags', 'u1'),
+    ('interval', 'u1'),
+    ('_pad', 'V5'),
+    ('recv_time', '<i8'),
+    ('event_time', '<i8'),
+    ('ref_time', '<i8'),
+    ('values', '<f8', (5,)),
+])
+
+DAY_MS = 86_400_000
+INDEX_FILE = 'index.json'
+
+
+def day_name(day: int) -> str:
+    """UTC 일 번호 (epoch ms // DAY_MS) -> YYYYMMDD"""
+    return datetime.fromtimestamp(day * 86400, tz=timezone.utc).strftime('%Y%m%d')
+
+
+def encode_message(kind: str, recv_time: int, data: Dict) -> Tuple[str, tuple]:
+    """스트림 메시지 -> (심볼, 레코드 튜플)"""
+    if kind == 'kline':
+        k = data['k']
+        return k['s'], (
+            RECORD_KINDS['kline'], FLAG_CLOSED if k['x'] else 0, INTERVAL_CODES.get(k['i'], 0), b'',
+            recv_time, int(data.get('E', k['t'])), int(k['t']),
+            (float(k['o']), float(k['h']), float(k['l']), float(k['c']), float(k['v']))
+        )
+    if kind == 'aggTrade':
+        return data['s'], (
+            RECORD_KINDS['aggTrade'], FLAG_BUYER_MAKER if data.get('m') else 0, 0, b'',
+            recv_time, int(data.get('E', data['T'])), int(data['T']),
+            (float(data['p']), float(data['q']), float(data.get('a', 0)), 0.0, 0.0)
+        )
+    if kind == 'markPrice':
+        return data['s'], (
+            RECORD_KINDS['markPrice'], 0, 0, b'',
+            recv_time, int(data.get('E', recv_time)), int(data.get('T', 0)),
+            (float(data['p']), float(data.get('i', 0)), float(data.get('r', 0)), 0.0, 0.0)
+        )
+    raise ValueError(f"기록하지 않는 스트림 종류: {kind}")
+
+
+def decode_record(symbol: str, record) -> Tuple[str, Dict]:
+    """레코드 -> (스트림 종류, 스트림 메시지 data) - 재생용"""
+    kind = KIND_NAMES[int(record['kind'])]
+    flags = int(record['flags'])
+    values = record['values']
+    event_time = int(record['event_time'])
+    ref_time = int(record['ref_time'])
+
+    if kind == 'kline':
+        interval = INTERVAL_NAMES[int(record['interval'])]
+        return kind, {'e': 'kline', 'E': event_time, 's': symbol, 'k': {
+            't': ref_time, 'T': ref_time + INTERVAL_MS[interval] - 1, 's': symbol, 'i': interval,
+            'o': str(values[0]), 'h': str(values[1]), 'l': str(values[2]),
+            'c': str(values[3]), 'v': str(values[4]), 'x': bool(flags & FLAG_CLOSED)
+        }}
+    if kind == 'aggTrade':
+        return kind, {'e': 'aggTrade', 'E': event_time, 's': symbol, 'a': int(values[2]),
+                      'p': str(values[0]), 'q': str(values[1]), 'T': ref_time,
+                      'm': bool(flags & FLAG_BUYER_MAKER)}
+    return kind, {'e': 'markPriceUpdate', 'E': event_time, 's': symbol,
+                  'p': str(values[0]), 'i': str(values[1]), 'r': str(values[2]), 'T': ref_time}
+
+
+def read_segment(path: str) -> np.ndarray:
+    """세그먼트 파일 읽기 (.bin / .bin.gz)"""
+    opener = gzip.open if path.endswith('.gz') else open
+    with opener(path, 'rb') as f:
+        payload = f.read()
+    usable = len(payload) - len(payload) % RECORD_DTYPE.itemsize  # 기록 중 잘린 마지막 레코드 제외
+    return np.frombuffer(payload[:usable], dtype=RECORD_DTYPE)
+
+
+def segment_path(root_dir: str, day: str, symbol: str) -> Optional[str]:
+    """일/심볼 세그먼트 파일 경로 (압축 여부 무관, 없으면 None)"""
+    base = os.path.join(root_dir, day, f"{symbol}.bin")
+    for path in (base, base + '.gz'):
+        if os.path.exists(path):
+            return path
+    return None
+
+
+class _Segment:
+    """열려 있는 세그먼트 (기록 스레드 전용)"""
+
+    __slots__ = ('day', 'symbol', 'path', 'file', 'records')
+
+    def __init__(self, day: str, symbol: str, path: str):
+        self.day = day
+        self.symbol = symbol
+        self.path = path
+        self.file = open(path, 'ab')
+        self.records = self.file.tell() // RECORD_DTYPE.itemsize
+
+
+class MarketRecorder:
+    """시세 메시지 바이너리 기록기"""
+
+    def __init__(self, root_dir: str = "data/recordings", flush_interval: float = 1.0,
+                 compress: bool = True, max_pending: int = 200_000):
+        self.root_dir = root_dir
+        self.flush_interval = flush_interval
+        self.compress = compress
+        self.max_pending = max_pending  # 디스크가 밀릴 때 메모리 상한 (초과분은 버림)
+
+        self._pending: List[tuple] = []
+        self._segments: Dict[str, _Segment] = {}
+        self._index: Dict[str, Dict[str, Dict]] = {}
+        self._io_lock = threading.Lock()
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+        self.is_running = False
+
+        self.stats = {
+            'recorded': 0,
+            'dropped': 0,
+            'written': 0,
+            'bytes_written': 0,
+            'flushes': 0,
+            'segments_closed': 0,
+            'write_errors': 0,
+        }
+
+    def record(self, kind: str, data: Dict):
+        """메시지 기록 (동기 - 큐에 넣기만 함)"""
+        if len(self._pending) >= self.max_pending:
+            self.stats['dropped'] += 1
+            return
+        self._pending.append((kind, int(time.time() * 1000), data))
+        self.stats['recorded'] += 1
+
+    async def start(self):
+        """기록 시작 - 이전 날짜의 닫히지 않은 세그먼트 압축 후 주기적 기록"""
+        os.makedirs(self.root_dir, exist_ok=True)
+        self.is_running = True
+        if self.compress:
+            await asyncio.to_thread(self._compress_stale_segments)
+        self._flush_task = asyncio.create_task(self._flush_loop())
+        logger.info(f"시세 기록기 시작: {self.root_dir}")
+
+    async def _flush_loop(self):
+        while self.is_running:
+            try:
+                await asyncio.sleep(self.flush_interval)
+                await self.flush()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                self.stats['write_errors'] += 1
+                logger.error(f"시세 기록 오류: {e}")
+
+    async def flush(self):
+        """대기 중인 메시지를 세그먼트에 기록"""
+        async with self._flush_lock:
+            if not self._pending:
+                return
+            batch, self._pending = self._pending, []
+            await asyncio.to_thread(self._write_batch, batch)
+            self.stats['flushes'] += 1
+
+    async def stop(self):
+        """남은 메시지 기록 후 세그먼트 닫기 (당일 세그먼트는 압축하지 않음 - 재시작 시 이어 씀)"""
+        self.is_running = False
+        if self._flush_task:
+            self._flush_task.cancel()
+            await asyncio.gather(self._flush_task, return_exceptions=True)
+            self._flush_task = None
+        await self.flush()
+        await asyncio.to_thread(self._close_all)
+        logger.info(f"시세 기록기 중지 ({self.stats['written']}건 기록)")
+
+    # ---- 기록 스레드 ----
+
+    def _write_batch(self, batch: List[tuple]):
+        """메시지 인코딩 -> 심볼/일별 세그먼트에 추가"""
+        by_symbol: Dict[str, List[tuple]] = {}
+        for kind, recv_time, data in batch:
+            try:
+                symbol, record = encode_message(kind, recv_time, data)
+            except (KeyError, TypeError, ValueError) as e:
+                self.stats['write_errors'] += 1
+                logger.debug(f"기록할 수 없는 메시지 ({kind}): {e}")
+                continue
+            by_symbol.setdefault(symbol, []).append(record)
+
+        touched_days = set()
+        with self._io_lock:
+            for symbol, records in by_symbol.items():
+                array = np.array(records, dtype=RECORD_DTYPE)
+                days = array['recv_time'] // DAY_MS
+                # 수신 시각은 단조 증가하므로 날짜별 연속 구간으로 나뉜다
+                for day in np.unique(days):
+                    chunk = array[days == day]
+                    name = day_name(int(day))
+                    segment = self._segment_for(symbol, name)
+                    segment.file.write(chunk.tobytes())
+                    segment.file.flush()
+                    segment.records += len(chunk)
+                    self._update_index(segment, int(chunk['recv_time'][0]), int(chunk['recv_time'][-1]))
+                    touched_days.add(name)
+                    self.stats['written'] += len(chunk)
+                    self.stats['bytes_written'] += chunk.nbytes
+
+            for name in touched_days:
+                self._save_index(name)
+
+    def _segment_for(self, symbol: str, day: str) -> _Segment:
+        """심볼의 해당 일 세그먼트 (날짜가 바뀌면 이전 세그먼트 닫고 압축)"""
+        segment = self._segments.get(symbol)
+        if segment is not None and segment.day == day:
+            return segment
+        if segment is not None:
+            self._close_segment(segment, compress=self.compress)
+
+        day_dir = os.path.join(self.root_dir, day)
+        os.makedirs(day_dir, exist_ok=True)
+        segment = _Segment(day, symbol, os.path.join(day_dir, f"{symbol}.bin"))
+        self._segments[symbol] = segment
+        return segment
+
+    def _close_segment(self, segment: _Segment, compress: bool):
+        segment.file.close()
+        self._segments.pop(segment.symbol, None)
+        if compress:
+            self._compress_file(segment.day, segment.symbol, segment.path)
+        self.stats['segments_closed'] += 1
+
+    def _close_all(self):
+        with self._io_lock:
+            for segment in list(self._segments.values()):
+                self._close_segment(segment, compress=False)
+
+    def _compress_file(self, day: str, symbol: str, path: str):
+        """닫힌 세그먼트 gzip 압축 후 원본 삭제"""
+        with open(path, 'rb') as src, gzip.open(path + '.gz', 'wb', compresslevel=6) as dst:
+            shutil.copyfileobj(src, dst)
+        os.remove(path)
+
+        entry = self._load_index(day).setdefault(symbol, {})
+        entry['file'] = os.path.basename(path) + '.gz'
+        entry['compressed'] = True
+        self._save_index(day)
+        logger.debug(f"시세 세그먼트 압축: {day}/{symbol}")
+
+    def _compress_stale_segments(self):
+        """오늘 이전 날짜의 .bin 세그먼트 압축 (비정상 종료 / 날짜 변경 중 중지)"""
+        today = day_name(int(time.time() * 1000) // DAY_MS)
+        with self._io_lock:
+            for day in sorted(os.listdir(self.root_dir)):
+                day_dir = os.path.join(self.root_dir, day)
+                if day >= today or not os.path.isdir(day_dir):
+                    continue
+                for file_name in os.listdir(day_dir):
+                    if file_name.endswith('.bin'):
+                        self._compress_file(day, file_name[:-len('.bin')], os.path.join(day_dir, file_name))
+
+    # ---- 인덱스 ----
+
+    def _load_index(self, day: str) -> Dict[str, Dict]:
+        index = self._index.get(day)
+        if index is None:
+            path = os.path.join(self.root_dir, day, INDEX_FILE)
+            index = {}
+            if os.path.exists(path):
+                with open(path, encoding='utf-8') as f:
+                    index = json.load(f)
+            self._index[day] = index
+        return index
+
+    def _update_index(self, segment: _Segment, first_time: int, last_time: int):
+        entry = self._load_index(segment.day).setdefault(segment.symbol, {})
+        entry['file'] = os.path.basename(segment.path)
+        entry['compressed'] = False
+        entry['records'] = segment.records
+        entry['record_size'] = RECORD_DTYPE.itemsize
+        entry.setdefault('first_recv_time', first_time)
+        entry['last_recv_time'] = last_time
+
+    def _save_index(self, day: str):
+        """원자적 교체로 인덱스 저장"""
+        path = os.path.join(self.root_dir, day, INDEX_FILE)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._index.get(day, {}), f, indent=2, sort_keys=True)
+        os.replace(tmp_path, path)
+
+    def get_stats(self) -> Dict:
+        return {
+            'pending': len(self._pending),
+            'open_segments': len(self._segments),
+            **self.stats
+        }
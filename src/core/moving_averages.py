@@ -0,0 +1,68 @@
+# src/core/moving_averages.py
+"""
+가중 이동평균 계열 벡터 연산
+rolling(period).apply(lambda ...) 처럼 캔들마다 파이썬 함수를 부르지 않고
+np.convolve 한 번으로 전체 구간을 계산한다 (O(n * period), 파이썬 콜백 없음).
+
+- 누적합 항등식(WMA = (C2_t - C2_{t-n}) - (t-n)(C1_t - C1_{t-n}))은 O(n) 이지만 긴 시계열에서
+  누적합이 커져 자릿수 손실이 생기므로, 윈도우별 내적과 같은 값을 내는 합성곱을 사용한다.
+- NaN 이 포함된 윈도우는 NaN (rolling 의 min_periods=period 와 동일 - HMA 준비 구간도 그대로 전파)
+"""
+
+from typing import Union
+
+import numpy as np
+import pandas as pd
+
+ArrayLike = Union[pd.Series, np.ndarray]
+
+
+def _wrap(result: np.ndarray, like: ArrayLike) -> ArrayLike:
+    if isinstance(like, pd.Series):
+        return pd.Series(result, index=like.index)
+    return result
+
+
+def wma_array(values: np.ndarray, period: int) -> np.ndarray:
+    """선형 가중 이동평균 (최근 값 가중치 period) - 앞쪽 period - 1 개는 NaN"""
+    if period < 1:
+        raise ValueError(f"WMA 기간은 1 이상이어야 합니다: {period}")
+    values = np.asarray(values, dtype=np.float64)
+    result = np.full(values.shape, np.nan)
+    if len(values) < period:
+        return result
+    weights = np.arange(1, period + 1, dtype=np.float64)
+    # convolve 는 커널을 뒤집어 적용하므로 역순 가중치 = 윈도우 끝(최근 값)에 가중치 period
+    result[period - 1:] = np.convolve(values, weights[::-1], mode='valid') / weights.sum()
+    return result
+
+
+def hma_array(values: np.ndarray, period: int) -> np.ndarray:
+    """Hull 이동평균: WMA(2 * WMA(n/2) - WMA(n), sqrt(n))"""
+    raw = 2 * wma_array(values, int(period / 2)) - wma_array(values, period)
+    return wma_array(raw, int(np.sqrt(period)))
+
+
+def zlhma_array(values: np.ndarray, period: int) -> np.ndarray:
+    """Zero Lag HMA: HMA + (HMA - HMA[lag]), lag = (n - 1) / 2"""
+    hma = hma_array(values, period)
+    lag = int((period - 1) / 2)
+    shifted = np.full(hma.shape, np.nan)
+    if lag < len(hma):
+        shifted[lag:] = hma[:len(hma) - lag]
+    return hma + (hma - shifted)
+
+
+def wma(values: ArrayLike, period: int) -> ArrayLike:
+    """WMA (Series 면 같은 인덱스의 Series 반환)"""
+    return _wrap(wma_array(np.asarray(values, dtype=np.float64), period), values)
+
+
+def hma(values: ArrayLike, period: int) -> ArrayLike:
+    """HMA (Series 면 같은 인덱스의 Series 반환)"""
+    return _wrap(hma_array(np.asarray(values, dtype=np.float64), period), values)
+
+
+def zlhma(values: ArrayLike, period: int) -> ArrayLike:
+    """ZLHMA (Series 면 같은 인덱스의 Series 반환)"""
+    return _wrap(zlhma_array(np.asarray(values, dtype=np.float64), period), values)
@@ -308,7 +308,8 @@ class MultiAccountManager:
                 master_api = BinanceAPI(
                     api_key=self.master_account.api_key,
                     secret_key=self.master_account.api_secret,
-                    testnet=self.config_manager.config.get('system', {}).get('mode') == 'testnet'
+                    testnet=self.config_manager.config.get('system', {}).get('mode') == 'testnet',
+                    account_name='MASTER'
                 )
                 
                 if await master_api.initialize():
@@ -324,7 +325,8 @@ class MultiAccountManager:
                     api_client = BinanceAPI(
                         api_key=account.api_key,
                         secret_key=account.api_secret,
-                        testnet=self.config_manager.config.get('system', {}).get('mode') == 'testnet'
+                        testnet=self.config_manager.config.get('system', {}).get('mode') == 'testnet',
+                        account_name=account_id
                     )
                     
                     if await api_client.initialize():
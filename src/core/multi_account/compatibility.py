@@ -261,12 +261,12 @@ class UnifiedBinanceAPI:
                 api_client = self.multi_manager.api_clients.get(account_id)
                 return await api_client.get_account_balance() if api_client else 0.0
             else:
-                # 전체 계좌 잔고 합계
-                total_balance = 0.0
-                for api_client in self.multi_manager.api_clients.values():
-                    balance = await api_client.get_account_balance()
-                    total_balance += balance
-                return total_balance
+                # 전체 계좌 잔고 합계 (계좌별 요청을 동시에 실행)
+                balances = await asyncio.gather(
+                    *(api_client.get_account_balance()
+                      for api_client in self.multi_manager.api_clients.values())
+                )
+                return float(sum(balances))
         else:
             return await self.single_api.get_account_balance()
     
@@ -315,10 +315,13 @@ class UnifiedBinanceAPI:
     async def get_positions(self) -> Optional[List[Dict]]:
         """거래소 포지션 조회"""
         if self.is_multi_mode:
-            # 모든 계좌의 포지션 병합
+            # 모든 계좌의 포지션 병합 (계좌별 요청을 동시에 실행)
+            results = await asyncio.gather(
+                *(api_client.get_positions()
+                  for api_client in self.multi_manager.api_clients.values())
+            )
             all_positions = []
-            for api_client in self.multi_manager.api_clients.values():
-                positions = await api_client.get_positions()
+            for positions in results:
                 if positions:
                     all_positions.extend(positions)
             return all_positions
@@ -332,7 +335,15 @@ class UnifiedBinanceAPI:
             # 필요시 모든 계좌 정보를 병합할 수 있음
             api_client = self.multi_manager.api_clients.get('MASTER')
             if api_client:
-                master_info = await api_client.get_account_info()
+                # 마스터/서브 계좌 정보를 동시에 조회
+                sub_apis = [
+                    sub_api for account_id, sub_api in self.multi_manager.api_clients.items()
+                    if account_id != 'MASTER'
+                ]
+                master_info, *sub_infos = await asyncio.gather(
+                    api_client.get_account_info(),
+                    *(sub_api.get_account_info() for sub_api in sub_apis)
+                )
                 
                 # 서브 계좌들의 잔고를 합산 (옵션)
                 if master_info:
@@ -340,12 +351,10 @@ class UnifiedBinanceAPI:
                     total_unrealized = float(master_info.get('totalUnrealizedProfit', 0))
                     
                     # 서브 계좌 정보 추가
-                    for account_id, sub_api in self.multi_manager.api_clients.items():
-                        if account_id != 'MASTER':
-                            sub_info = await sub_api.get_account_info()
-                            if sub_info:
-                                total_balance += float(sub_info.get('totalWalletBalance', 0))
-                                total_unrealized += float(sub_info.get('totalUnrealizedProfit', 0))
+                    for sub_info in sub_infos:
+                        if sub_info:
+                            total_balance += float(sub_info.get('totalWalletBalance', 0))
+                            total_unrealized += float(sub_info.get('totalUnrealizedProfit', 0))
                     
                     # 병합된 정보 반환
                     master_info['totalWalletBalance'] = str(total_balance)
@@ -12,6 +12,7 @@ from datetime import datetime
 from src.strategies.base_strategy import BaseStrategy
 from src.strategies.strategy_factory import get_strategy_factory
 from src.core.position_manager import PositionManager
+from src.core.api_telemetry import api_caller
 from src.core.binance_api import BinanceAPI
 
 logger = logging.getLogger(__name__)
@@ -31,6 +32,7 @@ class MultiAccountStrategyExecutor:
         # 실행 태스크
         self.execution_tasks = []
         self.running = False
+        self.candle_scheduler = None
         
         logger.info("MultiAccountStrategyExecutor 초기화")
     
@@ -114,13 +116,22 @@ class MultiAccountStrategyExecutor:
         except Exception as e:
             logger.error(f"전략 설정 적용 실패: {e}")
     
-    async def start_execution(self) -> None:
-        """전략 실행 시작"""
+    async def start_execution(self, candle_scheduler=None) -> None:
+        """전략 실행 시작
+        
+        Args:
+            candle_scheduler: 캔들 완성 스케줄러 (있으면 완성 이벤트 시 즉시 실행)
+        """
         if not self.account_strategies:
             logger.warning("실행할 전략이 없습니다")
             return
         
         self.running = True
+        self.candle_scheduler = candle_scheduler
+        if candle_scheduler:
+            for strategy in self.account_strategies.values():
+                if hasattr(strategy, 'bind_candle_scheduler'):
+                    strategy.bind_candle_scheduler(candle_scheduler)
         logger.info(f"{len(self.account_strategies)}개 계좌 전략 실행 시작")
         
         # 각 계좌별 실행 태스크 생성
@@ -149,13 +160,17 @@ class MultiAccountStrategyExecutor:
                 
                 # 전략 실행
                 if hasattr(strategy, 'run_cycle'):
-                    await strategy.run_cycle()
+                    with api_caller(strategy.name, account_id):
+                        await strategy.run_cycle()
                 else:
                     logger.warning(f"[{account_id}] run_cycle 메서드가 없습니다")
                 
                 # 대기 (전략별 주기에 맞춤)
                 interval = getattr(strategy, 'check_interval', 60)
-                await asyncio.sleep(interval)
+                if self.candle_scheduler:
+                    await self.candle_scheduler.wait_for_close(timeout=interval)
+                else:
+                    await asyncio.sleep(interval)
                 
             except Exception as e:
                 logger.error(f"[{account_id}] 전략 실행 오류: {e}")
@@ -0,0 +1,340 @@
+# src/core/order_book.py
+"""
+로컬 오더북
+@depth@100ms 차분 스트림 + REST 스냅샷으로 심볼별 호가를 유지한다 (REST 호출은 동기화 시에만).
+
+바이낸스 선물 동기화 절차:
+1. 차분 스트림 구독 후 이벤트 버퍼링
+2. REST 스냅샷 (lastUpdateId) 조회
+3. u < lastUpdateId 인 이벤트 폐기, 첫 이벤트는 U <= lastUpdateId <= u
+4. 이후 이벤트의 pu 가 직전 이벤트의 u 와 다르면 누락 - 스냅샷부터 재동기화
+"""
+
+import asyncio
+import logging
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# 스냅샷 조회 깊이 (거래소 최대 1000)
+DEFAULT_SNAPSHOT_LIMIT = 1000
+# 동기화 대기 중 버퍼링할 최대 이벤트 수 (넘으면 오래된 것부터 폐기)
+MAX_BUFFERED_EVENTS = 1000
+
+
+class SlippageEstimate(NamedTuple):
+    """시장가 주문 예상 체결 결과"""
+    avg_price: float       # 평균 체결가
+    slippage_bps: float    # 최우선 호가 대비 불리한 정도 (bp)
+    filled_qty: float      # 호가 잔량 내 체결 가능 수량
+    levels: int            # 소진한 호가 단계 수
+
+
+class BookSide:
+    """한쪽 호가 - 최우선 호가가 앞에 오도록 정렬한 가격 / 잔량 배열
+
+    매수 호가는 가격을 음수로 바꿔 저장해 양쪽 모두 오름차순 이진 탐색으로 갱신한다 (O(log n) 탐색).
+    """
+
+    __slots__ = ('descending', '_keys', '_qtys')
+
+    def __init__(self, descending: bool):
+        self.descending = descending
+        self._keys: List[float] = []
+        self._qtys: List[float] = []
+
+    def _key(self, price: float) -> float:
+        return -price if self.descending else price
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def clear(self):
+        self._keys.clear()
+        self._qtys.clear()
+
+    def load(self, levels: Iterable[Sequence]):
+        """스냅샷 전체 교체"""
+        pairs = sorted((self._key(float(price)), float(qty)) for price, qty in levels if float(qty) > 0)
+        self._keys = [key for key, _ in pairs]
+        self._qtys = [qty for _, qty in pairs]
+
+    def update(self, price: float, qty: float):
+        """호가 단계 갱신 (잔량 0 이면 삭제)"""
+        key = self._key(price)
+        keys = self._keys
+        i = bisect_left(keys, key)
+        found = i < len(keys) and keys[i] == key
+        if qty > 0:
+            if found:
+                self._qtys[i] = qty
+            else:
+                keys.insert(i, key)
+                self._qtys.insert(i, qty)
+        elif found:
+            del keys[i]
+            del self._qtys[i]
+
+    def best(self) -> Optional[float]:
+        if not self._keys:
+            return None
+        return -self._keys[0] if self.descending else self._keys[0]
+
+    def levels(self, limit: Optional[int] = None) -> List[List[float]]:
+        """[[가격, 잔량], ...] 최우선 호가부터"""
+        keys = self._keys[:limit] if limit else self._keys
+        sign = -1.0 if self.descending else 1.0
+        return [[sign * key, qty] for key, qty in zip(keys, self._qtys)]
+
+    def depth_to(self, limit_price: float) -> tuple:
+        """최우선 호가부터 limit_price 까지(포함)의 (수량, 명목가치)"""
+        end = bisect_right(self._keys, self._key(limit_price))
+        sign = -1.0 if self.descending else 1.0
+        qty = notional = 0.0
+        for key, level_qty in zip(self._keys[:end], self._qtys[:end]):
+            qty += level_qty
+            notional += sign * key * level_qty
+        return qty, notional
+
+    def walk(self, quantity: float) -> tuple:
+        """최우선 호가부터 quantity 만큼 소진 - (체결 수량, 명목가치, 단계 수)"""
+        sign = -1.0 if self.descending else 1.0
+        filled = notional = 0.0
+        levels = 0
+        for key, level_qty in zip(self._keys, self._qtys):
+            take = min(level_qty, quantity - filled)
+            filled += take
+            notional += sign * key * take
+            levels += 1
+            if filled >= quantity:
+                break
+        return filled, notional, levels
+
+
+class LocalOrderBook:
+    """심볼 하나의 로컬 오더북"""
+
+    def __init__(self, symbol: str):
+        self.symbol = symbol
+        self.bids = BookSide(descending=True)
+        self.asks = BookSide(descending=False)
+        self.last_update_id: Optional[int] = None
+        self.event_time: Optional[int] = None
+        self.synced = False
+        self._bridged = False  # 스냅샷 이후 첫 이벤트 반영 여부
+
+    def reset(self):
+        self.bids.clear()
+        self.asks.clear()
+        self.last_update_id = None
+        self.synced = False
+        self._bridged = False
+
+    def sync(self, snapshot: Dict, buffered: Sequence[Dict]) -> bool:
+        """스냅샷 적용 후 버퍼링된 차분 이벤트 반영
+
+        Returns:
+            동기화 성공 여부 (버퍼 첫 이벤트가 스냅샷보다 뒤에서 시작하면 실패 - 스냅샷 재조회 필요)
+        """
+        self.bids.load(snapshot['bids'])
+        self.asks.load(snapshot['asks'])
+        self.last_update_id = int(snapshot['lastUpdateId'])
+        self._bridged = False
+        self.synced = True
+        for event in buffered:
+            if not self.apply_diff(event):
+                return False
+        return True
+
+    def apply_diff(self, event: Dict) -> bool:
+        """차분 이벤트 반영
+
+        스냅샷 직후 첫 이벤트는 U <= lastUpdateId <= u, 이후는 pu == 직전 u 여야 한다.
+        어긋나면 누락으로 보고 False (동기화 해제 - 스냅샷부터 다시).
+        """
+        if not self.synced:
+            return False
+        if not self._bridged:
+            if event['u'] < self.last_update_id:
+                return True  # 스냅샷에 이미 포함
+            valid = event['U'] <= self.last_update_id
+        else:
+            valid = event.get('pu') == self.last_update_id
+        if not valid:
+            logger.warning(f"오더북 시퀀스 누락: {self.symbol} (U={event['U']}, pu={event.get('pu')}, "
+                           f"직전 u={self.last_update_id})")
+            self.reset()
+            return False
+        self._apply(event)
+        self._bridged = True
+        return True
+
+    def _apply(self, event: Dict):
+        for price, qty in event['b']:
+            self.bids.update(float(price), float(qty))
+        for price, qty in event['a']:
+            self.asks.update(float(price), float(qty))
+        self.last_update_id = event['u']
+        self.event_time = event.get('E')
+
+    # ---- 조회 ----
+
+    @property
+    def best_bid(self) -> Optional[float]:
+        return self.bids.best()
+
+    @property
+    def best_ask(self) -> Optional[float]:
+        return self.asks.best()
+
+    @property
+    def mid_price(self) -> Optional[float]:
+        bid, ask = self.best_bid, self.best_ask
+        if bid is None or ask is None:
+            return None
+        return (bid + ask) / 2
+
+    @property
+    def spread_bps(self) -> Optional[float]:
+        mid = self.mid_price
+        if not mid:
+            return None
+        return (self.best_ask - self.best_bid) / mid * 10000
+
+    def depth_within(self, bps: float) -> Dict[str, float]:
+        """중간가 ± bps 이내 호가 잔량 / 명목가치"""
+        mid = self.mid_price
+        if mid is None:
+            return {'bid_qty': 0.0, 'bid_notional': 0.0, 'ask_qty': 0.0, 'ask_notional': 0.0}
+        bid_qty, bid_notional = self.bids.depth_to(mid * (1 - bps / 10000))
+        ask_qty, ask_notional = self.asks.depth_to(mid * (1 + bps / 10000))
+        return {'bid_qty': bid_qty, 'bid_notional': bid_notional,
+                'ask_qty': ask_qty, 'ask_notional': ask_notional}
+
+    def estimate_slippage(self, side: str, quantity: float) -> Optional[SlippageEstimate]:
+        """시장가 주문 예상 평균 체결가 / 슬리피지
+
+        Args:
+            side: 'BUY' (매도 호가 소진) 또는 'SELL' (매수 호가 소진)
+            quantity: 주문 수량 (코인)
+        """
+        book_side = self.asks if side.upper() == 'BUY' else self.bids
+        best = book_side.best()
+        if best is None or quantity <= 0:
+            return None
+        filled, notional, levels = book_side.walk(quantity)
+        avg_price = notional / filled
+        slippage = (avg_price - best) / best if book_side is self.asks else (best - avg_price) / best
+        return SlippageEstimate(avg_price, slippage * 10000, filled, levels)
+
+    def snapshot(self, limit: int = 20) -> Dict:
+        """BinanceAPI.get_order_book 과 같은 형태"""
+        return {
+            'bids': self.bids.levels(limit),
+            'asks': self.asks.levels(limit),
+            'lastUpdateId': self.last_update_id,
+        }
+
+
+class OrderBookManager:
+    """심볼별 로컬 오더북 - RealtimePriceMonitor 의 depth_update 이벤트로 갱신"""
+
+    def __init__(self, binance_api, price_monitor, snapshot_limit: int = DEFAULT_SNAPSHOT_LIMIT,
+                 resync_delay: float = 1.0):
+        self.binance_api = binance_api
+        self.price_monitor = price_monitor
+        self.snapshot_limit = snapshot_limit
+        self.resync_delay = resync_delay
+
+        self.books: Dict[str, LocalOrderBook] = {}
+        self._buffers: Dict[str, List[Dict]] = {}   # 동기화 대기 중 차분 이벤트
+        self._sync_tasks: Dict[str, asyncio.Task] = {}
+
+        self.stats = {
+            'updates': 0,
+            'snapshots': 0,
+            'resyncs': 0,
+            'dropped': 0,
+        }
+
+        price_monitor.on('depth_update', self._on_depth_update)
+
+    async def track(self, symbols: Iterable[str]):
+        """심볼 오더북 유지 시작 (차분 스트림 구독 - 첫 이벤트 도착 시 스냅샷 동기화)"""
+        for symbol in symbols:
+            if symbol not in self.books:
+                self.books[symbol] = LocalOrderBook(symbol)
+                self._buffers[symbol] = []
+            await self.price_monitor.watch_depth(symbol)
+
+    async def untrack(self, symbols: Iterable[str]):
+        for symbol in symbols:
+            self.books.pop(symbol, None)
+            self._buffers.pop(symbol, None)
+            task = self._sync_tasks.pop(symbol, None)
+            if task:
+                task.cancel()
+            await self.price_monitor.unwatch_depth(symbol)
+
+    def get_book(self, symbol: str) -> Optional[LocalOrderBook]:
+        """동기화된 오더북만 반환"""
+        book = self.books.get(symbol)
+        return book if book is not None and book.synced else None
+
+    def _on_depth_update(self, symbol: str, event: Dict):
+        book = self.books.get(symbol)
+        if book is None:
+            return
+        self.stats['updates'] += 1
+
+        if book.synced:
+            if book.apply_diff(event):
+                return
+            self.stats['resyncs'] += 1
+
+        buffer = self._buffers[symbol]
+        buffer.append(event)
+        if len(buffer) > MAX_BUFFERED_EVENTS:
+            del buffer[0]
+            self.stats['dropped'] += 1
+        if symbol not in self._sync_tasks:
+            self._sync_tasks[symbol] = asyncio.create_task(self._sync(symbol))
+
+    async def _sync(self, symbol: str):
+        """스냅샷 조회 후 버퍼 반영 (스냅샷이 버퍼보다 오래되면 재조회)"""
+        try:
+            while symbol in self.books:
+                snapshot = await self.binance_api.get_order_book(symbol, limit=self.snapshot_limit)
+                if snapshot is None:
+                    await asyncio.sleep(self.resync_delay)
+                    continue
+                self.stats['snapshots'] += 1
+
+                buffer = self._buffers.get(symbol, [])
+                book = self.books.get(symbol)
+                if book is None:
+                    return
+                if book.sync(snapshot, buffer):
+                    buffer.clear()
+                    logger.info(f"오더북 동기화: {symbol} (lastUpdateId={book.last_update_id})")
+                    return
+                await asyncio.sleep(self.resync_delay)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"오더북 동기화 실패 ({symbol}): {e}")
+        finally:
+            self._sync_tasks.pop(symbol, None)
+
+    async def stop(self):
+        for task in list(self._sync_tasks.values()):
+            task.cancel()
+        self._sync_tasks.clear()
+
+    def get_stats(self) -> Dict:
+        return {
+            **self.stats,
+            'books': len(self.books),
+            'synced': sum(1 for book in self.books.values() if book.synced),
+        }
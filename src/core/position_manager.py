@@ -1,8 +1,9 @@
 # src/core/position_manager.py
 import json
 import os
+import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass, asdict
 import hashlib
 import asyncio
@@ -230,7 +231,9 @@ class PositionManager:
                 'auto_sync_interval': sync_config.get('auto_sync_interval', 60),  # config.yaml 값 사용
                 'max_position_age_days': 30,
                 'enable_auto_cleanup': True,
-                'batch_operation_size': 50
+                'batch_operation_size': 50,
+                'pending_order_ttl': sync_config.get('pending_order_ttl', 30),  # 전략 주문 대기 최대 시간(초)
+                'exit_fill_timeout': sync_config.get('exit_fill_timeout', 2.0)  # 청산 체결가 대기(초)
             }
         else:
             # 기본값 (60초로 변경)
@@ -239,7 +242,9 @@ class PositionManager:
                 'auto_sync_interval': 60,  # 60초로 변경
                 'max_position_age_days': 30,
                 'enable_auto_cleanup': True,
-                'batch_operation_size': 50
+                'batch_operation_size': 50,
+                'pending_order_ttl': 30,
+                'exit_fill_timeout': 2.0
             }
         
         # 통계
@@ -251,7 +256,9 @@ class PositionManager:
             'last_sync_time': None,
             'last_error_time': None,
             'position_changes_detected': 0,
-            'partial_closes_detected': 0
+            'partial_closes_detected': 0,
+            'stream_updates': 0,
+            'stream_deferred': 0
         }
         
         # 시스템 포지션 ID 추적
@@ -266,9 +273,21 @@ class PositionManager:
             'position_updated': [],
             'position_closed': [],
             'position_modified': [],
-            'sync_completed': []
+            'sync_completed': [],
+            'order_updated': []
         }
         
+        # 사용자 데이터 스트림 체결가 (청산가 조회 시 REST 대신 사용)
+        self._last_fill_prices: Dict[str, float] = {}
+        # 체결가보다 먼저 온 청산의 기록 대기 (심볼 -> 체결 도착 이벤트)
+        self._fill_waiters: Dict[str, asyncio.Event] = {}
+        self._exit_record_tasks = set()
+        
+        # 전략 주문 진행 중인 심볼 - 체결 직후 스트림 이벤트가 전략의 add_position /
+        # remove_position 보다 먼저 와도 수동 포지션 / 청산 감지로 처리하지 않음
+        self._pending_orders: Dict[str, Dict] = {}
+        self._deferred_updates: Dict[str, List[Dict]] = {}  # 대기 중 보류한 최신 포지션 항목
+        
         # 캐시 무효화 플래그
         self._cache_invalidated = False
         
@@ -613,7 +632,9 @@ class PositionManager:
                     sync_report['errors'].append("거래소 포지션 조회 실패")
                     return sync_report
                 
-                exchange_dict = {pos['symbol']: pos for pos in exchange_positions}
+                # 전략 주문이 진행 중인 심볼은 전략이 직접 반영하므로 제외
+                exchange_dict = {pos['symbol']: pos for pos in exchange_positions
+                                 if not self._get_pending_order(pos['symbol'])}
                 
                 # 2. 새로운 수동 포지션 감지 (배치 처리)
                 new_positions = await self._detect_new_positions(exchange_dict, sync_report)
@@ -653,6 +674,203 @@ class PositionManager:
                 
                 return sync_report
     
+    async def apply_position_update(self, updates: List[Dict]) -> Dict[str, List]:
+        """사용자 데이터 스트림 ACCOUNT_UPDATE 증분 반영
+        
+        전체 스냅샷 대신 변경된 심볼만 sync_positions 와 같은 감지 로직으로 처리한다.
+        전략 주문이 진행 중인 심볼은 보류했다가 주문이 실패로 끝나면 다시 반영한다.
+        
+        Args:
+            updates: get_positions 와 같은 형식의 포지션 목록 (positionAmt 0 은 청산)
+        """
+        deferred = {}
+        for pos in updates:
+            if self._get_pending_order(pos['symbol']):
+                deferred.setdefault(pos['symbol'], []).append(pos)
+        if deferred:
+            self._deferred_updates.update(deferred)
+            self.stats['stream_deferred'] += 1
+            logger.debug(f"전략 주문 진행 중 - 포지션 스트림 보류: {', '.join(sorted(deferred))}")
+            updates = [pos for pos in updates if pos['symbol'] not in deferred]
+        
+        async with self._lock:
+            sync_report = {
+                'new_manual': [],
+                'closed': [],
+                'modified': [],
+                'size_changed': [],
+                'partial_closed': [],
+                'active': [],
+                'errors': [],
+                'warnings': [],
+                'deferred': sorted(deferred),
+                'sync_time': datetime.now().isoformat()
+            }
+            if not updates:
+                return sync_report
+            
+            try:
+                self.stats['stream_updates'] += 1
+                
+                # 헤지 모드에서는 같은 심볼에 0 수량 항목이 함께 오므로 보유 중인 항목만 사용
+                exchange_dict = {
+                    pos['symbol']: pos for pos in updates
+                    if float(pos.get('positionAmt', 0)) != 0
+                }
+                updated_symbols = {pos['symbol'] for pos in updates}
+                
+                await self._detect_new_positions(exchange_dict, sync_report)
+                await self._check_position_changes(exchange_dict, sync_report)
+                await self._handle_closed_positions(exchange_dict, sync_report, updated_symbols)
+                
+                await self._save_positions_batch()
+                
+                self.stats['position_changes_detected'] += len(sync_report['size_changed'])
+                self.stats['partial_closes_detected'] += len(sync_report['partial_closed'])
+                
+                logger.debug(f"포지션 스트림 반영: {', '.join(sorted(updated_symbols))}")
+                
+            except Exception as e:
+                error_msg = f"포지션 스트림 반영 실패: {e}"
+                logger.error(error_msg)
+                sync_report['errors'].append(error_msg)
+                
+                self.stats['errors'] += 1
+                self.stats['last_error_time'] = datetime.now().isoformat()
+            
+            return sync_report
+    
+    def register_pending_order(self, symbol: str, strategy_name: str, side: str,
+                               action: str = 'ENTRY', client_order_id: Optional[str] = None) -> str:
+        """전략 주문 전송 전 등록
+        
+        체결 직후 도착하는 ACCOUNT_UPDATE 는 add_position / remove_position 또는
+        release_pending_order 가 호출될 때까지 보류된다.
+        
+        Returns:
+            주문에 사용할 clientOrderId (스트림의 주문 이벤트와 대조)
+        """
+        if client_order_id is None:
+            client_order_id = f"{strategy_name}_{symbol}_{int(time.time() * 1000)}"[-36:]
+        self._pending_orders[symbol] = {
+            'strategy_name': strategy_name,
+            'side': side,
+            'action': action,
+            'client_order_id': client_order_id,
+            'registered_at': time.monotonic()
+        }
+        return client_order_id
+    
+    async def release_pending_order(self, symbol: str):
+        """전략 주문이 포지션 반영 없이 끝난 경우 (실패/예외) - 보류한 스트림 항목 반영"""
+        self._pending_orders.pop(symbol, None)
+        deferred = self._deferred_updates.pop(symbol, None)
+        if deferred:
+            await self.apply_position_update(deferred)
+    
+    def _complete_pending_order(self, symbol: str):
+        """전략이 직접 포지션을 반영함 - 보류한 스트림 항목은 폐기"""
+        self._pending_orders.pop(symbol, None)
+        self._deferred_updates.pop(symbol, None)
+    
+    def _get_pending_order(self, symbol: str) -> Optional[Dict]:
+        """진행 중인 전략 주문 (pending_order_ttl 초과 시 만료 처리)"""
+        pending = self._pending_orders.get(symbol)
+        if pending and time.monotonic() - pending['registered_at'] > self.config['pending_order_ttl']:
+            logger.warning(f"{symbol} 전략 주문 대기 만료 ({pending['strategy_name']}) - 스트림 반영 재개")
+            self._complete_pending_order(symbol)
+            return None
+        return pending
+    
+    async def apply_order_update(self, order: Dict):
+        """사용자 데이터 스트림 ORDER_TRADE_UPDATE 반영
+        
+        포지션을 줄이는 체결가만 기록해 이후 청산/부분 청산 기록에 사용하고
+        order_updated 이벤트를 발생시킨다. 진입 체결은 청산가로 쓰이지 않도록 제외하고,
+        보유 포지션도 대기 중인 청산 기록도 없는 늦은 체결은 버린다.
+        """
+        symbol = order.get('s')
+        if order.get('x') == 'TRADE' and symbol and self._is_reducing_fill(order):
+            fill_price = float(order.get('L', 0))
+            waiter = self._fill_waiters.get(symbol)
+            if fill_price > 0 and (waiter or self.get_position(symbol)):
+                self._last_fill_prices[symbol] = fill_price
+                if waiter:
+                    waiter.set()
+        
+        # 전략 주문이 체결 없이 끝나면 보류한 스트림 항목 반영
+        pending = self._pending_orders.get(symbol)
+        if (pending and order.get('c') == pending['client_order_id']
+                and order.get('X') in ('CANCELED', 'EXPIRED', 'REJECTED')):
+            await self.release_pending_order(symbol)
+        
+        await self._emit_event('order_updated', {
+            'symbol': symbol,
+            'order_id': order.get('i'),
+            'client_order_id': order.get('c'),
+            'side': order.get('S'),
+            'type': order.get('o'),
+            'status': order.get('X'),
+            'filled_qty': float(order.get('z', 0)),
+            'avg_price': float(order.get('ap', 0)),
+            'realized_pnl': float(order.get('rp', 0)),
+            'reduce_only': order.get('R', False)
+        })
+    
+    def _is_reducing_fill(self, order: Dict) -> bool:
+        """체결이 포지션을 줄이는지 판단 (reduceOnly, 실현 손익, 보유 방향의 반대 주문)"""
+        if order.get('R') or float(order.get('rp', 0)) != 0:
+            return True
+        
+        position = self.get_position(order.get('s'))
+        if not position:
+            return False
+        closing_side = 'SELL' if position.side == 'LONG' else 'BUY'
+        return order.get('S') == closing_side
+    
+    async def _with_exit_price(self, symbol: str, record: Callable[[Optional[float]], Awaitable]):
+        """청산가로 기록 실행
+        
+        스트림 체결가가 이미 있으면 바로 기록하고, 포지션 이벤트가 체결보다 먼저 왔다면
+        체결가를 exit_fill_timeout 초까지 기다렸다가 기록한다 (없으면 현재가).
+        스트림 메시지 처리를 막지 않도록 대기는 별도 태스크에서 진행한다.
+        """
+        fill_price = self._last_fill_prices.pop(symbol, None)
+        if fill_price:
+            await record(fill_price)
+            return
+        
+        waiter = self._fill_waiters.setdefault(symbol, asyncio.Event())
+        task = asyncio.create_task(self._record_after_fill(symbol, waiter, record))
+        self._exit_record_tasks.add(task)
+        task.add_done_callback(self._exit_record_tasks.discard)
+    
+    async def _record_after_fill(self, symbol: str, waiter: asyncio.Event,
+                                 record: Callable[[Optional[float]], Awaitable]):
+        """체결가 도착(또는 시간 초과) 후 청산 기록"""
+        try:
+            await asyncio.wait_for(waiter.wait(), self.config['exit_fill_timeout'])
+        except asyncio.TimeoutError:
+            pass
+        if self._fill_waiters.get(symbol) is waiter:
+            del self._fill_waiters[symbol]
+        
+        exit_price = self._last_fill_prices.pop(symbol, None)
+        if not exit_price:
+            try:
+                exit_price = await self.binance_api.get_current_price(symbol)
+            except Exception:
+                exit_price = None
+        try:
+            await record(exit_price)
+        except Exception as e:
+            logger.error(f"청산 기록 실패 ({symbol}): {e}")
+    
+    async def flush_exit_records(self):
+        """체결가를 기다리는 청산 기록 완료 대기"""
+        if self._exit_record_tasks:
+            await asyncio.gather(*list(self._exit_record_tasks), return_exceptions=True)
+    
     async def _get_exchange_positions_with_retry(self, max_retries: int = 3) -> Optional[List[Dict]]:
         """거래소 포지션 조회 - 재시도 포함"""
         for attempt in range(max_retries):
@@ -850,6 +1068,7 @@ class PositionManager:
                         key = f"{symbol}_MANUAL"  # 수동 포지션
                     
                     self.positions[key] = new_position
+                    self._last_fill_prices.pop(symbol, None)  # 이전 포지션의 체결가 폐기
                     
                     # 전략별 인덱스 업데이트
                     strategy_key = detected_strategy_name or "MANUAL"
@@ -1098,60 +1317,77 @@ class PositionManager:
     
     async def _record_partial_close(self, symbol: str, position: Position, 
                                   old_size: float, new_size: float, sync_report: Dict):
-        """부분 청산 기록"""
+        """부분 청산 기록 (청산가는 스트림 체결가 우선)"""
         try:
-            closed_size = old_size - new_size
-            current_price = await self.binance_api.get_current_price(symbol)
-            
-            if current_price and self.db:
-                await self.db.record_partial_close(
-                    position_id=position.position_id,
-                    symbol=symbol,
-                    closed_size=closed_size,
-                    remaining_size=new_size,
-                    exit_price=current_price,
-                    entry_price=position.entry_price,
-                    side=position.side
-                )
-            
-            # 부분 청산 정보 추가
+            # 부분 청산 정보 추가 (청산가는 확보 후 채움)
             partial_close_data = {
                 'symbol': symbol,
-                'closed_size': closed_size,
+                'closed_size': old_size - new_size,
                 'remaining_size': new_size,
-                'exit_price': current_price,
+                'exit_price': None,
                 'timestamp': datetime.now().isoformat()
             }
-            
             sync_report['partial_closed'].append(partial_close_data)
             
-            # 알림 전송 (notification_manager 사용)
-            if self.notification_manager:
-                # 이벤트 ID 생성: "심볼_partial_남은크기_타임스탬프"
-                event_id = f"{symbol}_partial_{new_size}_{datetime.now().timestamp()}"
-                
-                await self.notification_manager.send_alert(
-                    event_type='PARTIAL_CLOSE',
-                    title=f"✂️ {symbol} 부분 청산",
-                    message=(
-                        f"<b>청산 수량:</b> {closed_size:.4f}\n"
-                        f"<b>남은 수량:</b> {new_size:.4f}\n"
-                        f"<b>청산가:</b> ${current_price:.2f}"
-                    ),
-                    data=partial_close_data,
-                    event_id=event_id
-                )
-            
-            logger.info(f"부분 청산 기록: {symbol} {closed_size:.4f} @ {current_price:.2f}")
+            await self._with_exit_price(
+                symbol, lambda exit_price: self._write_partial_close(position, partial_close_data, exit_price)
+            )
             
         except Exception as e:
             logger.error(f"부분 청산 기록 실패 ({symbol}): {e}")
     
-    async def _handle_closed_positions(self, exchange_dict: Dict, sync_report: Dict):
-        """청산된 포지션 처리"""
+    async def _write_partial_close(self, position: Position, partial_close_data: Dict,
+                                   current_price: Optional[float]):
+        """부분 청산 DB 기록 및 알림"""
+        symbol = partial_close_data['symbol']
+        closed_size = partial_close_data['closed_size']
+        new_size = partial_close_data['remaining_size']
+        partial_close_data['exit_price'] = current_price
+        
+        if current_price and self.db:
+            await self.db.record_partial_close(
+                position_id=position.position_id,
+                symbol=symbol,
+                closed_size=closed_size,
+                remaining_size=new_size,
+                exit_price=current_price,
+                entry_price=position.entry_price,
+                side=position.side
+            )
+        
+        # 알림 전송 (notification_manager 사용)
+        if self.notification_manager:
+            # 이벤트 ID 생성: "심볼_partial_남은크기_타임스탬프"
+            event_id = f"{symbol}_partial_{new_size}_{datetime.now().timestamp()}"
+            
+            await self.notification_manager.send_alert(
+                event_type='PARTIAL_CLOSE',
+                title=f"✂️ {symbol} 부분 청산",
+                message=(
+                    f"<b>청산 수량:</b> {closed_size:.4f}\n"
+                    f"<b>남은 수량:</b> {new_size:.4f}\n"
+                    f"<b>청산가:</b> ${current_price or 0:.2f}"
+                ),
+                data=partial_close_data,
+                event_id=event_id
+            )
+        
+        logger.info(f"부분 청산 기록: {symbol} {closed_size:.4f} @ {current_price or 0:.2f}")
+    
+    async def _handle_closed_positions(self, exchange_dict: Dict, sync_report: Dict,
+                                       symbols: Optional[set] = None):
+        """청산된 포지션 처리
+        
+        Args:
+            symbols: 확인 대상 심볼 (증분 반영 시). None 이면 전체 포지션
+        """
         closed_keys = []
         
         for key, sys_pos in list(self.positions.items()):
+            if symbols is not None and sys_pos.symbol not in symbols:
+                continue
+            if self._get_pending_order(sys_pos.symbol):
+                continue  # 전략 청산 진행 중 - remove_position 에서 기록
             # 활성 포지션이고 거래소에 없는 경우
             if sys_pos.status == PositionStatus.ACTIVE.value and sys_pos.symbol not in exchange_dict:
                 closed_keys.append(key)
@@ -1167,72 +1403,10 @@ class PositionManager:
                 sync_report['closed'].append(symbol)
                 self.stats['total_positions_closed'] += 1
                 
-                # 완전 청산 기록
-                if self.db:
-                    current_price = await self.binance_api.get_current_price(symbol)
-                    if current_price:
-                        await self.db.record_trade({
-                            'position_id': sys_pos.position_id,
-                            'symbol': symbol,
-                            'action': 'CLOSE',
-                            'size': sys_pos.size,
-                            'price': current_price,
-                            'reason': '포지션 청산 감지'
-                        })
-                
-                # 청산 알림 - 모든 포지션에 대해 전송
-                if self.notification_manager:
-                    # 이벤트 ID 생성: "심볼_closed_포지션ID"
-                    event_id = f"{symbol}_closed_{sys_pos.position_id}"
-                    
-                    # 수동/시스템 포지션 구분하여 다른 이벤트 타입 사용
-                    if sys_pos.is_manual:
-                        event_type = 'MANUAL_POSITION_CLOSED'
-                        title = f"🔴 {symbol} 수동 포지션 청산"
-                        description = "수동 포지션이 완전히 청산되었습니다."
-                    else:
-                        event_type = 'POSITION_CLOSED'
-                        title = f"🔵 {symbol} 시스템 포지션 청산"
-                        description = f"시스템 포지션이 청산되었습니다. (전략: {sys_pos.strategy_name or 'Unknown'})"
-                    
-                    # 현재가 조회 시도
-                    current_price = None
-                    try:
-                        current_price = await self.binance_api.get_current_price(symbol)
-                    except Exception:
-                        pass
-                    
-                    # PnL 계산 (가능한 경우)
-                    pnl_text = ""
-                    if current_price:
-                        if sys_pos.side == 'LONG':
-                            pnl_pct = (current_price - sys_pos.entry_price) / sys_pos.entry_price * 100
-                        else:
-                            pnl_pct = (sys_pos.entry_price - current_price) / sys_pos.entry_price * 100
-                        pnl_pct *= sys_pos.leverage
-                        pnl_emoji = '🟢' if pnl_pct >= 0 else '🔴'
-                        pnl_text = f"<b>손익:</b> {pnl_emoji} {pnl_pct:+.2f}%\n"
-                    
-                    await self.notification_manager.send_alert(
-                        event_type=event_type,
-                        title=title,
-                        message=(
-                            f"<b>방향:</b> {sys_pos.side}\n"
-                            f"<b>진입가:</b> ${sys_pos.entry_price:.2f}\n"
-                            f"<b>수량:</b> {sys_pos.size:.4f}\n"
-                            f"{pnl_text}"
-                            f"\n{description}"
-                        ),
-                        data={
-                            'symbol': symbol,
-                            'side': sys_pos.side,
-                            'entry_price': sys_pos.entry_price,
-                            'size': sys_pos.size,
-                            'strategy': sys_pos.strategy_name,
-                            'is_manual': sys_pos.is_manual,
-                            'current_price': current_price
-                        },
-                        event_id=event_id
+                # 청산 기록/알림 (청산가는 스트림 체결가 우선, 체결보다 먼저 왔으면 잠시 대기)
+                if self.db or self.notification_manager:
+                    await self._with_exit_price(
+                        symbol, lambda exit_price, position=sys_pos: self._write_detected_close(position, exit_price)
                     )
                 
                 # 이벤트 발생
@@ -1248,6 +1422,70 @@ class PositionManager:
                 logger.error(f"청산 포지션 처리 실패 ({symbol}): {e}")
                 sync_report['errors'].append(f"청산 포지션 처리 실패 ({symbol}): {e}")
     
+    async def _write_detected_close(self, sys_pos: Position, current_price: Optional[float]):
+        """감지된 청산 DB 기록 및 알림"""
+        symbol = sys_pos.symbol
+        
+        # 완전 청산 기록
+        if self.db:
+            if current_price:
+                await self.db.record_trade({
+                    'position_id': sys_pos.position_id,
+                    'symbol': symbol,
+                    'action': 'CLOSE',
+                    'size': sys_pos.size,
+                    'price': current_price,
+                    'reason': '포지션 청산 감지'
+                })
+        
+        # 청산 알림 - 모든 포지션에 대해 전송
+        if self.notification_manager:
+            # 이벤트 ID 생성: "심볼_closed_포지션ID"
+            event_id = f"{symbol}_closed_{sys_pos.position_id}"
+            
+            # 수동/시스템 포지션 구분하여 다른 이벤트 타입 사용
+            if sys_pos.is_manual:
+                event_type = 'MANUAL_POSITION_CLOSED'
+                title = f"🔴 {symbol} 수동 포지션 청산"
+                description = "수동 포지션이 완전히 청산되었습니다."
+            else:
+                event_type = 'POSITION_CLOSED'
+                title = f"🔵 {symbol} 시스템 포지션 청산"
+                description = f"시스템 포지션이 청산되었습니다. (전략: {sys_pos.strategy_name or 'Unknown'})"
+            
+            # PnL 계산 (가능한 경우)
+            pnl_text = ""
+            if current_price:
+                if sys_pos.side == 'LONG':
+                    pnl_pct = (current_price - sys_pos.entry_price) / sys_pos.entry_price * 100
+                else:
+                    pnl_pct = (sys_pos.entry_price - current_price) / sys_pos.entry_price * 100
+                pnl_pct *= sys_pos.leverage
+                pnl_emoji = '🟢' if pnl_pct >= 0 else '🔴'
+                pnl_text = f"<b>손익:</b> {pnl_emoji} {pnl_pct:+.2f}%\n"
+            
+            await self.notification_manager.send_alert(
+                event_type=event_type,
+                title=title,
+                message=(
+                    f"<b>방향:</b> {sys_pos.side}\n"
+                    f"<b>진입가:</b> ${sys_pos.entry_price:.2f}\n"
+                    f"<b>수량:</b> {sys_pos.size:.4f}\n"
+                    f"{pnl_text}"
+                    f"\n{description}"
+                ),
+                data={
+                    'symbol': symbol,
+                    'side': sys_pos.side,
+                    'entry_price': sys_pos.entry_price,
+                    'size': sys_pos.size,
+                    'strategy': sys_pos.strategy_name,
+                    'is_manual': sys_pos.is_manual,
+                    'current_price': current_price
+                },
+                event_id=event_id
+            )
+    
     async def _save_positions_batch(self):
         """포지션 배치 저장"""
         try:
@@ -1378,6 +1616,8 @@ class PositionManager:
                 
                 # 복합 키로 저장
                 self.positions[key] = position
+                self._last_fill_prices.pop(symbol, None)  # 이전 포지션의 체결가 폐기
+                self._complete_pending_order(symbol)  # 진입 중 보류한 스트림 항목은 이 포지션으로 대체
                 
                 # 전략별 인덱스 업데이트
                 if strategy_name not in self.strategy_positions:
@@ -1494,6 +1734,10 @@ class PositionManager:
                 position.status = PositionStatus.CLOSED.value
                 position.last_updated = datetime.now().isoformat()
                 
+                # 전략이 청산가를 직접 기록하므로 보류한 스트림 항목과 체결가 폐기
+                self._complete_pending_order(symbol)
+                self._last_fill_prices.pop(symbol, None)
+                
                 # 전략별 인덱스에서 제거
                 if position.strategy_name:
                     strategy_key = position.strategy_name
@@ -1605,6 +1849,9 @@ class PositionManager:
     async def cleanup(self):
         """정리 작업 - 강화된 버전"""
         try:
+            # 체결가 대기 중인 청산 기록 마무리
+            await self.flush_exit_records()
+            
             # 최종 상태 저장
             await self._save_positions_batch()
             
@@ -0,0 +1,109 @@
+# src/core/price_mailbox.py
+"""
+심볼별 최신 가격 우편함 (conflation)
+소비자가 밀려도 심볼마다 마지막 값만 남겨 두고, 소비자는 자기 속도로 꺼내 처리한다.
+급변동 구간에 오래된 틱이 한 건씩 쌓여 처리되는 대신 항상 최신 가격을 받는다.
+"""
+
+import asyncio
+import inspect
+import logging
+from typing import Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class ConflatingMailbox:
+    """키(심볼)별 최신 값만 보관하는 단일 소비자 우편함"""
+
+    def __init__(self, handler: Callable, name: str = '', capacity: Optional[int] = None):
+        self.handler = handler
+        self.name = name or getattr(handler, '__qualname__', 'mailbox')
+        self.capacity = capacity  # 대기 심볼 수 상한 (None 이면 무제한)
+        self._is_async = inspect.iscoroutinefunction(handler)
+
+        self._pending: Dict[str, Tuple] = {}  # 심볼 -> 최신 인자 (도착 순서 유지)
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self.is_running = True
+
+        self.stats = {
+            'posted': 0,
+            'delivered': 0,
+            'coalesced': 0,   # 처리 전 새 값으로 덮어쓴 수
+            'dropped': 0,     # 용량 초과 / 종료 후 도착으로 버린 수
+            'max_depth': 0,
+            'handler_errors': 0,
+        }
+
+    @property
+    def depth(self) -> int:
+        return len(self._pending)
+
+    def post(self, symbol: str, *args):
+        """최신 값 등록 (동기 - 이벤트 발생 측은 기다리지 않음)"""
+        self.stats['posted'] += 1
+        if not self.is_running:
+            self.stats['dropped'] += 1
+            return
+
+        if symbol in self._pending:
+            self.stats['coalesced'] += 1
+        elif self.capacity is not None and len(self._pending) >= self.capacity:
+            self.stats['dropped'] += 1
+            return
+        self._pending[symbol] = args
+
+        depth = len(self._pending)
+        if depth > self.stats['max_depth']:
+            self.stats['max_depth'] = depth
+
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._drain())
+        self._wakeup.set()
+
+    async def _drain(self):
+        """소비 루프 - 도착 순서대로 심볼당 최신 값 한 건씩 전달"""
+        while self.is_running:
+            if not self._pending:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            symbol = next(iter(self._pending))
+            args = self._pending.pop(symbol)
+            try:
+                if self._is_async:
+                    await self.handler(symbol, *args)
+                else:
+                    self.handler(symbol, *args)
+                    await asyncio.sleep(0)  # 동기 소비자도 생산자에게 양보
+                self.stats['delivered'] += 1
+            except Exception as e:
+                self.stats['handler_errors'] += 1
+                logger.error(f"우편함 소비자 오류 ({self.name}, {symbol}): {e}")
+
+    def close(self) -> Optional[asyncio.Task]:
+        """소비 중단 요청 (동기) - 남은 값은 버리고 소비 태스크 취소, 취소된 태스크 반환"""
+        self.is_running = False
+        self.stats['dropped'] += len(self._pending)
+        self._pending.clear()
+        task, self._task = self._task, None
+        if task:
+            task.cancel()
+        return task
+
+    async def stop(self):
+        """소비 중단 - 소비 태스크 종료까지 대기"""
+        task = self.close()
+        if task:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def get_stats(self) -> Dict:
+        return {
+            'depth': self.depth,
+            **self.stats
+        }
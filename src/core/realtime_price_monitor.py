@@ -1,55 +1,167 @@
 # src/core/realtime_price_monitor.py
 import asyncio
-import json
 import logging
+import time
 from typing import Dict, List, Callable, Optional, Set
 from datetime import datetime
-import websockets
 from collections import defaultdict
 
+from src.core.kline_store import INTERVAL_MS
+from src.core.market_recorder import RECORD_KINDS
+from src.core.price_mailbox import ConflatingMailbox
+from src.core.stream_dispatch import StreamDispatcher, classify_handler
+from src.core.stream_manager import StreamManager
+
 logger = logging.getLogger(__name__)
 
+# 스트림 종류별로 메시지를 소비하는 이벤트 - 모두 구독자가 없으면 파싱 없이 건너뜀
+STREAM_EVENTS = {
+    'kline': ('kline_update', 'kline_closed'),
+    'aggTrade': ('trade', 'price_update'),
+    'markPrice': ('mark_price_update',),
+    'depth': ('depth_update',),
+}
+
+# (symbol, price) 형태라 심볼별 최신 값만 남겨도 되는 이벤트
+CONFLATABLE_EVENTS = ('price_update', 'mark_price_update')
+
+# 캔들 REST 조회 최대 개수
+MAX_BACKFILL_KLINES = 1500
+
 class RealtimePriceMonitor:
     """바이낸스 WebSocket을 통한 실시간 가격 모니터링"""
     
-    def __init__(self, binance_api):
+    def __init__(self, binance_api, stream_config: Optional[Dict] = None, recorder=None):
+        """
+        Args:
+            stream_config: StreamManager 설정 (샤드당 스트림 수, 재연결 등)
+            recorder: 수신 메시지 기록기 (MarketRecorder, 선택)
+        """
         self.binance_api = binance_api
-        self.ws = None
         self.is_running = False
         
-        # 이벤트 핸들러
+        # 수신한 시세 메시지 기록 (있으면 구독자 유무와 무관하게 모든 스트림 종류 처리)
+        self.recorder = recorder
+        
+        # 이벤트 핸들러 (handler, is_async) - 동기/비동기는 등록 시 한 번만 판별
         self.event_handlers = defaultdict(list)
         
+        # 최신 가격만 받는 소비자의 우편함 (event, handler) -> mailbox
+        self.mailboxes: Dict[tuple, ConflatingMailbox] = {}
+        
         # 심볼별 데이터 캐시
         self.price_cache = {}
         self.kline_cache = {}
         
+        # 재연결 누락 구간 보충: (symbol, interval) -> 마지막 완성 캔들 open time (ms)
+        self.last_closed_klines: Dict[tuple, int] = {}
+        # 보충 중인 스트림에 도착한 실시간 메시지 (보충 후 순서대로 처리)
+        self._backfilling: Dict[tuple, List[Dict]] = {}
+        self._backfill_tasks: Set[asyncio.Task] = set()
+        self.backfill_stats = {
+            'backfills': 0,
+            'backfilled_klines': 0,
+            'deferred_messages': 0,
+            'backfill_errors': 0,
+        }
+        
         # 모니터링 심볼
         self.symbols: Set[str] = set()
         
-        # WebSocket URL
-        self.ws_url = "wss://fstream.binance.com/ws"  # Futures WebSocket
+        # 구독할 캔들 인터벌
+        self.kline_intervals: List[str] = ['1m', '15m']
+        
+        # 호가 차분 스트림 구독 심볼 (로컬 오더북용, 모니터링 심볼과 별도)
+        self.depth_symbols: Set[str] = set()
+        self.depth_speed = '100ms'
+        
+        # 스트림 종류별 핸들러 표
+        self.dispatcher = StreamDispatcher()
+        self.dispatcher.route('kline', self._handle_kline)
+        self.dispatcher.route('aggTrade', self._handle_trade)
+        self.dispatcher.route('markPrice', self._handle_mark_price)
+        self.dispatcher.route('depth', self._handle_depth)
+        self._event_routes = {
+            'kline': self._handle_kline,
+            'aggTrade': self._handle_trade,
+            'markPriceUpdate': self._handle_mark_price,
+            'depthUpdate': self._handle_depth,
+        }
+        
+        # 공유 캔들 저장소 (KlineStore.attach 로 연결)
+        self._kline_store = None
+        self._refresh_routes()
+        
+        # WebSocket URL (API 클라이언트의 엔드포인트를 따름 - 시뮬레이터 접속 지원)
+        base_ws_url = getattr(binance_api, 'ws_url', None)
+        if not isinstance(base_ws_url, str):
+            base_ws_url = "wss://fstream.binance.com"
+        self.ws_url = f"{base_ws_url}/stream"  # Futures 결합 스트림
+        
+        # 구독은 레인/샤드별 연결로 분산 (재연결, 무응답 감시도 샤드 단위)
+        self.stream_manager = StreamManager(
+            self.ws_url, self.dispatcher.dispatch, on_event=self._on_stream_event,
+            **(stream_config or {})
+        )
+        
+    @property
+    def kline_store(self):
+        return self._kline_store
+    
+    @kline_store.setter
+    def kline_store(self, store):
+        self._kline_store = store
+        self._refresh_routes()
+    
+    def on(self, event: str, handler: Callable, conflate: bool = False,
+           capacity: Optional[int] = None):
+        """이벤트 핸들러 등록
         
-        # 재연결 설정
-        self.reconnect_delay = 5
-        self.max_reconnect_attempts = 10
+        conflate=True 면 우편함을 거쳐 심볼별 최신 가격만 소비자 속도로 전달한다
+        (price_update / mark_price_update 만 지원).
+        """
+        if conflate:
+            if event not in CONFLATABLE_EVENTS:
+                raise ValueError(f"최신 값 병합을 지원하지 않는 이벤트: {event}")
+            mailbox = ConflatingMailbox(handler, name=f"{event}:{getattr(handler, '__qualname__', handler)}",
+                                        capacity=capacity)
+            self.mailboxes[(event, handler)] = mailbox
+            handler = mailbox.post
         
-    def on(self, event: str, handler: Callable):
-        """이벤트 핸들러 등록"""
-        self.event_handlers[event].append(handler)
-        logger.info(f"이벤트 핸들러 등록: {event}")
+        self.event_handlers[event].append(classify_handler(handler))
+        self._refresh_routes()
+        logger.info(f"이벤트 핸들러 등록: {event}{' (최신 값 병합)' if conflate else ''}")
         
     def off(self, event: str, handler: Callable):
         """이벤트 핸들러 제거"""
-        if handler in self.event_handlers[event]:
-            self.event_handlers[event].remove(handler)
+        mailbox = self.mailboxes.pop((event, handler), None)
+        if mailbox:
+            mailbox.close()  # 대기 중인 소비 태스크까지 취소
+            handler = mailbox.post
+        
+        handlers = self.event_handlers.get(event)
+        if handlers:
+            handlers[:] = [entry for entry in handlers if entry[0] != handler]
+            self._refresh_routes()
+    
+    def _refresh_routes(self):
+        """구독자 없는 스트림 종류 비활성화 (캔들은 저장소 연결 시에도 활성, 기록 중이면 기록 대상 모두 활성)"""
+        for kind, events in STREAM_EVENTS.items():
+            active = any(self.event_handlers.get(event) for event in events)
+            if kind == 'kline' and self._kline_store is not None:
+                active = True
+            if self.recorder is not None and kind in RECORD_KINDS:
+                active = True
+            self.dispatcher.set_active(kind, active)
             
     async def emit(self, event: str, *args, **kwargs):
         """이벤트 발생"""
-        handlers = self.event_handlers.get(event, [])
-        for handler in handlers:
+        handlers = self.event_handlers.get(event)
+        if not handlers:
+            return
+        for handler, is_async in handlers:
             try:
-                if asyncio.iscoroutinefunction(handler):
+                if is_async:
                     await handler(*args, **kwargs)
                 else:
                     handler(*args, **kwargs)
@@ -62,118 +174,178 @@ class RealtimePriceMonitor:
         if new_symbols:
             self.symbols.update(new_symbols)
             logger.info(f"모니터링 심볼 추가: {', '.join(new_symbols)}")
-            
-            # 이미 연결중이면 구독 추가
-            if self.ws and not self.ws.closed:
-                await self._subscribe_symbols(list(new_symbols))
+            await self.stream_manager.add_streams(self._symbol_streams(new_symbols))
     
-    async def remove_symbols(self, symbols: List[str]):
-        """모니터링 심볼 제거"""
-        self.symbols -= set(symbols)
-        # 구독 해제는 재연결시 자동 처리
-        
-    async def start(self):
-        """WebSocket 연결 시작"""
-        self.is_running = True
-        reconnect_count = 0
+    async def watch_kline(self, symbol: str, interval: str):
+        """캔들 스트림 추가 구독 (캔들 저장소 갱신용)"""
+        if interval not in self.kline_intervals:
+            self.kline_intervals.append(interval)
+            await self.stream_manager.add_streams(
+                f"{s.lower()}@kline_{interval}" for s in self.symbols
+            )
         
-        while self.is_running and reconnect_count < self.max_reconnect_attempts:
-            try:
-                logger.info("WebSocket 연결 시작...")
-                await self._connect()
-                reconnect_count = 0  # 연결 성공시 카운트 리셋
-                
-            except Exception as e:
-                reconnect_count += 1
-                logger.error(f"WebSocket 연결 실패 (시도 {reconnect_count}/{self.max_reconnect_attempts}): {e}")
-                
-                if reconnect_count < self.max_reconnect_attempts:
-                    await asyncio.sleep(self.reconnect_delay * reconnect_count)
-                else:
-                    logger.error("최대 재연결 시도 횟수 초과")
-                    await self.emit('connection_failed')
-                    break
-    
-    async def _connect(self):
-        """WebSocket 연결 및 메시지 처리"""
-        async with websockets.connect(self.ws_url) as websocket:
-            self.ws = websocket
-            logger.info("✓ WebSocket 연결 성공")
-            
-            # 심볼 구독
-            if self.symbols:
-                await self._subscribe_symbols(list(self.symbols))
-            
-            # 연결 성공 이벤트
-            await self.emit('connected')
-            
-            # 메시지 수신 루프
-            async for message in websocket:
-                if not self.is_running:
-                    break
-                    
-                try:
-                    data = json.loads(message)
-                    await self._handle_message(data)
-                except json.JSONDecodeError as e:
-                    logger.error(f"JSON 파싱 오류: {e}")
-                except Exception as e:
-                    logger.error(f"메시지 처리 오류: {e}")
-    
-    async def _subscribe_symbols(self, symbols: List[str]):
-        """심볼 구독"""
-        if not self.ws or self.ws.closed:
+        await self.add_symbols([symbol])
+    
+    async def watch_depth(self, symbol: str):
+        """호가 차분 스트림 구독 (OrderBookManager 용)"""
+        if symbol not in self.depth_symbols:
+            self.depth_symbols.add(symbol)
+            await self.stream_manager.add_streams([f"{symbol.lower()}@depth@{self.depth_speed}"])
+    
+    async def unwatch_depth(self, symbol: str):
+        """호가 차분 스트림 구독 해제"""
+        if symbol in self.depth_symbols:
+            self.depth_symbols.discard(symbol)
+            await self.stream_manager.remove_streams([f"{symbol.lower()}@depth@{self.depth_speed}"])
+    
+    async def remove_symbols(self, symbols: List[str]):
+        """모니터링 심볼 제거 (스트림 구독 해제)"""
+        removed = self.symbols & set(symbols)
+        if not removed:
             return
-            
-        # 스트림 리스트 생성
+        self.symbols -= removed
+        await self.stream_manager.remove_streams(self._symbol_streams(removed))
+        for symbol in removed:
+            self.price_cache.pop(symbol, None)
+            self.kline_cache.pop(symbol, None)
+        for key in [key for key in self.last_closed_klines if key[0] in removed]:
+            del self.last_closed_klines[key]
+        logger.info(f"모니터링 심볼 제거: {', '.join(removed)}")
+        
+    def _symbol_streams(self, symbols) -> List[str]:
+        """심볼별 구독 스트림 목록"""
         streams = []
         for symbol in symbols:
             symbol_lower = symbol.lower()
+            streams.extend(f"{symbol_lower}@kline_{interval}" for interval in self.kline_intervals)
             streams.extend([
-                f"{symbol_lower}@kline_1m",    # 1분봉
-                f"{symbol_lower}@kline_15m",   # 15분봉  
                 f"{symbol_lower}@aggTrade",     # 체결 데이터
                 f"{symbol_lower}@markPrice"     # 마크 가격
             ])
+        return streams
         
-        # 구독 메시지
-        subscribe_msg = {
-            "method": "SUBSCRIBE",
-            "params": streams,
-            "id": 1
-        }
-        
-        await self.ws.send(json.dumps(subscribe_msg))
-        logger.info(f"구독 요청: {len(symbols)}개 심볼")
+    async def start(self):
+        """WebSocket 연결 시작 (stop 까지 대기)"""
+        self.is_running = True
+        logger.info("WebSocket 연결 시작...")
+        await self.stream_manager.start()
     
-    async def _handle_message(self, data: Dict):
-        """WebSocket 메시지 처리"""
-        if 'e' not in data:
-            return
-            
-        event_type = data['e']
+    async def _on_stream_event(self, event: str, streams: Optional[List[str]] = None):
+        """스트림 관리자 이벤트 전달"""
+        if event == 'connected':
+            logger.info("✓ WebSocket 연결 성공")
+            await self.emit('connected')
+        elif event == 'reconnected':
+            self._schedule_backfill(streams or [])
+        elif event == 'failed':
+            await self.emit('connection_failed')
+    
+    def _schedule_backfill(self, streams: List[str]):
+        """재연결된 캔들 스트림의 누락 구간 보충 예약
         
-        # 캔들 데이터
-        if event_type == 'kline':
-            await self._handle_kline(data)
-            
-        # 체결 데이터
-        elif event_type == 'aggTrade':
-            await self._handle_trade(data)
+        샤드 수신 루프가 시작되기 전에 호출되므로, 여기서 보충 중으로 표시한 스트림의
+        실시간 메시지는 보충이 끝날 때까지 보류된다.
+        """
+        for stream in streams:
+            name, _, kind = stream.partition('@')
+            if not kind.startswith('kline_'):
+                continue
+            key = (name.upper(), kind[len('kline_'):])
+            if key in self._backfilling:
+                continue
+            last_open = self._last_closed_open(key)
+            if last_open is None:
+                continue  # 완성 캔들을 받은 적 없음 - 보충 기준 없음
             
-        # 마크 가격
-        elif event_type == 'markPriceUpdate':
-            await self._handle_mark_price(data)
+            self._backfilling[key] = []
+            task = asyncio.create_task(self._backfill_klines(key, last_open))
+            self._backfill_tasks.add(task)
+            task.add_done_callback(self._backfill_tasks.discard)
+    
+    def _last_closed_open(self, key: tuple) -> Optional[int]:
+        """마지막으로 받은 완성 캔들 open time (스트림 기록이 없으면 캔들 저장소 기준)"""
+        last_open = self.last_closed_klines.get(key)
+        if last_open is None and self._kline_store is not None:
+            buffer = self._kline_store.buffers.get(key)
+            if buffer is not None:
+                last_open = buffer.last_closed_time
+        return last_open
+    
+    async def _backfill_klines(self, key: tuple, last_open: int):
+        """끊긴 동안 완성된 캔들을 REST 1회로 조회해 순서대로 재생 후 보류 메시지 처리"""
+        symbol, interval = key
+        interval_ms = INTERVAL_MS.get(interval)
+        try:
+            if interval_ms is not None:
+                now_ms = int(time.time() * 1000) + getattr(self.binance_api, 'time_offset', 0)
+                missing = (now_ms // interval_ms - 1) * interval_ms - last_open
+                missing //= interval_ms
+                if missing > 0:
+                    if missing > MAX_BACKFILL_KLINES:
+                        logger.warning(f"캔들 누락 구간이 최대 조회 수 초과: {symbol} {interval} "
+                                       f"{missing}개 중 {MAX_BACKFILL_KLINES}개만 보충")
+                    klines = await self.binance_api.get_kline_arrays(
+                        symbol, interval, limit=min(missing, MAX_BACKFILL_KLINES),
+                        start_time=last_open + interval_ms
+                    )
+                    replayed = 0
+                    for open_time, values in zip(klines.open_time.tolist(), klines.ohlcv.tolist()):
+                        if open_time <= last_open or open_time + interval_ms > now_ms:
+                            continue  # 이미 받은 캔들 / 진행 중 캔들
+                        await self._apply_kline({
+                            's': symbol, 'i': interval, 't': open_time,
+                            'o': values[0], 'h': values[1], 'l': values[2],
+                            'c': values[3], 'v': values[4], 'x': True
+                        })
+                        replayed += 1
+                    self.backfill_stats['backfills'] += 1
+                    self.backfill_stats['backfilled_klines'] += replayed
+                    logger.info(f"재연결 캔들 누락 구간 보충: {symbol} {interval} {replayed}개")
+        except Exception as e:
+            self.backfill_stats['backfill_errors'] += 1
+            logger.error(f"캔들 누락 구간 보충 실패 ({symbol} {interval}): {e}")
+        finally:
+            # 보류된 실시간 메시지 처리 (비는 순간 보류 해제 - 사이에 await 없음)
+            pending = self._backfilling[key]
+            while pending:
+                await self._apply_kline(pending.pop(0)['k'])
+            del self._backfilling[key]
+    
+    async def _handle_message(self, data: Dict):
+        """파싱된 이벤트 처리 (스트림 프레임은 dispatcher 가 직접 라우팅)"""
+        handler = self._event_routes.get(data.get('e'))
+        if handler:
+            await handler(data)
     
     async def _handle_kline(self, data: Dict):
         """캔들 데이터 처리"""
+        if self.recorder:
+            self.recorder.record('kline', data)
         kline = data['k']
+        pending = self._backfilling.get((kline['s'], kline['i']))
+        if pending is not None:
+            # 누락 구간 보충 중 - 보충 캔들보다 뒤에 처리
+            pending.append(data)
+            self.backfill_stats['deferred_messages'] += 1
+            return
+        await self._apply_kline(kline)
+    
+    async def _apply_kline(self, kline: Dict):
+        """캔들 반영 및 이벤트 발생 (스트림 / 누락 구간 보충 공용)"""
         symbol = kline['s']
         interval = kline['i']
         
+        if kline['x']:
+            key = (symbol, interval)
+            open_time = int(kline['t'])
+            if open_time <= self.last_closed_klines.get(key, -1):
+                return  # 보충으로 이미 반영된 완성 캔들
+            self.last_closed_klines[key] = open_time
+        
         # 캔들 정보
         candle_info = {
             'time': datetime.fromtimestamp(kline['t'] / 1000),
+            'open_time': int(kline['t']),
             'open': float(kline['o']),
             'high': float(kline['h']),
             'low': float(kline['l']),
@@ -187,6 +359,10 @@ class RealtimePriceMonitor:
             self.kline_cache[symbol] = {}
         self.kline_cache[symbol][interval] = candle_info
         
+        # 캔들 저장소 갱신 (이벤트 핸들러보다 먼저 반영)
+        if self.kline_store:
+            self.kline_store.on_kline(symbol, interval, kline)
+        
         # 이벤트 발생
         await self.emit('kline_update', symbol, interval, candle_info)
         
@@ -196,43 +372,66 @@ class RealtimePriceMonitor:
     
     async def _handle_trade(self, data: Dict):
         """체결 데이터 처리"""
+        if self.recorder:
+            self.recorder.record('aggTrade', data)
         symbol = data['s']
-        trade_info = {
-            'time': datetime.fromtimestamp(data['T'] / 1000),
-            'price': float(data['p']),
-            'quantity': float(data['q']),
-            'is_buyer_maker': data['m']
-        }
+        price = float(data['p'])
         
         # 가격 캐시 업데이트
-        self.price_cache[symbol] = trade_info['price']
+        self.price_cache[symbol] = price
         
-        # 이벤트 발생
-        await self.emit('trade', symbol, trade_info)
-        await self.emit('price_update', symbol, trade_info['price'])
+        # 이벤트 발생 (체결 상세는 구독자가 있을 때만 생성)
+        if self.event_handlers.get('trade'):
+            trade_info = {
+                'time': datetime.fromtimestamp(data['T'] / 1000),
+                'price': price,
+                'quantity': float(data['q']),
+                'is_buyer_maker': data['m']
+            }
+            await self.emit('trade', symbol, trade_info)
+        await self.emit('price_update', symbol, price)
     
     async def _handle_mark_price(self, data: Dict):
         """마크 가격 처리"""
+        if self.recorder:
+            self.recorder.record('markPrice', data)
         symbol = data['s']
         mark_price = float(data['p'])
         
         # 이벤트 발생
         await self.emit('mark_price_update', symbol, mark_price)
     
+    async def _handle_depth(self, data: Dict):
+        """호가 차분 처리 (시퀀스 검증 / 반영은 OrderBookManager)"""
+        await self.emit('depth_update', data['s'], data)
+    
     def get_cached_price(self, symbol: str) -> Optional[float]:
-        """캐시된 가격 조회"""
+        """캐시된 가격 조회 (trade / price_update 구독자가 있을 때만 갱신)"""
         return self.price_cache.get(symbol)
     
     def get_cached_kline(self, symbol: str, interval: str) -> Optional[Dict]:
         """캐시된 캔들 조회"""
         return self.kline_cache.get(symbol, {}).get(interval)
     
+    def get_stats(self) -> Dict:
+        """스트림 샤드 / 디스패치 / 우편함 통계"""
+        return {
+            **self.stream_manager.get_stats(),
+            'dispatch': self.dispatcher.get_stats(),
+            'backfill': dict(self.backfill_stats),
+            'recorder': self.recorder.get_stats() if self.recorder else None,
+            'mailboxes': {mailbox.name: mailbox.get_stats() for mailbox in self.mailboxes.values()}
+        }
+    
     async def stop(self):
         """WebSocket 연결 종료"""
         self.is_running = False
-        
-        if self.ws and not self.ws.closed:
-            await self.ws.close()
+        await self.stream_manager.stop()
+        for task in list(self._backfill_tasks):
+            task.cancel()
+        await asyncio.gather(*self._backfill_tasks, return_exceptions=True)
+        for mailbox in self.mailboxes.values():
+            await mailbox.stop()
             
         logger.info("WebSocket 연결 종료")
         await self.emit('disconnected')
\ No newline at end of file
@@ -1,12 +1,13 @@
 # src/core/realtime_signal_processor.py
 import asyncio
 import logging
-from typing import Dict, Optional, Set
-from datetime import datetime, timedelta
+import time
+from typing import Dict, Optional, Set, Tuple
+from datetime import datetime
 from dataclasses import dataclass
-from collections import deque
-import numpy as np
 
+from .rolling_stats import RollingWindow, LaggedValue
+from .streaming_indicators import IndicatorEngine, WilderATR, WilderRSI
 from ..strategies.signal import Signal, SignalType, SignalStrength
 
 logger = logging.getLogger(__name__)
@@ -17,6 +18,7 @@ class QuickIndicators:
     symbol: str
     price: float
     rsi: Optional[float] = None
+    atr: Optional[float] = None
     price_change_1m: Optional[float] = None
     price_change_5m: Optional[float] = None
     volume_ratio: Optional[float] = None
@@ -29,20 +31,42 @@ class QuickIndicators:
             self.timestamp = datetime.now()
 
 
+class SymbolPriceStats:
+    """심볼별 틱 통계 - 틱마다 O(1) 갱신"""
+    
+    __slots__ = ('window', 'lag_1m', 'lag_5m', 'last_price', 'count')
+    
+    def __init__(self, window_size: int = 20):
+        self.window = RollingWindow(window_size)   # 변동성 / 가격 위치용 최근 틱
+        self.lag_1m = LaggedValue(60)
+        self.lag_5m = LaggedValue(300)
+        self.last_price: Optional[float] = None
+        self.count = 0
+    
+    def update(self, timestamp: float, price: float):
+        self.window.append(price)
+        self.lag_1m.update(timestamp, price)
+        self.lag_5m.update(timestamp, price)
+        self.last_price = price
+        self.count += 1
+
+
 class RealtimeSignalProcessor:
     """실시간 신호 처리 및 빠른 지표 계산 - 개선된 버전"""
     
-    def __init__(self, strategy, position_manager):
+    def __init__(self, strategy, position_manager, kline_store=None):
         self.strategy = strategy
         self.position_manager = position_manager
+        self.kline_store = kline_store  # Wilder 지표 초기값용 과거 캔들
         
-        # 가격 히스토리 (빠른 지표 계산용)
-        self.price_history = {}  # symbol -> deque of (timestamp, price)
+        # 가격 통계 (빠른 지표 계산용, 틱마다 O(1) 갱신)
+        self.price_history: Dict[str, SymbolPriceStats] = {}
         self.volume_history = {}  # symbol -> deque of (timestamp, volume)
         
-        # RSI 계산용 데이터
-        self.rsi_gains = {}  # symbol -> deque of gains
-        self.rsi_losses = {}  # symbol -> deque of losses
+        # RSI / ATR - 전략 캔들 인터벌의 완성 캔들마다 O(1) 갱신하는 Wilder 평활 상태
+        # (캔들 완성 시 전략이 계산하는 ta.rsi / ta.atr 와 같은 값)
+        self.indicator_interval = getattr(strategy, 'candle_interval', '15m')
+        self.indicator_states: Dict[Tuple[str, str], IndicatorEngine] = {}
         
         # 개선된 쿨다운 관리
         self.position_entry_time = {}  # symbol -> entry_time (포지션 진입 시간)
@@ -149,101 +173,88 @@ class RealtimeSignalProcessor:
     async def on_kline_closed(self, symbol: str, interval: str, kline: Dict):
         """캔들 완성시 처리"""
         try:
-            # 15분봉 완성시 전체 체크
-            if interval == '15m':
+            # 전략 인터벌 완성시 RSI / ATR 갱신 후 전체 체크
+            if interval == self.indicator_interval:
+                self._update_indicator_state(symbol, interval, kline)
+                
                 # 포지션이 없고 쿨다운이 없으면 체크
                 if not self.position_manager.is_position_exist(symbol):
                     if symbol not in self.position_entry_time:
-                        await self._trigger_full_check(symbol, reason="15m_candle_closed")
-                
-            # 1분봉 완성시 RSI 업데이트
-            elif interval == '1m':
-                self._update_rsi_data(symbol, kline)
+                        await self._trigger_full_check(symbol, reason=f"{interval}_candle_closed")
                 
         except Exception as e:
             logger.error(f"캔들 처리 실패 ({symbol}): {e}")
     
     def _update_price_history(self, symbol: str, price: float):
-        """가격 히스토리 업데이트"""
-        if symbol not in self.price_history:
-            self.price_history[symbol] = deque(maxlen=300)  # 5분 데이터
+        """가격 통계 업데이트"""
+        stats = self.price_history.get(symbol)
+        if stats is None:
+            stats = self.price_history[symbol] = SymbolPriceStats()
             
-        self.price_history[symbol].append((datetime.now(), price))
+        stats.update(time.monotonic(), price)
     
     def _calculate_quick_indicators(self, symbol: str, current_price: float) -> QuickIndicators:
         """빠른 지표 계산 - 가격 위치 추가"""
         indicators = QuickIndicators(symbol=symbol, price=current_price)
         
-        if symbol not in self.price_history or len(self.price_history[symbol]) < 2:
-            return indicators
-        
-        prices = self.price_history[symbol]
-        current_time = datetime.now()
-        
-        # 1분전 가격 변화
-        one_min_ago = current_time - timedelta(minutes=1)
-        for timestamp, price in reversed(prices):
-            if timestamp <= one_min_ago:
-                indicators.price_change_1m = (current_price - price) / price
-                break
+        # RSI / ATR (완성 캔들 기준 증분 상태)
+        state = self.indicator_states.get((symbol, self.indicator_interval))
+        if state is not None:
+            indicators.rsi = state.indicators['rsi'].value
+            indicators.atr = state.indicators['atr'].value
         
-        # 5분전 가격 변화
-        five_min_ago = current_time - timedelta(minutes=5)
-        for timestamp, price in reversed(prices):
-            if timestamp <= five_min_ago:
-                indicators.price_change_5m = (current_price - price) / price
-                break
-        
-        # 간단한 변동성 계산
-        recent_prices = [p for _, p in list(prices)[-20:]]  # 최근 20개
-        if len(recent_prices) > 1:
-            indicators.volatility = np.std(recent_prices) / np.mean(recent_prices)
+        stats = self.price_history.get(symbol)
+        if stats is None or stats.count < 2:
+            return indicators
         
-        # RSI (캐시된 값 사용)
-        if symbol in self.rsi_gains and symbol in self.rsi_losses:
-            indicators.rsi = self._calculate_rsi_from_cache(symbol)
+        # 1분 / 5분전 가격 변화
+        price_1m = stats.lag_1m.value
+        if price_1m:
+            indicators.price_change_1m = (current_price - price_1m) / price_1m
+        price_5m = stats.lag_5m.value
+        if price_5m:
+            indicators.price_change_5m = (current_price - price_5m) / price_5m
         
+        # 간단한 변동성 계산 (최근 20개)
+        window = stats.window
+        if len(window) > 1:
+            indicators.volatility = window.std / window.mean
+                
         # 가격 위치 계산 (Donchian용)
-        if len(recent_prices) >= 20:
-            high_20 = max(recent_prices)
-            low_20 = min(recent_prices)
+        if window.is_full:
+            high_20 = window.max
+            low_20 = window.min
             if high_20 > low_20:
                 indicators.price_position = (current_price - low_20) / (high_20 - low_20)
         
         return indicators
     
-    def _calculate_rsi_from_cache(self, symbol: str) -> Optional[float]:
-        """캐시된 데이터로 RSI 계산"""
-        if symbol not in self.rsi_gains or not self.rsi_gains[symbol]:
-            return None
-            
-        avg_gain = np.mean(list(self.rsi_gains[symbol]))
-        avg_loss = np.mean(list(self.rsi_losses[symbol]))
-        
-        if avg_loss == 0:
-            return 100.0
-            
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
-        
-        return rsi
+    @staticmethod
+    def _new_indicator_state() -> IndicatorEngine:
+        return IndicatorEngine({'rsi': WilderRSI(14), 'atr': WilderATR(14)})
     
-    def _update_rsi_data(self, symbol: str, kline: Dict):
-        """RSI 계산용 데이터 업데이트"""
-        if symbol not in self.rsi_gains:
-            self.rsi_gains[symbol] = deque(maxlen=14)
-            self.rsi_losses[symbol] = deque(maxlen=14)
-            return
-            
-        # 가격 변화 계산
-        change = kline['close'] - kline['open']
+    def seed_indicators(self, symbol: str, interval: str, open_times, ohlcv) -> IndicatorEngine:
+        """과거 완성 캔들로 RSI / ATR 상태 초기화 (이후 완성 캔들은 O(1) 갱신)"""
+        state = self.indicator_states[(symbol, interval)] = self._new_indicator_state()
+        state.seed(open_times, ohlcv)
+        return state
+    
+    def _update_indicator_state(self, symbol: str, interval: str, kline: Dict):
+        """완성 캔들 1개 반영 - 처음이면 캔들 저장소 히스토리로 초기화"""
+        key = (symbol, interval)
+        state = self.indicator_states.get(key)
+        if state is None:
+            view = self.kline_store.view(symbol, interval, include_forming=False) if self.kline_store else None
+            if view is not None and len(view.open_time):
+                # 저장소는 이벤트보다 먼저 갱신되므로 이번 캔들까지 포함됨
+                state = self.seed_indicators(symbol, interval, view.open_time, view.ohlcv)
+            else:
+                state = self.indicator_states[key] = self._new_indicator_state()
         
-        if change > 0:
-            self.rsi_gains[symbol].append(change)
-            self.rsi_losses[symbol].append(0)
-        else:
-            self.rsi_gains[symbol].append(0)
-            self.rsi_losses[symbol].append(abs(change))
+        open_time = kline.get('open_time')
+        if open_time is None:
+            open_time = int(kline['time'].timestamp() * 1000)
+        state.update(open_time, kline['high'], kline['low'], kline['close'])
     
     async def _trigger_full_check(self, symbol: str, indicators: Optional[QuickIndicators] = None, reason: str = ""):
         """전체 신호 체크 트리거 - 비동기 실행 개선"""
@@ -310,8 +321,9 @@ class RealtimeSignalProcessor:
     
     def get_quick_indicators(self, symbol: str) -> Optional[QuickIndicators]:
         """현재 빠른 지표 조회"""
-        if symbol not in self.price_history or not self.price_history[symbol]:
+        stats = self.price_history.get(symbol)
+        if stats is None or stats.last_price is None:
             return None
             
-        current_price = self.price_history[symbol][-1][1]
+        current_price = stats.last_price
         return self._calculate_quick_indicators(symbol, current_price)
\ No newline at end of file
@@ -0,0 +1,61 @@
+# src/core/rolling_extrema.py
+"""
+이동 최댓값 / 최솟값 (Donchian 채널, 일목균형표 전환선 / 기준선 / 선행스팬 B)
+
+- 배치: van Herk / Gil-Werman 블록 분해. 시계열을 length 크기 블록으로 나눠
+  블록 내 앞에서부터 누적(prefix) / 뒤에서부터 누적(suffix) 극값을 구하면
+  [i - length + 1, i] 윈도우는 최대 두 블록에 걸치므로
+  극값 = op(suffix[i - length + 1], prefix[i]) - 윈도우 길이와 무관하게 원소당 비교 3회
+- 스트리밍: streaming_indicators.RollingExtremum (단조 덱, 캔들당 상각 O(1))
+- NaN 이 포함된 윈도우는 NaN, 앞쪽 length - 1 개는 NaN (rolling(length).max() 와 동일)
+"""
+
+import numpy as np
+
+from src.core.moving_averages import ArrayLike, _wrap
+
+
+def _van_herk(values: np.ndarray, length: int, op: np.ufunc) -> np.ndarray:
+    if length < 1:
+        raise ValueError(f"윈도우 크기는 1 이상이어야 합니다: {length}")
+    values = np.asarray(values, dtype=np.float64)
+    n = len(values)
+    result = np.full(n, np.nan)
+    if n < length:
+        return result
+    if length == 1:
+        result[:] = values
+        return result
+
+    # 마지막 블록 채움 값은 사용되지 않음 (전체가 실제 값인 블록만 suffix 로 참조)
+    blocks = -(-n // length)
+    padded = np.empty(blocks * length)
+    padded[:n] = values
+    padded[n:] = values[-1]
+
+    # (length, blocks) 뷰에서 axis=0 누적 - 블록 내 위치마다 모든 블록을 한 번에 비교
+    columns = padded.reshape(blocks, length).T
+    prefix = op.accumulate(columns, axis=0).T.ravel()
+    suffix = op.accumulate(columns[::-1], axis=0)[::-1].T.ravel()
+    result[length - 1:] = op(suffix[:n - length + 1], prefix[length - 1:n])
+    return result
+
+
+def rolling_max_array(values: np.ndarray, length: int) -> np.ndarray:
+    """최근 length 개 최댓값"""
+    return _van_herk(values, length, np.maximum)
+
+
+def rolling_min_array(values: np.ndarray, length: int) -> np.ndarray:
+    """최근 length 개 최솟값"""
+    return _van_herk(values, length, np.minimum)
+
+
+def rolling_max(values: ArrayLike, length: int) -> ArrayLike:
+    """이동 최댓값 (Series 면 같은 인덱스의 Series 반환)"""
+    return _wrap(rolling_max_array(values, length), values)
+
+
+def rolling_min(values: ArrayLike, length: int) -> ArrayLike:
+    """이동 최솟값 (Series 면 같은 인덱스의 Series 반환)"""
+    return _wrap(rolling_min_array(values, length), values)
@@ -0,0 +1,151 @@
+# src/core/rolling_stats.py
+"""
+증분 롤링 통계
+틱마다 윈도우 전체를 다시 훑지 않도록 갱신 1회당 O(1)(상각)로 유지한다.
+- RollingWindow: 최근 N개 값의 평균/분산(슬라이딩 Welford), 최대/최소(단조 덱)
+- LaggedValue: lag 초 전 시점의 값 (초 단위 시간 링)
+"""
+
+import math
+from collections import deque
+from typing import Optional
+
+# 부동소수 누적 오차 방지를 위해 이 횟수마다 평균/분산을 윈도우에서 재계산 (상각 O(1))
+RESYNC_INTERVAL = 4096
+
+
+class RollingWindow:
+    """고정 길이 최근 N개 값의 평균/분산/최대/최소"""
+
+    __slots__ = ('size', 'track_extrema', '_values', '_mean', '_m2',
+                 '_max', '_min', '_index', '_updates')
+
+    def __init__(self, size: int, track_extrema: bool = True):
+        if size < 1:
+            raise ValueError(f"윈도우 크기는 1 이상이어야 합니다: {size}")
+        self.size = size
+        self.track_extrema = track_extrema
+        self._values = deque()
+        self._mean = 0.0
+        self._m2 = 0.0
+        # (인덱스, 값) - 최대는 값 내림차순, 최소는 오름차순 유지
+        self._max = deque()
+        self._min = deque()
+        self._index = 0
+        self._updates = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    @property
+    def is_full(self) -> bool:
+        return len(self._values) == self.size
+
+    def append(self, value: float):
+        values = self._values
+        if len(values) == self.size:
+            # 가장 오래된 값을 새 값으로 교체
+            old = values.popleft()
+            values.append(value)
+            old_mean = self._mean
+            self._mean += (value - old) / self.size
+            self._m2 += (value - old) * (value - self._mean + old - old_mean)
+
+            self._updates += 1
+            if self._updates >= RESYNC_INTERVAL:
+                self._resync()
+        else:
+            values.append(value)
+            delta = value - self._mean
+            self._mean += delta / len(values)
+            self._m2 += delta * (value - self._mean)
+
+        if self.track_extrema:
+            index = self._index
+            expired = index - self.size
+
+            highs = self._max
+            while highs and highs[-1][1] <= value:
+                highs.pop()
+            highs.append((index, value))
+            if highs[0][0] <= expired:
+                highs.popleft()
+
+            lows = self._min
+            while lows and lows[-1][1] >= value:
+                lows.pop()
+            lows.append((index, value))
+            if lows[0][0] <= expired:
+                lows.popleft()
+
+        self._index += 1
+
+    def _resync(self):
+        n = len(self._values)
+        mean = math.fsum(self._values) / n
+        self._mean = mean
+        self._m2 = math.fsum((v - mean) ** 2 for v in self._values)
+        self._updates = 0
+
+    @property
+    def last(self) -> Optional[float]:
+        return self._values[-1] if self._values else None
+
+    @property
+    def sum(self) -> float:
+        return self._mean * len(self._values)
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self._mean if self._values else None
+
+    @property
+    def variance(self) -> Optional[float]:
+        """모분산 (np.var 기본값과 동일)"""
+        if not self._values:
+            return None
+        return max(self._m2, 0.0) / len(self._values)
+
+    @property
+    def std(self) -> Optional[float]:
+        variance = self.variance
+        return math.sqrt(variance) if variance is not None else None
+
+    @property
+    def max(self) -> Optional[float]:
+        return self._max[0][1] if self._max else None
+
+    @property
+    def min(self) -> Optional[float]:
+        return self._min[0][1] if self._min else None
+
+
+class LaggedValue:
+    """lag 초 전 시점(이하)의 마지막 값
+
+    resolution 초 단위 슬롯마다 마지막 값만 남기므로 보관 크기는 lag / resolution 으로 고정된다.
+    """
+
+    __slots__ = ('lag', 'resolution', '_slots', 'value')
+
+    def __init__(self, lag: float, resolution: float = 1.0):
+        self.lag = lag
+        self.resolution = resolution
+        self._slots = deque()  # (슬롯, 시각, 값)
+        self.value: Optional[float] = None
+
+    def update(self, timestamp: float, value: float):
+        slot = int(timestamp // self.resolution)
+        slots = self._slots
+        if slots and slots[-1][0] == slot:
+            slots[-1] = (slot, timestamp, value)
+        else:
+            slots.append((slot, timestamp, value))
+
+        cutoff = timestamp - self.lag
+        while slots and slots[0][1] <= cutoff:
+            self.value = slots.popleft()[2]
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
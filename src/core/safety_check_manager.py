@@ -273,17 +273,26 @@ class SafetyCheckManager:
         closed_count = 0
         failed_count = 0
         
+        # 청산 주문을 배치로 전송 (요청당 5개)
+        try:
+            results = await self.binance_api.close_positions([p.symbol for p in positions])
+        except Exception as e:
+            logger.error(f"포지션 일괄 청산 오류: {e}")
+            results = {}
+        
         for position in positions:
             try:
-                result = await self.binance_api.close_position(position.symbol)
+                result = results.get(position.symbol)
                 
                 if result:
                     closed_count += 1
                     logger.info(f"✅ {position.symbol} 포지션 청산 완료")
                     
-                    # 포지션 매니저에서 제거
-                    current_price = await self.binance_api.get_current_price(position.symbol)
-                    await self.position_manager.remove_position(position.symbol, current_price)
+                    # 포지션 매니저에서 제거 (체결가 우선)
+                    exit_price = float(result.get('avgPrice') or 0)
+                    if exit_price <= 0:
+                        exit_price = await self.binance_api.get_current_price(position.symbol)
+                    await self.position_manager.remove_position(position.symbol, "안전 체크 일괄 청산", exit_price)
                 else:
                     failed_count += 1
                     logger.error(f"❌ {position.symbol} 포지션 청산 실패")
@@ -0,0 +1,34 @@
+# src/core/simulator/__init__.py
+"""
+로컬 거래소 시뮬레이터
+실제 거래소 없이 BinanceAPI / 웹소켓 모니터 / 전략을 함께 실행하기 위한 인프로세스 선물 거래소와
+네트워크 없이 스트림 처리 경로에 과거 시세를 흘려 넣는 재생 드라이버
+"""
+
+from src.core.kline_store import INTERVAL_MS
+from .market import ReplayMarket, SimClock, load_cached_klines
+from .streams import StreamEventBuilder
+from .exchange import ExchangeSimulator, SimAccount, SimulatorError
+from .launcher import start_simulator, collect_symbols
+from .replay import (
+    ReplayDriver, ReplayClock, ReplayEvent, market_events, recording_events, patch_clock
+)
+
+__all__ = [
+    'ReplayMarket',
+    'SimClock',
+    'INTERVAL_MS',
+    'load_cached_klines',
+    'StreamEventBuilder',
+    'ExchangeSimulator',
+    'SimAccount',
+    'SimulatorError',
+    'start_simulator',
+    'collect_symbols',
+    'ReplayDriver',
+    'ReplayClock',
+    'ReplayEvent',
+    'market_events',
+    'recording_events',
+    'patch_clock',
+]
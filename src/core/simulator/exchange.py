@@ -0,0 +1,894 @@
+# src/core/simulator/exchange.py
+"""
+로컬 선물 거래소 시뮬레이터
+aiohttp 서버 하나로 REST(/fapi/...)와 웹소켓(/ws, /stream) 엔드포인트를 제공한다.
+BinanceAPI / RealtimePriceMonitor / UserDataStream 이 실제 거래소 대신 접속할 수 있도록
+응답 형식, 가중치 헤더, 429 레이트 리밋 응답을 거래소와 같게 맞춘다.
+
+- 계좌는 X-MBX-APIKEY 별로 자동 생성 (서명은 검증하지 않음)
+- One-way 포지션, MARKET 즉시 체결, LIMIT/STOP_MARKET/TAKE_PROFIT_MARKET 은 틱마다 체결 검사
+- 시세는 ReplayMarket 재생 시계 기준
+"""
+
+import asyncio
+import itertools
+import json
+import logging
+import secrets
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from aiohttp import WSMsgType, web
+
+from src.core.binance_api import SlidingWindowCounter, SlidingWindowRateLimiter
+from src.core.kline_store import INTERVAL_MS
+from src.core.simulator.market import ReplayMarket, tick_decimals
+from src.core.simulator.streams import StreamEventBuilder, compact_json as _compact
+
+logger = logging.getLogger(__name__)
+
+# 요청 가중치 (거래소 문서 기준, 파라미터별 가변 가중치는 핸들러에서 계산)
+ENDPOINT_WEIGHTS = {
+    '/fapi/v1/exchangeInfo': 1,
+    '/fapi/v2/account': 5,
+    '/fapi/v2/positionRisk': 5,
+    '/fapi/v1/batchOrders': 5,
+    '/fapi/v1/openOrders': 1,
+    '/fapi/v1/order': 1,
+}
+
+# STOP 계열 주문 체결 조건 (side -> 현재가가 stopPrice 이상이어야 하는지)
+_TRIGGER_ABOVE = {
+    ('STOP_MARKET', 'BUY'): True,
+    ('STOP_MARKET', 'SELL'): False,
+    ('TAKE_PROFIT_MARKET', 'BUY'): False,
+    ('TAKE_PROFIT_MARKET', 'SELL'): True,
+}
+
+
+class SimulatorError(Exception):
+    """거래소 형식 오류 응답 (HTTP 상태, 오류 코드)"""
+
+    def __init__(self, code: int, msg: str, status: int = 400):
+        super().__init__(msg)
+        self.code = code
+        self.msg = msg
+        self.status = status
+
+
+@dataclass
+class SimPosition:
+    amount: float = 0.0  # 부호 포함 (롱 +, 숏 -)
+    entry_price: float = 0.0
+
+
+@dataclass
+class SimAccount:
+    """시뮬레이터 계좌"""
+    api_key: str
+    wallet_balance: float
+    positions: Dict[str, SimPosition] = field(default_factory=lambda: defaultdict(SimPosition))
+    leverages: Dict[str, int] = field(default_factory=dict)
+    isolated: Dict[str, bool] = field(default_factory=dict)
+    open_orders: Dict[int, Dict] = field(default_factory=dict)
+    dual_side: bool = False
+    listen_key: Optional[str] = None
+    order_counters: Dict[str, SlidingWindowCounter] = field(default_factory=lambda: {
+        '10S': SlidingWindowCounter(300, 10),
+        '1M': SlidingWindowCounter(1200, 60),
+    })
+
+
+class _WsClient:
+    """웹소켓 연결 상태"""
+
+    def __init__(self, ws: web.WebSocketResponse, combined: bool):
+        self.ws = ws
+        self.combined = combined
+        self.streams: Set[str] = set()
+
+
+class ExchangeSimulator:
+    """인프로세스 선물 거래소"""
+
+    def __init__(self, market: ReplayMarket, host: str = '127.0.0.1', port: int = 0,
+                 initial_balance: float = 10000.0, weight_limit: int = 2400,
+                 order_limit_10s: int = 300, order_limit_1m: int = 1200,
+                 latency_ms: float = 0.0, tick_interval: float = 1.0,
+                 taker_fee: float = 0.0004, default_leverage: int = 10):
+        """
+        Args:
+            market: 시세 재생기
+            port: 0 이면 임의 포트
+            weight_limit: IP 당 1분 가중치 한도 (초과 시 429, 코드 -1003)
+            order_limit_10s / order_limit_1m: 계좌당 주문 수 한도 (초과 시 429, 코드 -1015)
+            latency_ms: REST 응답 지연 (네트워크 지연 모사)
+            tick_interval: 시세/주문 체결 검사 주기 (초, 실제 시간)
+        """
+        self.market = market
+        self.host = host
+        self.port = port
+        self.initial_balance = initial_balance
+        self.order_limit_10s = order_limit_10s
+        self.order_limit_1m = order_limit_1m
+        self.latency_ms = latency_ms
+        self.tick_interval = tick_interval
+        self.taker_fee = taker_fee
+        self.default_leverage = default_leverage
+
+        # IP 가중치 (모든 계좌 공유 - 실제 거래소도 IP 기준)
+        self.weight_counter = SlidingWindowCounter(weight_limit, 60)
+
+        self.accounts: Dict[str, SimAccount] = {}
+        self._listen_keys: Dict[str, SimAccount] = {}
+        self._order_ids = itertools.count(1)
+        self._trade_ids = itertools.count(1)
+
+        self.prices: Dict[str, float] = {}
+        self._clients: Set[_WsClient] = set()
+        self._subscribers: Dict[str, Set[_WsClient]] = defaultdict(set)
+        self._user_streams: Dict[str, Set[web.WebSocketResponse]] = defaultdict(set)
+        self.streams = StreamEventBuilder(market)
+
+        self._runner: Optional[web.AppRunner] = None
+        self._tick_task: Optional[asyncio.Task] = None
+
+        self.stats = {
+            'requests': 0,
+            'rate_limited': 0,
+            'orders': 0,
+            'fills': 0,
+            'ws_messages': 0,
+        }
+
+        self.app = web.Application(middlewares=[self._middleware])
+        self._setup_routes()
+
+    # ===== 수명 주기 =====
+
+    @property
+    def rest_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def ws_url(self) -> str:
+        return f"ws://{self.host}:{self.port}"
+
+    def environment(self) -> Dict[str, str]:
+        """BinanceAPI 접속 주소 환경변수"""
+        return {
+            'BINANCE_FUTURES_REST_URL': self.rest_url,
+            'BINANCE_FUTURES_WS_URL': self.ws_url,
+        }
+
+    async def start(self):
+        """서버 및 시세 틱 시작"""
+        if self.market.clock is None:
+            self.market.start()
+        self._update_prices(self.market.now_ms())
+
+        self._runner = web.AppRunner(self.app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+
+        self._tick_task = asyncio.create_task(self._tick_loop())
+        logger.info(
+            f"거래소 시뮬레이터 시작: {self.rest_url} "
+            f"({len(self.market.candles)}개 심볼, {self.market.speed}배속)"
+        )
+
+    async def stop(self):
+        """서버 중지"""
+        if self._tick_task:
+            self._tick_task.cancel()
+            try:
+                await self._tick_task
+            except asyncio.CancelledError:
+                pass
+        for client in list(self._clients):
+            await client.ws.close()
+        for sockets in list(self._user_streams.values()):
+            for ws in list(sockets):
+                await ws.close()
+        if self._runner:
+            await self._runner.cleanup()
+        logger.info("거래소 시뮬레이터 중지")
+
+    # ===== 공통 처리 =====
+
+    def _setup_routes(self):
+        self.app.add_routes([
+            web.get('/fapi/v1/ping', self._ping),
+            web.get('/fapi/v1/time', self._time),
+            web.get('/fapi/v1/exchangeInfo', self._exchange_info),
+            web.get('/fapi/v1/klines', self._klines),
+            web.get('/fapi/v1/ticker/price', self._ticker_price),
+            web.get('/fapi/v1/ticker/24hr', self._ticker_24hr),
+            web.get('/fapi/v1/depth', self._depth),
+            web.get('/fapi/v2/account', self._account_info),
+            web.get('/fapi/v2/positionRisk', self._position_risk),
+            web.get('/fapi/v1/positionSide/dual', self._get_position_mode),
+            web.post('/fapi/v1/positionSide/dual', self._set_position_mode),
+            web.post('/fapi/v1/leverage', self._leverage),
+            web.post('/fapi/v1/marginType', self._margin_type),
+            web.post('/fapi/v1/order', self._new_order),
+            web.delete('/fapi/v1/order', self._cancel_order),
+            web.post('/fapi/v1/batchOrders', self._batch_orders),
+            web.get('/fapi/v1/openOrders', self._open_orders),
+            web.delete('/fapi/v1/allOpenOrders', self._cancel_all_orders),
+            web.post('/fapi/v1/listenKey', self._create_listen_key),
+            web.put('/fapi/v1/listenKey', self._keepalive_listen_key),
+            web.delete('/fapi/v1/listenKey', self._close_listen_key),
+            web.get('/ws', self._ws_handler),
+            web.get('/ws/{name}', self._ws_handler),
+            web.get('/stream', self._ws_handler),
+        ])
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler):
+        """지연 모사, IP 가중치 차감, 오류 응답 변환"""
+        if request.path.startswith('/ws') or request.path.startswith('/stream'):
+            return await handler(request)
+
+        self.stats['requests'] += 1
+        if self.latency_ms:
+            await asyncio.sleep(self.latency_ms / 1000)
+
+        now = time.time()
+        weight = self._request_weight(request)
+        if self.weight_counter.used(now) + weight > self.weight_counter.limit:
+            self.stats['rate_limited'] += 1
+            retry_after = max(1, int(self.weight_counter.seconds_until_available(weight, now)) + 1)
+            return self._error_response(
+                SimulatorError(-1003, 'Too many requests; current limit is '
+                               f'{self.weight_counter.limit} request weight per 1 MINUTE.', 429),
+                {'Retry-After': str(retry_after),
+                 'X-MBX-USED-WEIGHT-1M': str(self.weight_counter.used(now))}
+            )
+        self.weight_counter.add(weight, now)
+        headers = {'X-MBX-USED-WEIGHT-1M': str(self.weight_counter.used(now))}
+
+        try:
+            request['params'] = await self._params(request)
+            result = await handler(request)
+        except SimulatorError as e:
+            return self._error_response(e, headers)
+
+        account = request.get('account')
+        if account is not None:
+            for interval, counter in account.order_counters.items():
+                headers[f'X-MBX-ORDER-COUNT-{interval}'] = str(counter.used(now))
+        return web.Response(text=json.dumps(result), content_type='application/json', headers=headers)
+
+    @staticmethod
+    def _error_response(error: SimulatorError, headers: Dict[str, str]) -> web.Response:
+        return web.Response(
+            text=json.dumps({'code': error.code, 'msg': error.msg}),
+            status=error.status, content_type='application/json', headers=headers
+        )
+
+    @staticmethod
+    async def _params(request: web.Request) -> Dict[str, str]:
+        params = dict(request.query)
+        if request.method in ('POST', 'PUT') and request.can_read_body:
+            params.update(await request.post())
+        return params
+
+    def _request_weight(self, request: web.Request) -> int:
+        path = request.path
+        query = request.query
+        if path == '/fapi/v1/klines':
+            return SlidingWindowRateLimiter.kline_weight(int(query.get('limit', 500)))
+        if path == '/fapi/v1/ticker/price':
+            return 1 if 'symbol' in query else 2
+        if path == '/fapi/v1/ticker/24hr':
+            return 1 if 'symbol' in query else 40
+        if path == '/fapi/v1/depth':
+            limit = int(query.get('limit', 500))
+            return 2 if limit <= 50 else 5 if limit <= 100 else 10 if limit <= 500 else 20
+        return ENDPOINT_WEIGHTS.get(path, 1)
+
+    def _get_account(self, request: web.Request) -> SimAccount:
+        """API 키로 계좌 조회 (없으면 생성)"""
+        api_key = request.headers.get('X-MBX-APIKEY')
+        if not api_key:
+            raise SimulatorError(-2014, 'API-key format invalid.', 401)
+        account = self.accounts.get(api_key)
+        if account is None:
+            account = self.accounts[api_key] = SimAccount(api_key, self.initial_balance)
+            for counter, limit in ((account.order_counters['10S'], self.order_limit_10s),
+                                   (account.order_counters['1M'], self.order_limit_1m)):
+                counter.limit = limit
+        request['account'] = account
+        return account
+
+    def _symbol(self, params: Dict) -> str:
+        symbol = params.get('symbol', '')
+        if symbol not in self.market.candles:
+            raise SimulatorError(-1121, 'Invalid symbol.')
+        return symbol
+
+    def _fmt_price(self, symbol: str, price: float) -> str:
+        return self.streams.fmt_price(symbol, price)
+
+    # ===== 시세 REST =====
+
+    async def _ping(self, request):
+        return {}
+
+    async def _time(self, request):
+        return {'serverTime': self.market.now_ms()}
+
+    async def _exchange_info(self, request):
+        symbols = []
+        for symbol, tick in self.market.tick_sizes.items():
+            decimals = tick_decimals(tick)
+            # 가격대가 높을수록 수량 단위가 작음 (최소 주문 금액 5 USDT 근처)
+            step_decimals = max(0, min(3, 4 - decimals))
+            step = f"{10.0 ** -step_decimals:.{step_decimals}f}"
+            symbols.append({
+                'symbol': symbol,
+                'status': 'TRADING',
+                'contractType': 'PERPETUAL',
+                'baseAsset': symbol[:-4],
+                'quoteAsset': 'USDT',
+                'pricePrecision': decimals,
+                'quantityPrecision': step_decimals,
+                'filters': [
+                    {'filterType': 'PRICE_FILTER', 'minPrice': f"{tick:.{decimals}f}",
+                     'maxPrice': '10000000', 'tickSize': f"{tick:.{decimals}f}"},
+                    {'filterType': 'LOT_SIZE', 'minQty': step, 'maxQty': '10000000', 'stepSize': step},
+                    {'filterType': 'MARKET_LOT_SIZE', 'minQty': step, 'maxQty': '10000000', 'stepSize': step},
+                    {'filterType': 'MIN_NOTIONAL', 'notional': '5'},
+                ]
+            })
+        return {'timezone': 'UTC', 'serverTime': self.market.now_ms(), 'symbols': symbols}
+
+    async def _klines(self, request):
+        params = request['params']
+        symbol = self._symbol(params)
+        interval = params.get('interval')
+        if interval not in INTERVAL_MS:
+            raise SimulatorError(-1120, 'Invalid interval.')
+        try:
+            return self.market.klines(
+                symbol, interval, min(int(params.get('limit', 500)), 1500),
+                int(params['startTime']) if 'startTime' in params else None,
+                int(params['endTime']) if 'endTime' in params else None
+            )
+        except ValueError as e:
+            raise SimulatorError(-1120, str(e))
+
+    async def _ticker_price(self, request):
+        params = request['params']
+        now = self.market.now_ms()
+        if 'symbol' in params:
+            symbol = self._symbol(params)
+            return {'symbol': symbol, 'price': self._fmt_price(symbol, self.prices[symbol]), 'time': now}
+        return [{'symbol': s, 'price': self._fmt_price(s, p), 'time': now} for s, p in self.prices.items()]
+
+    def _ticker(self, symbol: str) -> Dict:
+        rows = self.market.klines(symbol, '1h' if INTERVAL_MS['1h'] >= self.market.base_ms
+                                  else self.market.base_interval, limit=25)
+        open_price = float(rows[0][1])
+        last = self.prices[symbol]
+        change = last - open_price
+        return {
+            'symbol': symbol,
+            'priceChange': self._fmt_price(symbol, change),
+            'priceChangePercent': f"{change / open_price * 100:.3f}" if open_price else '0',
+            'lastPrice': self._fmt_price(symbol, last),
+            'openPrice': self._fmt_price(symbol, open_price),
+            'highPrice': self._fmt_price(symbol, max(float(r[2]) for r in rows)),
+            'lowPrice': self._fmt_price(symbol, min(float(r[3]) for r in rows)),
+            'volume': f"{sum(float(r[5]) for r in rows):.3f}",
+            'quoteVolume': f"{sum(float(r[7]) for r in rows):.2f}",
+            'closeTime': self.market.now_ms(),
+        }
+
+    async def _ticker_24hr(self, request):
+        params = request['params']
+        if 'symbol' in params:
+            return self._ticker(self._symbol(params))
+        return [self._ticker(symbol) for symbol in self.market.candles]
+
+    async def _depth(self, request):
+        params = request['params']
+        symbol = self._symbol(params)
+        limit = int(params.get('limit', 20))
+        tick = self.market.tick_sizes[symbol]
+        price = self.prices[symbol]
+        return {
+            'lastUpdateId': self.market.now_ms(),
+            'bids': [[self._fmt_price(symbol, price - tick * (i + 1)), '1.000'] for i in range(limit)],
+            'asks': [[self._fmt_price(symbol, price + tick * (i + 1)), '1.000'] for i in range(limit)],
+        }
+
+    # ===== 계좌 REST =====
+
+    def _position_fields(self, account: SimAccount, symbol: str) -> Dict:
+        position = account.positions.get(symbol) or SimPosition()
+        mark = self.prices[symbol]
+        leverage = account.leverages.get(symbol, self.default_leverage)
+        notional = position.amount * mark
+        unrealized = (mark - position.entry_price) * position.amount if position.amount else 0.0
+        return {
+            'symbol': symbol,
+            'positionAmt': f"{position.amount:.8g}",
+            'entryPrice': self._fmt_price(symbol, position.entry_price),
+            'markPrice': self._fmt_price(symbol, mark),
+            'unrealizedProfit': f"{unrealized:.8f}",
+            'leverage': str(leverage),
+            'isolated': account.isolated.get(symbol, False),
+            'positionSide': 'BOTH',
+            'notional': f"{notional:.8f}",
+            'initialMargin': f"{abs(notional) / leverage:.8f}",
+            'isolatedWallet': '0',
+        }
+
+    def _margin_summary(self, account: SimAccount) -> Tuple[float, float]:
+        """(미실현 손익 합계, 사용 증거금 합계)"""
+        unrealized = 0.0
+        margin = 0.0
+        for symbol, position in account.positions.items():
+            if not position.amount:
+                continue
+            mark = self.prices[symbol]
+            unrealized += (mark - position.entry_price) * position.amount
+            margin += abs(position.amount) * mark / account.leverages.get(symbol, self.default_leverage)
+        return unrealized, margin
+
+    async def _account_info(self, request):
+        account = self._get_account(request)
+        unrealized, margin = self._margin_summary(account)
+        margin_balance = account.wallet_balance + unrealized
+        available = margin_balance - margin
+        return {
+            'totalWalletBalance': f"{account.wallet_balance:.8f}",
+            'totalUnrealizedProfit': f"{unrealized:.8f}",
+            'totalMarginBalance': f"{margin_balance:.8f}",
+            'totalPositionInitialMargin': f"{margin:.8f}",
+            'availableBalance': f"{available:.8f}",
+            'maxWithdrawAmount': f"{max(0.0, available):.8f}",
+            'assets': [{
+                'asset': 'USDT',
+                'walletBalance': f"{account.wallet_balance:.8f}",
+                'unrealizedProfit': f"{unrealized:.8f}",
+                'marginBalance': f"{margin_balance:.8f}",
+                'availableBalance': f"{available:.8f}",
+            }],
+            'positions': [self._position_fields(account, symbol) for symbol in self.market.candles],
+        }
+
+    async def _position_risk(self, request):
+        account = self._get_account(request)
+        params = request['params']
+        symbols = [self._symbol(params)] if 'symbol' in params else list(self.market.candles)
+        return [
+            {**self._position_fields(account, symbol), 'liquidationPrice': '0', 'marginType':
+             'isolated' if account.isolated.get(symbol) else 'cross'}
+            for symbol in symbols
+        ]
+
+    async def _get_position_mode(self, request):
+        return {'dualSidePosition': self._get_account(request).dual_side}
+
+    async def _set_position_mode(self, request):
+        account = self._get_account(request)
+        account.dual_side = request['params'].get('dualSidePosition') == 'true'
+        return {'code': 200, 'msg': 'success'}
+
+    async def _leverage(self, request):
+        account = self._get_account(request)
+        params = request['params']
+        symbol = self._symbol(params)
+        leverage = int(params.get('leverage', self.default_leverage))
+        if not 1 <= leverage <= 125:
+            raise SimulatorError(-4028, 'Leverage is not valid')
+        account.leverages[symbol] = leverage
+        await self._push_user_event(account, {
+            'e': 'ACCOUNT_CONFIG_UPDATE', 'E': self.market.now_ms(), 'T': self.market.now_ms(),
+            'ac': {'s': symbol, 'l': leverage}
+        })
+        return {'symbol': symbol, 'leverage': leverage, 'maxNotionalValue': '10000000'}
+
+    async def _margin_type(self, request):
+        account = self._get_account(request)
+        params = request['params']
+        symbol = self._symbol(params)
+        isolated = params.get('marginType', '').upper() == 'ISOLATED'
+        if account.isolated.get(symbol, False) == isolated:
+            raise SimulatorError(-4046, 'No need to change margin type.')
+        account.isolated[symbol] = isolated
+        return {'code': 200, 'msg': 'success'}
+
+    # ===== 주문 =====
+
+    def _count_orders(self, account: SimAccount, count: int):
+        now = time.time()
+        for counter in account.order_counters.values():
+            if counter.used(now) + count > counter.limit:
+                self.stats['rate_limited'] += 1
+                raise SimulatorError(-1015, 'Too many new orders.', 429)
+        for counter in account.order_counters.values():
+            counter.add(count, now)
+
+    async def _new_order(self, request):
+        account = self._get_account(request)
+        self._count_orders(account, 1)
+        return await self._place(account, request['params'])
+
+    async def _batch_orders(self, request):
+        account = self._get_account(request)
+        orders = json.loads(request['params'].get('batchOrders', '[]'))
+        if not 1 <= len(orders) <= 5:
+            raise SimulatorError(-1130, 'Data sent for parameter batchOrders is not valid.')
+        self._count_orders(account, len(orders))
+        results = []
+        for order in orders:
+            try:
+                results.append(await self._place(account, order))
+            except SimulatorError as e:
+                results.append({'code': e.code, 'msg': e.msg})
+        return results
+
+    async def _place(self, account: SimAccount, params: Dict) -> Dict:
+        """주문 접수 - MARKET 은 즉시 체결, 나머지는 대기 주문"""
+        symbol = self._symbol(params)
+        side = params.get('side')
+        order_type = params.get('type')
+        if side not in ('BUY', 'SELL'):
+            raise SimulatorError(-1117, 'Invalid side.')
+        if order_type not in ('MARKET', 'LIMIT', 'STOP_MARKET', 'TAKE_PROFIT_MARKET'):
+            raise SimulatorError(-1116, 'Invalid orderType.')
+
+        close_position = str(params.get('closePosition', 'false')).lower() == 'true'
+        quantity = float(params.get('quantity', 0) or 0)
+        if quantity <= 0 and not close_position:
+            raise SimulatorError(-4003, 'Quantity less than or equal to zero.')
+        if order_type in ('STOP_MARKET', 'TAKE_PROFIT_MARKET') and not params.get('stopPrice'):
+            raise SimulatorError(-1102, "Mandatory parameter 'stopPrice' was not sent.")
+        if order_type == 'LIMIT' and not params.get('price'):
+            raise SimulatorError(-1102, "Mandatory parameter 'price' was not sent.")
+
+        self.stats['orders'] += 1
+        now = self.market.now_ms()
+        order = {
+            'orderId': next(self._order_ids),
+            'symbol': symbol,
+            'status': 'NEW',
+            'clientOrderId': params.get('newClientOrderId') or f"sim_{secrets.token_hex(6)}",
+            'price': params.get('price', '0'),
+            'avgPrice': '0',
+            'origQty': f"{quantity:.8g}",
+            'executedQty': '0',
+            'cumQuote': '0',
+            'timeInForce': params.get('timeInForce', 'GTC'),
+            'type': order_type,
+            'reduceOnly': str(params.get('reduceOnly', 'false')).lower() == 'true' or close_position,
+            'closePosition': close_position,
+            'side': side,
+            'positionSide': 'BOTH',
+            'stopPrice': params.get('stopPrice', '0'),
+            'updateTime': now,
+        }
+
+        if order_type == 'MARKET':
+            await self._fill(account, order, self.prices[symbol])
+        else:
+            account.open_orders[order['orderId']] = order
+            await self._push_order_update(account, order, 'NEW')
+        return dict(order)
+
+    async def _fill(self, account: SimAccount, order: Dict, price: float):
+        """체결 처리 - 포지션/잔고 갱신 후 사용자 스트림 이벤트"""
+        symbol = order['symbol']
+        position = account.positions[symbol]
+        direction = 1 if order['side'] == 'BUY' else -1
+        quantity = float(order['origQty'])
+
+        if order['closePosition']:
+            quantity = abs(position.amount)
+        if order['reduceOnly']:
+            if position.amount == 0 or (position.amount > 0) == (direction > 0):
+                raise SimulatorError(-2022, 'ReduceOnly Order is rejected.')
+            quantity = min(quantity, abs(position.amount))
+
+        # 신규/증가분 증거금 확인
+        opening = quantity if position.amount * direction >= 0 else max(0.0, quantity - abs(position.amount))
+        if opening:
+            unrealized, margin = self._margin_summary(account)
+            available = account.wallet_balance + unrealized - margin
+            leverage = account.leverages.get(symbol, self.default_leverage)
+            if opening * price / leverage > available:
+                raise SimulatorError(-2019, 'Margin is insufficient.')
+
+        realized = 0.0
+        signed = quantity * direction
+        if position.amount * direction < 0:
+            closed = min(quantity, abs(position.amount))
+            realized = (price - position.entry_price) * closed * (1 if position.amount > 0 else -1)
+        new_amount = round(position.amount + signed, 10)
+        if position.amount * direction >= 0 and new_amount:
+            position.entry_price = (position.entry_price * abs(position.amount) + price * quantity) / abs(new_amount)
+        elif new_amount and (new_amount > 0) != (position.amount > 0):
+            position.entry_price = price  # 반대 방향으로 전환
+        elif not new_amount:
+            position.entry_price = 0.0
+        position.amount = new_amount
+
+        fee = quantity * price * self.taker_fee
+        account.wallet_balance += realized - fee
+        self.stats['fills'] += 1
+
+        order.update({
+            'status': 'FILLED',
+            'avgPrice': self._fmt_price(symbol, price),
+            'origQty': f"{quantity:.8g}",
+            'executedQty': f"{quantity:.8g}",
+            'cumQuote': f"{quantity * price:.8f}",
+            'updateTime': self.market.now_ms(),
+        })
+        await self._push_order_update(account, order, 'TRADE', price, quantity, realized, fee)
+        await self._push_account_update(account, symbol)
+
+    async def _cancel_order(self, request):
+        account = self._get_account(request)
+        params = request['params']
+        order = account.open_orders.pop(int(params.get('orderId', 0)), None)
+        if order is None:
+            raise SimulatorError(-2011, 'Unknown order sent.')
+        order['status'] = 'CANCELED'
+        await self._push_order_update(account, order, 'CANCELED')
+        return order
+
+    async def _open_orders(self, request):
+        account = self._get_account(request)
+        symbol = request['params'].get('symbol')
+        return [order for order in account.open_orders.values() if symbol in (None, order['symbol'])]
+
+    async def _cancel_all_orders(self, request):
+        account = self._get_account(request)
+        symbol = self._symbol(request['params'])
+        for order_id in [i for i, o in account.open_orders.items() if o['symbol'] == symbol]:
+            order = account.open_orders.pop(order_id)
+            order['status'] = 'CANCELED'
+            await self._push_order_update(account, order, 'CANCELED')
+        return {'code': 200, 'msg': 'The operation of cancel all open order is done.'}
+
+    async def _check_open_orders(self):
+        """대기 주문 체결 조건 검사 (틱마다)"""
+        for account in self.accounts.values():
+            for order_id, order in list(account.open_orders.items()):
+                price = self.prices[order['symbol']]
+                if order['type'] == 'LIMIT':
+                    limit = float(order['price'])
+                    triggered = price <= limit if order['side'] == 'BUY' else price >= limit
+                    fill_price = limit
+                else:
+                    stop = float(order['stopPrice'])
+                    above = _TRIGGER_ABOVE[(order['type'], order['side'])]
+                    triggered = price >= stop if above else price <= stop
+                    fill_price = price
+                if not triggered:
+                    continue
+                account.open_orders.pop(order_id, None)
+                try:
+                    await self._fill(account, order, fill_price)
+                except SimulatorError as e:
+                    # 청산할 포지션이 없는 STOP(closePosition) 등은 만료 처리
+                    order['status'] = 'EXPIRED'
+                    await self._push_order_update(account, order, 'EXPIRED')
+                    logger.debug(f"시뮬레이터 대기 주문 만료 ({order['symbol']} #{order_id}): {e.msg}")
+
+    # ===== 사용자 데이터 스트림 =====
+
+    async def _create_listen_key(self, request):
+        account = self._get_account(request)
+        if account.listen_key is None:
+            account.listen_key = secrets.token_hex(32)
+            self._listen_keys[account.listen_key] = account
+        return {'listenKey': account.listen_key}
+
+    async def _keepalive_listen_key(self, request):
+        account = self._get_account(request)
+        if account.listen_key is None:
+            raise SimulatorError(-1125, 'This listenKey does not exist.')
+        return {'listenKey': account.listen_key}
+
+    async def _close_listen_key(self, request):
+        account = self._get_account(request)
+        if account.listen_key:
+            self._listen_keys.pop(account.listen_key, None)
+            for ws in list(self._user_streams.pop(account.listen_key, ())):
+                await ws.close()
+            account.listen_key = None
+        return {}
+
+    async def _push_user_event(self, account: SimAccount, event: Dict):
+        sockets = self._user_streams.get(account.listen_key) if account.listen_key else None
+        if not sockets:
+            return
+        message = _compact(event)
+        for ws in list(sockets):
+            try:
+                await ws.send_str(message)
+            except ConnectionError:
+                sockets.discard(ws)
+
+    async def _push_order_update(self, account: SimAccount, order: Dict, execution: str,
+                                 price: float = 0.0, quantity: float = 0.0,
+                                 realized: float = 0.0, fee: float = 0.0):
+        now = self.market.now_ms()
+        await self._push_user_event(account, {
+            'e': 'ORDER_TRADE_UPDATE', 'E': now, 'T': now,
+            'o': {
+                's': order['symbol'], 'c': order['clientOrderId'], 'S': order['side'],
+                'o': order['type'], 'f': order['timeInForce'], 'q': order['origQty'],
+                'p': order['price'], 'ap': order['avgPrice'], 'sp': order['stopPrice'],
+                'x': execution, 'X': order['status'], 'i': order['orderId'],
+                'l': f"{quantity:.8g}", 'z': order['executedQty'], 'L': f"{price:.8g}",
+                'N': 'USDT', 'n': f"{fee:.8f}", 'T': now,
+                't': next(self._trade_ids) if execution == 'TRADE' else 0,
+                'm': False, 'R': order['reduceOnly'], 'ps': 'BOTH',
+                'cp': order['closePosition'], 'rp': f"{realized:.8f}",
+            }
+        })
+
+    async def _push_account_update(self, account: SimAccount, symbol: str):
+        now = self.market.now_ms()
+        fields = self._position_fields(account, symbol)
+        await self._push_user_event(account, {
+            'e': 'ACCOUNT_UPDATE', 'E': now, 'T': now,
+            'a': {
+                'm': 'ORDER',
+                'B': [{'a': 'USDT', 'wb': f"{account.wallet_balance:.8f}",
+                       'cw': f"{account.wallet_balance:.8f}", 'bc': '0'}],
+                'P': [{'s': symbol, 'pa': fields['positionAmt'], 'ep': fields['entryPrice'],
+                       'cr': '0', 'up': fields['unrealizedProfit'],
+                       'mt': 'isolated' if fields['isolated'] else 'cross', 'iw': '0', 'ps': 'BOTH'}],
+            }
+        })
+
+    # ===== 웹소켓 =====
+
+    async def _ws_handler(self, request: web.Request):
+        ws = web.WebSocketResponse(heartbeat=30)
+        await ws.prepare(request)
+        name = request.match_info.get('name')
+
+        if name and name in self._listen_keys:
+            return await self._serve_user_stream(ws, name)
+
+        client = _WsClient(ws, combined=request.path == '/stream')
+        self._clients.add(client)
+        initial = request.query.get('streams', '').split('/') if client.combined else [name]
+        self._subscribe(client, [stream for stream in initial if stream])
+        try:
+            async for message in ws:
+                if message.type != WSMsgType.TEXT:
+                    continue
+                await self._handle_ws_request(client, message.data)
+        finally:
+            self._clients.discard(client)
+            self._unsubscribe(client, list(client.streams))
+        return ws
+
+    async def _serve_user_stream(self, ws: web.WebSocketResponse, listen_key: str):
+        sockets = self._user_streams[listen_key]
+        sockets.add(ws)
+        try:
+            async for _ in ws:
+                pass
+        finally:
+            sockets.discard(ws)
+        return ws
+
+    async def _handle_ws_request(self, client: _WsClient, text: str):
+        """SUBSCRIBE / UNSUBSCRIBE / LIST_SUBSCRIPTIONS"""
+        try:
+            request = json.loads(text)
+        except json.JSONDecodeError:
+            await client.ws.send_str(json.dumps({'code': 2, 'msg': 'Invalid JSON'}))
+            return
+        method = request.get('method')
+        params = request.get('params') or []
+        result = None
+        if method == 'SUBSCRIBE':
+            self._subscribe(client, params)
+        elif method == 'UNSUBSCRIBE':
+            self._unsubscribe(client, params)
+        elif method == 'LIST_SUBSCRIPTIONS':
+            result = sorted(client.streams)
+        else:
+            await client.ws.send_str(json.dumps({'code': 1, 'msg': f'Invalid method {method}',
+                                                 'id': request.get('id')}))
+            return
+        await client.ws.send_str(json.dumps({'result': result, 'id': request.get('id')}))
+
+    def _subscribe(self, client: _WsClient, streams: List[str]):
+        for stream in streams:
+            client.streams.add(stream)
+            self._subscribers[stream].add(client)
+
+    def _unsubscribe(self, client: _WsClient, streams: List[str]):
+        for stream in streams:
+            client.streams.discard(stream)
+            subscribers = self._subscribers.get(stream)
+            if subscribers is not None:
+                subscribers.discard(client)
+                if not subscribers:
+                    del self._subscribers[stream]
+                    self.streams.forget(stream)
+
+    # ===== 시세 틱 =====
+
+    def _update_prices(self, now_ms: int):
+        for symbol in self.market.candles:
+            self.prices[symbol] = self.market.price(symbol, now_ms)
+
+    async def _tick_loop(self):
+        while True:
+            try:
+                await asyncio.sleep(self.tick_interval)
+                now = self.market.now_ms()
+                self._update_prices(now)
+                await self._check_open_orders()
+                await self._broadcast(now)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"시뮬레이터 틱 처리 오류: {e}")
+
+    def _stream_events(self, stream: str, now: int) -> List[Dict]:
+        """구독 스트림의 이번 틱 이벤트"""
+        symbol = stream.partition('@')[0].upper()
+        if symbol not in self.prices:
+            return []
+        return self.streams.events(stream, now, self.prices[symbol])
+
+    async def _broadcast(self, now: int):
+        """스트림별 이벤트를 한 번만 직렬화해 구독자에게 전송"""
+        sends = []
+        for stream, subscribers in list(self._subscribers.items()):
+            events = self._stream_events(stream, now)
+            if not events:
+                continue
+            raw = combined = None
+            for client in list(subscribers):
+                if client.combined:
+                    if combined is None:
+                        combined = [_compact({'stream': stream, 'data': e}) for e in events]
+                    payloads = combined
+                else:
+                    if raw is None:
+                        raw = [_compact(e) for e in events]
+                    payloads = raw
+                sends.extend(self._send(client, payload) for payload in payloads)
+        if sends:
+            self.stats['ws_messages'] += len(sends)
+            await asyncio.gather(*sends)
+
+    async def _send(self, client: _WsClient, payload: str):
+        if client.ws.closed:
+            return
+        try:
+            await client.ws.send_str(payload)
+        except ConnectionError:
+            pass
+
+    # ===== 상태 =====
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            'accounts': len(self.accounts),
+            'ws_clients': len(self._clients),
+            'streams': len(self._subscribers),
+            'weight_used_1m': self.weight_counter.used(time.time()),
+            'sim_time': self.market.now_ms(),
+        }
@@ -0,0 +1,91 @@
+# src/core/simulator/launcher.py
+"""
+설정 기반 시뮬레이터 실행
+main.py / main_multi_account.py 의 --simulate 옵션에서 사용한다.
+시뮬레이터를 같은 이벤트 루프에서 띄운 뒤 BinanceAPI 가 접속하도록 환경변수를 설정한다.
+"""
+
+import logging
+import os
+from typing import Dict, List
+
+from src.core.simulator.exchange import ExchangeSimulator
+from src.core.simulator.market import ReplayMarket
+
+logger = logging.getLogger(__name__)
+
+
+def collect_symbols(config: Dict) -> List[str]:
+    """설정 전체에서 거래 심볼 수집 (전략/서브계좌의 symbols, major_coins + simulator.symbols)"""
+    found = []
+
+    def walk(node):
+        if isinstance(node, dict):
+            for key, value in node.items():
+                if key in ('symbols', 'major_coins') and isinstance(value, list):
+                    found.extend(s for s in value if isinstance(s, str) and s.endswith('USDT'))
+                else:
+                    walk(value)
+        elif isinstance(node, list):
+            for item in node:
+                walk(item)
+
+    walk(config)
+    sim_config = config.get('simulator', {})
+    found.extend(sim_config.get('symbols', []))
+    # 부하 테스트용 가상 심볼
+    found.extend(f"SIM{i:03d}USDT" for i in range(1, sim_config.get('extra_symbols', 0) + 1))
+    return list(dict.fromkeys(found))
+
+
+def build_market(sim_config: Dict, symbols: List[str]) -> ReplayMarket:
+    """과거 데이터 디렉토리가 있으면 재생, 없으면 합성 캔들"""
+    options = {
+        'base_interval': sim_config.get('base_interval', '15m'),
+        'speed': sim_config.get('speed', 1.0),
+        'warmup_bars': sim_config.get('warmup_bars', 1000),
+    }
+    data_dir = sim_config.get('data_dir')
+    if data_dir and os.path.isdir(data_dir):
+        return ReplayMarket.from_csv_dir(data_dir, symbols=symbols or None, **options)
+    if data_dir:
+        logger.warning(f"시뮬레이터 데이터 디렉토리 없음: {data_dir} - 합성 캔들 사용")
+    return ReplayMarket.synthetic(
+        symbols, bars=sim_config.get('bars', options['warmup_bars'] + 2000),
+        volatility=sim_config.get('volatility', 0.002), seed=sim_config.get('seed'), **options
+    )
+
+
+async def start_simulator(config: Dict) -> ExchangeSimulator:
+    """설정으로 시뮬레이터 시작 후 API 엔드포인트/계좌 키 환경변수 설정
+
+    실제 키가 없는 계좌에는 계좌별 가상 키를 넣는다 (시뮬레이터는 키별로 계좌를 구분).
+    """
+    sim_config = config.get('simulator', {})
+    symbols = collect_symbols(config)
+    market = build_market(sim_config, symbols)
+
+    simulator = ExchangeSimulator(
+        market,
+        host=sim_config.get('host', '127.0.0.1'),
+        port=sim_config.get('port', 0),
+        initial_balance=sim_config.get('initial_balance', 10000.0),
+        weight_limit=sim_config.get('weight_limit', 2400),
+        order_limit_10s=sim_config.get('order_limit_10s', 300),
+        order_limit_1m=sim_config.get('order_limit_1m', 1200),
+        latency_ms=sim_config.get('latency_ms', 0.0),
+        tick_interval=sim_config.get('tick_interval', 1.0),
+    )
+    await simulator.start()
+
+    os.environ.update(simulator.environment())
+    os.environ.setdefault('BINANCE_API_KEY', 'sim-master')
+    os.environ.setdefault('BINANCE_SECRET_KEY', 'sim-master-secret')
+    sub_accounts = config.get('multi_account', {}).get('sub_accounts', {})
+    for account_id, account_config in sub_accounts.items():
+        if account_config.get('enabled', True):
+            os.environ.setdefault(f'{account_id.upper()}_API_KEY', f'sim-{account_id}')
+            os.environ.setdefault(f'{account_id.upper()}_API_SECRET', f'sim-{account_id}-secret')
+
+    logger.warning(f"⚠️ 시뮬레이션 모드 - 모든 거래소 요청이 {simulator.rest_url} 로 전송됩니다")
+    return simulator
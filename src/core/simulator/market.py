@@ -0,0 +1,352 @@
+# src/core/simulator/market.py
+"""
+시뮬레이터 시세 재생
+기준 인터벌 캔들(과거 데이터 또는 합성 데이터)을 설정한 배속으로 재생한다.
+캔들 내부 가격은 O→L→H→C(양봉) / O→H→L→C(음봉) 경로를 선형 보간해 만들고,
+상위 인터벌 캔들은 기준 캔들을 묶어 계산한다.
+"""
+
+import glob
+import logging
+import math
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.core.kline_decoder import KlineArrays, decode_klines, dedupe_sorted
+from src.core.kline_store import INTERVAL_MS
+
+logger = logging.getLogger(__name__)
+
+# 캔들 내부 경로 시점 (시가, 1차 극값, 2차 극값, 종가)
+_PATH_FRACTIONS = np.array([0.0, 1 / 3, 2 / 3, 1.0])
+
+
+def tick_size_for(price: float) -> float:
+    """가격대별 틱 크기 (유효숫자 약 5자리)"""
+    if price <= 0:
+        return 0.0001
+    return round(10.0 ** (math.floor(math.log10(price)) - 4), 12)
+
+
+def tick_decimals(tick: float) -> int:
+    return max(0, -int(math.floor(math.log10(tick))))
+
+
+def load_cached_klines(path: str) -> KlineArrays:
+    """캔들 DataFrame pickle -> KlineArrays
+
+    datetime 인덱스 또는 timestamp 열(ms / 날짜), open/high/low/close/volume 열(대소문자 무관).
+    """
+    df = pd.read_pickle(path)
+    if not isinstance(df, pd.DataFrame):
+        raise ValueError(f"캔들 DataFrame 이 아님: {path}")
+    df = df.rename(columns=str.lower)
+    if 'timestamp' in df.columns:
+        timestamps = df['timestamp']
+        if not np.issubdtype(timestamps.dtype, np.number):
+            timestamps = pd.to_datetime(timestamps).astype('int64') // 1_000_000
+        open_time = timestamps.to_numpy(dtype=np.float64)
+    else:
+        index = pd.DatetimeIndex(df.index)
+        if index.tz is not None:
+            index = index.tz_convert('UTC').tz_localize(None)
+        open_time = ((index - pd.Timestamp(0)) // pd.Timedelta(milliseconds=1)).to_numpy(dtype=np.float64)
+    rows = np.column_stack([
+        open_time,
+        df[['open', 'high', 'low', 'close', 'volume']].to_numpy(dtype=np.float64)
+    ])
+    return dedupe_sorted(decode_klines(rows))
+
+
+class SimClock:
+    """배속 재생 시계 (거래소 시간 ms)"""
+
+    def __init__(self, start_ms: int, speed: float = 1.0):
+        self.speed = speed
+        self._origin_ms = start_ms
+        self._wall_origin = time.monotonic()
+
+    def now_ms(self) -> int:
+        return int(self._origin_ms + (time.monotonic() - self._wall_origin) * 1000 * self.speed)
+
+    def set_speed(self, speed: float):
+        """배속 변경 (현재 시각 유지)"""
+        self._origin_ms = self.now_ms()
+        self._wall_origin = time.monotonic()
+        self.speed = speed
+
+
+class ReplayMarket:
+    """심볼별 기준 캔들 재생기"""
+
+    def __init__(self, base_interval: str = '1m', speed: float = 1.0, warmup_bars: int = 1000):
+        """
+        Args:
+            base_interval: 저장된 캔들 인터벌 (요청 인터벌은 이 배수여야 함)
+            speed: 재생 배속 (1.0 = 실시간)
+            warmup_bars: 재생 시작 전 이미 완성된 것으로 취급할 기준 캔들 수 (지표 계산용 과거 데이터)
+        """
+        if base_interval not in INTERVAL_MS:
+            raise ValueError(f"지원하지 않는 인터벌: {base_interval}")
+        self.base_interval = base_interval
+        self.base_ms = INTERVAL_MS[base_interval]
+        self.speed = speed
+        self.warmup_bars = warmup_bars
+        self.candles: Dict[str, KlineArrays] = {}
+        self.tick_sizes: Dict[str, float] = {}
+        self.clock: Optional[SimClock] = None
+        self._aggregated: Dict[Tuple[str, str], KlineArrays] = {}
+
+    # ===== 데이터 로드 =====
+
+    def add_symbol(self, symbol: str, klines: KlineArrays):
+        """기준 인터벌 캔들 등록 (open time 오름차순)"""
+        if len(klines) == 0:
+            raise ValueError(f"{symbol}: 캔들 없음")
+        self.candles[symbol] = klines
+        self.tick_sizes[symbol] = tick_size_for(float(klines.ohlcv[0, 3]))
+
+    @classmethod
+    def synthetic(cls, symbols: List[str], base_interval: str = '1m', bars: int = 5000,
+                  speed: float = 1.0, warmup_bars: int = 1000, volatility: float = 0.002,
+                  seed: Optional[int] = None) -> 'ReplayMarket':
+        """기하 랜덤워크 합성 캔들 (부하 테스트용)
+
+        Args:
+            volatility: 1분당 수익률 표준편차 (기준 인터벌에 맞게 스케일)
+        """
+        market = cls(base_interval, speed, warmup_bars)
+        rng = np.random.default_rng(seed)
+        base_ms = market.base_ms
+        sigma = volatility * math.sqrt(base_ms / 60_000)
+        # 데이터 끝이 현재 시각 근처가 되도록 시작 시각을 일 단위로 정렬
+        end_ms = int(time.time() * 1000) // base_ms * base_ms
+        start_ms = (end_ms - warmup_bars * base_ms) // INTERVAL_MS['1d'] * INTERVAL_MS['1d']
+        open_time = start_ms + np.arange(bars, dtype=np.int64) * base_ms
+
+        for symbol in symbols:
+            start_price = math.exp(rng.uniform(math.log(0.5), math.log(50000)))
+            tick = tick_size_for(start_price)
+            closes = start_price * np.exp(np.cumsum(rng.normal(0, sigma, bars)))
+            opens = np.concatenate(([start_price], closes[:-1]))
+            wick = np.abs(rng.normal(0, sigma / 2, (2, bars)))
+            highs = np.maximum(opens, closes) * (1 + wick[0])
+            lows = np.minimum(opens, closes) * (1 - wick[1])
+            volume = rng.lognormal(3, 1, bars)
+            ohlcv = np.column_stack([opens, highs, lows, closes, volume])
+            ohlcv[:, :4] = np.round(np.round(ohlcv[:, :4] / tick) * tick, tick_decimals(tick))
+            market.candles[symbol] = KlineArrays(open_time.copy(), np.ascontiguousarray(ohlcv))
+            market.tick_sizes[symbol] = tick
+        return market
+
+    @classmethod
+    def from_csv_dir(cls, path: str, symbols: Optional[List[str]] = None, base_interval: str = '1m',
+                     speed: float = 1.0, warmup_bars: int = 1000) -> 'ReplayMarket':
+        """과거 캔들 CSV 로드
+
+        파일명은 {SYMBOL}.csv 또는 {SYMBOL}_*.csv, 열은 timestamp(ms 또는 날짜), open, high, low, close, volume.
+        """
+        market = cls(base_interval, speed, warmup_bars)
+        for file_path in sorted(glob.glob(os.path.join(path, '*.csv'))):
+            symbol = os.path.basename(file_path)[:-4].split('_')[0].upper()
+            if symbols and symbol not in symbols:
+                continue
+            df = pd.read_csv(file_path)
+            timestamps = df['timestamp']
+            if not np.issubdtype(timestamps.dtype, np.number):
+                timestamps = pd.to_datetime(timestamps).astype('int64') // 1_000_000
+            rows = np.column_stack([
+                timestamps.to_numpy(dtype=np.float64),
+                df[['open', 'high', 'low', 'close', 'volume']].to_numpy(dtype=np.float64)
+            ])
+            market.add_symbol(symbol, dedupe_sorted(decode_klines(rows)))
+        if not market.candles:
+            raise ValueError(f"CSV 캔들 없음: {path}")
+        logger.info(f"시뮬레이터 과거 캔들 로드: {len(market.candles)}개 심볼")
+        return market
+
+    @classmethod
+    def from_cache_pickles(cls, paths: Dict[str, str], base_interval: str = '15m',
+                           speed: float = 1.0, warmup_bars: int = 200) -> 'ReplayMarket':
+        """백테스트 캐시(cache_data/*.pkl) 캔들 로드
+
+        Args:
+            paths: 심볼 -> BinanceDataFeed / DataFetcherFixed 가 저장한 캔들 DataFrame pickle 경로
+        """
+        market = cls(base_interval, speed, warmup_bars)
+        for symbol, path in paths.items():
+            market.add_symbol(symbol, load_cached_klines(path))
+        logger.info(f"시뮬레이터 캐시 캔들 로드: {len(market.candles)}개 심볼")
+        return market
+
+    # ===== 재생 =====
+
+    def start(self, speed: Optional[float] = None) -> SimClock:
+        """재생 시작
+
+        모든 심볼에 warmup_bars 만큼 과거 데이터가 있는 시점부터 재생한다.
+        데이터가 현재 시각을 포함하면(합성 데이터) 현재 시각부터 시작해 캔들 경계를 실제 시계와 맞춘다.
+        """
+        if speed is not None:
+            self.speed = speed
+        earliest = max(int(k.open_time[0]) for k in self.candles.values()) + self.warmup_bars * self.base_ms
+        latest = min(self.end_ms(symbol) for symbol in self.candles)
+        wall_ms = int(time.time() * 1000)
+        start_ms = wall_ms if earliest <= wall_ms < latest else earliest
+        self.clock = SimClock(start_ms, self.speed)
+        return self.clock
+
+    def now_ms(self) -> int:
+        if self.clock is None:
+            self.start()
+        return self.clock.now_ms()
+
+    def end_ms(self, symbol: str) -> int:
+        return int(self.candles[symbol].open_time[-1]) + self.base_ms
+
+    def _locate(self, symbol: str, now_ms: int) -> Tuple[int, float]:
+        """현재 기준 캔들 인덱스와 진행률 (데이터 끝이면 마지막 캔들 종가에 고정)"""
+        open_time = self.candles[symbol].open_time
+        index = int(np.searchsorted(open_time, now_ms, side='right')) - 1
+        if index < 0:
+            return 0, 0.0
+        fraction = (now_ms - int(open_time[index])) / self.base_ms
+        return index, min(fraction, 1.0)
+
+    def _path(self, ohlcv_row: np.ndarray) -> np.ndarray:
+        o, h, l, c = ohlcv_row[:4]
+        return np.array([o, l, h, c] if c >= o else [o, h, l, c])
+
+    def _partial(self, symbol: str, ohlcv_row: np.ndarray, fraction: float) -> Tuple[float, float, float]:
+        """진행 중인 기준 캔들의 (현재가, 고가, 저가) - 틱 단위"""
+        path = self._path(ohlcv_row)
+        price = self.round_price(symbol, float(np.interp(fraction, _PATH_FRACTIONS, path)))
+        visited = path[_PATH_FRACTIONS <= fraction]
+        return price, max(float(visited.max()), price), min(float(visited.min()), price)
+
+    def price(self, symbol: str, now_ms: Optional[int] = None) -> float:
+        """현재가 (틱 단위 반올림)"""
+        now_ms = self.now_ms() if now_ms is None else now_ms
+        index, fraction = self._locate(symbol, now_ms)
+        price, _, _ = self._partial(symbol, self.candles[symbol].ohlcv[index], fraction)
+        return price
+
+    def round_price(self, symbol: str, price: float) -> float:
+        tick = self.tick_sizes[symbol]
+        return round(round(price / tick) * tick, tick_decimals(tick))
+
+    def _aggregate(self, symbol: str, interval: str) -> KlineArrays:
+        """기준 캔들 -> 상위 인터벌 캔들 (완성 기준, 결과 캐시)"""
+        key = (symbol, interval)
+        cached = self._aggregated.get(key)
+        if cached is not None:
+            return cached
+
+        klines = self.candles[symbol]
+        interval_ms = INTERVAL_MS[interval]
+        if interval_ms == self.base_ms:
+            self._aggregated[key] = klines
+            return klines
+        if interval_ms % self.base_ms:
+            raise ValueError(f"{interval} 은 기준 인터벌 {self.base_interval} 의 배수가 아님")
+
+        groups = klines.open_time // interval_ms * interval_ms
+        group_time, starts = np.unique(groups, return_index=True)
+        ends = np.append(starts[1:], len(groups)) - 1
+        ohlcv = klines.ohlcv
+        aggregated = np.column_stack([
+            ohlcv[starts, 0],
+            np.maximum.reduceat(ohlcv[:, 1], starts),
+            np.minimum.reduceat(ohlcv[:, 2], starts),
+            ohlcv[ends, 3],
+            np.add.reduceat(ohlcv[:, 4], starts),
+        ])
+        result = KlineArrays(group_time, np.ascontiguousarray(aggregated))
+        self._aggregated[key] = result
+        return result
+
+    def _sub_candle(self, symbol: str, start_ms: int, end_ms: int) -> List[float]:
+        """기준 캔들 하나 안의 [start_ms, end_ms] 구간 캔들 (기준보다 짧은 인터벌용)"""
+        index, f1 = self._locate(symbol, end_ms)
+        row = self.candles[symbol].ohlcv[index]
+        f0 = max(0.0, (start_ms - int(self.candles[symbol].open_time[index])) / self.base_ms)
+        path = self._path(row)
+        p0 = self.round_price(symbol, float(np.interp(f0, _PATH_FRACTIONS, path)))
+        p1 = self.round_price(symbol, float(np.interp(f1, _PATH_FRACTIONS, path)))
+        points = [p0, p1] + path[(_PATH_FRACTIONS > f0) & (_PATH_FRACTIONS < f1)].tolist()
+        return [p0, max(points), min(points), p1, round(float(row[4]) * (f1 - f0), 3)]
+
+    def candle_at(self, symbol: str, interval: str, now_ms: Optional[int] = None
+                  ) -> Tuple[int, List[float]]:
+        """now_ms 시점의 진행 중인 인터벌 캔들 (open time, [O, H, L, C, V])
+
+        지난 기준 캔들과 현재 기준 캔들의 진행분으로 계산한다.
+        """
+        now_ms = self.now_ms() if now_ms is None else now_ms
+        klines = self.candles[symbol]
+        interval_ms = INTERVAL_MS[interval]
+        group_start = now_ms // interval_ms * interval_ms
+        if interval_ms < self.base_ms:
+            return group_start, self._sub_candle(symbol, group_start, now_ms)
+
+        index, fraction = self._locate(symbol, now_ms)
+        first = int(np.searchsorted(klines.open_time, group_start, side='left'))
+        if first > index:
+            # 데이터 구간 밖 - 마지막 종가로 고정된 빈 캔들
+            close = float(klines.ohlcv[index, 3])
+            return group_start, [close, close, close, close, 0.0]
+
+        price, high, low = self._partial(symbol, klines.ohlcv[index], fraction)
+        done = klines.ohlcv[first:index]
+        if len(done):
+            high = max(high, float(done[:, 1].max()))
+            low = min(low, float(done[:, 2].min()))
+        volume = round(float(done[:, 4].sum()) + float(klines.ohlcv[index, 4]) * fraction, 3)
+        return group_start, [float(klines.ohlcv[first, 0]), high, low, price, volume]
+
+    def closed_candle(self, symbol: str, interval: str, open_time: int) -> List[float]:
+        """완성된 인터벌 캔들 [O, H, L, C, V]"""
+        interval_ms = INTERVAL_MS[interval]
+        if interval_ms < self.base_ms:
+            return self._sub_candle(symbol, open_time, open_time + interval_ms)
+        aggregated = self._aggregate(symbol, interval)
+        index = int(np.searchsorted(aggregated.open_time, open_time, side='left'))
+        if index >= len(aggregated) or aggregated.open_time[index] != open_time:
+            return self.candle_at(symbol, interval, open_time + interval_ms - 1)[1]
+        return aggregated.ohlcv[index].tolist()
+
+    def klines(self, symbol: str, interval: str, limit: int = 500,
+               start_time: Optional[int] = None, end_time: Optional[int] = None,
+               now_ms: Optional[int] = None) -> List[list]:
+        """REST /fapi/v1/klines 형식 행 (마지막 행은 진행 중인 캔들)"""
+        now_ms = self.now_ms() if now_ms is None else now_ms
+        interval_ms = INTERVAL_MS[interval]
+        aggregated = self._aggregate(symbol, interval)
+        current_start = now_ms // interval_ms * interval_ms
+        upper = current_start if end_time is None else min(current_start, end_time + 1)
+        stop = int(np.searchsorted(aggregated.open_time, upper, side='left'))
+        if start_time is not None:
+            begin = int(np.searchsorted(aggregated.open_time, start_time, side='left'))
+            stop = min(stop, begin + limit)
+        else:
+            begin = max(0, stop - limit + 1)
+
+        rows = [
+            self._rest_row(int(aggregated.open_time[i]), aggregated.ohlcv[i].tolist(), interval_ms)
+            for i in range(begin, stop)
+        ]
+        include_current = end_time is None or end_time >= current_start
+        if include_current and len(rows) < limit:
+            open_time, values = self.candle_at(symbol, interval, now_ms)
+            rows.append(self._rest_row(open_time, values, interval_ms))
+        return rows
+
+    @staticmethod
+    def _rest_row(open_time: int, values: List[float], interval_ms: int) -> list:
+        o, h, l, c, v = values
+        return [open_time, repr(o), repr(h), repr(l), repr(c), repr(v), open_time + interval_ms - 1,
+                repr(v * c), 0, repr(v / 2), repr(v * c / 2), '0']
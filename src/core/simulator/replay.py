@@ -0,0 +1,295 @@
+# src/core/simulator/replay.py
+"""
+시세 재생 드라이버
+네트워크 없이 RealtimePriceMonitor 의 스트림 처리 경로(디스패처 -> 핸들러 -> 캔들 저장소 /
+캔들 완성 스케줄러 / RealtimeSignalProcessor)에 과거 시세를 그대로 흘려 넣는다.
+
+- 입력: ReplayMarket(백테스트 캐시 pickle / CSV / 합성 캔들)로 만든 스트림 이벤트,
+        또는 MarketRecorder 가 기록한 실거래 수신 세그먼트
+- 속도: speed=None 이면 최대 속도, 1.0 이면 실시간, N 이면 N배속
+- 재생 시계: 전략 / 신호 처리 모듈의 datetime.now(), time.time() 을 이벤트 시각으로 대체해
+  실거래 상황을 결정적으로 재현한다 (같은 모듈의 asyncio.sleep 은 배속만큼 줄임)
+"""
+
+import asyncio
+import heapq
+import importlib
+import json
+import logging
+import os
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence
+
+from src.core.market_recorder import INDEX_FILE, decode_record, read_segment, segment_path
+from src.core.simulator.market import ReplayMarket
+from src.core.simulator.streams import StreamEventBuilder, compact_json
+
+logger = logging.getLogger(__name__)
+
+# 재생 시계로 바꿀 모듈 (src.strategies 하위 모듈은 로드된 것 모두 포함)
+DEFAULT_CLOCK_MODULES = (
+    'src.core.realtime_price_monitor',
+    'src.core.realtime_signal_processor',
+    'src.core.candle_close_monitor',
+    'src.core.kline_store',
+)
+
+
+class ReplayEvent(NamedTuple):
+    """재생 이벤트 (거래소 시각 ms, 스트림 이름, 스트림 메시지 data)"""
+    time_ms: int
+    stream: str
+    data: Dict
+
+
+class ReplayClock:
+    """재생 이벤트 시각으로만 움직이는 시계"""
+
+    def __init__(self, start_ms: int = 0):
+        self._now_ms = start_ms
+
+    def now_ms(self) -> int:
+        return self._now_ms
+
+    def advance_to(self, time_ms: int):
+        """시각 이동 (뒤로 가지 않음)"""
+        if time_ms > self._now_ms:
+            self._now_ms = time_ms
+
+    def time(self) -> float:
+        return self._now_ms / 1000
+
+    def now(self) -> datetime:
+        return datetime.fromtimestamp(self._now_ms / 1000)
+
+
+def _clock_datetime(clock: ReplayClock) -> type:
+    """now()/today()/utcnow() 가 재생 시계를 따르는 datetime 하위 클래스"""
+
+    class ReplayDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime.fromtimestamp(clock.time(), tz)
+
+        @classmethod
+        def today(cls):
+            return cls.now()
+
+        @classmethod
+        def utcnow(cls):
+            return datetime.fromtimestamp(clock.time(), timezone.utc).replace(tzinfo=None)
+
+    return ReplayDatetime
+
+
+class _ClockTime:
+    """time 모듈 대체 - 현재 시각 함수만 재생 시계, 나머지는 원래 time 모듈"""
+
+    def __init__(self, clock: ReplayClock):
+        self._clock = clock
+
+    def time(self) -> float:
+        return self._clock.time()
+
+    def monotonic(self) -> float:
+        return self._clock.time()
+
+    def __getattr__(self, name):
+        return getattr(time, name)
+
+
+class _ScaledAsyncio:
+    """asyncio 모듈 대체 - sleep() 만 배속 반영 (최대 속도면 양보만), 나머지는 원래 asyncio"""
+
+    def __init__(self, speed: Optional[float]):
+        self._speed = speed
+
+    async def sleep(self, delay, result=None):
+        return await asyncio.sleep(delay / self._speed if self._speed else 0, result)
+
+    def __getattr__(self, name):
+        return getattr(asyncio, name)
+
+
+@contextmanager
+def patch_clock(clock: ReplayClock, modules: Optional[Sequence[str]] = None,
+                speed: Optional[float] = None):
+    """대상 모듈의 datetime / time / asyncio 이름을 재생 시계 기준으로 교체 (종료 시 복원)"""
+    names = list(modules if modules is not None else DEFAULT_CLOCK_MODULES)
+    names += [name for name in list(sys.modules) if name.startswith('src.strategies.')]
+
+    replay_datetime = _clock_datetime(clock)
+    replay_time = _ClockTime(clock)
+    replay_asyncio = _ScaledAsyncio(speed)
+    patched = []
+    for name in dict.fromkeys(names):
+        module = importlib.import_module(name)
+        if getattr(module, 'datetime', None) is datetime:
+            patched.append((module, 'datetime', datetime))
+            module.datetime = replay_datetime
+        if getattr(module, 'time', None) is time:
+            patched.append((module, 'time', time))
+            module.time = replay_time
+        if getattr(module, 'asyncio', None) is asyncio:
+            patched.append((module, 'asyncio', asyncio))
+            module.asyncio = replay_asyncio
+    try:
+        yield clock
+    finally:
+        for module, attr, original in patched:
+            setattr(module, attr, original)
+
+
+# ===== 입력 =====
+
+def market_events(market: ReplayMarket, symbols: Optional[List[str]] = None,
+                  intervals: Sequence[str] = ('1m', '15m'), start_ms: Optional[int] = None,
+                  end_ms: Optional[int] = None, step_ms: int = 1000,
+                  mark_price_ms: int = 3000) -> Iterator[ReplayEvent]:
+    """재생기 캔들 -> 실시간과 같은 스트림 이벤트
+
+    step_ms 마다 심볼별 진행 중 캔들 / 체결, mark_price_ms 마다 마크 가격을 만들고
+    캔들 경계를 지나면 완성 캔들(x=true)을 먼저 낸다.
+    """
+    symbols = symbols or sorted(market.candles)
+    if start_ms is None:
+        start_ms = max(int(market.candles[s].open_time[0]) for s in symbols) + market.warmup_bars * market.base_ms
+    if end_ms is None:
+        end_ms = min(market.end_ms(s) for s in symbols)
+    start_ms = start_ms // step_ms * step_ms
+
+    builder = StreamEventBuilder(market)
+    streams = {
+        symbol: [f"{symbol.lower()}@kline_{interval}" for interval in intervals]
+                + [f"{symbol.lower()}@aggTrade"]
+        for symbol in symbols
+    }
+    for now in range(start_ms, end_ms + 1, step_ms):
+        with_mark = now % mark_price_ms < step_ms
+        for symbol in symbols:
+            price = market.price(symbol, now)
+            for stream in streams[symbol]:
+                for data in builder.events(stream, now, price):
+                    yield ReplayEvent(now, stream, data)
+            if with_mark:
+                stream = f"{symbol.lower()}@markPrice"
+                for data in builder.events(stream, now, price):
+                    yield ReplayEvent(now, stream, data)
+
+
+def _recorded_stream(symbol: str, kind: str, data: Dict) -> str:
+    if kind == 'kline':
+        return f"{symbol.lower()}@kline_{data['k']['i']}"
+    return f"{symbol.lower()}@{kind}"
+
+
+def _segment_events(path: str, symbol: str) -> Iterator[ReplayEvent]:
+    for record in read_segment(path):
+        kind, data = decode_record(symbol, record)
+        yield ReplayEvent(int(record['recv_time']), _recorded_stream(symbol, kind, data), data)
+
+
+def recording_events(root_dir: str, symbols: Optional[List[str]] = None,
+                     start_day: Optional[str] = None, end_day: Optional[str] = None) -> Iterator[ReplayEvent]:
+    """MarketRecorder 세그먼트 -> 수신 시각 순 이벤트 (심볼 간 병합)
+
+    Args:
+        start_day / end_day: YYYYMMDD (포함)
+    """
+    for day in sorted(os.listdir(root_dir)):
+        day_dir = os.path.join(root_dir, day)
+        if not os.path.isdir(day_dir) or (start_day and day < start_day) or (end_day and day > end_day):
+            continue
+        index_path = os.path.join(day_dir, INDEX_FILE)
+        if os.path.exists(index_path):
+            with open(index_path, encoding='utf-8') as f:
+                day_symbols = sorted(json.load(f))
+        else:
+            day_symbols = sorted({name.split('.')[0] for name in os.listdir(day_dir) if '.bin' in name})
+
+        sources = []
+        for symbol in day_symbols:
+            if symbols and symbol not in symbols:
+                continue
+            path = segment_path(root_dir, day, symbol)
+            if path:
+                sources.append(_segment_events(path, symbol))
+        yield from heapq.merge(*sources, key=lambda event: event.time_ms)
+
+
+# ===== 드라이버 =====
+
+class ReplayDriver:
+    """스트림 이벤트를 RealtimePriceMonitor 디스패처로 재생"""
+
+    def __init__(self, monitor, speed: Optional[float] = None, clock: Optional[ReplayClock] = None,
+                 clock_modules: Optional[Sequence[str]] = None, yield_every: int = 64):
+        """
+        Args:
+            monitor: RealtimePriceMonitor (핸들러 / 캔들 저장소 / 구독자 연결 완료 상태)
+            speed: None 이면 최대 속도, 1.0 이면 실시간, N 이면 N배속
+            clock_modules: 재생 시계로 바꿀 모듈 (None 이면 DEFAULT_CLOCK_MODULES + 전략 모듈)
+            yield_every: 최대 속도에서 이 이벤트 수마다 이벤트 루프에 양보 (비동기 구독자 실행)
+        """
+        if speed is not None and speed <= 0:
+            raise ValueError(f"재생 배속은 0보다 커야 합니다: {speed}")
+        self.monitor = monitor
+        self.speed = speed
+        self.clock = clock or ReplayClock()
+        self.clock_modules = clock_modules
+        self.yield_every = max(1, yield_every)
+
+        self.stats = {
+            'events': 0,
+            'sim_start_ms': None,
+            'sim_end_ms': None,
+            'wall_seconds': 0.0,
+        }
+
+    async def run(self, events: Iterable[ReplayEvent], limit: Optional[int] = None) -> Dict:
+        """이벤트 재생 (끝까지 또는 limit 개)"""
+        dispatch = self.monitor.dispatcher.dispatch
+        wall_start = time.perf_counter()
+        sim_start = None
+        count = 0
+
+        with patch_clock(self.clock, self.clock_modules, self.speed):
+            for event in events:
+                if limit is not None and count >= limit:
+                    break
+                if sim_start is None:
+                    sim_start = event.time_ms
+                    self.stats['sim_start_ms'] = sim_start
+                self.clock.advance_to(event.time_ms)
+
+                if self.speed is not None:
+                    delay = (event.time_ms - sim_start) / 1000 / self.speed - (time.perf_counter() - wall_start)
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+
+                await dispatch(compact_json({'stream': event.stream, 'data': event.data}))
+                count += 1
+                if self.speed is None and count % self.yield_every == 0:
+                    await asyncio.sleep(0)
+
+            # 마지막 이벤트의 비동기 구독자 처리
+            await asyncio.sleep(0)
+
+        self.stats['events'] += count
+        self.stats['sim_end_ms'] = self.clock.now_ms()
+        self.stats['wall_seconds'] += time.perf_counter() - wall_start
+        return self.get_stats()
+
+    def get_stats(self) -> Dict:
+        wall = self.stats['wall_seconds']
+        span_ms = 0
+        if self.stats['sim_start_ms'] is not None:
+            span_ms = self.stats['sim_end_ms'] - self.stats['sim_start_ms']
+        return {
+            **self.stats,
+            'events_per_second': round(self.stats['events'] / wall, 1) if wall else 0.0,
+            'speedup': round(span_ms / 1000 / wall, 1) if wall else 0.0,
+        }
@@ -0,0 +1,84 @@
+# src/core/simulator/streams.py
+"""
+시세 재생기 -> 거래소 스트림 이벤트
+시뮬레이터 웹소켓 방송과 재생 드라이버가 같은 형식의 kline / aggTrade / markPrice 메시지를 만들도록 공유한다.
+"""
+
+import itertools
+import json
+from typing import Dict, List, Optional
+
+from src.core.kline_store import INTERVAL_MS
+from src.core.simulator.market import ReplayMarket, tick_decimals
+
+# 거래소와 같은 공백 없는 JSON 프레임
+compact_json = json.JSONEncoder(separators=(',', ':')).encode
+
+
+class StreamEventBuilder:
+    """스트림별 이번 시각의 이벤트 생성 (스트림마다 마지막 캔들 기억 - 사이에 완성된 캔들 보충)"""
+
+    def __init__(self, market: ReplayMarket):
+        self.market = market
+        self._kline_last_open: Dict[str, int] = {}
+        self._trade_ids = itertools.count(1)
+
+    def fmt_price(self, symbol: str, price: float) -> str:
+        return f"{price:.{tick_decimals(self.market.tick_sizes[symbol])}f}"
+
+    def forget(self, stream: str):
+        """구독 해제된 스트림 상태 제거"""
+        self._kline_last_open.pop(stream, None)
+
+    def events(self, stream: str, now: int, price: Optional[float] = None) -> List[Dict]:
+        """스트림의 now 시점 이벤트 (price 생략 시 재생기 현재가)"""
+        symbol_lower, _, kind = stream.partition('@')
+        symbol = symbol_lower.upper()
+        if symbol not in self.market.candles:
+            return []
+        if price is None:
+            price = self.market.price(symbol, now)
+        price_text = self.fmt_price(symbol, price)
+
+        if kind.startswith('kline_'):
+            interval = kind[len('kline_'):]
+            if interval not in INTERVAL_MS:
+                return []
+            interval_ms = INTERVAL_MS[interval]
+            open_time, values = self.market.candle_at(symbol, interval, now)
+            events = []
+            last_open = self._kline_last_open.get(stream)
+            if last_open is not None and last_open < open_time:
+                # 이전 이벤트 이후 완성된 캔들 (고배속이면 여러 개)
+                closed_starts = range(max(last_open, open_time - 100 * interval_ms), open_time, interval_ms)
+                events.extend(self.kline_event(symbol, interval, t, self.market.closed_candle(symbol, interval, t),
+                                               True, now) for t in closed_starts)
+            self._kline_last_open[stream] = open_time
+            events.append(self.kline_event(symbol, interval, open_time, values, False, now))
+            return events
+
+        if kind == 'aggTrade':
+            trade_id = next(self._trade_ids)
+            return [{'e': 'aggTrade', 'E': now, 's': symbol, 'a': trade_id, 'p': price_text, 'q': '1.000',
+                     'f': trade_id, 'l': trade_id, 'T': now, 'm': False}]
+
+        if kind.startswith('markPrice'):
+            funding_ms = INTERVAL_MS['8h']
+            return [{'e': 'markPriceUpdate', 'E': now, 's': symbol, 'p': price_text, 'i': price_text,
+                     'P': price_text, 'r': '0.00010000', 'T': (now // funding_ms + 1) * funding_ms}]
+        return []
+
+    def kline_event(self, symbol: str, interval: str, open_time: int, values: List[float],
+                    closed: bool, now: int) -> Dict:
+        o, h, l, c, v = values
+        fmt = self.fmt_price
+        return {
+            'e': 'kline', 'E': now, 's': symbol,
+            'k': {
+                't': open_time, 'T': open_time + INTERVAL_MS[interval] - 1, 's': symbol, 'i': interval,
+                'f': 0, 'L': 0, 'o': fmt(symbol, o), 'c': fmt(symbol, c),
+                'h': fmt(symbol, h), 'l': fmt(symbol, l), 'v': f"{v:.3f}",
+                'n': 0, 'x': closed, 'q': f"{v * c:.2f}", 'V': f"{v / 2:.3f}", 'Q': f"{v * c / 2:.2f}",
+                'B': '0'
+            }
+        }
@@ -0,0 +1,114 @@
+# src/core/stream_dispatch.py
+"""
+결합 스트림 메시지 디스패치
+프레임 앞부분의 스트림 이름만 보고 핸들러 표에서 경로를 찾고,
+구독자가 없는 스트림 종류는 본문을 파싱하기 전에 버린다.
+orjson 이 설치되어 있으면 사용하고 없으면 표준 json 으로 동작한다.
+"""
+
+import inspect
+import json
+import logging
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+    loads = orjson.loads
+    ORJSON_AVAILABLE = True
+except ImportError:
+    loads = json.loads
+    ORJSON_AVAILABLE = False
+
+# 결합 스트림 프레임: {"stream":"btcusdt@aggTrade","data":{...}}
+STREAM_PREFIX = '{"stream":"'
+_NAME_START = len(STREAM_PREFIX)
+
+
+def stream_kind(stream: str) -> str:
+    """스트림 이름 -> 종류 (btcusdt@kline_1m -> kline, btcusdt@markPrice@1s -> markPrice)"""
+    kind = stream.partition('@')[2].partition('@')[0]
+    return kind.partition('_')[0]
+
+
+def classify_handler(handler: Callable) -> Tuple[Callable, bool]:
+    """등록 시점에 한 번만 동기/비동기 판별"""
+    return handler, inspect.iscoroutinefunction(handler)
+
+
+class Route:
+    """스트림 종류별 경로 (같은 종류의 모든 스트림 이름이 공유)"""
+
+    __slots__ = ('kind', 'handler', 'is_async', 'active')
+
+    def __init__(self, kind: str, handler: Optional[Callable] = None, active: bool = True):
+        self.kind = kind
+        self.active = active
+        self.handler, self.is_async = classify_handler(handler) if handler else (None, False)
+
+
+class StreamDispatcher:
+    """스트림 이름 기반 핸들러 표 라우팅"""
+
+    def __init__(self):
+        self._routes: Dict[str, Route] = {}   # 종류 -> 경로
+        self._table: Dict[str, Route] = {}    # 스트림 이름 -> 경로 (처음 본 이름만 계산)
+        self._unrouted = Route('', active=False)
+
+        self.stats = {
+            'dispatched': 0,
+            'skipped': 0,
+            'unrouted': 0,
+            'invalid': 0,
+        }
+
+    def route(self, kind: str, handler: Callable, active: bool = True):
+        """스트림 종류에 핸들러(data) 등록"""
+        route = self._routes.get(kind)
+        if route is None:
+            self._routes[kind] = Route(kind, handler, active)
+            self._table.clear()  # 미등록으로 계산해 둔 이름 재계산
+        else:
+            route.handler, route.is_async = classify_handler(handler)
+            route.active = active
+
+    def set_active(self, kind: str, active: bool):
+        """구독자 유무 반영 - 비활성 종류는 파싱 없이 건너뜀"""
+        route = self._routes.get(kind)
+        if route is not None:
+            route.active = active
+
+    def active_kinds(self) -> List[str]:
+        return [kind for kind, route in self._routes.items() if route.active]
+
+    def _resolve(self, stream: str) -> Route:
+        route = self._routes.get(stream_kind(stream), self._unrouted)
+        self._table[stream] = route
+        return route
+
+    async def dispatch(self, frame: str):
+        """결합 스트림 프레임 처리"""
+        if not frame.startswith(STREAM_PREFIX):
+            self.stats['invalid'] += 1
+            return
+        stream = frame[_NAME_START:frame.find('"', _NAME_START)]
+
+        route = self._table.get(stream) or self._resolve(stream)
+        if not route.active:
+            self.stats['unrouted' if route is self._unrouted else 'skipped'] += 1
+            return
+
+        data = loads(frame)['data']
+        self.stats['dispatched'] += 1
+        if route.is_async:
+            await route.handler(data)
+        else:
+            route.handler(data)
+
+    def get_stats(self) -> Dict:
+        return {
+            'parser': 'orjson' if ORJSON_AVAILABLE else 'json',
+            'active_kinds': self.active_kinds(),
+            **self.stats
+        }
@@ -0,0 +1,399 @@
+# src/core/stream_manager.py
+"""
+샤딩된 결합 스트림(/stream) 관리자
+구독을 여러 웹소켓 연결(샤드)로 나누어 연결당 스트림 수 / 제어 메시지 속도 제한을 지킨다.
+체결(aggTrade) 스트림은 별도 레인의 연결로 분리해 특정 심볼의 체결 폭주가
+마크 가격 / 캔들 완성 메시지를 지연시키지 않도록 한다.
+샤드마다 수신 루프, 재연결, 무응답 감시가 독립적으로 동작한다.
+재연결은 지터를 준 지수 백오프로 멈추지 않고 반복하며, 재연결된 샤드의 스트림 목록을
+'reconnected' 이벤트로 알려 끊긴 동안의 누락 구간을 보충할 수 있게 한다.
+"""
+
+import asyncio
+import json
+import logging
+import random
+import time
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Set
+
+import websockets
+
+from src.core.stream_dispatch import STREAM_PREFIX
+
+logger = logging.getLogger(__name__)
+
+# 바이낸스 선물 제한: 연결당 최대 1024 스트림, 연결당 초당 10개 수신(클라이언트 -> 서버) 메시지
+MAX_STREAMS_PER_CONNECTION = 1024
+MAX_CONTROL_MESSAGES_PER_SECOND = 10
+
+# 같은 레인의 스트림만 한 연결을 공유
+MARKET_LANE = 'market'   # 캔들, 마크 가격
+TRADE_LANE = 'trade'     # 체결
+DEPTH_LANE = 'depth'     # 호가 차분 (메시지가 많아 별도 연결)
+
+DEFAULT_STALE_TIMEOUTS = {
+    MARKET_LANE: 30.0,   # 마크 가격은 최소 3초마다 발생
+    TRADE_LANE: 120.0,   # 거래가 적은 심볼은 체결 간격이 길 수 있음
+    DEPTH_LANE: 30.0,    # 호가 변경이 없으면 차분 이벤트도 없음
+}
+
+
+def stream_lane(stream: str) -> str:
+    """스트림 이름으로 레인 결정"""
+    kind = stream.partition('@')[2]
+    if kind in ('aggTrade', 'trade'):
+        return TRADE_LANE
+    if kind.startswith('depth'):
+        return DEPTH_LANE
+    return MARKET_LANE
+
+
+class StreamShard:
+    """결합 스트림 연결 하나 (구독 목록, 수신 루프, 재연결, 무응답 감시)
+
+    스트림 프레임은 파싱하지 않은 원문 그대로 on_message 로 전달한다 (StreamDispatcher.dispatch).
+    """
+
+    def __init__(self, shard_id: str, lane: str, url: str,
+                 on_message: Callable[[str], Awaitable],
+                 on_state_change: Callable[['StreamShard', str], Awaitable],
+                 max_streams: int = 200, max_messages_per_second: float = 5,
+                 stale_timeout: float = 30.0, reconnect_delay: float = 5,
+                 max_reconnect_delay: float = 60, alert_after_attempts: int = 10,
+                 params_per_message: int = 100):
+        self.shard_id = shard_id
+        self.lane = lane
+        self.url = url
+        self._on_message = on_message
+        self._on_state_change = on_state_change
+
+        self.max_streams = max_streams
+        self.max_messages_per_second = max_messages_per_second
+        self.stale_timeout = stale_timeout
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.alert_after_attempts = alert_after_attempts
+        self.params_per_message = params_per_message
+
+        self.streams: Set[str] = set()
+        self.ws = None
+        self.is_running = False
+        self.is_connected = False
+        self.last_message_at = time.monotonic()
+        self.failed_attempts = 0  # 연속 연결 실패 횟수 (연결 성공 시 초기화)
+
+        self._send_lock = asyncio.Lock()
+        self._next_send_at = 0.0
+        self._request_id = 0
+
+        self.stats = {
+            'messages': 0,
+            'connects': 0,
+            'stale_restarts': 0,
+            'connect_failures': 0,
+            'control_messages': 0,
+            'errors': 0,
+        }
+
+    @property
+    def free_slots(self) -> int:
+        return self.max_streams - len(self.streams)
+
+    async def subscribe(self, streams: List[str]):
+        """스트림 구독 추가 (미연결 상태면 연결 시 일괄 구독)"""
+        new_streams = [s for s in streams if s not in self.streams]
+        if not new_streams:
+            return
+        if not self.streams:
+            # 구독이 비어 있던 동안은 무응답 감시 대상이 아님
+            self.last_message_at = time.monotonic()
+        self.streams.update(new_streams)
+        if self.is_connected:
+            await self._send('SUBSCRIBE', new_streams)
+
+    async def unsubscribe(self, streams: List[str]):
+        """스트림 구독 해제"""
+        removed = [s for s in streams if s in self.streams]
+        if not removed:
+            return
+        self.streams.difference_update(removed)
+        if self.is_connected:
+            await self._send('UNSUBSCRIBE', removed)
+
+    async def _send(self, method: str, streams: List[str]):
+        """제어 메시지 전송 - 메시지당 파라미터 수를 나누고 초당 메시지 수 제한에 맞춰 간격 유지"""
+        async with self._send_lock:
+            for i in range(0, len(streams), self.params_per_message):
+                ws = self.ws
+                if ws is None:
+                    return  # 재연결 시 전체 재구독
+                delay = self._next_send_at - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+                self._request_id += 1
+                message = {
+                    'method': method,
+                    'params': streams[i:i + self.params_per_message],
+                    'id': self._request_id
+                }
+                try:
+                    await ws.send(json.dumps(message))
+                except websockets.ConnectionClosed:
+                    return
+                self._next_send_at = time.monotonic() + 1 / self.max_messages_per_second
+                self.stats['control_messages'] += 1
+
+    def backoff_delay(self, attempts: int) -> float:
+        """재연결 대기 시간 - 지수 증가(상한 max_reconnect_delay) 구간의 절반~전체에서 무작위
+        
+        여러 샤드/프로세스가 동시에 끊겨도 재연결 시점이 분산되도록 지터를 준다.
+        """
+        ceiling = min(self.max_reconnect_delay, self.reconnect_delay * 2 ** max(attempts - 1, 0))
+        return random.uniform(ceiling / 2, ceiling)
+
+    async def run(self):
+        """연결 유지 (stop 까지 재연결 반복)"""
+        self.is_running = True
+        self.failed_attempts = 0
+
+        while self.is_running:
+            try:
+                await self._connect()
+                continue  # 정상 종료(무응답 재시작 등)면 즉시 재연결
+
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                if not self.is_running:
+                    break
+                self.failed_attempts += 1
+                self.stats['connect_failures'] += 1
+                delay = self.backoff_delay(self.failed_attempts)
+                logger.error(f"스트림 샤드 {self.shard_id} 연결 실패 "
+                             f"(연속 {self.failed_attempts}회, {delay:.1f}초 후 재시도): {e}")
+
+                if self.failed_attempts == self.alert_after_attempts:
+                    # 알림만 보내고 재연결은 계속
+                    logger.error(f"스트림 샤드 {self.shard_id} 연속 {self.failed_attempts}회 연결 실패")
+                    await self._on_state_change(self, 'failed')
+                await asyncio.sleep(delay)
+
+    async def _connect(self):
+        """연결, 전체 구독, 메시지 수신"""
+        async with websockets.connect(self.url) as websocket:
+            self.ws = websocket
+            self.is_connected = True
+            self.failed_attempts = 0
+            self.last_message_at = time.monotonic()
+            self.stats['connects'] += 1
+            watchdog = asyncio.create_task(self._watchdog(websocket))
+
+            try:
+                if self.streams:
+                    await self._send('SUBSCRIBE', sorted(self.streams))
+                await self._on_state_change(self, 'connected')
+
+                async for message in websocket:
+                    if not self.is_running:
+                        break
+                    self.last_message_at = time.monotonic()
+                    self.stats['messages'] += 1
+
+                    try:
+                        if message.startswith(STREAM_PREFIX):
+                            await self._on_message(message)
+                        else:
+                            self._handle_control(json.loads(message))
+                    except json.JSONDecodeError as e:
+                        logger.error(f"JSON 파싱 오류: {e}")
+                    except Exception as e:
+                        logger.error(f"메시지 처리 오류: {e}")
+            finally:
+                watchdog.cancel()
+                self.is_connected = False
+                self.ws = None
+                await self._on_state_change(self, 'disconnected')
+
+    def _handle_control(self, message: Dict):
+        """구독 요청 응답 - 오류만 기록"""
+        if 'error' in message or 'code' in message:
+            self.stats['errors'] += 1
+            logger.error(f"스트림 샤드 {self.shard_id} 요청 오류: {message}")
+
+    async def _watchdog(self, websocket):
+        """구독 중인데 stale_timeout 동안 메시지가 없으면 이 샤드만 재연결"""
+        interval = max(self.stale_timeout / 4, 0.05)
+        while True:
+            await asyncio.sleep(interval)
+            idle = time.monotonic() - self.last_message_at
+            if self.streams and idle > self.stale_timeout:
+                self.stats['stale_restarts'] += 1
+                logger.warning(f"스트림 샤드 {self.shard_id} {idle:.0f}초 무응답 - 재연결")
+                await websocket.close()
+                return
+
+    async def stop(self):
+        """연결 종료"""
+        self.is_running = False
+        if self.ws is not None:
+            await self.ws.close()
+
+    def get_stats(self) -> Dict:
+        return {
+            'lane': self.lane,
+            'streams': len(self.streams),
+            'is_connected': self.is_connected,
+            'failed_attempts': self.failed_attempts,
+            'idle_seconds': round(time.monotonic() - self.last_message_at, 1),
+            **self.stats
+        }
+
+
+class StreamManager:
+    """스트림 구독을 레인/샤드로 나누어 관리"""
+
+    def __init__(self, url: str, on_message: Callable[[str], Awaitable],
+                 on_event: Optional[Callable[..., Awaitable]] = None,
+                 max_streams_per_connection: int = 200, max_messages_per_second: float = 5,
+                 stale_timeouts: Optional[Dict[str, float]] = None,
+                 reconnect_delay: float = 5, max_reconnect_delay: float = 60,
+                 alert_after_attempts: int = 10):
+        self.url = url
+        self.on_message = on_message
+        self.on_event = on_event
+
+        self.max_streams = min(max_streams_per_connection, MAX_STREAMS_PER_CONNECTION)
+        self.max_messages_per_second = min(max_messages_per_second, MAX_CONTROL_MESSAGES_PER_SECOND)
+        self.stale_timeouts = {**DEFAULT_STALE_TIMEOUTS, **(stale_timeouts or {})}
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.alert_after_attempts = alert_after_attempts
+
+        self.shards: List[StreamShard] = []
+        self._owner: Dict[str, StreamShard] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._shard_seq = 0
+        self._all_connected = False
+
+        self.is_running = False
+        self._stopped = asyncio.Event()
+
+    @property
+    def streams(self) -> Set[str]:
+        return set(self._owner)
+
+    @property
+    def is_connected(self) -> bool:
+        return bool(self.shards) and all(shard.is_connected for shard in self.shards)
+
+    async def add_streams(self, streams: Iterable[str]):
+        """스트림 구독 - 같은 레인에서 여유 있는 샤드에 배치, 없으면 샤드 추가"""
+        groups: Dict[StreamShard, List[str]] = {}
+        for stream in dict.fromkeys(streams):
+            if stream in self._owner:
+                continue
+            lane = stream_lane(stream)
+            shard = next((s for s in self.shards
+                          if s.lane == lane and s.free_slots - len(groups.get(s, ())) > 0), None)
+            if shard is None:
+                shard = self._new_shard(lane)
+            self._owner[stream] = shard
+            groups.setdefault(shard, []).append(stream)
+
+        for shard, group in groups.items():
+            await shard.subscribe(group)
+
+    async def remove_streams(self, streams: Iterable[str]):
+        """스트림 구독 해제 - 비게 된 샤드는 연결 종료"""
+        groups: Dict[StreamShard, List[str]] = {}
+        for stream in streams:
+            shard = self._owner.pop(stream, None)
+            if shard is not None:
+                groups.setdefault(shard, []).append(stream)
+
+        for shard, group in groups.items():
+            if shard.streams.issubset(group):
+                await self._retire(shard)
+            else:
+                await shard.unsubscribe(group)
+
+    def _new_shard(self, lane: str) -> StreamShard:
+        self._shard_seq += 1
+        shard = StreamShard(
+            f"{lane}-{self._shard_seq}", lane, self.url,
+            self.on_message, self._on_shard_state,
+            max_streams=self.max_streams,
+            max_messages_per_second=self.max_messages_per_second,
+            stale_timeout=self.stale_timeouts.get(lane, DEFAULT_STALE_TIMEOUTS[MARKET_LANE]),
+            reconnect_delay=self.reconnect_delay,
+            max_reconnect_delay=self.max_reconnect_delay,
+            alert_after_attempts=self.alert_after_attempts
+        )
+        self.shards.append(shard)
+        if self.is_running:
+            self._launch(shard)
+        logger.info(f"스트림 샤드 추가: {shard.shard_id}")
+        return shard
+
+    def _launch(self, shard: StreamShard):
+        self._tasks[shard.shard_id] = asyncio.create_task(shard.run())
+
+    async def _retire(self, shard: StreamShard):
+        """샤드 제거"""
+        self.shards.remove(shard)
+        for stream in shard.streams:
+            self._owner.pop(stream, None)
+        shard.streams.clear()
+        await shard.stop()
+        task = self._tasks.pop(shard.shard_id, None)
+        if task:
+            task.cancel()
+        logger.info(f"스트림 샤드 제거: {shard.shard_id}")
+
+    async def _on_shard_state(self, shard: StreamShard, state: str):
+        """샤드 상태 변화 - 전체 연결 완료 / 샤드 재연결 / 연속 실패 이벤트 전달"""
+        if state == 'failed':
+            await self._notify('failed')
+        elif state == 'connected' and shard.stats['connects'] > 1:
+            # 수신 루프 시작 전에 호출되므로 끊긴 동안의 누락 구간 보충을 먼저 예약할 수 있음
+            await self._notify('reconnected', sorted(shard.streams))
+
+        connected = self.is_connected
+        if connected != self._all_connected:
+            self._all_connected = connected
+            if connected:
+                await self._notify('connected')
+
+    async def _notify(self, event: str, *args):
+        if self.on_event:
+            await self.on_event(event, *args)
+
+    async def start(self):
+        """모든 샤드 연결 (stop 까지 대기)"""
+        self.is_running = True
+        self._stopped.clear()
+        for shard in self.shards:
+            self._launch(shard)
+        await self._stopped.wait()
+
+    async def stop(self):
+        """모든 샤드 종료"""
+        self.is_running = False
+        for shard in self.shards:
+            await shard.stop()
+        tasks = list(self._tasks.values())
+        self._tasks.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._stopped.set()
+
+    def get_stats(self) -> Dict:
+        """샤드별 통계"""
+        return {
+            'shards': len(self.shards),
+            'streams': len(self._owner),
+            'connected_shards': sum(1 for shard in self.shards if shard.is_connected),
+            'per_shard': {shard.shard_id: shard.get_stats() for shard in self.shards}
+        }
@@ -0,0 +1,617 @@
+# src/core/streaming_indicators.py
+"""
+스트리밍 지표 엔진
+과거 캔들로 한 번 초기화한 뒤 완성 캔들 1개마다 O(1)(상각)로 갱신하는 상태형 지표.
+전략이 캔들마다 전체 히스토리로 다시 계산하는 배치 결과와 같은 값을 낸다.
+
+- 배치 기준: pandas_ta (ema / wma / hma / rsi / atr / adx / donchian) 기본값,
+  전략 자체 계산 (ewm(adjust=False) EMA, ZLHMA, ZLEMA / ZLMACD, Ichimoku)
+- 모든 지표 상태는 get_state() / set_state() 로 JSON 저장 / 복원 가능 (재시작 시 재초기화 불필요)
+"""
+
+import math
+from collections import deque
+from typing import Dict, Optional, Sequence
+
+from src.core.rolling_stats import RESYNC_INTERVAL
+
+
+class StreamingIndicator:
+    """스트리밍 지표 공통 - 입력 종류 / 체크포인트 상태 정의
+
+    inputs: 'close' (종가), 'hl' (고가, 저가), 'hlc' (고가, 저가, 종가)
+    _state: 체크포인트 대상 속성 (하위 지표 / deque 는 재귀 변환)
+    """
+
+    inputs = 'close'
+    _state: Sequence[str] = ()
+
+    def update_bar(self, high: float, low: float, close: float):
+        """캔들 1개 반영 (입력 종류에 맞게 전달)"""
+        if self.inputs == 'close':
+            return self.update(close)
+        if self.inputs == 'hl':
+            return self.update(high, low)
+        return self.update(high, low, close)
+
+    def outputs(self) -> Dict[str, Optional[float]]:
+        """여러 값을 내는 지표의 {컬럼: 값} (단일 값 지표는 빈 dict - 엔진 이름 사용)"""
+        return {}
+
+    def get_state(self) -> Dict:
+        state = {}
+        for name in self._state:
+            value = getattr(self, name)
+            if isinstance(value, StreamingIndicator):
+                value = value.get_state()
+            elif isinstance(value, deque):
+                value = [list(item) if isinstance(item, tuple) else item for item in value]
+            state[name] = value
+        return state
+
+    def set_state(self, state: Dict):
+        for name in self._state:
+            current = getattr(self, name)
+            value = state[name]
+            if isinstance(current, StreamingIndicator):
+                current.set_state(value)
+            elif isinstance(current, deque):
+                setattr(self, name, deque((tuple(item) if isinstance(item, list) else item for item in value),
+                                          maxlen=current.maxlen))
+            else:
+                setattr(self, name, value)
+
+
+# ===== 이동평균 =====
+
+class EMA(StreamingIndicator):
+    """지수 이동평균 (alpha = 2 / (length + 1))
+
+    presma=False: 첫 값부터 시작 (pandas ewm(span, adjust=False) - 전략 자체 계산)
+    presma=True: 첫 length 개 단순 평균으로 시작 (pandas_ta.ema 기본값)
+    """
+
+    _state = ('value', 'count', '_seed_sum')
+
+    def __init__(self, length: int, presma: bool = False):
+        if length < 1:
+            raise ValueError(f"EMA 기간은 1 이상이어야 합니다: {length}")
+        self.length = length
+        self.presma = presma
+        self.alpha = 2.0 / (length + 1)
+        self.value: Optional[float] = None
+        self.count = 0
+        self._seed_sum = 0.0
+
+    def update(self, x: float) -> Optional[float]:
+        self.count += 1
+        if self.value is not None:
+            self.value = (1 - self.alpha) * self.value + self.alpha * x
+        elif not self.presma:
+            self.value = x
+        else:
+            self._seed_sum += x
+            if self.count == self.length:
+                self.value = self._seed_sum / self.length
+        return self.value
+
+
+class WMA(StreamingIndicator):
+    """선형 가중 이동평균 (최근 값 가중치 length) - pandas_ta.wma / 전략 calculate_wma
+
+    가중합 W 와 단순합 S 를 유지해 새 값마다 W' = W - S + n * x 로 갱신 (O(1)),
+    부동소수 누적 오차는 RESYNC_INTERVAL 마다 윈도우에서 다시 계산한다.
+    """
+
+    _state = ('_values', '_sum', '_weighted', '_updates')
+
+    def __init__(self, length: int):
+        if length < 1:
+            raise ValueError(f"WMA 기간은 1 이상이어야 합니다: {length}")
+        self.length = length
+        self._divisor = length * (length + 1) / 2
+        self._values = deque(maxlen=length)
+        self._sum = 0.0
+        self._weighted = 0.0
+        self._updates = 0
+
+    def update(self, x: float) -> Optional[float]:
+        values = self._values
+        if len(values) == self.length:
+            self._weighted += self.length * x - self._sum
+            self._sum += x - values[0]
+            self._updates += 1
+        else:
+            self._weighted += (len(values) + 1) * x
+            self._sum += x
+        values.append(x)
+        if self._updates >= RESYNC_INTERVAL:
+            self._resync()
+        return self.value
+
+    def _resync(self):
+        self._sum = math.fsum(self._values)
+        self._weighted = math.fsum(i * v for i, v in enumerate(self._values, 1))
+        self._updates = 0
+
+    @property
+    def value(self) -> Optional[float]:
+        if len(self._values) < self.length:
+            return None
+        return self._weighted / self._divisor
+
+
+class HMA(StreamingIndicator):
+    """Hull 이동평균: WMA(2 * WMA(n/2) - WMA(n), sqrt(n)) - pandas_ta.hma"""
+
+    _state = ('_half', '_full', '_smooth')
+
+    def __init__(self, length: int):
+        self.length = length
+        self._half = WMA(int(length / 2))
+        self._full = WMA(length)
+        self._smooth = WMA(int(math.sqrt(length)))
+
+    def update(self, x: float) -> Optional[float]:
+        half = self._half.update(x)
+        full = self._full.update(x)
+        if half is None or full is None:
+            return None
+        return self._smooth.update(2 * half - full)
+
+    @property
+    def value(self) -> Optional[float]:
+        return self._smooth.value
+
+
+class ZLHMA(StreamingIndicator):
+    """Zero Lag HMA: HMA + (HMA - HMA[lag]), lag = (n - 1) / 2 - ZLHMAEMACrossStrategy.calculate_zlhma"""
+
+    _state = ('_hma', '_history')
+
+    def __init__(self, length: int):
+        self.length = length
+        self.lag = int((length - 1) / 2)
+        self._hma = HMA(length)
+        self._history = deque(maxlen=self.lag + 1)  # 최근 lag + 1 개 HMA
+
+    def update(self, x: float) -> Optional[float]:
+        hma = self._hma.update(x)
+        if hma is not None:
+            self._history.append(hma)
+        return self.value
+
+    @property
+    def value(self) -> Optional[float]:
+        if len(self._history) <= self.lag:
+            return None
+        hma = self._history[-1]
+        return hma + (hma - self._history[0])
+
+
+class ZLEMA(StreamingIndicator):
+    """Zero Lag EMA: 2 * EMA - EMA(EMA) - ZLMACDIchimokuStrategy.calculate_zlema"""
+
+    _state = ('_ema1', '_ema2')
+
+    def __init__(self, length: int):
+        self.length = length
+        self._ema1 = EMA(length)
+        self._ema2 = EMA(length)
+
+    def update(self, x: float) -> float:
+        ema1 = self._ema1.update(x)
+        ema2 = self._ema2.update(ema1)
+        return 2 * ema1 - ema2
+
+    @property
+    def value(self) -> Optional[float]:
+        if self._ema1.value is None:
+            return None
+        return 2 * self._ema1.value - self._ema2.value
+
+
+class ZLMACD(StreamingIndicator):
+    """Zero Lag MACD (ZLEMA 빠른 - 느린, 시그널은 EMA) - ZLMACDIchimokuStrategy.calculate_zlmacd"""
+
+    _state = ('_fast', '_slow', '_signal')
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        self._fast = ZLEMA(fast)
+        self._slow = ZLEMA(slow)
+        self._signal = EMA(signal)
+
+    def update(self, x: float) -> float:
+        macd = self._fast.update(x) - self._slow.update(x)
+        self._signal.update(macd)
+        return macd
+
+    @property
+    def value(self) -> Optional[float]:
+        if self._fast.value is None:
+            return None
+        return self._fast.value - self._slow.value
+
+    def outputs(self) -> Dict[str, Optional[float]]:
+        macd, signal = self.value, self._signal.value
+        return {
+            'zlmacd': macd,
+            'zlmacd_signal': signal,
+            'zlmacd_hist': macd - signal if macd is not None else None,
+        }
+
+
+# ===== Wilder 평활 =====
+
+class WilderRSI(StreamingIndicator):
+    """Wilder RSI (pandas_ta.rsi 기본값: rma 평활, drift=1)
+
+    첫 종가 다음 캔들부터 값이 나오며 평균 상승/하락폭은 첫 변화량으로 시작해
+    avg = avg + (x - avg) / length 로 갱신한다 (ewm(alpha=1/length, adjust=False) 와 동일).
+    """
+
+    _state = ('avg_gain', 'avg_loss', 'last_close', 'count')
+
+    def __init__(self, length: int = 14):
+        if length < 1:
+            raise ValueError(f"RSI 기간은 1 이상이어야 합니다: {length}")
+        self.length = length
+        self.alpha = 1.0 / length
+        self.avg_gain: Optional[float] = None
+        self.avg_loss: Optional[float] = None
+        self.last_close: Optional[float] = None
+        self.count = 0
+
+    def update(self, close: float) -> Optional[float]:
+        prev = self.last_close
+        self.last_close = close
+        self.count += 1
+        if prev is None:
+            return None
+
+        change = close - prev
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+        if self.avg_gain is None:
+            self.avg_gain, self.avg_loss = gain, loss
+        else:
+            self.avg_gain += self.alpha * (gain - self.avg_gain)
+            self.avg_loss += self.alpha * (loss - self.avg_loss)
+        return self.value
+
+    @property
+    def value(self) -> Optional[float]:
+        if self.avg_gain is None:
+            return None
+        total = self.avg_gain + self.avg_loss
+        if total == 0:
+            return None  # 변화 없음 (pandas_ta 는 NaN)
+        return 100.0 * self.avg_gain / total
+
+
+class WilderATR(StreamingIndicator):
+    """Wilder ATR (pandas_ta.atr 기본값: rma 평활, presma=True)
+
+    첫 length 개 True Range 의 단순 평균으로 시작해 이후 rma 로 갱신한다.
+    첫 캔들의 True Range 는 고가 - 저가, prenan=True 면 제외 (pandas_ta.adx 내부 ATR).
+    """
+
+    inputs = 'hlc'
+    _state = ('value', 'last_close', 'count', '_tr_sum')
+
+    def __init__(self, length: int = 14, prenan: bool = False):
+        if length < 1:
+            raise ValueError(f"ATR 기간은 1 이상이어야 합니다: {length}")
+        self.length = length
+        self.prenan = prenan
+        self.alpha = 1.0 / length
+        self.value: Optional[float] = None
+        self.last_close: Optional[float] = None
+        self.count = 0
+        self._tr_sum = 0.0
+
+    def update(self, high: float, low: float, close: float) -> Optional[float]:
+        prev = self.last_close
+        self.last_close = close
+        self.count += 1
+        if prev is None:
+            if self.prenan:
+                return None
+            tr = high - low
+        else:
+            tr = max(high - low, abs(high - prev), abs(prev - low))
+
+        if self.value is not None:
+            self.value += self.alpha * (tr - self.value)
+        else:
+            self._tr_sum += tr
+            if self.count == self.length:
+                self.value = self._tr_sum / (self.length - 1 if self.prenan else self.length)
+        return self.value
+
+
+class WilderADX(StreamingIndicator):
+    """Wilder ADX / +DI / -DI (pandas_ta.adx 기본값)
+
+    +DM / -DM 은 두 번째 캔들부터 rma, DI 는 ATR(prenan) 이 준비된 length 번째 캔들부터,
+    ADX 는 DX 의 rma.
+    """
+
+    inputs = 'hlc'
+    _state = ('_atr', 'avg_pos', 'avg_neg', 'adx', 'plus_di', 'minus_di', 'last_high', 'last_low')
+
+    def __init__(self, length: int = 14):
+        self.length = length
+        self.alpha = 1.0 / length
+        self._atr = WilderATR(length, prenan=True)
+        self.avg_pos: Optional[float] = None
+        self.avg_neg: Optional[float] = None
+        self.adx: Optional[float] = None
+        self.plus_di: Optional[float] = None
+        self.minus_di: Optional[float] = None
+        self.last_high: Optional[float] = None
+        self.last_low: Optional[float] = None
+
+    def update(self, high: float, low: float, close: float) -> Optional[float]:
+        atr = self._atr.update(high, low, close)
+        prev_high, prev_low = self.last_high, self.last_low
+        self.last_high, self.last_low = high, low
+        if prev_high is None:
+            return None
+
+        up = high - prev_high
+        dn = prev_low - low
+        pos = up if up > dn and up > 0 else 0.0
+        neg = dn if dn > up and dn > 0 else 0.0
+        if self.avg_pos is None:
+            self.avg_pos, self.avg_neg = pos, neg
+        else:
+            self.avg_pos += self.alpha * (pos - self.avg_pos)
+            self.avg_neg += self.alpha * (neg - self.avg_neg)
+
+        if not atr:
+            return None
+        self.plus_di = 100.0 * self.avg_pos / atr
+        self.minus_di = 100.0 * self.avg_neg / atr
+        di_sum = self.plus_di + self.minus_di
+        if di_sum == 0:
+            return self.adx
+        dx = 100.0 * abs(self.plus_di - self.minus_di) / di_sum
+        if self.adx is None:
+            self.adx = dx
+        else:
+            self.adx += self.alpha * (dx - self.adx)
+        return self.adx
+
+    @property
+    def value(self) -> Optional[float]:
+        return self.adx
+
+    def outputs(self) -> Dict[str, Optional[float]]:
+        return {'adx': self.adx, 'plus_di': self.plus_di, 'minus_di': self.minus_di}
+
+
+# ===== 채널 =====
+
+class RollingExtremum(StreamingIndicator):
+    """최근 length 개의 최대(또는 최소) - 단조 덱으로 상각 O(1) (배치 계산은 rolling_extrema)"""
+
+    _state = ('_deque', '_index')
+
+    def __init__(self, length: int, maximum: bool = True):
+        if length < 1:
+            raise ValueError(f"윈도우 크기는 1 이상이어야 합니다: {length}")
+        self.length = length
+        self.maximum = maximum
+        self._deque = deque()  # (인덱스, 값) - 최대는 값 내림차순, 최소는 오름차순
+        self._index = 0
+
+    def update(self, x: float) -> Optional[float]:
+        items = self._deque
+        if self.maximum:
+            while items and items[-1][1] <= x:
+                items.pop()
+        else:
+            while items and items[-1][1] >= x:
+                items.pop()
+        items.append((self._index, x))
+        if items[0][0] <= self._index - self.length:
+            items.popleft()
+        self._index += 1
+        return self.value
+
+    @property
+    def value(self) -> Optional[float]:
+        if self._index < self.length:
+            return None
+        return self._deque[0][1]
+
+
+class Donchian(StreamingIndicator):
+    """Donchian 채널 (pandas_ta.donchian / TFPEStrategy dc_upper / dc_lower / dc_middle)"""
+
+    inputs = 'hl'
+    _state = ('_upper', '_lower')
+
+    def __init__(self, length: int = 20):
+        self.length = length
+        self._upper = RollingExtremum(length, maximum=True)
+        self._lower = RollingExtremum(length, maximum=False)
+
+    def update(self, high: float, low: float) -> Optional[float]:
+        self._upper.update(high)
+        self._lower.update(low)
+        return self.value
+
+    @property
+    def value(self) -> Optional[float]:
+        upper, lower = self._upper.value, self._lower.value
+        if upper is None or lower is None:
+            return None
+        return (upper + lower) / 2
+
+    def outputs(self) -> Dict[str, Optional[float]]:
+        return {'dc_upper': self._upper.value, 'dc_middle': self.value, 'dc_lower': self._lower.value}
+
+
+class Ichimoku(StreamingIndicator):
+    """일목균형표 전환선 / 기준선 / 선행스팬 A, B (ZLMACDIchimokuStrategy.calculate_ichimoku)
+
+    선행스팬은 shift 캔들 전에 계산한 값 (배치의 .shift(cloud_shift) 와 같은 행 기준).
+    후행스팬(미래 종가)은 실시간으로 알 수 없으므로 제공하지 않는다.
+    """
+
+    inputs = 'hl'
+    _state = ('_tenkan_high', '_tenkan_low', '_kijun_high', '_kijun_low',
+              '_span_b_high', '_span_b_low', '_spans')
+
+    def __init__(self, tenkan: int = 9, kijun: int = 26, senkou_b: int = 52, shift: int = 26):
+        self.shift = shift
+        self._tenkan_high = RollingExtremum(tenkan, True)
+        self._tenkan_low = RollingExtremum(tenkan, False)
+        self._kijun_high = RollingExtremum(kijun, True)
+        self._kijun_low = RollingExtremum(kijun, False)
+        self._span_b_high = RollingExtremum(senkou_b, True)
+        self._span_b_low = RollingExtremum(senkou_b, False)
+        self._spans = deque(maxlen=shift + 1)  # (선행 A, 선행 B) 계산 시점 값
+
+    @staticmethod
+    def _mid(high: RollingExtremum, low: RollingExtremum) -> Optional[float]:
+        if high.value is None or low.value is None:
+            return None
+        return (high.value + low.value) / 2
+
+    def update(self, high: float, low: float) -> Optional[float]:
+        for extremum in (self._tenkan_high, self._kijun_high, self._span_b_high):
+            extremum.update(high)
+        for extremum in (self._tenkan_low, self._kijun_low, self._span_b_low):
+            extremum.update(low)
+        tenkan, kijun = self.tenkan_sen, self.kijun_sen
+        span_a = (tenkan + kijun) / 2 if tenkan is not None and kijun is not None else None
+        self._spans.append((span_a, self._mid(self._span_b_high, self._span_b_low)))
+        return self.value
+
+    @property
+    def tenkan_sen(self) -> Optional[float]:
+        return self._mid(self._tenkan_high, self._tenkan_low)
+
+    @property
+    def kijun_sen(self) -> Optional[float]:
+        return self._mid(self._kijun_high, self._kijun_low)
+
+    def _shifted(self, i: int) -> Optional[float]:
+        if len(self._spans) <= self.shift:
+            return None
+        return self._spans[0][i]
+
+    @property
+    def value(self) -> Optional[float]:
+        return self.kijun_sen
+
+    def outputs(self) -> Dict[str, Optional[float]]:
+        return {
+            'tenkan_sen': self.tenkan_sen,
+            'kijun_sen': self.kijun_sen,
+            'senkou_span_a': self._shifted(0),
+            'senkou_span_b': self._shifted(1),
+        }
+
+
+# ===== 엔진 =====
+
+class IndicatorEngine:
+    """(symbol, interval) 하나의 지표 묶음 - 완성 캔들 시각으로 중복 반영 방지
+
+    단일 값 지표는 등록 이름, 여러 값 지표는 outputs() 의 컬럼 이름으로 latest() 에 나타난다
+    (전략 DataFrame 컬럼과 같은 이름).
+    """
+
+    def __init__(self, indicators: Dict[str, StreamingIndicator]):
+        self.indicators = indicators
+        self.last_open_time: Optional[int] = None
+        self.bars = 0
+
+    def seed(self, open_times: Sequence[int], ohlcv) -> int:
+        """과거 완성 캔들로 초기화 (open_times 오름차순, ohlcv 는 (n, 5) 배열) - 반영한 캔들 수 반환"""
+        applied = 0
+        for open_time, row in zip(open_times, ohlcv):
+            if self.update(int(open_time), float(row[1]), float(row[2]), float(row[3])):
+                applied += 1
+        return applied
+
+    def update(self, open_time: int, high: float, low: float, close: float) -> bool:
+        """완성 캔들 1개 반영 (이미 반영한 시각이면 무시)"""
+        if self.last_open_time is not None and open_time <= self.last_open_time:
+            return False
+        self.last_open_time = open_time
+        self.bars += 1
+        for indicator in self.indicators.values():
+            indicator.update_bar(high, low, close)
+        return True
+
+    def latest(self) -> Dict[str, Optional[float]]:
+        """마지막 완성 캔들 기준 지표 값"""
+        values = {}
+        for name, indicator in self.indicators.items():
+            outputs = indicator.outputs()
+            if outputs:
+                values.update(outputs)
+            else:
+                values[name] = indicator.value
+        return values
+
+    def checkpoint(self) -> Dict:
+        """JSON 으로 저장 가능한 전체 상태"""
+        return {
+            'last_open_time': self.last_open_time,
+            'bars': self.bars,
+            'indicators': {name: {'type': type(indicator).__name__, 'state': indicator.get_state()}
+                           for name, indicator in self.indicators.items()},
+        }
+
+    def restore(self, checkpoint: Dict):
+        """checkpoint() 결과 복원 (같은 구성으로 만든 엔진이어야 함)"""
+        saved = checkpoint['indicators']
+        for name, indicator in self.indicators.items():
+            entry = saved.get(name)
+            if entry is None or entry['type'] != type(indicator).__name__:
+                raise ValueError(f"체크포인트 지표 구성이 다릅니다: {name}")
+        for name, indicator in self.indicators.items():
+            indicator.set_state(saved[name]['state'])
+        self.last_open_time = checkpoint['last_open_time']
+        self.bars = checkpoint['bars']
+
+
+def tfpe_indicators(dc_period: int = 20) -> Dict[str, StreamingIndicator]:
+    """TFPEStrategy.calculate_indicators / add_donchian_indicators 구성"""
+    return {
+        'adx': WilderADX(14),
+        'rsi': WilderRSI(14),
+        'ema12': EMA(12, presma=True),
+        'atr': WilderATR(14),
+        'donchian': Donchian(dc_period),
+    }
+
+
+def zlhma_ema_cross_indicators(zlhma_period: int = 14, fast_ema_period: int = 50,
+                               slow_ema_period: int = 200, adx_period: int = 14) -> Dict[str, StreamingIndicator]:
+    """ZLHMAEMACrossStrategy.calculate_indicators 구성 (ADX / ATR 은 Wilder)"""
+    return {
+        'zlhma': ZLHMA(zlhma_period),
+        'ema_fast': EMA(fast_ema_period),
+        'ema_slow': EMA(slow_ema_period),
+        'adx': WilderADX(adx_period),
+        'atr': WilderATR(14),
+    }
+
+
+def zlmacd_ichimoku_indicators(fast: int = 12, slow: int = 26, signal: int = 9, tenkan: int = 9,
+                               kijun: int = 26, senkou_b: int = 52, cloud_shift: int = 26,
+                               adx_period: int = 14) -> Dict[str, StreamingIndicator]:
+    """ZLMACDIchimokuStrategy 구성"""
+    return {
+        'zlmacd': ZLMACD(fast, slow, signal),
+        'ichimoku': Ichimoku(tenkan, kijun, senkou_b, cloud_shift),
+        'adx': WilderADX(adx_period),
+    }
+
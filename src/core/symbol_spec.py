@@ -0,0 +1,163 @@
+# src/core/symbol_spec.py
+"""
+심볼별 주문 규격 (거래소 필터 사전 컴파일)
+exchangeInfo 필터를 틱/스텝의 정수 지수 표현으로 한 번만 변환해 두고,
+주문 수량/가격 검증은 정수 연산으로만 처리한다.
+"""
+
+import json
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass
+from decimal import Decimal
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SPEC_CACHE_VERSION = 1
+
+
+def _parse_increment(value: str) -> Tuple[int, int]:
+    """틱/스텝 문자열을 (정수 배수, 소수 자릿수) 로 변환
+
+    예: '0.0100' -> (1, 2), '0.5' -> (5, 1), '10' -> (10, 0)
+    """
+    text = str(value)
+    if '.' in text:
+        text = text.rstrip('0').rstrip('.')
+    if '.' not in text:
+        return int(text), 0
+    integer, fraction = text.split('.')
+    return int(integer + fraction), len(fraction)
+
+
+def _to_units(value: str, exponent: int) -> int:
+    """필터 값 문자열을 10^-exponent 단위 정수로 변환 (컴파일 시 1회)"""
+    return int(Decimal(str(value)).scaleb(exponent).to_integral_value())
+
+
+def _floor_units(scaled: float) -> int:
+    """스케일된 값 내림 - 부동소수 표현 오차(28.999999...)는 가까운 정수로 보정"""
+    nearest = round(scaled)
+    if abs(scaled - nearest) <= 1e-9 * max(1.0, abs(scaled)):
+        return int(nearest)
+    return int(scaled // 1)
+
+
+@dataclass(frozen=True)
+class SymbolSpec:
+    """심볼 주문 규격
+
+    가격/수량은 각각 10^-price_exp, 10^-qty_exp 단위 정수로 다룬다.
+    """
+    symbol: str
+    price_exp: int
+    tick_units: int
+    min_price_units: int
+    max_price_units: int
+    qty_exp: int
+    step_units: int
+    min_qty_units: int
+    max_qty_units: int
+    min_notional: float
+
+    @property
+    def tick_size(self) -> float:
+        return self.tick_units / 10 ** self.price_exp
+
+    @property
+    def step_size(self) -> float:
+        return self.step_units / 10 ** self.qty_exp
+
+    @property
+    def min_qty(self) -> float:
+        return self.min_qty_units / 10 ** self.qty_exp
+
+    def quantize_quantity(self, quantity: float) -> float:
+        """최소/최대 수량 제한 후 스텝 단위 내림"""
+        units = _floor_units(quantity * 10 ** self.qty_exp)
+        units = max(self.min_qty_units, min(units, self.max_qty_units))
+        units -= units % self.step_units
+        return units / 10 ** self.qty_exp
+
+    def quantize_price(self, price: float) -> float:
+        """최소/최대 가격 제한 후 가장 가까운 틱으로 반올림"""
+        units = round(price * 10 ** self.price_exp)
+        if self.max_price_units:
+            units = min(units, self.max_price_units)
+        units = max(self.min_price_units, units)
+        units = (units + self.tick_units // 2) // self.tick_units * self.tick_units
+        return units / 10 ** self.price_exp
+
+    def meets_min_notional(self, quantity: float, price: float) -> bool:
+        """최소 주문 금액 충족 여부"""
+        return quantity * price >= self.min_notional
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'SymbolSpec':
+        return cls(**data)
+
+
+def compile_symbol_spec(symbol_info: Dict) -> SymbolSpec:
+    """exchangeInfo 심볼 항목을 SymbolSpec 으로 변환"""
+    filters = {f['filterType']: f for f in symbol_info.get('filters', [])}
+    price_filter = filters.get('PRICE_FILTER', {})
+    lot_size = filters.get('LOT_SIZE', {})
+    min_notional = filters.get('MIN_NOTIONAL', {})
+
+    tick_units, price_exp = _parse_increment(price_filter.get('tickSize', '0.01'))
+    step_units, qty_exp = _parse_increment(lot_size.get('stepSize', '0.001'))
+
+    return SymbolSpec(
+        symbol=symbol_info['symbol'],
+        price_exp=price_exp,
+        tick_units=tick_units or 1,
+        min_price_units=_to_units(price_filter.get('minPrice', '0'), price_exp),
+        max_price_units=_to_units(price_filter.get('maxPrice', '0'), price_exp),
+        qty_exp=qty_exp,
+        step_units=step_units or 1,
+        min_qty_units=_to_units(lot_size.get('minQty', '0'), qty_exp),
+        max_qty_units=_to_units(lot_size.get('maxQty', '0'), qty_exp) or 10 ** 18,
+        min_notional=float(min_notional.get('notional', min_notional.get('minNotional', 0)))
+    )
+
+
+def load_spec_cache(path: str) -> Tuple[Dict[str, SymbolSpec], Optional[float]]:
+    """디스크 캐시 로드
+
+    Returns:
+        (심볼별 규격, 갱신 시각 epoch). 파일이 없거나 형식이 다르면 ({}, None)
+    """
+    try:
+        if not os.path.exists(path):
+            return {}, None
+        with open(path, 'r') as f:
+            data = json.load(f)
+        if data.get('version') != SPEC_CACHE_VERSION:
+            return {}, None
+        specs = {symbol: SymbolSpec.from_dict(spec) for symbol, spec in data['symbols'].items()}
+        return specs, float(data['updated_at'])
+    except Exception as e:
+        logger.warning(f"심볼 규격 캐시 로드 실패: {e}")
+        return {}, None
+
+
+def save_spec_cache(path: str, specs: Dict[str, SymbolSpec], updated_at: Optional[float] = None):
+    """디스크 캐시 저장 (임시 파일 후 교체)"""
+    try:
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        data = {
+            'version': SPEC_CACHE_VERSION,
+            'updated_at': updated_at if updated_at is not None else time.time(),
+            'symbols': {symbol: spec.to_dict() for symbol, spec in specs.items()}
+        }
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        logger.error(f"심볼 규격 캐시 저장 실패: {e}")
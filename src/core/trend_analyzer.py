@@ -9,13 +9,16 @@ from typing import Dict, Tuple, Optional
 from datetime import datetime, timedelta
 import logging
 
+from src.core import indicators
+
 logger = logging.getLogger(__name__)
 
 class TrendAnalyzer:
     """중장기 트렌드 분석기"""
     
-    def __init__(self, binance_api):
+    def __init__(self, binance_api, indicator_cache=None):
         self.binance_api = binance_api
+        self.indicator_cache = indicator_cache  # 공유 지표 캐시 (선택)
         self.lookback_days = 14  # 2주
         
         # EMA 기간
@@ -72,25 +75,16 @@ class TrendAnalyzer:
     async def _get_historical_data(self, symbol: str, interval: str, limit: int) -> pd.DataFrame:
         """과거 데이터 조회"""
         try:
-            klines = await self.binance_api.client.get_klines(
+            df = await self.binance_api.get_klines(
                 symbol=symbol,
                 interval=interval,
                 limit=limit
             )
             
-            df = pd.DataFrame(klines, columns=[
-                'timestamp', 'open', 'high', 'low', 'close', 
-                'volume', 'close_time', 'quote_volume', 'trades',
-                'taker_buy_base', 'taker_buy_quote', 'ignore'
-            ])
-            
-            # 데이터 타입 변환
-            for col in ['open', 'high', 'low', 'close', 'volume']:
-                df[col] = df[col].astype(float)
-            
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-            df.set_index('timestamp', inplace=True)
+            if df.empty:
+                raise ValueError(f"캔들 데이터 없음 ({symbol} {interval})")
             
+            df.attrs.update(symbol=symbol, interval=interval)
             return df
             
         except Exception as e:
@@ -102,8 +96,10 @@ class TrendAnalyzer:
         if len(df) < period:
             return df['close'].mean()
         
-        ema = df['close'].ewm(span=period, adjust=False).mean()
-        return ema.iloc[-1]
+        if self.indicator_cache is not None and df.attrs.get('symbol'):
+            ema = self.indicator_cache.get(df.attrs['symbol'], df.attrs['interval'], 'ema', df, length=period)
+            return ema[-1]
+        return indicators.ema(df['close'], period)[-1]
     
     def _calculate_trend_score(self, price: float, ema_200_4h: float, 
                               ema_50_1h: float, df_1h: pd.DataFrame) -> float:
@@ -0,0 +1,233 @@
+# src/core/user_data_stream.py
+"""
+사용자 데이터 스트림 (listenKey)
+ACCOUNT_UPDATE / ORDER_TRADE_UPDATE 이벤트를 PositionManager 에 증분 반영한다.
+REST 전체 동기화는 재연결 직후(끊긴 동안 놓친 이벤트 보정)에만 수행.
+"""
+
+import asyncio
+import json
+import logging
+from typing import Dict, List, Optional
+
+import websockets
+from binance.exceptions import BinanceAPIException
+
+logger = logging.getLogger(__name__)
+
+
+class UserDataStream:
+    """바이낸스 선물 사용자 데이터 스트림 클라이언트"""
+
+    def __init__(self, binance_api, position_manager, keepalive_interval: int = 1800,
+                 reconnect_delay: int = 5, max_reconnect_delay: int = 60):
+        self.binance_api = binance_api
+        self.position_manager = position_manager
+
+        # listenKey 는 60분 후 만료되므로 30분마다 연장
+        self.keepalive_interval = keepalive_interval
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+
+        self.listen_key: Optional[str] = None
+        self.ws = None
+        self.is_running = False
+        self.is_connected = False
+        self._connected_once = False
+        self._keepalive_task: Optional[asyncio.Task] = None
+
+        # ACCOUNT_UPDATE 에는 레버리지가 없으므로 별도로 유지
+        self.leverages: Dict[str, int] = {}
+
+        self._handlers = {
+            'ACCOUNT_UPDATE': self._on_account_update,
+            'ORDER_TRADE_UPDATE': self._on_order_update,
+            'ACCOUNT_CONFIG_UPDATE': self._on_config_update,
+            'listenKeyExpired': self._on_listen_key_expired,
+        }
+
+        self.stats = {
+            'messages': 0,
+            'account_updates': 0,
+            'order_updates': 0,
+            'reconnects': 0,
+            'resyncs': 0,
+            'renewals': 0,
+            'keepalives': 0,
+        }
+
+    @property
+    def stream_url(self) -> str:
+        return f"{self.binance_api.ws_url}/ws/{self.listen_key}"
+
+    async def start(self):
+        """스트림 시작 (종료될 때까지 재연결 반복)"""
+        self.is_running = True
+        delay = self.reconnect_delay
+
+        while self.is_running:
+            try:
+                self.listen_key = await self.binance_api.create_listen_key()
+                await self._connect()
+                delay = self.reconnect_delay  # 정상 종료(키 갱신 등)면 즉시 재연결
+                continue
+
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"사용자 데이터 스트림 오류: {e}")
+
+            if self.is_running:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.max_reconnect_delay)
+
+        self.is_connected = False
+
+    async def _connect(self):
+        """WebSocket 연결 및 메시지 처리"""
+        async with websockets.connect(self.stream_url) as websocket:
+            self.ws = websocket
+            self.is_connected = True
+
+            try:
+                if self._connected_once:
+                    # 끊긴 동안 놓친 이벤트는 REST 로 한 번만 보정
+                    self.stats['reconnects'] += 1
+                    await self._resync()
+                else:
+                    await self._load_leverages()
+                    self._connected_once = True
+
+                logger.info("✓ 사용자 데이터 스트림 연결")
+                self._keepalive_task = asyncio.create_task(self._keepalive_loop())
+
+                async for message in websocket:
+                    if not self.is_running:
+                        break
+                    try:
+                        await self._handle_message(json.loads(message))
+                    except Exception as e:
+                        logger.error(f"사용자 데이터 이벤트 처리 오류: {e}")
+            finally:
+                self.is_connected = False
+                self.ws = None
+                if self._keepalive_task:
+                    self._keepalive_task.cancel()
+                    self._keepalive_task = None
+
+    async def _resync(self):
+        """재연결 후 REST 전체 동기화"""
+        self.stats['resyncs'] += 1
+        self.binance_api.invalidate_read_cache()
+        await self._load_leverages()
+        await self.position_manager.sync_positions()
+        logger.info("사용자 데이터 스트림 재연결 - 포지션 재동기화 완료")
+
+    async def _load_leverages(self):
+        """심볼별 레버리지 로드"""
+        account = await self.binance_api.get_account_info()
+        if not account:
+            return
+        for pos in account.get('positions', []):
+            try:
+                self.leverages[pos['symbol']] = int(pos.get('leverage', 1))
+            except (KeyError, ValueError, TypeError):
+                continue
+
+    async def _keepalive_loop(self):
+        """listenKey 주기적 연장 - 만료된 키는 연결을 끊어 새 키로 재연결"""
+        while self.is_running:
+            await asyncio.sleep(self.keepalive_interval)
+            try:
+                await self.binance_api.keepalive_listen_key()
+                self.stats['keepalives'] += 1
+            except BinanceAPIException as e:
+                if e.code == -1125:
+                    logger.warning("listenKey 만료 - 재발급")
+                    await self._renew()
+                    return
+                logger.error(f"listenKey 연장 실패: {e}")
+            except Exception as e:
+                logger.error(f"listenKey 연장 실패: {e}")
+
+    async def _renew(self):
+        """현재 연결을 닫아 새 listenKey 로 재연결"""
+        self.stats['renewals'] += 1
+        if self.ws is not None:
+            await self.ws.close()
+
+    async def _handle_message(self, data: Dict):
+        """이벤트 타입별 처리"""
+        self.stats['messages'] += 1
+        handler = self._handlers.get(data.get('e'))
+        if handler:
+            await handler(data)
+
+    async def _on_account_update(self, data: Dict):
+        """잔고/포지션 변경"""
+        self.stats['account_updates'] += 1
+        self.binance_api.invalidate_read_cache()
+
+        updates = self._convert_positions(data.get('a', {}).get('P', []))
+        if updates:
+            await self.position_manager.apply_position_update(updates)
+
+    def _convert_positions(self, raw_positions: List[Dict]) -> List[Dict]:
+        """스트림 포지션 항목을 get_positions 형식으로 변환"""
+        updates = []
+        for pos in raw_positions:
+            symbol = pos['s']
+            position_amt = float(pos.get('pa', 0))
+            position_side = pos.get('ps', 'BOTH')
+            if position_side == 'BOTH':
+                side = 'LONG' if position_amt > 0 else 'SHORT'
+            else:
+                side = position_side
+
+            updates.append({
+                'symbol': symbol,
+                'side': side,
+                'positionAmt': position_amt,
+                'entryPrice': float(pos.get('ep', 0)),
+                'unRealizedPnl': float(pos.get('up', 0)),
+                'leverage': self.leverages.get(symbol, 1),
+                'marginType': pos.get('mt', 'cross'),
+                'positionSide': position_side
+            })
+        return updates
+
+    async def _on_order_update(self, data: Dict):
+        """주문 상태/체결"""
+        self.stats['order_updates'] += 1
+        order = data.get('o', {})
+        if order.get('x') == 'TRADE':
+            self.binance_api.invalidate_read_cache()
+        await self.position_manager.apply_order_update(order)
+
+    async def _on_config_update(self, data: Dict):
+        """레버리지 변경"""
+        config = data.get('ac')
+        if config and 's' in config:
+            self.leverages[config['s']] = int(config['l'])
+            self.binance_api.invalidate_read_cache()
+
+    async def _on_listen_key_expired(self, data: Dict):
+        """서버가 알린 listenKey 만료"""
+        logger.warning("listenKey 만료 이벤트 수신 - 재발급")
+        await self._renew()
+
+    async def stop(self):
+        """스트림 종료 및 listenKey 폐기"""
+        self.is_running = False
+        if self.ws is not None:
+            await self.ws.close()
+        if self.listen_key:
+            await self.binance_api.close_listen_key()
+            self.listen_key = None
+
+    def get_stats(self) -> Dict:
+        """스트림 통계"""
+        return {
+            'is_connected': self.is_connected,
+            **self.stats
+        }
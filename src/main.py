@@ -30,11 +30,18 @@ if project_root not in sys.path:
 print(f"Python Path: {sys.path[0]}")
 print(f"Project Root: {project_root}")
 
+from src.core.api_telemetry import api_caller
 from src.core.binance_api import BinanceAPI
 from src.core.position_manager import PositionManager
 from src.core.state_manager import StateManager
 from src.core.realtime_price_monitor import RealtimePriceMonitor
 from src.core.realtime_signal_processor import RealtimeSignalProcessor
+from src.core.kline_store import KlineStore
+from src.core.indicator_cache import get_indicator_cache
+from src.core.candle_close_monitor import CandleCloseScheduler
+from src.core.market_recorder import MarketRecorder
+from src.core.order_book import OrderBookManager
+from src.core.simulator import start_simulator
 from src.strategies.strategy_factory import get_strategy_factory
 from src.strategies.base_strategy import BaseStrategy
 from src.web.dashboard import create_dashboard
@@ -46,6 +53,7 @@ from src.utils.telegram_commands import setup_telegram_commands, TelegramCommand
 from src.core.smart_resume_manager import SmartResumeManager
 from src.core.safety_check_manager import SafetyCheckManager
 from src.core.fast_position_monitor import FastPositionMonitor
+from src.core.user_data_stream import UserDataStream
 from src.core.event_logger import get_event_logger, log_event
 from src.monitoring.position_sync_monitor import PositionSyncMonitor
 from src.core.phase2_integration import Phase2Integration, setup_phase2_components
@@ -93,6 +101,12 @@ class TradingSystem:
         self.realtime_monitor = None
         self.realtime_enabled = False
         self.fast_monitor = None  # 빠른 포지션 모니터
+        self.user_stream = None  # 사용자 데이터 스트림 (포지션/주문 푸시)
+        self.kline_store = None  # 공유 캔들 저장소
+        self.indicator_cache = None  # 전략 간 공유 지표 캐시
+        self.candle_scheduler = None  # 캔들 완성 이벤트 스케줄러
+        self.market_recorder = None  # 수신 시세 기록기
+        self.order_books = None  # 로컬 오더북 (호가 차분 스트림)
         
         # 이벤트 루프
         self.loop = None
@@ -137,7 +151,12 @@ class TradingSystem:
             testnet = self.config.get('system', {}).get('mode', 'testnet') == 'testnet'
             
             # 거래소 API 초기화 - API 키 전달
-            self.exchange = BinanceAPI(api_key=api_key, secret_key=secret_key, testnet=testnet)
+            self.exchange = BinanceAPI(
+                api_key=api_key,
+                secret_key=secret_key,
+                testnet=testnet,
+                read_cache_ttl=self.config.get('trading', {}).get('account_cache_ttl', 1.0)
+            )
             await self.exchange.initialize()
             
             # 상태 관리자 초기화
@@ -240,9 +259,86 @@ class TradingSystem:
                 logger.error("시스템 안전 체크 실패")
                 return False
             
+            # 시세 WebSocket 기반 기능 (캔들 저장소 / 시세 기록 / 로컬 오더북) - 각자 설정으로 활성화
+            market_data_config = self.config.get('market_data', {})
+            kline_store_config = market_data_config.get('kline_store', {})
+            recorder_config = market_data_config.get('recorder', {})
+            order_book_config = market_data_config.get('order_book', {})
+            if any(feature_config.get('enabled', False)
+                   for feature_config in (kline_store_config, recorder_config, order_book_config)):
+                # 수신 시세 기록 (실거래 입력 재생용, 선택)
+                if recorder_config.get('enabled', False):
+                    self.market_recorder = MarketRecorder(
+                        root_dir=recorder_config.get('path', 'data/recordings'),
+                        flush_interval=recorder_config.get('flush_interval', 1.0),
+                        compress=recorder_config.get('compress', True)
+                    )
+                    logger.info("✓ 시세 기록기 초기화")
+                
+                self.realtime_monitor = RealtimePriceMonitor(
+                    self.exchange,
+                    stream_config=market_data_config.get('streams'),
+                    recorder=self.market_recorder
+                )
+                
+                # 공유 캔들 저장소 (WebSocket 완성 캔들로 갱신)
+                if kline_store_config.get('enabled', False):
+                    self.kline_store = KlineStore(
+                        self.exchange,
+                        capacity=kline_store_config.get('capacity', 1500)
+                    )
+                    self.kline_store.attach(self.realtime_monitor)
+                    logger.info("✓ 공유 캔들 저장소 초기화")
+                
+                # 로컬 오더북 (호가 조회 / 슬리피지 추정을 REST 없이)
+                if order_book_config.get('enabled', False):
+                    self.realtime_monitor.depth_speed = order_book_config.get('speed', '100ms')
+                    self.order_books = OrderBookManager(
+                        self.exchange, self.realtime_monitor,
+                        snapshot_limit=order_book_config.get('snapshot_limit', 1000)
+                    )
+                    logger.info("✓ 로컬 오더북 초기화")
+            
             # 전략 초기화
             await self._initialize_strategies()
             
+            # 전략에 캔들 저장소 주입
+            if self.kline_store:
+                for strategy in self.strategies:
+                    if hasattr(strategy, 'kline_store'):
+                        strategy.kline_store = self.kline_store
+            
+            # 전략 간 공유 지표 캐시 (같은 심볼/인터벌 캔들의 지표를 캔들당 한 번만 계산)
+            indicator_cache_config = self.config.get('market_data', {}).get('indicator_cache', {})
+            if indicator_cache_config.get('enabled', True):
+                self.indicator_cache = get_indicator_cache(indicator_cache_config.get('max_entries', 1024))
+                for strategy in self.strategies:
+                    if hasattr(strategy, 'indicator_cache'):
+                        strategy.indicator_cache = self.indicator_cache
+                logger.info("✓ 공유 지표 캐시 초기화")
+            
+            # 전략 거래 심볼의 오더북 유지
+            strategy_symbols = sorted({symbol for strategy in self.strategies
+                                       for symbol in getattr(strategy, 'symbols', [])})
+            if self.order_books:
+                await self.order_books.track(strategy_symbols)
+            
+            # 캔들 저장소 없이 기록만 켠 경우 전략 심볼 시세를 직접 구독
+            if self.market_recorder and not self.kline_store:
+                await self.realtime_monitor.add_symbols(strategy_symbols)
+            
+            # 캔들 완성 스케줄러 (kline 스트림 완성 신호 + 서버 시간 타이머 보완)
+            scheduler_config = self.config.get('market_data', {}).get('candle_scheduler', {})
+            self.candle_scheduler = CandleCloseScheduler(
+                self.exchange,
+                price_monitor=self.realtime_monitor,
+                fallback_delay=scheduler_config.get('fallback_delay', 3.0)
+            )
+            for strategy in self.strategies:
+                if hasattr(strategy, 'bind_candle_scheduler'):
+                    strategy.bind_candle_scheduler(self.candle_scheduler)
+            logger.info("✓ 캔들 완성 스케줄러 초기화")
+            
             # 트레이딩 모드 확인
             tfpe_config = self.config.get('strategies', {}).get('tfpe', {})
             trading_mode = tfpe_config.get('trading_mode', 'candle_close')
@@ -304,12 +400,22 @@ class TradingSystem:
                 self.pyramiding_manager = None
                 logger.info("피라미딩 비활성화됨")
             
-            # 빠른 포지션 모니터 초기화
-            self.fast_monitor = FastPositionMonitor(
-                self.position_manager,
-                self.exchange,
-                self.notification_manager
-            )
+            # 사용자 데이터 스트림 (포지션/주문 변경을 푸시로 수신)
+            user_stream_config = self.config.get('position_sync', {}).get('user_data_stream', {})
+            if user_stream_config.get('enabled', False):
+                self.user_stream = UserDataStream(
+                    self.exchange,
+                    self.position_manager,
+                    keepalive_interval=user_stream_config.get('keepalive_interval', 1800)
+                )
+                logger.info("✓ 사용자 데이터 스트림 초기화")
+            else:
+                # 스트림 미사용 시 폴링 기반 빠른 포지션 모니터
+                self.fast_monitor = FastPositionMonitor(
+                    self.position_manager,
+                    self.exchange,
+                    self.notification_manager
+                )
             
             # 헬스 체커 초기화 (선택적)
             self.health_checker = None
@@ -497,7 +603,7 @@ class TradingSystem:
                 
             dashboard_thread = threading.Thread(
                 target=create_dashboard,
-                args=(self.position_manager, self.strategies, self.config),
+                args=(self.position_manager, self.strategies, self.config, self.loop),
                 daemon=True
             )
             dashboard_thread.start()
@@ -520,34 +626,27 @@ class TradingSystem:
                 # 각 전략 실행
                 for strategy in self.strategies:
                     try:
-                        if hasattr(strategy, 'run_cycle'):
-                            await strategy.run_cycle()
-                        elif hasattr(strategy, 'analyze'):
-                            # 구버전 호환성
-                            market_data = {}  # 필요시 시장 데이터 수집
-                            signals = await strategy.analyze(market_data)
-                            if signals and self.position_manager:
-                                await self.position_manager.process_signals(signals)
+                        # 이 전략이 발생시키는 REST 호출의 가중치/지연을 전략 이름으로 집계
+                        with api_caller(getattr(strategy, 'name', 'Unknown'),
+                                        getattr(strategy, 'account_name', None)):
+                            if hasattr(strategy, 'run_cycle'):
+                                await strategy.run_cycle()
+                            elif hasattr(strategy, 'analyze'):
+                                # 구버전 호환성
+                                market_data = {}  # 필요시 시장 데이터 수집
+                                signals = await strategy.analyze(market_data)
+                                if signals and self.position_manager:
+                                    await self.position_manager.process_signals(signals)
                     except Exception as e:
                         logger.error(f"{strategy.name if hasattr(strategy, 'name') else 'Unknown'} 전략 실행 실패: {e}")
                 
-                # 대기 시간 계산 (15분 캔들 주기에 맞춤)
-                current_time = datetime.now()
-                current_minute = current_time.minute
-                current_second = current_time.second
-                
-                # 다음 15분 캔들까지 남은 시간 계산
-                minutes_to_next = 15 - (current_minute % 15)
-                seconds_to_next = minutes_to_next * 60 - current_second
-                
-                # 너무 짧으면 최소 5초 대기
-                wait_time = max(5, seconds_to_next)
-                
-                # 다음 체크 시간 로그 (분 단위로만)
-                if current_second == 0:  # 매분 정각에만 로그
-                    logger.debug(f"다음 캔들 체크까지 {int(wait_time/60)}분 {int(wait_time%60)}초")
-                    
-                await asyncio.sleep(wait_time)
+                # 다음 캔들 완성 이벤트까지 대기 (이벤트가 없어도 idle_timeout 마다 실행)
+                idle_timeout = self.config.get('market_data', {}).get(
+                    'candle_scheduler', {}).get('idle_timeout', 900)
+                if self.candle_scheduler:
+                    await self.candle_scheduler.wait_for_close(timeout=idle_timeout)
+                else:
+                    await asyncio.sleep(60)
                 
             except Exception as e:
                 logger.error(f"전략 실행 중 오류: {e}")
@@ -562,8 +661,9 @@ class TradingSystem:
             logger.info("기본 포지션 모니터링 시작")
             while self.running:
                 try:
-                    # 포지션 동기화
-                    if hasattr(self.position_manager, 'sync_positions'):
+                    # 포지션 동기화 (사용자 데이터 스트림 연결 중에는 푸시로 반영되므로 생략)
+                    stream_connected = self.user_stream is not None and self.user_stream.is_connected
+                    if hasattr(self.position_manager, 'sync_positions') and not stream_connected:
                         await self.position_manager.sync_positions()
                     # config에서 동기화 간격 읽기
                     sync_interval = self.position_manager.config.get('auto_sync_interval', 60)
@@ -584,6 +684,10 @@ class TradingSystem:
             self.running = True
             self.loop = asyncio.get_event_loop()
             
+            # 캔들 완성 스케줄러 시작 (전략 루프보다 먼저)
+            if self.candle_scheduler:
+                await self.candle_scheduler.start()
+            
             # 대시보드 시작
             await self.start_dashboard()
             
@@ -595,13 +699,25 @@ class TradingSystem:
             
             # 멀티계좌 전략 실행 (해당하는 경우)
             if self.multi_strategy_executor:
-                await self.multi_strategy_executor.start_execution()
+                await self.multi_strategy_executor.start_execution(candle_scheduler=self.candle_scheduler)
                 logger.info("✓ 멀티계좌 전략 실행 시작")
             
             # 스마트 재개 매니저 시작
             if self.resume_manager:
                 tasks.append(asyncio.create_task(self.resume_manager.start_monitoring()))
             
+            # 캔들 스트림 시작 (캔들 저장소 갱신)
+            if self.market_recorder:
+                await self.market_recorder.start()
+            if self.realtime_monitor:
+                tasks.append(asyncio.create_task(self.realtime_monitor.start()))
+                logger.info("✓ 캔들 스트림 시작")
+            
+            # 사용자 데이터 스트림 시작
+            if self.user_stream:
+                tasks.append(asyncio.create_task(self.user_stream.start()))
+                logger.info("✓ 사용자 데이터 스트림 시작")
+            
             # 빠른 포지션 모니터 시작
             if self.fast_monitor:
                 await self.fast_monitor.start()
@@ -649,6 +765,23 @@ class TradingSystem:
             if hasattr(strategy, 'price_monitor') and strategy.price_monitor:
                 await strategy.price_monitor.stop()
         
+        if self.candle_scheduler:
+            await self.candle_scheduler.stop()
+        
+        if self.order_books:
+            await self.order_books.stop()
+        
+        if self.realtime_monitor:
+            await self.realtime_monitor.stop()
+        
+        if self.market_recorder:
+            await self.market_recorder.stop()
+        
+        if self.indicator_cache:
+            stats = self.indicator_cache.get_stats()
+            logger.info(f"지표 캐시: 적중률 {stats['hit_rate']:.1%} "
+                        f"(적중 {stats['hits']} / 계산 {stats['misses']} / 제거 {stats['evictions']})")
+        
         # 모든 태스크 취소
         for task in self.tasks:
             if not task.done():
@@ -674,6 +807,9 @@ class TradingSystem:
         if self.fast_monitor:
             await self.fast_monitor.stop()
             
+        if self.user_stream:
+            await self.user_stream.stop()
+            
         if self.resume_manager:
             await self.resume_manager.stop_monitoring()
         
@@ -784,6 +920,12 @@ def parse_arguments():
         help='실시간 모니터링 비활성화'
     )
     
+    parser.add_argument(
+        '--simulate',
+        action='store_true',
+        help='실제 거래소 대신 로컬 거래소 시뮬레이터에 접속 (config의 simulator 설정 사용)'
+    )
+    
     return parser.parse_args()
 
 
@@ -867,6 +1009,9 @@ async def main():
     # shutdown 이벤트 추가 (telegram_commands.py 호환성)
     system._shutdown_event = asyncio.Event()
     
+    # 로컬 거래소 시뮬레이터 (API 초기화 전에 엔드포인트 설정)
+    simulator = await start_simulator(system.config) if args.simulate else None
+    
     try:
         await system.run()
     except KeyboardInterrupt:
@@ -876,6 +1021,8 @@ async def main():
     finally:
         if system.running:
             await system.shutdown()
+        if simulator:
+            await simulator.stop()
 
 
 if __name__ == "__main__":
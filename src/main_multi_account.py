@@ -38,8 +38,11 @@ from src.utils.config_manager import ConfigManager
 from src.utils.telegram_notifier import TelegramNotifier
 from src.utils.smart_notification_manager import SmartNotificationManager
 from src.core.state_manager import StateManager
+from src.core.api_telemetry import api_caller
 from src.core.binance_api import BinanceAPI
+from src.core.simulator import start_simulator
 from src.core.position_manager import PositionManager
+from src.core.candle_close_monitor import CandleCloseScheduler
 # from src.core.position_monitor import PositionMonitor  # Deprecated
 from src.monitoring.position_sync_monitor import PositionSyncMonitor
 from src.monitoring.health_checker import SystemHealthChecker
@@ -171,6 +174,7 @@ class MultiAccountTradingSystem:
         # 전략
         self.strategies_dict: Dict[str, Any] = {}  # 계좌별 전략 관리 (내부 용도)
         self.strategies: List[Any] = []  # main.py 호환성 위한 리스트
+        self.candle_scheduler: Optional[CandleCloseScheduler] = None  # 캔들 완성 스케줄러
         
         # 웹 대시보드
         self.dashboard: Optional[DashboardApp] = None
@@ -846,7 +850,13 @@ class MultiAccountTradingSystem:
             main_tasks.append(task)
             self.tasks.append(task)
             
-            # 3. 전략 실행
+            # 3. 전략 실행 (서버 시간 기준 캔들 완성 시 즉시 실행)
+            self.candle_scheduler = CandleCloseScheduler(self.binance_api)
+            for strategy in self.strategies:
+                if hasattr(strategy, 'bind_candle_scheduler'):
+                    strategy.bind_candle_scheduler(self.candle_scheduler)
+            await self.candle_scheduler.start()
+            
             for name, strategy in self.strategies_dict.items():
                 task = asyncio.create_task(
                     self._run_strategy(name, strategy),
@@ -1000,20 +1010,24 @@ class MultiAccountTradingSystem:
                     logger.debug(f"[DRY RUN] {name} 전략 실행 (실제 거래 없음)")
                 
                 # 전략 실행 - main.py와 동일한 방식
-                if hasattr(strategy, 'run_cycle'):
-                    await strategy.run_cycle()
-                elif hasattr(strategy, 'analyze'):
-                    # 구버전 호환성
-                    market_data = {}
-                    signals = await strategy.analyze(market_data)
-                    if signals and self.position_manager:
-                        await self.position_manager.process_signals(signals)
-                else:
-                    logger.warning(f"{name} 전략에 실행 가능한 메서드가 없습니다")
+                with api_caller(name, getattr(strategy, 'account_name', None)):
+                    if hasattr(strategy, 'run_cycle'):
+                        await strategy.run_cycle()
+                    elif hasattr(strategy, 'analyze'):
+                        # 구버전 호환성
+                        market_data = {}
+                        signals = await strategy.analyze(market_data)
+                        if signals and self.position_manager:
+                            await self.position_manager.process_signals(signals)
+                    else:
+                        logger.warning(f"{name} 전략에 실행 가능한 메서드가 없습니다")
                 
                 # 전략별 체크 간격
                 check_interval = strategy.config.get('check_interval', 60)
-                await asyncio.sleep(check_interval)
+                if self.candle_scheduler:
+                    await self.candle_scheduler.wait_for_close(timeout=check_interval)
+                else:
+                    await asyncio.sleep(check_interval)
                 
             except asyncio.CancelledError:
                 break
@@ -1209,6 +1223,8 @@ class MultiAccountTradingSystem:
             
             # 2. 실행 중인 태스크 취소
             logger.info("2. 실행 중인 태스크 취소")
+            if self.candle_scheduler:
+                await self.candle_scheduler.stop()
             for task in self.tasks:
                 if not task.done():
                     task.cancel()
@@ -1337,6 +1353,9 @@ Examples:
   
   # 시스템 상태 확인
   python main_multi_account.py --status
+  
+  # 로컬 거래소 시뮬레이터로 실행 (부하/지연 테스트)
+  python main_multi_account.py --mode multi --simulate
         """
     )
     
@@ -1372,6 +1391,12 @@ Examples:
         help='현재 상태만 출력'
     )
     
+    parser.add_argument(
+        '--simulate',
+        action='store_true',
+        help='실제 거래소 대신 로컬 거래소 시뮬레이터에 접속 (config의 simulator 설정 사용)'
+    )
+    
     parser.add_argument(
         '--log-level',
         type=str,
@@ -1402,6 +1427,9 @@ async def main():
     else:
         mode = OperationMode(args.mode)
     
+    # 로컬 거래소 시뮬레이터 (계좌 API 초기화 전에 엔드포인트/가상 키 설정)
+    simulator = await start_simulator(ConfigManager().config) if args.simulate else None
+    
     # 시스템 인스턴스 생성
     trading_system = MultiAccountTradingSystem(
         mode=mode,
@@ -1447,6 +1475,8 @@ async def main():
     finally:
         # 정리 작업
         await trading_system.shutdown(ShutdownReason.NORMAL)
+        if simulator:
+            await simulator.stop()
 
 
 if __name__ == "__main__":
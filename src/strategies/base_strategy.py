@@ -1,18 +1,22 @@
 # src/strategies/base_strategy.py
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Tuple
-from datetime import datetime
+from datetime import datetime, timedelta
 import logging
 import asyncio
 
 # Signal 클래스 import 추가
 from .signal import Signal, SignalType, SignalStrength
+from ..core import indicators
 
 logger = logging.getLogger(__name__)
 
 class BaseStrategy(ABC):
     """전략 기본 클래스"""
     
+    # 캔들 종가 체크 기준 인터벌 (하위 클래스에서 지정)
+    candle_interval = '15m'
+    
     def __init__(self, binance_api, position_manager, config: Dict):
         self.binance_api = binance_api
         self.position_manager = position_manager
@@ -43,6 +47,83 @@ class BaseStrategy(ABC):
         self.pyramiding_enabled = config.get('pyramiding_enabled', False)
         self.pyramiding_manager = None  # 나중에 시스템에서 주입
         
+        # 공유 캔들 저장소 (시스템에서 주입, 없으면 REST 조회)
+        self.kline_store = None
+        
+        # 공유 지표 캐시 (시스템에서 주입, 없으면 매번 계산)
+        self.indicator_cache = None
+        
+        # 캔들 종가 스케줄러 (시스템에서 연결) 와 아직 처리하지 않은 완성 캔들
+        self.candle_scheduler = None
+        self._closed_candles: Dict[str, datetime] = {}
+        
+    async def get_klines(self, symbol: str, interval: str, limit: int = 500):
+        """캔들 조회 - 공유 캔들 저장소 우선, 없으면 REST
+        
+        지표 캐시 키로 쓰도록 DataFrame.attrs 에 심볼 / 인터벌을 기록한다.
+        """
+        if self.kline_store:
+            df = await self.kline_store.get_klines(symbol, interval, limit)
+        else:
+            df = await self.binance_api.get_klines(symbol, interval, limit)
+        if df is not None:
+            df.attrs.update(symbol=symbol, interval=interval)
+        return df
+    
+    def indicator(self, df, name: str, **params):
+        """등록된 지표 계산 (indicators.INDICATORS)
+        
+        get_klines 로 받은 캔들이고 지표 캐시가 주입되어 있으면 같은 캔들의 같은 지표를
+        다른 전략과 공유한다 (결과는 읽기 전용).
+        """
+        symbol, interval = df.attrs.get('symbol'), df.attrs.get('interval')
+        if symbol and interval and self.indicator_cache is not None:
+            return self.indicator_cache.get(symbol, interval, name, df, **params)
+        return indicators.compute(name, df, **params)
+    
+    # === 캔들 종가 스케줄 ===
+    
+    def get_candle_symbols(self) -> List[str]:
+        """캔들 완성 이벤트를 구독할 심볼"""
+        return list(getattr(self, 'symbols', None) or self.config.get('symbols', []))
+    
+    def bind_candle_scheduler(self, scheduler):
+        """캔들 종가 스케줄러에 (심볼, 인터벌) 구독"""
+        self.candle_scheduler = scheduler
+        for symbol in self.get_candle_symbols():
+            scheduler.subscribe(symbol, self.candle_interval, self.on_candle_closed)
+    
+    def on_candle_closed(self, symbol: str, interval: str, candle_time: datetime):
+        """캔들 완성 알림 - 다음 사이클에서 처리"""
+        previous = self._closed_candles.get(symbol)
+        if previous is None or candle_time > previous:
+            self._closed_candles[symbol] = candle_time
+    
+    async def _is_candle_close_time(self) -> Tuple[bool, Optional[datetime]]:
+        """처리할 캔들 완성이 있는지 확인 (최신 완성 캔들의 종료 시각 반환)
+        
+        스케줄러가 연결되지 않은 단독 실행에서는 서버 시간 기준 경계 직후 구간으로 판단한다.
+        """
+        if self.candle_scheduler is not None:
+            if not self._closed_candles:
+                return False, None
+            candle_time = max(self._closed_candles.values())
+            self._closed_candles.clear()
+            return True, candle_time
+        
+        check_window = self.config.get('candle_close_check', {}).get('check_window_seconds', 30)
+        interval_seconds = self._candle_interval_seconds()
+        now = datetime.now() + timedelta(milliseconds=getattr(self.binance_api, 'time_offset', 0))
+        elapsed = now.timestamp() % interval_seconds
+        if elapsed < check_window:
+            candle_time = (now - timedelta(seconds=elapsed)).replace(microsecond=0)
+            return True, candle_time
+        return False, None
+    
+    def _candle_interval_seconds(self) -> int:
+        unit = {'m': 60, 'h': 3600, 'd': 86400}[self.candle_interval[-1]]
+        return int(self.candle_interval[:-1]) * unit
+    
     @abstractmethod
     async def check_entry_signal(self, symbol: str, df_4h, df_15m, current_index: int) -> Tuple[bool, Optional[str]]:
         """진입 신호 체크 (구현 필요)"""
@@ -86,7 +167,7 @@ class BaseStrategy(ABC):
                     current_price = await self.binance_api.get_current_price(symbol)
                     
                     # 간단한 변동성 계산 (15분봉 기준)
-                    klines = await self.binance_api.get_klines(symbol, '15m', limit=100)
+                    klines = await self.get_klines(symbol, '15m', limit=100)
                     if not klines.empty:
                         current_atr = klines['atr'].iloc[-1] if 'atr' in klines.columns else current_price * 0.02
                         returns = klines['close'].pct_change().dropna()
@@ -162,10 +243,8 @@ class BaseStrategy(ABC):
             # 심볼별 정밀도 적용
             quantity = await self.binance_api.round_quantity(symbol, quantity)
             
-            # 최소 주문 금액 체크 (보통 $10)
-            min_notional = 10.0  # USDT
-            if quantity * current_price < min_notional:
-                logger.warning(f"주문 금액이 최소값 미만: ${quantity * current_price:.2f} < ${min_notional}")
+            # 최소 주문 금액 체크 (심볼 규격)
+            if not await self._meets_min_notional(symbol, quantity, current_price):
                 return 0.0
             
             return quantity
@@ -234,7 +313,24 @@ class BaseStrategy(ABC):
             return True
     
     async def execute_entry(self, symbol: str, direction: str, stop_loss: float, take_profit: float):
-        """포지션 진입 실행 - 시장가 주문 체결가 문제 수정"""
+        """포지션 진입 실행
+        
+        주문 전송 전 PositionManager 에 진행 중 주문으로 등록해, 체결 직후 도착하는
+        사용자 데이터 스트림 이벤트가 add_position 보다 먼저 수동 포지션으로 처리되지 않게 한다.
+        """
+        side = 'BUY' if direction == 'long' else 'SELL'
+        client_order_id = self.position_manager.register_pending_order(
+            symbol, self.strategy_name, side, 'ENTRY'
+        )
+        try:
+            return await self._execute_entry(symbol, direction, stop_loss, take_profit, client_order_id)
+        finally:
+            # 포지션 등록 없이 끝났으면 보류한 스트림 항목 반영
+            await self.position_manager.release_pending_order(symbol)
+    
+    async def _execute_entry(self, symbol: str, direction: str, stop_loss: float, take_profit: float,
+                             client_order_id: Optional[str] = None):
+        """진입 주문 및 포지션 등록 - 시장가 주문 체결가 문제 수정"""
         try:
             # 포지션 크기 계산
             quantity = await self.calculate_position_size(symbol)
@@ -247,12 +343,32 @@ class BaseStrategy(ABC):
             
             # 주문 실행
             side = 'BUY' if direction == 'long' else 'SELL'
-            order = await self.binance_api.place_order(
-                symbol=symbol,
-                side=side,
-                quantity=quantity,
-                order_type='MARKET'
-            )
+            stop_orders = []
+            if self.config.get('use_stop_orders', False):
+                stop_orders = self._build_stop_orders(symbol, direction, stop_loss, take_profit)
+            
+            if stop_orders:
+                # 진입/손절/익절을 배치 요청 1회로 전송
+                results = await self.binance_api.place_orders_batch(
+                    [{'symbol': symbol, 'side': side, 'quantity': quantity,
+                      'client_order_id': client_order_id}] + stop_orders
+                )
+                order = results[0]
+                if order and not all(results[1:]):
+                    logger.error(f"손절/익절 주문 일부 실패: {symbol}")
+                elif not order and any(results[1:]):
+                    # 진입 실패 시 이 배치로 등록된 조건부 주문만 정리 (다른 전략/수동 주문 보존)
+                    for stop_order in results[1:]:
+                        if stop_order and stop_order.get('orderId'):
+                            await self.binance_api.cancel_order(symbol, stop_order['orderId'])
+            else:
+                order = await self.binance_api.place_order(
+                    symbol=symbol,
+                    side=side,
+                    quantity=quantity,
+                    order_type='MARKET',
+                    client_order_id=client_order_id
+                )
             
             if not order:
                 logger.error(f"주문 실행 실패: {symbol} {direction}")
@@ -295,9 +411,6 @@ class BaseStrategy(ABC):
                     logger.error(f"{symbol} 체결가 확인 완전 실패")
                     return False
             
-            # === 핫픽스: 포지션 등록 전 대기 ===
-            await asyncio.sleep(0.5)  # 500ms 대기
-            
             # 포지션 정보 저장 - 재시도 로직 추가
             position = None
             max_retries = 3
@@ -343,9 +456,8 @@ class BaseStrategy(ABC):
                 
             logger.info(f"✅ 포지션 객체 생성 성공: {position.symbol}")
             
-            # 손절/익절 주문 설정 (옵션)
-            if self.config.get('use_stop_orders', False):
-                await self._place_stop_orders(symbol, direction, stop_loss, take_profit)
+            if stop_orders:
+                logger.info(f"손절/익절 설정: SL={stop_loss:.2f}, TP={take_profit:.2f}")
             
             # 마지막 신호 시간 업데이트
             self.last_signal_time[symbol] = datetime.now()
@@ -360,7 +472,19 @@ class BaseStrategy(ABC):
             return False
     
     async def execute_exit(self, position, reason: str):
-        """포지션 청산 실행"""
+        """포지션 청산 실행 (진행 중 주문 등록 - 스트림이 remove_position 보다 먼저 청산 처리하지 않음)"""
+        side = 'SELL' if position.side.upper() == 'LONG' else 'BUY'
+        client_order_id = self.position_manager.register_pending_order(
+            position.symbol, self.strategy_name, side, 'EXIT'
+        )
+        try:
+            return await self._execute_exit(position, reason, client_order_id)
+        finally:
+            # 포지션 제거 없이 끝났으면 보류한 스트림 항목 반영
+            await self.position_manager.release_pending_order(position.symbol)
+    
+    async def _execute_exit(self, position, reason: str, client_order_id: Optional[str] = None):
+        """청산 주문 및 포지션 제거"""
         try:
             symbol = position.symbol
             
@@ -371,7 +495,8 @@ class BaseStrategy(ABC):
                 symbol=symbol,
                 side=side,
                 quantity=position.size,
-                order_type='MARKET'
+                order_type='MARKET',
+                client_order_id=client_order_id
             )
             
             if not order:
@@ -432,34 +557,29 @@ class BaseStrategy(ABC):
             logger.error(f"포지션 청산 실패: {e}")
             return False
     
-    async def _place_stop_orders(self, symbol: str, direction: str, stop_loss: float, take_profit: float):
-        """손절/익절 주문 설정"""
-        try:
-            # 손절 주문
-            stop_side = 'SELL' if direction == 'long' else 'BUY'
-            stop_type = 'STOP_MARKET'
-            
-            await self.binance_api.place_stop_order(
-                symbol=symbol,
-                side=stop_side,
-                stop_price=stop_loss,
-                order_type=stop_type
-            )
-            
-            # 익절 주문 
-            tp_side = 'SELL' if direction == 'long' else 'BUY'
-            
-            await self.binance_api.place_limit_order(
-                symbol=symbol,
-                side=tp_side,
-                price=take_profit,
-                reduce_only=True
-            )
-            
-            logger.info(f"손절/익절 설정: SL={stop_loss:.2f}, TP={take_profit:.2f}")
-            
-        except Exception as e:
-            logger.error(f"손절/익절 주문 실패: {e}")
+    def _build_stop_orders(self, symbol: str, direction: str, stop_loss: float,
+                           take_profit: float) -> List[Dict]:
+        """손절/익절 조건부 주문 (포지션 전체 청산, 배치 주문 형식)"""
+        close_side = 'SELL' if direction == 'long' else 'BUY'
+        orders = []
+        if stop_loss:
+            orders.append({'symbol': symbol, 'side': close_side, 'order_type': 'STOP_MARKET',
+                           'stop_price': stop_loss, 'close_position': True})
+        if take_profit:
+            orders.append({'symbol': symbol, 'side': close_side, 'order_type': 'TAKE_PROFIT_MARKET',
+                           'stop_price': take_profit, 'close_position': True})
+        return orders
+    
+    async def _meets_min_notional(self, symbol: str, quantity: float, price: float) -> bool:
+        """심볼 규격의 최소 주문 금액 충족 여부"""
+        spec = await self.binance_api.get_symbol_spec(symbol)
+        if spec is None:
+            logger.error(f"심볼 규격 없음: {symbol}")
+            return False
+        if not spec.meets_min_notional(quantity, price):
+            logger.warning(f"주문 금액이 최소값 미만: ${quantity * price:.2f} < ${spec.min_notional}")
+            return False
+        return True
     
     async def run(self):
         """전략 실행 (기본 구현)"""
@@ -574,9 +694,7 @@ class BaseStrategy(ABC):
             
             # 최소 주문 금액 체크
             current_price = await self.binance_api.get_current_price(symbol)
-            min_notional = 10.0  # USDT
-            if pyramid_size * current_price < min_notional:
-                logger.warning(f"피라미딩 금액이 최소값 미만: ${pyramid_size * current_price:.2f}")
+            if not await self._meets_min_notional(symbol, pyramid_size, current_price):
                 return False
             
             # 현재 포지션 정보
@@ -6,9 +6,8 @@ Momentum Breakout Strategy
 
 import asyncio
 import pandas as pd
-import pandas_ta as ta
 import numpy as np
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 import logging
 
@@ -171,28 +170,18 @@ class MomentumStrategy(BaseStrategy):
         
         logger.info(f"{'='*60}\n")
     
-    async def _is_candle_close_time(self) -> Tuple[bool, Optional[datetime]]:
-        """캔들 종가 체크 시간인지 확인"""
-        # TFPE와 동일한 로직
-        current_time = datetime.now()
-        current_minute = current_time.minute
-        current_second = current_time.second
-        
-        # 15분 캔들 체크 시간인지 확인
-        if current_minute % 15 == 0 and current_second < 30:
-            candle_time = current_time.replace(minute=(current_minute // 15) * 15, second=0, microsecond=0)
-            return True, candle_time
-        
-        return False, None
+    def get_candle_symbols(self) -> List[str]:
+        """캔들 완성 이벤트를 구독할 심볼"""
+        return list(self.trading_coins)
     
     async def fetch_and_prepare_data(self, symbol: str) -> Tuple[pd.DataFrame, pd.DataFrame]:
         """데이터 수집 및 준비"""
         try:
             # 4시간봉 데이터 (추세 확인용)
-            df_4h = await self.binance_api.get_klines(symbol, '4h', limit=200)
+            df_4h = await self.get_klines(symbol, '4h', limit=200)
             
             # 15분봉 데이터 (진입 신호용)
-            df_15m = await self.binance_api.get_klines(symbol, '15m', limit=500)
+            df_15m = await self.get_klines(symbol, '15m', limit=500)
             
             if df_4h.empty or df_15m.empty:
                 logger.error(f"데이터 수집 실패: {symbol}")
@@ -220,18 +209,17 @@ class MomentumStrategy(BaseStrategy):
         """기술 지표 계산"""
         try:
             # ADX/DI
-            adx_data = ta.adx(df['high'], df['low'], df['close'], length=14)
-            if adx_data is not None:
-                df['adx'] = adx_data['ADX_14']
-                df['plus_di'] = adx_data['DMP_14']
-                df['minus_di'] = adx_data['DMN_14']
-                df['di_diff'] = df['plus_di'] - df['minus_di']
+            adx_data = self.indicator(df, 'adx', length=14)
+            df['adx'] = adx_data['adx']
+            df['plus_di'] = adx_data['plus_di']
+            df['minus_di'] = adx_data['minus_di']
+            df['di_diff'] = df['plus_di'] - df['minus_di']
             
             # ATR
-            df['atr'] = ta.atr(df['high'], df['low'], df['close'], length=14)
+            df['atr'] = self.indicator(df, 'atr', length=14)
             
             # 볼륨
-            df['volume_ma'] = df['volume'].rolling(window=20).mean()
+            df['volume_ma'] = self.indicator(df, 'volume_ma', length=20)
             df['volume_ratio'] = df['volume'] / df['volume_ma']
             
             # 모멘텀
@@ -247,9 +235,10 @@ class MomentumStrategy(BaseStrategy):
     def add_donchian_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
         """Donchian Channel 지표 추가"""
         try:
-            df['dc_upper'] = df['high'].rolling(window=self.dc_period).max()
-            df['dc_lower'] = df['low'].rolling(window=self.dc_period).min()
-            df['dc_middle'] = (df['dc_upper'] + df['dc_lower']) / 2
+            channel = self.indicator(df, 'donchian', length=self.dc_period)
+            df['dc_upper'] = channel['dc_upper']
+            df['dc_lower'] = channel['dc_lower']
+            df['dc_middle'] = channel['dc_middle']
             
             # 채널폭
             df['dc_width'] = df['dc_upper'] - df['dc_lower']
@@ -408,7 +397,7 @@ class MomentumStrategy(BaseStrategy):
                     continue
                 
                 # 최근 ATR 조회
-                df = await self.binance_api.get_klines(symbol, '15m', limit=20)
+                df = await self.get_klines(symbol, '15m', limit=20)
                 if df.empty or 'atr' not in df.columns:
                     continue
                 
@@ -1,13 +1,13 @@
 # src/strategies/tfpe_strategy.py
 import asyncio
 import pandas as pd
-import pandas_ta as ta
 import numpy as np
 from typing import Dict, Optional, Tuple
 from datetime import datetime, timedelta
 import logging
 
 from .base_strategy import BaseStrategy
+from ..core.api_telemetry import api_caller
 from ..core.mdd_manager_improved import ImprovedMDDManager
 from ..analysis.market_regime_analyzer import get_regime_analyzer, MarketRegime
 from ..analysis.performance_tracker import get_performance_tracker
@@ -115,7 +115,8 @@ class TFPEStrategy(BaseStrategy):
             'quick_rsi_oversold': config.get('quick_rsi_oversold', 35),
             'quick_rsi_overbought': config.get('quick_rsi_overbought', 65),
             'price_spike_threshold': config.get('price_spike_threshold', 0.01),
-            'realtime_cooldown': config.get('realtime_cooldown', 30)
+            'realtime_cooldown': config.get('realtime_cooldown', 30),
+            'conflate_price_updates': config.get('conflate_price_updates', False)
         }
         
         # 시장 레짐 분석기
@@ -147,10 +148,12 @@ class TFPEStrategy(BaseStrategy):
                 await self._initialize()
                 self._initialized = True
             
-            # 캔들 준비 단계 체크 (14분 50초)
-            is_prep_time, next_candle_time = await self._is_candle_preparation_time()
-            if is_prep_time:
-                await self._prepare_for_candle_close(next_candle_time)
+            # 캔들 준비 단계 체크 (14분 50초) - 스케줄러 구동 시에는 종가 이벤트 직후에만
+            # 사이클이 돌아 준비 구간에 들어오지 않으므로 단독 실행에서만 확인
+            if self.candle_scheduler is None:
+                is_prep_time, next_candle_time = await self._is_candle_preparation_time()
+                if is_prep_time:
+                    await self._prepare_for_candle_close(next_candle_time)
             
             # 캔들 종가 기반 체크
             await self._run_candle_close_cycle()
@@ -176,40 +179,16 @@ class TFPEStrategy(BaseStrategy):
             logger.error(f"서버 시간 조회 오류: {e}")
             return datetime.now()
     
-    async def _is_candle_close_time(self) -> Tuple[bool, Optional[datetime]]:
-        """캔들 종가 체크 시간인지 확인 - 서버 시간 기준"""
-        candle_config = self.config.get('candle_close_check', {})
-        use_server_time = candle_config.get('use_server_time', True)
-        check_window = candle_config.get('check_window_seconds', 30)
-        
-        # 시간 기준 선택
-        if use_server_time:
-            current_time = await self._get_binance_server_time()
-        else:
-            current_time = datetime.now()
-        
-        current_minute = current_time.minute
-        current_second = current_time.second
-        
-        # 15분 캔들 체크 시간인지 확인
-        if current_minute % 15 == 0 and current_second < check_window:
-            # 캔들 시간 계산
-            candle_time = current_time.replace(minute=(current_minute // 15) * 15, second=0, microsecond=0)
-            return True, candle_time
-        
-        return False, None
-    
     async def _is_candle_preparation_time(self) -> Tuple[bool, Optional[datetime]]:
         """캔들 준비 시간인지 확인 - 14분 50초"""
         candle_config = self.config.get('candle_close_check', {})
         use_server_time = candle_config.get('use_server_time', True)
         preparation_seconds = candle_config.get('preparation_seconds', 10)  # 기본 10초 전
         
-        # 시간 기준 선택
+        # 시간 기준 선택 (서버 시간은 API 의 보정값으로 계산 - REST 조회 없음)
+        current_time = datetime.now()
         if use_server_time:
-            current_time = await self._get_binance_server_time()
-        else:
-            current_time = datetime.now()
+            current_time += timedelta(milliseconds=getattr(self.binance_api, 'time_offset', 0))
         
         current_minute = current_time.minute
         current_second = current_time.second
@@ -426,21 +405,35 @@ class TFPEStrategy(BaseStrategy):
             
             logger.warning(f"MDD 강제 청산: {len(tfpe_positions)}개 포지션")
             
-            # 모든 포지션 청산
+            # 모든 포지션 청산 주문을 배치로 전송 (요청당 5개)
+            orders = []
             for position in tfpe_positions:
-                try:
-                    logger.info(f"강제 청산 실행: {position.symbol}")
-                    success = await self.execute_exit(position, reason)
-                    if success:
-                        logger.info(f"✅ {position.symbol} 강제 청산 성공")
-                    else:
-                        logger.error(f"❌ {position.symbol} 강제 청산 실패")
-                    
-                    # API 레이트 리밋 방지
-                    await asyncio.sleep(0.5)
-                    
-                except Exception as e:
-                    logger.error(f"{position.symbol} 강제 청산 중 오류: {e}")
+                side = 'SELL' if position.side.upper() == 'LONG' else 'BUY'
+                orders.append({
+                    'symbol': position.symbol,
+                    'side': side,
+                    'quantity': position.size,
+                    'reduce_only': True,
+                    'client_order_id': self.position_manager.register_pending_order(
+                        position.symbol, self.strategy_name, side, 'EXIT'
+                    )
+                })
+            
+            try:
+                results = await self.binance_api.place_orders_batch(orders)
+                
+                for position, order in zip(tfpe_positions, results):
+                    try:
+                        if order and await self._finalize_exit(position, reason, order):
+                            logger.info(f"✅ {position.symbol} 강제 청산 성공")
+                        else:
+                            logger.error(f"❌ {position.symbol} 강제 청산 실패")
+                        
+                    except Exception as e:
+                        logger.error(f"{position.symbol} 강제 청산 중 오류: {e}")
+            finally:
+                for position in tfpe_positions:
+                    await self.position_manager.release_pending_order(position.symbol)
             
         except Exception as e:
             logger.error(f"강제 청산 작업 실패: {e}")
@@ -642,10 +635,14 @@ class TFPEStrategy(BaseStrategy):
             
             # 신호 프로세서 생성
             from ..core.realtime_signal_processor import RealtimeSignalProcessor
-            self.signal_processor = RealtimeSignalProcessor(self, self.position_manager)
+            self.signal_processor = RealtimeSignalProcessor(self, self.position_manager,
+                                                            kline_store=self.kline_store)
             
             # 이벤트 핸들러 등록
-            self.price_monitor.on('price_update', self.signal_processor.on_price_update)
+            # 틱 단위 지표(RollingWindow, 1m/5m 지연 가격)를 쓰므로 기본은 모든 틱 처리
+            # conflate_price_updates 를 켜면 처리가 밀릴 때 심볼별 최신 가격만 받음
+            self.price_monitor.on('price_update', self.signal_processor.on_price_update,
+                                  conflate=self.realtime_config['conflate_price_updates'])
             self.price_monitor.on('kline_closed', self.signal_processor.on_kline_closed)
             self.price_monitor.on('connected', self._on_websocket_connected)
             self.price_monitor.on('disconnected', self._on_websocket_disconnected)
@@ -694,14 +691,14 @@ class TFPEStrategy(BaseStrategy):
             
             # 4시간봉 데이터 (추세 확인용)
             logger.debug(f"{symbol} 4시간봉 데이터 요청...")
-            df_4h = await self.binance_api.get_klines(symbol, '4h', limit=200)
+            df_4h = await self.get_klines(symbol, '4h', limit=200)
             
             # 15분봉 데이터 (진입 신호용) - 2주로 확장
             logger.debug(f"{symbol} 15분봉 데이터 요청...")
             # config에서 데이터 수집 설정 읽기
             data_config = self.config.get('data_collection', {})
             klines_15m_limit = data_config.get('klines_15m_limit', 1344)  # 기본값: 2주 (14일 * 24시간 * 4)
-            df_15m = await self.binance_api.get_klines(symbol, '15m', limit=klines_15m_limit)
+            df_15m = await self.get_klines(symbol, '15m', limit=klines_15m_limit)
             
             if df_4h.empty or df_15m.empty:
                 logger.error(f"데이터 수집 실패: {symbol} - 4H: {len(df_4h)} rows, 15M: {len(df_15m)} rows")
@@ -715,8 +712,8 @@ class TFPEStrategy(BaseStrategy):
                 df_4h = self.calculate_donchian_trend(df_4h)
             else:
                 # 기존 MA 기반 추세 (레거시 호환)
-                df_4h['ma50'] = ta.sma(df_4h['close'], 50)
-                df_4h['ma200'] = ta.sma(df_4h['close'], 200)
+                df_4h['ma50'] = self.indicator(df_4h, 'sma', length=50)
+                df_4h['ma200'] = self.indicator(df_4h, 'sma', length=200)
                 df_4h['trend'] = np.where(df_4h['ma50'] > df_4h['ma200'], 1, -1)
             
             # 15분봉 지표 계산
@@ -765,9 +762,10 @@ class TFPEStrategy(BaseStrategy):
         """Donchian Channel 기반 추세 계산"""
         try:
             # Donchian Channel 계산
-            df['dc_upper'] = df['high'].rolling(window=self.dc_period).max()
-            df['dc_lower'] = df['low'].rolling(window=self.dc_period).min()
-            df['dc_middle'] = (df['dc_upper'] + df['dc_lower']) / 2
+            channel = self.indicator(df, 'donchian', length=self.dc_period)
+            df['dc_upper'] = channel['dc_upper']
+            df['dc_lower'] = channel['dc_lower']
+            df['dc_middle'] = channel['dc_middle']
             
             # 가격 위치 계산
             df['dc_width'] = df['dc_upper'] - df['dc_lower']
@@ -802,9 +800,10 @@ class TFPEStrategy(BaseStrategy):
         """15분봉에 Donchian 지표 추가"""
         try:
             # 15분봉용 Donchian Channel
-            df['dc_upper'] = df['high'].rolling(window=self.dc_period).max()
-            df['dc_lower'] = df['low'].rolling(window=self.dc_period).min()
-            df['dc_middle'] = (df['dc_upper'] + df['dc_lower']) / 2
+            channel = self.indicator(df, 'donchian', length=self.dc_period)
+            df['dc_upper'] = channel['dc_upper']
+            df['dc_lower'] = channel['dc_lower']
+            df['dc_middle'] = channel['dc_middle']
             
             # 가격 위치 및 채널폭
             df['dc_width'] = df['dc_upper'] - df['dc_lower']
@@ -827,27 +826,24 @@ class TFPEStrategy(BaseStrategy):
             logger.debug(f"지표 계산 시작 - DataFrame 크기: {len(df)}")
             
             # ADX/DI
-            adx_data = ta.adx(df['high'], df['low'], df['close'], length=14)
-            if adx_data is not None:
-                df['adx'] = adx_data['ADX_14']
-                df['plus_di'] = adx_data['DMP_14']
-                df['minus_di'] = adx_data['DMN_14']
-                logger.debug(f"ADX 계산 완료 - 마지막 값: {df['adx'].iloc[-1]:.1f}")
-            else:
-                logger.warning("ADX 계산 실패")
+            adx_data = self.indicator(df, 'adx', length=14)
+            df['adx'] = adx_data['adx']
+            df['plus_di'] = adx_data['plus_di']
+            df['minus_di'] = adx_data['minus_di']
+            logger.debug(f"ADX 계산 완료 - 마지막 값: {df['adx'].iloc[-1]:.1f}")
             
             # RSI
-            df['rsi'] = ta.rsi(df['close'], length=14)
+            df['rsi'] = self.indicator(df, 'rsi', length=14)
             
             # EMA
-            df['ema12'] = ta.ema(df['close'], 12)
+            df['ema12'] = self.indicator(df, 'ema', length=12, presma=True)
             df['ema_distance'] = abs(df['close'] - df['ema12']) / df['close']
             
             # ATR
-            df['atr'] = ta.atr(df['high'], df['low'], df['close'], length=14)
+            df['atr'] = self.indicator(df, 'atr', length=14)
             
             # 볼륨
-            df['volume_ma'] = df['volume'].rolling(window=20).mean()
+            df['volume_ma'] = self.indicator(df, 'volume_ma', length=20)
             df['volume_ratio'] = df['volume'] / df['volume_ma']
             
             # 모멘텀 (백테스팅과 동일하게 수정)
@@ -1276,7 +1272,7 @@ class TFPEStrategy(BaseStrategy):
             main_symbol = self.major_coins[0] if self.major_coins else 'BTCUSDT'
             
             # 4시간봉 데이터 가져오기
-            df_4h = await self.binance_api.get_klines(main_symbol, '4h', limit=100)
+            df_4h = await self.get_klines(main_symbol, '4h', limit=100)
             if df_4h is None or df_4h.empty:
                 logger.warning("시장 레짐 분석을 위한 데이터 부족")
                 return
@@ -1404,8 +1400,9 @@ class TFPEStrategy(BaseStrategy):
             logger.error(f"동적 포지션 사이징 실패: {e}")
             return base_size
     
-    async def execute_entry(self, symbol: str, direction: str, stop_loss: float, take_profit: float):
-        """진입 실행 - 동적 포지션 사이징 적용"""
+    async def _execute_entry(self, symbol: str, direction: str, stop_loss: float, take_profit: float,
+                             client_order_id: Optional[str] = None):
+        """진입 실행 - 동적 포지션 사이징 적용 (진행 중 주문 등록은 BaseStrategy.execute_entry)"""
         try:
             # 현재 잔고 확인
             balance = await self.binance_api.get_account_balance()
@@ -1424,10 +1421,8 @@ class TFPEStrategy(BaseStrategy):
             # 수량 정밀도 적용
             quantity = await self.binance_api.round_quantity(symbol, quantity)
             
-            # 최소 주문 금액 체크
-            min_notional = 10.0  # USDT
-            if quantity * current_price < min_notional:
-                logger.warning(f"주문 금액이 최소값 미만: ${quantity * current_price:.2f} < ${min_notional}")
+            # 최소 주문 금액 체크 (심볼 규격)
+            if not await self._meets_min_notional(symbol, quantity, current_price):
                 return False
             
             # 레버리지 설정
@@ -1446,7 +1441,8 @@ class TFPEStrategy(BaseStrategy):
                 symbol=symbol,
                 side=side,
                 quantity=quantity,
-                order_type='MARKET'
+                order_type='MARKET',
+                client_order_id=client_order_id
             )
             
             if not order:
@@ -1482,8 +1478,6 @@ class TFPEStrategy(BaseStrategy):
                     logger.warning(f"과도한 슬리피지 발생: {slippage_pct:.2f}% > {expected_slippage}%")
             
             # 포지션 등록
-            await asyncio.sleep(0.5)  # API 지연 대기
-            
             position = await self.position_manager.add_position(
                 symbol=symbol,
                 side=direction,
@@ -1510,8 +1504,8 @@ class TFPEStrategy(BaseStrategy):
             logger.error(f"진입 실행 실패: {e}")
             return False
     
-    async def execute_exit(self, position, reason: str) -> bool:
-        """청산 실행 - 성과 기록 포함"""
+    async def _execute_exit(self, position, reason: str, client_order_id: Optional[str] = None) -> bool:
+        """청산 실행 - 성과 기록 포함 (진행 중 주문 등록은 BaseStrategy.execute_exit)"""
         try:
             # 현재가 가져오기
             current_price = await self.binance_api.get_current_price(position.symbol)
@@ -1526,13 +1520,24 @@ class TFPEStrategy(BaseStrategy):
                 symbol=position.symbol,
                 side=side,
                 quantity=position.size,
-                order_type='MARKET'
+                order_type='MARKET',
+                client_order_id=client_order_id
             )
             
             if not order:
                 logger.error(f"청산 주문 실패: {position.symbol}")
                 return False
             
+            return await self._finalize_exit(position, reason, order, current_price)
+            
+        except Exception as e:
+            logger.error(f"포지션 청산 실패: {e}")
+            return False
+    
+    async def _finalize_exit(self, position, reason: str, order: Dict,
+                             fallback_price: Optional[float] = None) -> bool:
+        """청산 주문 체결 후 처리 - 성과 기록, MDD 갱신, 포지션 제거"""
+        try:
             # 청산가 확인
             exit_price = 0.0
             if 'avgPrice' in order and order['avgPrice']:
@@ -1549,7 +1554,7 @@ class TFPEStrategy(BaseStrategy):
                     exit_price = total_value / total_qty
             
             if exit_price <= 0:
-                exit_price = current_price
+                exit_price = fallback_price or await self.binance_api.get_current_price(position.symbol)
             
             # PnL 계산
             if position.side.upper() == 'LONG':
@@ -1597,7 +1602,7 @@ class TFPEStrategy(BaseStrategy):
             return True
             
         except Exception as e:
-            logger.error(f"포지션 청산 실패: {e}")
+            logger.error(f"청산 후 처리 실패 ({position.symbol}): {e}")
             return False
     
     async def _send_entry_notification(self, symbol: str, direction: str, 
@@ -1768,9 +1773,10 @@ class TFPEStrategy(BaseStrategy):
         """실시간 신호 수신시 호출 (WebSocket 이벤트)"""
         logger.info(f"⚡ 실시간 신호: {symbol} - {signal_type}")
         
-        # 즉시 전체 체크 실행
-        if await self.can_enter_position(symbol):
-            await self._check_new_entry(symbol)
+        # 즉시 전체 체크 실행 (웹소켓 태스크에서 호출되므로 여기서 호출자 태그)
+        with api_caller(self.name):
+            if await self.can_enter_position(symbol):
+                await self._check_new_entry(symbol)
     
     async def stop(self):
         """전략 중지"""
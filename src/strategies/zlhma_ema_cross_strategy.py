@@ -12,6 +12,7 @@ import logging
 import asyncio
 
 from .base_strategy import BaseStrategy
+from ..core.moving_averages import hma, wma, zlhma
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +20,9 @@ logger = logging.getLogger(__name__)
 class ZLHMAEMACrossStrategy(BaseStrategy):
     """ZLHMA 50-200 EMA Cross Strategy - 실전 버전"""
     
+    # 1시간봉 종가 기준
+    candle_interval = '1h'
+    
     def __init__(self, binance_api, position_manager, config: Dict, config_manager=None):
         """전략 초기화"""
         super().__init__(binance_api, position_manager, config)
@@ -134,55 +138,22 @@ class ZLHMAEMACrossStrategy(BaseStrategy):
     
     def calculate_wma(self, values: pd.Series, period: int) -> pd.Series:
         """Weighted Moving Average 계산"""
-        weights = np.arange(1, period + 1)
-        wma = values.rolling(period).apply(
-            lambda x: np.dot(x, weights) / weights.sum(), raw=True
-        )
-        return wma
+        return wma(values, period)
     
     def calculate_hma(self, df: pd.DataFrame, period: int) -> pd.Series:
         """Hull Moving Average 계산"""
-        half_length = int(period / 2)
-        sqrt_length = int(np.sqrt(period))
-        
-        wma_half = self.calculate_wma(df['close'], half_length)
-        wma_full = self.calculate_wma(df['close'], period)
-        raw_hma = 2 * wma_half - wma_full
-        hma = self.calculate_wma(raw_hma, sqrt_length)
-        
-        return hma
+        return hma(df['close'], period)
     
     def calculate_zlhma(self, df: pd.DataFrame, period: int) -> pd.Series:
         """Zero Lag Hull Moving Average 계산"""
-        hma = self.calculate_hma(df, period)
-        lag = int((period - 1) / 2)
-        zlhma = hma + (hma - hma.shift(lag))
-        return zlhma
+        return zlhma(df['close'], period)
     
     def calculate_adx(self, df: pd.DataFrame, period: int = 14) -> pd.DataFrame:
-        """ADX 계산"""
-        high_low = df['high'] - df['low']
-        high_close = abs(df['high'] - df['close'].shift(1))
-        low_close = abs(df['low'] - df['close'].shift(1))
-        
-        df['tr'] = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-        
-        df['dm_plus'] = np.where(
-            (df['high'] - df['high'].shift(1)) > (df['low'].shift(1) - df['low']),
-            np.maximum(df['high'] - df['high'].shift(1), 0), 0
-        )
-        df['dm_minus'] = np.where(
-            (df['low'].shift(1) - df['low']) > (df['high'] - df['high'].shift(1)),
-            np.maximum(df['low'].shift(1) - df['low'], 0), 0
-        )
-        
-        atr = df['tr'].rolling(period).mean()
-        di_plus = 100 * (df['dm_plus'].rolling(period).mean() / atr)
-        di_minus = 100 * (df['dm_minus'].rolling(period).mean() / atr)
-        
-        dx = 100 * abs(di_plus - di_minus) / (di_plus + di_minus)
-        df['adx'] = dx.rolling(period).mean()
-        
+        """ADX 계산 (Wilder)"""
+        result = self.indicator(df, 'adx', length=period)
+        df['adx'] = result['adx']
+        df['plus_di'] = result['plus_di']
+        df['minus_di'] = result['minus_di']
         return df
     
     def calculate_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -192,18 +163,14 @@ class ZLHMAEMACrossStrategy(BaseStrategy):
             df['zlhma'] = self.calculate_zlhma(df, self.zlhma_period)
             
             # EMA
-            df['ema_fast'] = df['close'].ewm(span=self.fast_ema_period, adjust=False).mean()
-            df['ema_slow'] = df['close'].ewm(span=self.slow_ema_period, adjust=False).mean()
+            df['ema_fast'] = self.indicator(df, 'ema', length=self.fast_ema_period)
+            df['ema_slow'] = self.indicator(df, 'ema', length=self.slow_ema_period)
             
             # ADX
             df = self.calculate_adx(df, self.adx_period)
             
             # ATR (손절/익절용)
-            high_low = df['high'] - df['low']
-            high_close = abs(df['high'] - df['close'].shift(1))
-            low_close = abs(df['low'] - df['close'].shift(1))
-            tr = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-            df['atr'] = tr.rolling(14).mean()
+            df['atr'] = self.indicator(df, 'atr', length=14)
             df['atr_pct'] = (df['atr'] / df['close']) * 100  # 백테스트와 동일
             
             # ZLHMA 기울기 (모멘텀) - 백테스트와 동일
@@ -213,14 +180,14 @@ class ZLHMAEMACrossStrategy(BaseStrategy):
             df['price_position_zlhma'] = (df['close'] - df['zlhma']) / df['zlhma'] * 100
             
             # RSI (추가 - BaseStrategy와 호환성)
-            df['rsi'] = self._calculate_rsi(df['close'], 14)
+            df['rsi'] = self.indicator(df, 'rsi', length=14)
             
             # Momentum
             df['momentum'] = ((df['close'] - df['close'].shift(20)) / 
                               df['close'].shift(20) * 100).abs()
             
             # Volume
-            df['volume_ma'] = df['volume'].rolling(window=20).mean()
+            df['volume_ma'] = self.indicator(df, 'volume_ma', length=20)
             df['volume_ratio'] = df['volume'] / df['volume_ma']
             
             # NaN 처리 (백테스트와 동일)
@@ -232,15 +199,6 @@ class ZLHMAEMACrossStrategy(BaseStrategy):
             logger.error(f"지표 계산 실패: {e}")
             return df
     
-    def _calculate_rsi(self, prices: pd.Series, period: int) -> pd.Series:
-        """RSI 계산"""
-        delta = prices.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
-        return rsi
-    
     def calculate_kelly_position_size(self, symbol: str) -> float:
         """Kelly Criterion에 따른 포지션 크기 계산"""
         if len(self.recent_trades) < 10:  # 최소 거래 수
@@ -486,25 +444,12 @@ class ZLHMAEMACrossStrategy(BaseStrategy):
         except Exception as e:
             logger.error(f"ZLHMA 사이클 실행 실패: {e}")
     
-    async def _is_candle_close_time(self) -> Tuple[bool, Optional[datetime]]:
-        """캔들 종가 체크 시간인지 확인 - 1시간봉"""
-        current_time = datetime.now()
-        current_minute = current_time.minute
-        current_second = current_time.second
-        
-        # 1시간 캔들 체크 (정시)
-        if current_minute == 0 and current_second < 30:
-            candle_time = current_time.replace(minute=0, second=0, microsecond=0)
-            return True, candle_time
-        
-        return False, None
-    
     async def fetch_and_prepare_data(self, symbol: str) -> Tuple[Optional[pd.DataFrame], Optional[pd.DataFrame]]:
         """데이터 수집 및 준비 - 1시간봉 사용"""
         try:
             # 1시간봉 데이터만 사용 (백테스트와 동일)
             # EMA 200 계산을 위해 충분한 데이터 수집
-            df_1h = await self.binance_api.get_klines(symbol, '1h', limit=500)
+            df_1h = await self.get_klines(symbol, '1h', limit=500)
             
             if df_1h.empty:
                 logger.error(f"데이터 수집 실패: {symbol}")
@@ -927,10 +872,8 @@ class ZLHMAEMACrossStrategy(BaseStrategy):
             # 심볼별 정밀도 적용
             quantity = await self.binance_api.round_quantity(symbol, quantity)
             
-            # 최소 주문 금액 체크
-            min_notional = 10.0  # USDT
-            if quantity * current_price < min_notional:
-                logger.warning(f"주문 금액이 최소값 미만: ${quantity * current_price:.2f} < ${min_notional}")
+            # 최소 주문 금액 체크 (심볼 규격)
+            if not await self._meets_min_notional(symbol, quantity, current_price):
                 return 0.0
             
             return quantity
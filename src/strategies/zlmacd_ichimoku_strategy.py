@@ -6,13 +6,13 @@ ZL MACD + Ichimoku Strategy for AlbraTrading System
 
 import asyncio
 import pandas as pd
-import pandas_ta as ta
 import numpy as np
 from typing import Dict, Optional, Tuple, List
 from datetime import datetime, timedelta
 import logging
 
 from .base_strategy import BaseStrategy
+from ..core import indicators
 from ..core.mdd_manager_improved import ImprovedMDDManager
 from ..utils.smart_notification_manager import SmartNotificationManager
 
@@ -21,6 +21,9 @@ logger = logging.getLogger(__name__)
 class ZLMACDIchimokuStrategy(BaseStrategy):
     """ZL MACD + Ichimoku Combined Strategy"""
     
+    # 1시간봉 종가 기준
+    candle_interval = '1h'
+    
     def __init__(self, binance_api, position_manager, config: Dict, config_manager=None):
         """전략 초기화"""
         super().__init__(binance_api, position_manager, config)
@@ -112,47 +115,23 @@ class ZLMACDIchimokuStrategy(BaseStrategy):
     
     def calculate_zlema(self, series: pd.Series, period: int) -> pd.Series:
         """Zero Lag EMA 계산"""
-        ema1 = series.ewm(span=period, adjust=False).mean()
-        ema2 = ema1.ewm(span=period, adjust=False).mean()
-        zlema = 2 * ema1 - ema2
-        return zlema
+        return pd.Series(indicators.zlema(series, period), index=series.index)
     
     def calculate_zlmacd(self, df: pd.DataFrame) -> pd.DataFrame:
         """ZL MACD 계산"""
-        # Zero Lag EMA 계산
-        zlema_fast = self.calculate_zlema(df['close'], self.zlmacd_fast)
-        zlema_slow = self.calculate_zlema(df['close'], self.zlmacd_slow)
-        
-        # MACD line
-        df['zlmacd'] = zlema_fast - zlema_slow
-        
-        # Signal line (9-period EMA of MACD)
-        df['zlmacd_signal'] = df['zlmacd'].ewm(span=self.zlmacd_signal, adjust=False).mean()
-        
-        # Histogram
-        df['zlmacd_hist'] = df['zlmacd'] - df['zlmacd_signal']
-        
+        result = self.indicator(df, 'zlmacd', fast=self.zlmacd_fast, slow=self.zlmacd_slow,
+                                signal=self.zlmacd_signal)
+        for column, values in result.items():
+            df[column] = values
         return df
     
     def calculate_ichimoku(self, df: pd.DataFrame) -> pd.DataFrame:
         """Ichimoku Cloud 계산"""
-        # Tenkan-sen (Conversion Line)
-        high_9 = df['high'].rolling(self.tenkan_period).max()
-        low_9 = df['low'].rolling(self.tenkan_period).min()
-        df['tenkan_sen'] = (high_9 + low_9) / 2
-        
-        # Kijun-sen (Base Line)
-        high_26 = df['high'].rolling(self.kijun_period).max()
-        low_26 = df['low'].rolling(self.kijun_period).min()
-        df['kijun_sen'] = (high_26 + low_26) / 2
-        
-        # Senkou Span A (Leading Span A)
-        df['senkou_span_a'] = ((df['tenkan_sen'] + df['kijun_sen']) / 2).shift(self.cloud_shift)
-        
-        # Senkou Span B (Leading Span B)
-        high_52 = df['high'].rolling(self.senkou_b_period).max()
-        low_52 = df['low'].rolling(self.senkou_b_period).min()
-        df['senkou_span_b'] = ((high_52 + low_52) / 2).shift(self.cloud_shift)
+        # 전환선 / 기준선 / 선행스팬 A, B (선행스팬은 cloud_shift 만큼 앞으로)
+        result = self.indicator(df, 'ichimoku', tenkan=self.tenkan_period, kijun=self.kijun_period,
+                                senkou_b=self.senkou_b_period, shift=self.cloud_shift)
+        for column, values in result.items():
+            df[column] = values
         
         # Chikou Span (Lagging Span)
         df['chikou_span'] = df['close'].shift(-self.chikou_shift)
@@ -171,23 +150,11 @@ class ZLMACDIchimokuStrategy(BaseStrategy):
     
     def calculate_adx(self, df: pd.DataFrame) -> pd.DataFrame:
         """ADX 계산"""
-        # pandas_ta를 사용하여 ADX 계산
-        adx_df = ta.adx(df['high'], df['low'], df['close'], length=self.adx_period)
-        
-        if adx_df is not None and not adx_df.empty:
-            df = pd.concat([df, adx_df], axis=1)
-        else:
-            # Fallback: 수동 계산
-            high_low = df['high'] - df['low']
-            high_close = abs(df['high'] - df['close'].shift(1))
-            low_close = abs(df['low'] - df['close'].shift(1))
-            
-            df['tr'] = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-            df['atr'] = df['tr'].rolling(self.adx_period).mean()
-            
-            # 간단한 ADX 추정 (정확도는 떨어지지만 사용 가능)
-            df[f'ADX_{self.adx_period}'] = 25.0  # 기본값
-        
+        # pandas_ta 와 같은 컬럼명 유지
+        result = self.indicator(df, 'adx', length=self.adx_period)
+        df[f'ADX_{self.adx_period}'] = result['adx']
+        df[f'DMP_{self.adx_period}'] = result['plus_di']
+        df[f'DMN_{self.adx_period}'] = result['minus_di']
         return df
     
     async def check_entry_signal(self, symbol: str, df_1h: pd.DataFrame, df_15m: pd.DataFrame, current_index: int) -> Tuple[bool, Optional[str]]:
@@ -428,9 +395,7 @@ class ZLMACDIchimokuStrategy(BaseStrategy):
             
             # 최소 주문 금액 체크
             current_price = await self.binance_api.get_current_price(symbol)
-            min_notional = 10.0  # USDT
-            if exit_quantity * current_price < min_notional:
-                logger.warning(f"{symbol} 부분 익절 금액이 최소값 미만: ${exit_quantity * current_price:.2f}")
+            if not await self._meets_min_notional(symbol, exit_quantity, current_price):
                 return
             
             # 청산 주문
@@ -722,10 +687,8 @@ class ZLMACDIchimokuStrategy(BaseStrategy):
             # 수량 정밀도 조정
             pyramid_size = await self.binance_api.round_quantity(symbol, pyramid_size)
             
-            # 최소 주문 금액 체크
-            min_notional = 10.0  # USDT
-            if pyramid_size * current_price < min_notional:
-                logger.warning(f"{symbol} 피라미딩 금액이 최소값 미만: ${pyramid_size * current_price:.2f}")
+            # 최소 주문 금액 체크 (심볼 규격)
+            if not await self._meets_min_notional(symbol, pyramid_size, current_price):
                 return
             
             # 레버리지 설정 (기존 포지션과 동일)
@@ -837,7 +800,7 @@ class ZLMACDIchimokuStrategy(BaseStrategy):
         """포지션 관리"""
         try:
             # 1시간봉 데이터 조회
-            df_1h = await self.binance_api.get_klines(
+            df_1h = await self.get_klines(
                 position.symbol, 
                 self.timeframe, 
                 limit=200
@@ -872,7 +835,7 @@ class ZLMACDIchimokuStrategy(BaseStrategy):
         """신규 진입 체크"""
         try:
             # 1시간봉 데이터 조회
-            df_1h = await self.binance_api.get_klines(
+            df_1h = await self.get_klines(
                 symbol, 
                 self.timeframe, 
                 limit=200
@@ -925,18 +888,14 @@ class ZLMACDIchimokuStrategy(BaseStrategy):
     async def run_cycle(self):
         """전략 실행 사이클 - BaseStrategy 인터페이스 구현"""
         try:
-            # 현재 시간 확인
-            now = datetime.now()
-            
-            # 1시간봉 체크 시간인지 확인 (정시 + 30초)
-            if now.minute == 0 and now.second >= 30 and now.second < 90:
-                # 마지막 실행 시간 확인
-                if hasattr(self, '_last_run_time'):
-                    time_diff = (now - self._last_run_time).total_seconds()
-                    if time_diff < 3500:  # 1시간 미만이면 스킵
-                        return
+            # 1시간봉 완성 확인 (캔들 종가 스케줄러)
+            is_check_time, candle_time = await self._is_candle_close_time()
+            if is_check_time:
+                # 같은 캔들은 한 번만 처리
+                if getattr(self, '_last_run_time', None) and self._last_run_time >= candle_time:
+                    return
                 
-                self._last_run_time = now
+                self._last_run_time = candle_time
                 
                 # 모든 심볼에 대해 체크
                 for symbol in self.symbols:
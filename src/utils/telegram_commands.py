@@ -9,6 +9,8 @@ from telegram.ext import Application, CommandHandler, ContextTypes
 from telegram.request import HTTPXRequest
 from dotenv import load_dotenv
 
+from src.core.api_telemetry import telemetry_snapshot
+
 # .env 파일 로드
 load_dotenv()
 
@@ -491,6 +493,9 @@ class TelegramCommands:
                         'balance': 0  # TODO: 실제 잔고 조회 구현 필요
                     }
         
+        # 거래소 API 텔레메트리
+        status['api_telemetry'] = telemetry_snapshot()
+        
         return status
     
     # ===== 명령어 핸들러 =====
@@ -626,6 +631,8 @@ TFPE (Trend Following Pullback Entry) 전략으로
                 for acc_id, acc_info in status['sub_accounts'].items():
                     status_text += f"├ {acc_id}: {acc_info['strategy']}\n"
         
+        status_text += self._format_api_telemetry(status.get('api_telemetry', {}))
+        
         status_text += "\n<i>💡 실시간 동기화로 최신 정보를 표시합니다</i>"
         
         await status_msg.edit_text(status_text, parse_mode='HTML')
@@ -2057,6 +2064,31 @@ TFPE (Trend Following Pullback Entry) 전략으로
         except Exception as e:
             await fix_msg.edit_text(f"❌ 오류 발생: {str(e)}")
     
+    def _format_api_telemetry(self, snapshots: Dict, top: int = 3) -> str:
+        """API 가중치 사용량(호출자별)과 느린 엔드포인트 요약"""
+        callers = []
+        endpoints = []
+        error_count = 0
+        window = 60
+        for account, snapshot in snapshots.items():
+            window = snapshot.get('weight_window_seconds', window)
+            for caller, weight in snapshot.get('weight_by_caller', {}).items():
+                callers.append((weight['recent'], weight['total'], caller))
+            for endpoint, summary in snapshot.get('endpoints', {}).items():
+                endpoints.append((summary['p95_ms'], summary['p99_ms'], summary['count'], endpoint))
+            error_count += sum(sum(codes.values()) for codes in snapshot.get('errors', {}).values())
+        
+        if not callers and not endpoints:
+            return ""
+        
+        text = f"\n<b>📡 API 사용량 (최근 {window}초 가중치)</b>\n"
+        for recent, total, caller in sorted(callers, reverse=True)[:top]:
+            text += f"├ {caller}: {recent} (누적 {total})\n"
+        for p95, p99, count, endpoint in sorted(endpoints, reverse=True)[:top]:
+            text += f"├ {endpoint}: p95 {p95:.0f}ms / p99 {p99:.0f}ms ({count}회)\n"
+        text += f"└ 오류: {error_count}건\n"
+        return text
+    
     def _format_uptime(self, uptime) -> str:
         """업타임 포맷팅"""
         if not uptime:
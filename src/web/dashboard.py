@@ -13,6 +13,7 @@ from concurrent.futures import ThreadPoolExecutor
 import functools
 import os
 from src.web.performance_dashboard import PerformanceDashboard
+from src.core.api_telemetry import telemetry_snapshot
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +46,12 @@ class DashboardApp:
         self.notification_manager = notification_manager
         self.performance_tracker = None  # 성과 추적기 추가
         
+        # 메인 이벤트 루프 (API 세션/요청 병합이 이 루프에 묶여 있음)
+        try:
+            self.main_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.main_loop = None
+        
         # 메트릭 저장
         self.metrics = {
             'start_time': datetime.now(),
@@ -212,7 +219,9 @@ class DashboardApp:
                     'error_rate': self.metrics['errors_count'] / max(self.metrics['requests_count'], 1),
                     'api_calls': self.metrics['api_calls'],
                     'last_sync_time': self.metrics['last_sync_time'],
-                    'cache_stats': self._get_cache_stats()
+                    'cache_stats': self._get_cache_stats(),
+                    # 거래소 REST 엔드포인트별 지연/오류, 전략·계좌별 가중치
+                    'exchange_api': telemetry_snapshot()
                 }
                 
                 return jsonify(metrics)
@@ -744,7 +753,19 @@ class DashboardApp:
         return stats
     
     def _run_async(self, coro):
-        """비동기 함수 실행"""
+        """비동기 함수 실행
+        
+        메인 루프가 실행 중이면 그 루프에서 실행한다. API 세션과 진행 중인 조회 요청이
+        메인 루프에 묶여 있으므로 별도 루프에서 실행하면 공유할 수 없다.
+        """
+        if self.main_loop and self.main_loop.is_running():
+            try:
+                future = asyncio.run_coroutine_threadsafe(coro, self.main_loop)
+                return future.result(timeout=30)
+            except Exception as e:
+                logger.error(f"비동기 실행 실패: {e}")
+                return None
+        
         try:
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
@@ -1009,13 +1030,14 @@ class DashboardApp:
 _dashboard_app = None
 
 
-def create_dashboard(position_manager, strategies, config):
+def create_dashboard(position_manager, strategies, config, main_loop=None):
     """레거시 호환성을 위한 create_dashboard 함수"""
     global _dashboard_app
     
     try:
         # DashboardApp 인스턴스 생성
         _dashboard_app = DashboardApp()
+        _dashboard_app.main_loop = main_loop
         
         # 시스템 컴포넌트 연결
         _dashboard_app.position_manager = position_manager
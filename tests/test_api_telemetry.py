@@ -0,0 +1,94 @@
+# tests/test_api_telemetry.py
+"""
+API 텔레메트리 단위 테스트
+지연 히스토그램 백분위, 오류 코드 집계, 호출자별 가중치 귀속 검증
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+from aiohttp import web
+from binance.exceptions import BinanceAPIException
+
+# 프로젝트 루트 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.api_telemetry import ApiTelemetry, LatencyHistogram, api_caller, telemetry_snapshot
+from tests.test_binance_api import create_api, start_fake_server
+
+
+class TestLatencyHistogram:
+    """지연 히스토그램 테스트"""
+
+    def test_percentiles_within_bucket_error(self):
+        """백분위가 버킷 해상도(25%) 안에서 실제 값과 일치"""
+        histogram = LatencyHistogram()
+        for latency in range(1, 101):  # 1~100ms
+            histogram.record(float(latency))
+
+        assert histogram.count == 100
+        assert 50 <= histogram.percentile(50) <= 50 * 1.25
+        assert 95 <= histogram.percentile(95) <= 100
+        assert histogram.percentile(99) <= histogram.max_ms == 100
+        assert histogram.summary()['avg_ms'] == 50.5
+
+        assert LatencyHistogram().percentile(99) == 0.0
+
+
+class TestCallerAttribution:
+    """호출자별 가중치 귀속 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_weight_tagged_by_strategy_and_account(self):
+        """컨텍스트 태그가 하위 태스크까지 전달되고 태그 없는 호출은 system"""
+        telemetry = ApiTelemetry('MASTER')
+
+        async def fetch(weight):
+            telemetry.record_weight(weight, now=1000.0)
+
+        with api_caller('TFPE'):
+            await asyncio.gather(fetch(5), asyncio.create_task(fetch(2)))
+        with api_caller('ZLMACD', 'sub1'):
+            await fetch(1)
+        await fetch(40)
+
+        assert telemetry.recent_weight('TFPE@MASTER', now=1030.0) == 7
+        assert telemetry.recent_weight('TFPE@MASTER', now=1060.0) == 0
+
+        snapshot = telemetry.snapshot()['weight_by_caller']
+        assert snapshot['TFPE@MASTER']['total'] == 7
+        assert snapshot['ZLMACD@sub1']['total'] == 1
+        assert snapshot['system@MASTER']['total'] == 40
+        assert list(snapshot)[0] == 'system@MASTER'  # 사용량 내림차순
+
+    @pytest.mark.asyncio
+    async def test_request_records_latency_errors_and_weight(self):
+        """REST 호출마다 지연/오류 코드 기록, 레이트 리미터 차감분은 호출자에 귀속"""
+        async def leverage(request):
+            return web.json_response({'code': -4028, 'msg': 'Leverage is not valid'}, status=400)
+
+        async def ticker(request):
+            return web.json_response({'symbol': 'BTCUSDT', 'price': '65000'})
+
+        runner, base_url = await start_fake_server([
+            web.post('/fapi/v1/leverage', leverage),
+            web.get('/fapi/v1/ticker/price', ticker),
+        ])
+        api = await create_api(base_url)
+        try:
+            with api_caller('TFPE'):
+                assert await api.get_current_price('BTCUSDT') == 65000.0
+                with pytest.raises(BinanceAPIException):
+                    await api._request('POST', '/fapi/v1/leverage', {'symbol': 'BTCUSDT'}, signed=True)
+
+            stats = api.get_system_stats()['telemetry']
+            assert stats['endpoints']['GET /fapi/v1/ticker/price']['count'] == 1
+            assert stats['endpoints']['POST /fapi/v1/leverage']['count'] == 1
+            assert stats['errors'] == {'POST /fapi/v1/leverage': {'-4028': 1}}
+            assert stats['weight_by_caller']['TFPE@MAIN']['total'] == 1
+            assert telemetry_snapshot()['MAIN']['endpoints']
+        finally:
+            await api.session.close()
+            await runner.cleanup()
@@ -0,0 +1,318 @@
+# tests/test_binance_api.py
+"""
+BinanceAPI 단위 테스트
+로컬 aiohttp 서버로 REST 전송 계층을 검증
+"""
+
+import asyncio
+import hashlib
+import hmac
+import json
+import os
+import sys
+import time
+
+import aiohttp
+import pytest
+from aiohttp import web
+from binance.exceptions import BinanceAPIException
+
+# 프로젝트 루트 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.binance_api import BinanceAPI, SlidingWindowCounter, SlidingWindowRateLimiter
+
+
+async def start_fake_server(routes):
+    """테스트용 로컬 REST 서버 시작"""
+    app = web.Application()
+    app.add_routes(routes)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+async def create_api(base_url: str) -> BinanceAPI:
+    """네트워크 초기화 없이 세션만 준비된 API"""
+    api = BinanceAPI('test-key', 'test-secret')
+    api.base_url = base_url
+    api.session = aiohttp.ClientSession(headers={'X-MBX-APIKEY': api.api_key})
+    return api
+
+
+class TestRestTransport:
+    """aiohttp 기반 REST 전송 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_signed_request(self):
+        """서명 요청 검증"""
+        received = {}
+
+        async def order(request):
+            body = await request.text()
+            received['body'] = body
+            received['api_key'] = request.headers.get('X-MBX-APIKEY')
+            return web.json_response({'orderId': 1})
+
+        runner, base_url = await start_fake_server([web.post('/fapi/v1/order', order)])
+        api = await create_api(base_url)
+        try:
+            result = await api._request(
+                'POST', '/fapi/v1/order',
+                {'symbol': 'BTCUSDT', 'quantity': 0.00001, 'reduceOnly': True},
+                signed=True
+            )
+            assert result == {'orderId': 1}
+            assert received['api_key'] == 'test-key'
+
+            payload, signature = received['body'].rsplit('&signature=', 1)
+            expected = hmac.new(b'test-secret', payload.encode(), hashlib.sha256).hexdigest()
+            assert signature == expected
+            assert 'quantity=0.00001' in payload
+            assert 'reduceOnly=true' in payload
+            assert 'timestamp=' in payload
+        finally:
+            await api.session.close()
+            await runner.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_error_response_raises(self):
+        """오류 응답은 BinanceAPIException"""
+        async def leverage(request):
+            return web.json_response({'code': -4028, 'msg': 'Leverage is not valid'}, status=400)
+
+        runner, base_url = await start_fake_server([web.post('/fapi/v1/leverage', leverage)])
+        api = await create_api(base_url)
+        try:
+            with pytest.raises(BinanceAPIException) as exc_info:
+                await api._request('POST', '/fapi/v1/leverage', {'symbol': 'BTCUSDT'}, signed=True)
+            assert exc_info.value.code == -4028
+        finally:
+            await api.session.close()
+            await runner.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_timestamp_error_resyncs_and_retries(self):
+        """-1021 응답 시 서버 시간 재동기화 후 서명 요청 1회 재시도"""
+        server_offset = 60_000
+        attempts = []
+
+        async def server_time(request):
+            return web.json_response({'serverTime': int(time.time() * 1000) + server_offset})
+
+        async def account(request):
+            timestamp = int(request.query['timestamp'])
+            attempts.append(timestamp)
+            if abs(timestamp - (time.time() * 1000 + server_offset)) > 5000:
+                return web.json_response(
+                    {'code': -1021, 'msg': "Timestamp for this request is outside of the recvWindow."},
+                    status=400)
+            return web.json_response({'totalWalletBalance': '100'})
+
+        runner, base_url = await start_fake_server([
+            web.get('/fapi/v1/time', server_time),
+            web.get('/fapi/v2/account', account),
+        ])
+        api = await create_api(base_url)
+        try:
+            result = await api._request('GET', '/fapi/v2/account', signed=True)
+            assert result == {'totalWalletBalance': '100'}
+            assert len(attempts) == 2
+            assert abs(api.time_offset - server_offset) < 1000
+        finally:
+            await api.session.close()
+            await runner.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_overlap(self):
+        """동시 요청이 이벤트 루프를 막지 않고 겹쳐서 실행"""
+        async def server_time(request):
+            await asyncio.sleep(0.2)
+            return web.json_response({'serverTime': int(time.time() * 1000)})
+
+        runner, base_url = await start_fake_server([web.get('/fapi/v1/time', server_time)])
+        api = await create_api(base_url)
+        try:
+            started = time.monotonic()
+            results = await asyncio.gather(*(api.get_server_time() for _ in range(5)))
+            elapsed = time.monotonic() - started
+
+            assert all(results)
+            assert elapsed < 0.6
+        finally:
+            await api.session.close()
+            await runner.cleanup()
+
+
+class TestRateLimiter:
+    """슬라이딩 윈도우 레이트 리미터 테스트"""
+
+    def test_counter_expires_buckets(self):
+        """윈도우가 지나면 버킷 만료"""
+        counter = SlidingWindowCounter(limit=100, window=60)
+        counter.add(10, 1000.0)
+        counter.add(5, 1000.5)
+        counter.add(20, 1030.0)
+
+        assert counter.used(1030.0) == 35
+        assert counter.used(1060.0) == 20
+        assert counter.used(1090.0) == 0
+
+    def test_counter_wait_time(self):
+        """가장 오래된 버킷 만료 시점까지 대기"""
+        counter = SlidingWindowCounter(limit=100, window=60)
+        counter.add(60, 1000.0)
+        counter.add(40, 1010.0)
+
+        assert counter.seconds_until_available(10, 1020.0) == pytest.approx(40.0)
+        assert counter.seconds_until_available(0, 1020.0) == 0.0
+
+    def test_header_sync_raises_usage(self):
+        """헤더 사용량이 로컬 기록보다 크면 헤더 값 적용"""
+        limiter = SlidingWindowRateLimiter(max_requests=100)
+        limiter.update_from_headers({'X-MBX-USED-WEIGHT-1M': '95', 'X-MBX-ORDER-COUNT-10S': '3'})
+
+        used, limit = limiter.get_current_usage()
+        assert used == 95
+        assert limit == 100
+        assert limiter.get_order_usage()['10S'][0] == 3
+
+    @pytest.mark.asyncio
+    async def test_separate_order_budget(self):
+        """주문 예산은 가중치 예산과 별도로 소모"""
+        limiter = SlidingWindowRateLimiter(max_requests=1000, max_orders_10s=300)
+        await limiter.acquire('futures_order', 3)
+        await limiter.acquire('futures_account')
+
+        used, _ = limiter.get_current_usage()
+        assert used == 8
+        assert limiter.get_order_usage()['10S'][0] == 3
+        assert limiter.get_order_usage()['1M'][0] == 3
+
+    def test_kline_weight(self):
+        """klines limit 별 가중치"""
+        assert SlidingWindowRateLimiter.kline_weight(50) == 1
+        assert SlidingWindowRateLimiter.kline_weight(200) == 2
+        assert SlidingWindowRateLimiter.kline_weight(500) == 5
+        assert SlidingWindowRateLimiter.kline_weight(1344) == 10
+
+
+class TestSingleFlight:
+    """계정 조회 요청 병합 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_reads_share_one_request(self):
+        """동시 호출은 요청 1회로 병합되고 TTL 동안 재사용"""
+        calls = {'account': 0}
+
+        async def account(request):
+            calls['account'] += 1
+            await asyncio.sleep(0.1)
+            return web.json_response({'totalWalletBalance': '100.0', 'positions': []})
+
+        runner, base_url = await start_fake_server([web.get('/fapi/v2/account', account)])
+        api = await create_api(base_url)
+        api.read_cache_ttl = 5.0
+        try:
+            results = await asyncio.gather(
+                api.get_account_info(),
+                api.get_account_balance(),
+                api.get_positions(),
+                api.get_account_info()
+            )
+            assert results[1] == 100.0
+            assert results[2] == []
+            assert calls['account'] == 1
+
+            # 호출자 수정이 공유 결과에 영향 없음
+            results[0]['totalWalletBalance'] = '0'
+            assert await api.get_account_balance() == 100.0
+            assert calls['account'] == 1
+
+            stats = api.get_system_stats()['read_cache']
+            assert stats['misses'] == 1
+            assert stats['coalesced'] == 3
+            assert stats['hits'] == 1
+
+            # 무효화 후 새로 조회
+            api.invalidate_read_cache()
+            await api.get_account_info()
+            assert calls['account'] == 2
+        finally:
+            await api.session.close()
+            await runner.cleanup()
+
+
+class TestBatchOrders:
+    """배치 주문 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_orders_split_and_mapped_back(self):
+        """5개 단위로 나눠 전송하고 결과를 입력 순서대로 매핑"""
+        batches = []
+
+        async def batch_orders(request):
+            form = await request.post()
+            orders = json.loads(form['batchOrders'])
+            batches.append(orders)
+            results = []
+            for order in orders:
+                if order['symbol'] == 'BADUSDT':
+                    results.append({'code': -2022, 'msg': 'ReduceOnly Order is rejected.'})
+                else:
+                    results.append({'orderId': len(results) + 1, 'symbol': order['symbol'],
+                                    'avgPrice': '100.0'})
+            return web.json_response(results)
+
+        runner, base_url = await start_fake_server([web.post('/fapi/v1/batchOrders', batch_orders)])
+        api = await create_api(base_url)
+        try:
+            symbols = [f"S{i}USDT" for i in range(7)]
+            symbols[5] = 'BADUSDT'
+            orders = [{'symbol': s, 'side': 'SELL', 'quantity': 0.5, 'reduce_only': True} for s in symbols]
+
+            results = await api.place_orders_batch(orders)
+
+            assert [len(batch) for batch in batches] == [5, 2]
+            assert results[5] is None
+            assert [r['symbol'] for i, r in enumerate(results) if i != 5] == \
+                [s for i, s in enumerate(symbols) if i != 5]
+            first = batches[0][0]
+            assert first['quantity'] == '0.5'
+            assert first['reduceOnly'] == 'true'
+            assert first['newOrderRespType'] == 'RESULT'
+            assert api.rate_limiter.get_order_usage()['10S'][0] == 7
+        finally:
+            await api.session.close()
+            await runner.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_cancel_order_targets_order_id(self):
+        """단일 취소는 orderId 로 해당 주문만 취소"""
+        received = {}
+
+        async def cancel(request):
+            received.update(request.query)
+            return web.json_response({'orderId': int(request.query['orderId']), 'status': 'CANCELED'})
+
+        runner, base_url = await start_fake_server([web.delete('/fapi/v1/order', cancel)])
+        api = await create_api(base_url)
+        try:
+            assert await api.cancel_order('BTCUSDT', 42)
+            assert received['symbol'] == 'BTCUSDT'
+            assert received['orderId'] == '42'
+        finally:
+            await api.session.close()
+            await runner.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_stop_orders_use_close_position(self, tmp_path):
+        """손절/익절은 수량 없이 closePosition 조건부 주문"""
+        api = BinanceAPI('test-key', 'test-secret', spec_cache_dir=str(tmp_path))
+        params = await api.build_order('BTCUSDT', 'SELL', order_type='STOP_MARKET',
+                                       stop_price=59000.0, close_position=True)
+        assert params == {'symbol': 'BTCUSDT', 'side': 'SELL', 'type': 'STOP_MARKET',
+                          'closePosition': True, 'stopPrice': 59000.0}
@@ -0,0 +1,158 @@
+# tests/test_candle_scheduler.py
+"""
+캔들 완성 스케줄러 테스트
+스트림 완성 신호 전달/중복 제거, 서버 시간 타이머 보완, 전략 연동을 검증
+"""
+
+import asyncio
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+# 프로젝트 루트 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.candle_close_monitor import CandleCloseScheduler, STREAM_SOURCE, TIMER_SOURCE
+from src.core.kline_store import INTERVAL_MS
+from src.strategies.base_strategy import BaseStrategy
+
+MINUTE_MS = INTERVAL_MS['1m']
+
+
+class FakeAPI:
+    time_offset = 0
+
+
+class FakeMonitor:
+    """kline_closed 이벤트 등록만 흉내"""
+
+    def __init__(self):
+        self.handlers = {}
+        self.watched = []
+
+    def on(self, event, handler):
+        self.handlers.setdefault(event, []).append(handler)
+
+    def off(self, event, handler):
+        self.handlers[event].remove(handler)
+
+    async def watch_kline(self, symbol, interval):
+        self.watched.append((symbol, interval))
+
+    async def close_candle(self, symbol, interval, open_ms):
+        for handler in self.handlers.get('kline_closed', []):
+            await handler(symbol, interval, {'time': datetime.fromtimestamp(open_ms / 1000)})
+
+
+class DummyStrategy(BaseStrategy):
+    async def check_entry_signal(self, symbol, df_4h, df_15m, current_index):
+        return False, None
+
+    async def check_exit_signal(self, position, df_15m, current_index):
+        return False, ''
+
+
+class TestCandleCloseScheduler:
+    """캔들 완성 이벤트 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_stream_close_emits_once(self):
+        """스트림 완성 신호는 즉시 전달, 같은 캔들은 한 번만"""
+        monitor = FakeMonitor()
+        scheduler = CandleCloseScheduler(FakeAPI(), price_monitor=monitor)
+        received = []
+        scheduler.subscribe('BTCUSDT', '15m', lambda *args: received.append(args))
+
+        await scheduler.start()
+        try:
+            assert monitor.watched == [('BTCUSDT', '15m')]
+            open_ms = 1_700_000_100_000 // INTERVAL_MS['15m'] * INTERVAL_MS['15m']
+            await monitor.close_candle('BTCUSDT', '15m', open_ms)
+            await monitor.close_candle('BTCUSDT', '15m', open_ms)
+            # 구독하지 않은 (심볼, 인터벌)은 무시
+            await monitor.close_candle('ETHUSDT', '15m', open_ms)
+
+            close_time = datetime.fromtimestamp((open_ms + INTERVAL_MS['15m']) / 1000)
+            assert received == [('BTCUSDT', '15m', close_time)]
+            assert scheduler.stats['stream_closes'] == 1
+            assert scheduler.stats['duplicates'] == 1
+        finally:
+            await scheduler.stop()
+        assert monitor.handlers['kline_closed'] == []
+
+    def test_timer_fills_missing_closes(self):
+        """경계 이후 스트림 신호가 없는 구독만 타이머로 완성 처리"""
+        monitor = FakeMonitor()
+        scheduler = CandleCloseScheduler(FakeAPI(), price_monitor=monitor, fallback_delay=3.0)
+        received = []
+        scheduler.subscribe('BTCUSDT', '1m', lambda *args: received.append(args))
+        scheduler.subscribe('ETHUSDT', '1m', lambda *args: received.append(args))
+
+        base = 1_700_000_000_000 // MINUTE_MS * MINUTE_MS
+        # 시작 직후 첫 경계는 알리지 않음
+        scheduler._fire_timer(base + 5_000)
+        assert received == []
+        assert scheduler._next_deadline_ms(base + 5_000) == base + MINUTE_MS + 3_000
+
+        # 다음 경계 - BTC 는 스트림으로 먼저 완성됨
+        boundary = base + MINUTE_MS
+        scheduler._emit('BTCUSDT', '1m', boundary, STREAM_SOURCE)
+        scheduler._fire_timer(boundary + 3_000)
+
+        assert [args[0] for args in received] == ['BTCUSDT', 'ETHUSDT']
+        assert scheduler.stats['stream_closes'] == 1
+        assert scheduler.stats['timer_closes'] == 1
+
+        # 늦게 도착한 ETH 스트림 신호는 중복
+        assert not scheduler._emit('ETHUSDT', '1m', boundary, STREAM_SOURCE)
+
+    @pytest.mark.asyncio
+    async def test_timer_only_loop(self, monkeypatch):
+        """스트림 없이 서버 시간 타이머만으로 완성 이벤트 발생"""
+        scheduler = CandleCloseScheduler(FakeAPI())
+        assert scheduler.fallback_delay == 0
+
+        clock = {'now': 1_700_000_000_000 // MINUTE_MS * MINUTE_MS + MINUTE_MS - 50}
+        monkeypatch.setattr(scheduler, 'server_time_ms', lambda: clock['now'])
+        received = []
+        scheduler.subscribe('BTCUSDT', '1m', lambda *args: received.append(args))
+
+        await scheduler.start()
+        try:
+            await asyncio.sleep(0.01)
+            clock['now'] += 100  # 경계 통과
+            assert await scheduler.wait_for_close(timeout=1.0)
+            assert received and received[0][0] == 'BTCUSDT'
+            assert scheduler.stats['timer_closes'] == 1
+        finally:
+            await scheduler.stop()
+
+    @pytest.mark.asyncio
+    async def test_wait_for_close_timeout(self):
+        """완성 이벤트가 없으면 timeout 후 False"""
+        scheduler = CandleCloseScheduler(FakeAPI())
+        assert not await scheduler.wait_for_close(timeout=0.01)
+
+
+class TestStrategyBinding:
+    """전략 구독 / 완성 캔들 소비 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_strategy_consumes_pending_closes(self):
+        """전략은 구독 심볼의 완성 캔들을 한 번만 처리"""
+        strategy = DummyStrategy(FakeAPI(), None, {'symbols': ['BTCUSDT', 'ETHUSDT']})
+        scheduler = CandleCloseScheduler(FakeAPI())
+        strategy.bind_candle_scheduler(scheduler)
+        assert set(scheduler.callbacks) == {('BTCUSDT', '15m'), ('ETHUSDT', '15m')}
+
+        assert await strategy._is_candle_close_time() == (False, None)
+
+        boundary = 1_700_000_000_000 // INTERVAL_MS['15m'] * INTERVAL_MS['15m']
+        scheduler._emit('BTCUSDT', '15m', boundary, TIMER_SOURCE)
+        scheduler._emit('ETHUSDT', '15m', boundary, TIMER_SOURCE)
+
+        is_close, candle_time = await strategy._is_candle_close_time()
+        assert is_close and candle_time == datetime.fromtimestamp(boundary / 1000)
+        assert await strategy._is_candle_close_time() == (False, None)
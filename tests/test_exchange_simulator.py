@@ -0,0 +1,156 @@
+# tests/test_exchange_simulator.py
+"""
+거래소 시뮬레이터 테스트
+재생 캔들 집계, BinanceAPI 접속과 대기 주문 체결, 429 응답, 웹소켓 스트림 검증
+"""
+
+import asyncio
+import json
+import os
+import sys
+
+import numpy as np
+import pytest
+import websockets
+from binance.exceptions import BinanceAPIException
+
+# 프로젝트 루트 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.binance_api import BinanceAPI
+from src.core.simulator import ExchangeSimulator, ReplayMarket
+
+
+def make_market(speed: float = 1.0) -> ReplayMarket:
+    return ReplayMarket.synthetic(['BTCUSDT', 'ETHUSDT'], base_interval='15m', bars=1200,
+                                  warmup_bars=1000, speed=speed, seed=7)
+
+
+async def start_simulator(monkeypatch, **kwargs) -> ExchangeSimulator:
+    simulator = ExchangeSimulator(make_market(kwargs.pop('speed', 1.0)), tick_interval=0.02, **kwargs)
+    await simulator.start()
+    for key, value in simulator.environment().items():
+        monkeypatch.setenv(key, value)
+    return simulator
+
+
+class TestReplayMarket:
+    """캔들 재생 테스트"""
+
+    def test_aggregated_klines_match_base_candles(self):
+        """상위 인터벌 캔들은 기준 캔들 묶음, 마지막 행은 진행 중인 캔들"""
+        market = make_market()
+        now = market.now_ms()
+        rows = market.klines('BTCUSDT', '1h', limit=10, now_ms=now)
+        assert len(rows) == 10
+        assert rows[-1][0] == now // 3_600_000 * 3_600_000
+
+        base = market.candles['BTCUSDT']
+        first = int(np.searchsorted(base.open_time, rows[0][0]))
+        group = base.ohlcv[first:first + 4]
+        assert float(rows[0][1]) == group[0, 0]
+        assert float(rows[0][2]) == group[:, 1].max()
+        assert float(rows[0][3]) == group[:, 2].min()
+        assert float(rows[0][4]) == group[-1, 3]
+
+    def test_sub_interval_candle_follows_price_path(self):
+        """기준보다 짧은 인터벌은 캔들 내부 경로로 보간"""
+        market = make_market()
+        now = market.now_ms()
+        open_time, (o, h, l, c, v) = market.candle_at('BTCUSDT', '1m', now)
+        assert open_time == now // 60_000 * 60_000
+        assert l <= min(o, c) <= max(o, c) <= h
+        assert c == market.price('BTCUSDT', now)
+
+
+class TestSimulatedExchange:
+    """BinanceAPI 와 시뮬레이터 연동 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_initialize_loads_symbol_specs(self, monkeypatch):
+        """exchangeInfo 응답으로 심볼 규격 컴파일"""
+        simulator = await start_simulator(monkeypatch)
+        api = BinanceAPI('sim-key', 'sim-secret')
+        try:
+            assert await api.initialize()
+            assert set(api.symbol_specs) == {'BTCUSDT', 'ETHUSDT'}
+            spec = api.symbol_specs['BTCUSDT']
+            assert spec.tick_size == simulator.market.tick_sizes['BTCUSDT']
+            assert spec.min_notional == 5.0
+        finally:
+            await api.cleanup()
+            await simulator.stop()
+
+    @pytest.mark.asyncio
+    async def test_orders_and_stop_trigger(self, monkeypatch):
+        """시장가 진입 후 STOP_MARKET(closePosition) 이 틱에서 체결되어 포지션 종료"""
+        simulator = await start_simulator(monkeypatch)
+        api = BinanceAPI('sim-key', 'sim-secret')
+        try:
+            assert await api.initialize()
+            assert api.spec_cache_path is None  # 시뮬레이터 규격은 디스크에 저장하지 않음
+
+            df = await api.get_klines('BTCUSDT', '4h', 50)
+            assert len(df) == 50
+
+            price = await api.get_current_price('BTCUSDT')
+            quantity = await api.validate_quantity('BTCUSDT', 50 / price)
+            order = await api.place_order('BTCUSDT', 'SELL', quantity)
+            assert order['status'] == 'FILLED'
+            positions = await api.get_positions()
+            assert [(p['symbol'], p['side']) for p in positions] == [('BTCUSDT', 'SHORT')]
+
+            # 현재가 바로 아래 BUY STOP -> 다음 틱에 체결
+            results = await api.place_orders_batch([{
+                'symbol': 'BTCUSDT', 'side': 'BUY', 'order_type': 'STOP_MARKET',
+                'stop_price': price * 0.5, 'close_position': True
+            }])
+            assert results[0]['status'] == 'NEW'
+            await asyncio.sleep(0.1)
+
+            api.invalidate_read_cache()
+            assert await api.get_positions() == []
+            assert simulator.stats['fills'] == 2
+        finally:
+            await api.cleanup()
+            await simulator.stop()
+
+    @pytest.mark.asyncio
+    async def test_weight_limit_returns_429(self, monkeypatch):
+        """IP 가중치 초과 시 -1003 과 Retry-After, 클라이언트 리미터는 요청 보류"""
+        simulator = await start_simulator(monkeypatch, weight_limit=20)
+        api = BinanceAPI('sim-key', 'sim-secret')
+        try:
+            assert await api.initialize()  # time 1 + account 5 + exchangeInfo 1 + dual 1
+            for _ in range(12):
+                await api._request('GET', '/fapi/v1/ping')
+            with pytest.raises(BinanceAPIException) as exc_info:
+                await api._request('GET', '/fapi/v1/ticker/price', {'symbol': 'BTCUSDT'})
+            assert exc_info.value.code == -1003
+            assert api.rate_limiter._blocked_until > 0
+            assert simulator.stats['rate_limited'] == 1
+        finally:
+            await api.cleanup()
+            await simulator.stop()
+
+    @pytest.mark.asyncio
+    async def test_combined_stream_subscription(self, monkeypatch):
+        """결합 스트림 구독 - 가격/캔들 수신, 배속 재생 중 캔들 완성 이벤트"""
+        simulator = await start_simulator(monkeypatch, speed=600)
+        url = f"{simulator.ws_url}/stream?streams=ethusdt@aggTrade"
+        received = {'aggTrade': 0, 'closed': 0}
+        try:
+            async with websockets.connect(url) as ws:
+                await ws.send(json.dumps({'method': 'SUBSCRIBE', 'params': ['ethusdt@kline_1m'], 'id': 1}))
+                assert json.loads(await ws.recv()) == {'result': None, 'id': 1}
+                while received['closed'] == 0 or received['aggTrade'] == 0:
+                    message = json.loads(await asyncio.wait_for(ws.recv(), 5))
+                    data = message['data']
+                    if message['stream'] == 'ethusdt@aggTrade':
+                        assert data['s'] == 'ETHUSDT'
+                        received['aggTrade'] += 1
+                    elif data['k']['x']:
+                        # 600배속: 실제 0.1초마다 1분봉 완성
+                        received['closed'] += 1
+        finally:
+            await simulator.stop()
@@ -0,0 +1,118 @@
+# tests/test_indicator_cache.py
+"""
+공유 지표 캐시 테스트
+전략 간 공유 / 캔들 변경 시 재계산 / 읽기 전용 결과 / LRU 제거 / 통계 검증
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# 프로젝트 루트 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core import indicators
+from src.core.indicator_cache import IndicatorCache
+from src.strategies.momentum_strategy import MomentumStrategy
+from src.strategies.tfpe_strategy import TFPEStrategy
+
+
+def make_frame(n: int = 600, seed: int = 5, symbol: str = 'BTCUSDT', interval: str = '15m') -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 30000 + np.cumsum(rng.normal(0, 40, n))
+    open_ = np.concatenate([[close[0]], close[:-1]])
+    df = pd.DataFrame({
+        'open': open_,
+        'high': np.maximum(open_, close) + rng.uniform(0, 25, n),
+        'low': np.minimum(open_, close) - rng.uniform(0, 25, n),
+        'close': close,
+        'volume': rng.uniform(1, 100, n),
+    }, index=pd.date_range('2024-01-01', periods=n, freq='15min', name='datetime'))
+    df.attrs.update(symbol=symbol, interval=interval)
+    return df
+
+
+class TestSharing:
+    """같은 캔들의 같은 지표는 한 번만 계산"""
+
+    def test_strategies_share_indicators(self):
+        cache = IndicatorCache()
+        tfpe = object.__new__(TFPEStrategy)
+        tfpe.momentum_lookback, tfpe.indicator_cache = 20, cache
+        momentum = object.__new__(MomentumStrategy)
+        momentum.indicator_cache = cache
+
+        frame = make_frame()
+        df_tfpe = tfpe.calculate_indicators(frame.copy())
+        misses = cache.stats['misses']
+        df_momentum = momentum.calculate_indicators(frame.copy())
+
+        # Momentum 의 ADX / ATR / 거래량 MA 는 TFPE 가 계산한 값 재사용
+        assert cache.stats['misses'] == misses
+        assert cache.stats['hits'] == 3
+        for column in ('adx', 'plus_di', 'atr', 'volume_ma'):
+            np.testing.assert_array_equal(df_tfpe[column], df_momentum[column])
+        np.testing.assert_allclose(df_momentum['adx'], indicators.adx(frame['high'], frame['low'],
+                                                                       frame['close'], 14)['adx'])
+
+    def test_key_includes_candles_and_params(self):
+        cache = IndicatorCache()
+        frame = make_frame()
+        first = cache.get('BTCUSDT', '15m', 'rsi', frame)
+        assert cache.get('BTCUSDT', '15m', 'rsi', frame, length=14) is first
+        assert cache.get('ETHUSDT', '15m', 'rsi', frame) is not first
+        assert cache.get('BTCUSDT', '15m', 'rsi', frame, length=7) is not first
+
+        # 새 캔들 / 진행 중 캔들 값 변경 / 다른 조회 길이 -> 재계산
+        assert cache.get('BTCUSDT', '15m', 'rsi', make_frame(601)) is not first
+        forming = frame.copy()
+        forming.iloc[-1, forming.columns.get_loc('close')] += 10
+        assert cache.get('BTCUSDT', '15m', 'rsi', forming) is not first
+        assert cache.get('BTCUSDT', '15m', 'rsi', frame.iloc[100:]) is not first
+        assert cache.get_stats()['hits'] == 1
+
+
+class TestCacheBehaviour:
+    """읽기 전용 결과 / LRU / 통계"""
+
+    def test_results_are_read_only(self):
+        cache = IndicatorCache()
+        frame = make_frame()
+        atr = cache.get('BTCUSDT', '15m', 'atr', frame)
+        with pytest.raises(ValueError):
+            atr[-1] = 0.0
+        adx = cache.get('BTCUSDT', '15m', 'adx', frame)
+        with pytest.raises(TypeError):
+            adx['adx'] = None
+        with pytest.raises(ValueError):
+            adx['plus_di'][0] = 0.0
+
+        # DataFrame 에 넣은 뒤 수정해도 캐시 값은 그대로
+        df = frame.copy()
+        df['atr'] = atr
+        df.loc[df.index[-1], 'atr'] = -1.0
+        assert cache.get('BTCUSDT', '15m', 'atr', frame)[-1] > 0
+
+    def test_lru_eviction_and_stats(self):
+        cache = IndicatorCache(max_entries=2)
+        frame = make_frame(200)
+        sma = cache.get('BTCUSDT', '15m', 'sma', frame)
+        cache.get('BTCUSDT', '15m', 'ema', frame)
+        cache.get('BTCUSDT', '15m', 'sma', frame)  # sma 최근 사용
+        cache.get('BTCUSDT', '15m', 'rsi', frame)  # ema 제거
+        assert len(cache) == 2
+        assert cache.get('BTCUSDT', '15m', 'sma', frame) is sma
+
+        stats = cache.get_stats()
+        assert (stats['hits'], stats['misses'], stats['evictions']) == (2, 3, 1)
+        assert stats['hit_rate'] == pytest.approx(0.4)
+
+        # 시간 인덱스가 없으면 캐시 없이 계산
+        plain = frame.reset_index(drop=True)
+        np.testing.assert_array_equal(cache.get('BTCUSDT', '15m', 'sma', plain), sma)
+        assert cache.stats['uncached'] == 1
+        with pytest.raises(ValueError):
+            IndicatorCache(max_entries=0)
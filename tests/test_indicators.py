@@ -0,0 +1,123 @@
+# tests/test_indicators.py
+"""
+통합 지표 라이브러리 테스트
+pandas_ta / 스트리밍 엔진과 값 일치, 레지스트리 키 / 계산, 전략 지표 계산 경로 검증
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pandas_ta as ta
+import pytest
+
+# 프로젝트 루트 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core import indicators
+from src.core.streaming_indicators import ZLMACD, Ichimoku
+from src.strategies.tfpe_strategy import TFPEStrategy
+from src.strategies.zlhma_ema_cross_strategy import ZLHMAEMACrossStrategy
+
+
+def assert_same(actual, expected, atol: float = 1e-9):
+    actual, expected = np.asarray(actual, dtype=float), np.asarray(expected, dtype=float)
+    np.testing.assert_array_equal(np.isnan(actual), np.isnan(expected))
+    np.testing.assert_allclose(actual, expected, rtol=1e-9, atol=atol, equal_nan=True)
+
+
+@pytest.fixture(scope='module')
+def frame():
+    rng = np.random.default_rng(17)
+    n = 2000
+    close = 30000 + np.cumsum(rng.normal(0, 40, n))
+    open_ = np.concatenate([[close[0]], close[:-1]])
+    return pd.DataFrame({
+        'open': open_,
+        'high': np.maximum(open_, close) + rng.uniform(0, 25, n),
+        'low': np.minimum(open_, close) - rng.uniform(0, 25, n),
+        'close': close,
+        'volume': rng.uniform(1, 100, n),
+    })
+
+
+class TestPandasTAParity:
+    """pandas_ta 기본값과 일치"""
+
+    def test_moving_averages(self, frame):
+        close = frame['close']
+        assert_same(indicators.sma(close, 50), ta.sma(close, 50))
+        assert_same(indicators.ema(close, 12, presma=True), ta.ema(close, 12))
+        assert_same(indicators.ema(close, 200), close.ewm(span=200, adjust=False).mean())
+        assert_same(indicators.hma(close, 21), ta.hma(close, 21))
+
+    def test_wilder(self, frame):
+        high, low, close = frame['high'], frame['low'], frame['close']
+        assert_same(indicators.rsi(close, 14), ta.rsi(close, 14))
+        assert_same(indicators.atr(high, low, close, 14), ta.atr(high, low, close, 14))
+        expected = ta.adx(high, low, close, 14)
+        result = indicators.adx(high, low, close, 14)
+        for column, key in (('ADX_14', 'adx'), ('DMP_14', 'plus_di'), ('DMN_14', 'minus_di')):
+            assert_same(result[key], expected[column])
+
+    def test_bands_and_channels(self, frame):
+        bands = indicators.bbands(frame['close'], 20, 2.0)
+        expected = ta.bbands(frame['close'], length=20, std=2.0, ddof=1)
+        assert_same(bands['bb_upper'], expected.filter(like='BBU').iloc[:, 0])
+        assert_same(bands['bb_lower'], expected.filter(like='BBL').iloc[:, 0])
+        channel = indicators.donchian(frame['high'], frame['low'], 20)
+        expected = ta.donchian(frame['high'], frame['low'], lower_length=20, upper_length=20)
+        assert_same(channel['dc_upper'], expected['DCU_20_20'])
+        assert_same(channel['dc_middle'], expected['DCM_20_20'])
+
+    def test_streaming_parity(self, frame):
+        """배치 ZLMACD / Ichimoku 마지막 값 = 캔들 단위 스트리밍 값"""
+        zlmacd, cloud = ZLMACD(12, 26, 9), Ichimoku(9, 26, 52, 26)
+        for high, low, close in frame[['high', 'low', 'close']].itertuples(index=False):
+            zlmacd.update_bar(high, low, close)
+            cloud.update_bar(high, low, close)
+        batch = indicators.zlmacd(frame['close'], 12, 26, 9)
+        assert batch['zlmacd_signal'][-1] == pytest.approx(zlmacd.outputs()['zlmacd_signal'], abs=1e-7)
+        batch = indicators.ichimoku(frame['high'], frame['low'], 9, 26, 52, 26)
+        for column, value in cloud.outputs().items():
+            assert batch[column][-1] == pytest.approx(value)
+
+
+class TestRegistry:
+    """(이름, 파라미터) 키 / 등록 지표 계산"""
+
+    def test_key_fills_defaults(self):
+        assert indicators.indicator_key('rsi') == indicators.indicator_key('rsi', length=14)
+        assert indicators.indicator_key('ema', presma=True, length=12) == \
+            ('ema', (('length', 12), ('presma', True)))
+        with pytest.raises(ValueError):
+            indicators.indicator_key('rsi', period=14)
+        with pytest.raises(KeyError):
+            indicators.indicator_key('unknown')
+
+    def test_compute(self, frame):
+        assert_same(indicators.compute('atr', frame, length=10),
+                    indicators.atr(frame['high'], frame['low'], frame['close'], 10))
+        columns = {name: frame[name].to_numpy() for name in ('high', 'low', 'close')}
+        result = indicators.compute('adx', columns)
+        assert set(result) == {'adx', 'plus_di', 'minus_di'}
+        assert result['adx'].dtype == np.float64
+
+
+class TestStrategyPaths:
+    """전략 지표 계산이 라이브러리 값을 그대로 사용"""
+
+    def test_tfpe_and_zlhma_use_wilder(self, frame):
+        tfpe = object.__new__(TFPEStrategy)
+        tfpe.momentum_lookback = 20
+        df = tfpe.calculate_indicators(frame.copy())
+        assert_same(df['rsi'], ta.rsi(frame['close'], 14))
+        assert_same(df['ema12'], ta.ema(frame['close'], 12))
+
+        zlhma = object.__new__(ZLHMAEMACrossStrategy)
+        zlhma.zlhma_period, zlhma.fast_ema_period, zlhma.slow_ema_period, zlhma.adx_period = 14, 50, 200, 14
+        df = zlhma.calculate_indicators(frame.copy())
+        expected = ta.adx(frame['high'], frame['low'], frame['close'], 14)['ADX_14'].fillna(0)
+        assert_same(df['adx'], expected)
+        assert_same(df['atr'], ta.atr(frame['high'], frame['low'], frame['close'], 14).fillna(0))
@@ -0,0 +1,58 @@
+# tests/test_kline_decoder.py
+"""
+캔들 디코더 단위 테스트
+REST 응답 텍스트/ccxt 리스트 -> numpy 배열 변환 검증
+"""
+
+import json
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+# 프로젝트 루트 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.kline_decoder import decode_klines, dedupe_sorted, to_frame
+
+REST_ROWS = [
+    [1700000000000, "37000.10", "37100.00", "36950.50", "37050.20", "1234.567",
+     1700000899999, "45678901.23", 1520, "600.1", "22200000.5", "0"],
+    [1700000900000, "37050.20", "37200.00", "37000.00", "37180.00", "987.654",
+     1700001799999, "36712345.67", 1200, "500.2", "18500000.1", "0"],
+]
+
+
+class TestKlineDecoder:
+    """캔들 디코더 테스트"""
+
+    def test_decode_rest_text(self):
+        """응답 텍스트를 파싱된 리스트와 같은 값의 배열로 변환"""
+        text = json.dumps(REST_ROWS)
+        klines = decode_klines(text)
+
+        assert klines.open_time.dtype == np.int64
+        assert klines.ohlcv.dtype == np.float64
+        assert klines.ohlcv.flags['C_CONTIGUOUS']
+        assert list(klines.open_time) == [1700000000000, 1700000900000]
+        assert klines.ohlcv[0].tolist() == [37000.10, 37100.00, 36950.50, 37050.20, 1234.567]
+
+        from_rows = decode_klines(REST_ROWS)
+        assert np.array_equal(from_rows.ohlcv, klines.ohlcv)
+        assert len(decode_klines('[]')) == 0
+
+    def test_ccxt_pages_dedupe_and_frame(self):
+        """ccxt 6열 행 - 중복 제거/정렬 후 DataFrame"""
+        rows = [
+            [1700000900000, 2.0, 3.0, 1.0, 2.5, 10.0],
+            [1700000000000, 1.0, 2.0, 0.5, 1.5, 5.0],
+            [1700000900000, 2.0, 3.0, 1.0, 2.5, 10.0],
+        ]
+        klines = dedupe_sorted(decode_klines(rows))
+        df = to_frame(klines, index_name='timestamp', include_timestamp=False)
+
+        assert list(df.columns) == ['open', 'high', 'low', 'close', 'volume']
+        assert df.index.name == 'timestamp'
+        assert df.index[0] == pd.Timestamp(1700000000000, unit='ms')
+        assert df['close'].tolist() == [1.5, 2.5]
@@ -0,0 +1,124 @@
+# tests/test_kline_store.py
+"""
+KlineStore 단위 테스트
+링 버퍼 뷰, WebSocket 증분 갱신, REST 백필 검증
+"""
+
+import os
+import sys
+import time
+from unittest.mock import AsyncMock, Mock
+
+import numpy as np
+import pytest
+
+# 프로젝트 루트 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.kline_decoder import decode_klines
+from src.core.kline_store import INTERVAL_MS, KlineRingBuffer, KlineStore
+
+INTERVAL = '15m'
+STEP = INTERVAL_MS[INTERVAL]
+
+
+def make_rows(start_time: int, count: int):
+    """REST 응답 형식 캔들 행 생성"""
+    rows = []
+    for i in range(count):
+        open_time = start_time + i * STEP
+        close_time = open_time + STEP - 1
+        price = 100.0 + i
+        rows.append([open_time, str(price), str(price + 1), str(price - 1), str(price + 0.5),
+                     '10', close_time, '0', 0, '0', '0', '0'])
+    return rows
+
+
+def current_open_time() -> int:
+    """진행 중 캔들 open time"""
+    return int(time.time() * 1000) // STEP * STEP
+
+
+class TestKlineRingBuffer:
+    """링 버퍼 테스트"""
+
+    def test_view_is_contiguous_after_wrap(self):
+        """용량을 넘겨도 최근 캔들이 순서대로 연속 뷰"""
+        buffer = KlineRingBuffer(capacity=5)
+        for i in range(12):
+            buffer.append_closed(i, (i, i, i, i, i))
+        buffer.set_forming(12, (12, 12, 12, 12, 12))
+
+        view = buffer.view()
+        assert list(view.open_time) == [7, 8, 9, 10, 11, 12]
+        assert list(view.ohlcv[:, 3]) == [7, 8, 9, 10, 11, 12]
+        assert view.ohlcv.base is not None  # 복사 없는 뷰
+        assert buffer.last_closed_time == 11
+
+    def test_view_limit_and_read_only(self):
+        """limit 은 진행 중 캔들 포함 행 수"""
+        buffer = KlineRingBuffer(capacity=10)
+        for i in range(4):
+            buffer.append_closed(i, (i, i, i, i, i))
+        buffer.set_forming(4, (4, 4, 4, 4, 4))
+
+        view = buffer.view(limit=3)
+        assert list(view.open_time) == [2, 3, 4]
+        assert list(buffer.view(limit=3, include_forming=False).open_time) == [1, 2, 3]
+        with pytest.raises(ValueError):
+            view.ohlcv[0, 0] = 1.0
+
+
+class TestKlineStore:
+    """공유 캔들 저장소 테스트"""
+
+    @pytest.fixture
+    def store(self):
+        now_open = current_open_time()
+        start = now_open - 99 * STEP
+        api = Mock()
+        api.time_offset = 0
+        api.get_kline_arrays = AsyncMock(return_value=decode_klines(make_rows(start, 100)))
+        return KlineStore(api, capacity=200)
+
+    @pytest.mark.asyncio
+    async def test_backfill_once_then_serve_from_memory(self, store):
+        """최초 1회만 REST 백필"""
+        df = await store.get_klines('BTCUSDT', INTERVAL, limit=100)
+        assert len(df) == 100
+        assert list(df.columns) == ['open', 'high', 'low', 'close', 'volume', 'timestamp']
+        assert df['close'].dtype == np.float64
+
+        df = await store.get_klines('BTCUSDT', INTERVAL, limit=50)
+        assert len(df) == 50
+        assert store.binance_api.get_kline_arrays.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_closed_kline_appends(self, store):
+        """완성 캔들 메시지가 저장소에 반영"""
+        await store.get_klines('BTCUSDT', INTERVAL, limit=100)
+        buffer = store.buffers[('BTCUSDT', INTERVAL)]
+        forming_open = buffer.view().open_time[-1]
+
+        store.on_kline('BTCUSDT', INTERVAL, {
+            't': int(forming_open), 'o': '1', 'h': '3', 'l': '0.5', 'c': '2', 'v': '7', 'x': True
+        })
+
+        assert buffer.last_closed_time == forming_open
+        view = buffer.view(limit=2)
+        assert view.ohlcv[0, 3] == 2.0
+        assert view.open_time[1] == forming_open + STEP
+        assert store.stats['stream_updates'] == 1
+
+    @pytest.mark.asyncio
+    async def test_stream_gap_marks_dirty(self, store):
+        """캔들이 건너뛰어지면 다음 조회 시 REST 보충"""
+        await store.get_klines('BTCUSDT', INTERVAL, limit=100)
+        last = store.buffers[('BTCUSDT', INTERVAL)].last_closed_time
+
+        store.on_kline('BTCUSDT', INTERVAL, {
+            't': last + 3 * STEP, 'o': '1', 'h': '1', 'l': '1', 'c': '1', 'v': '1', 'x': True
+        })
+
+        assert ('BTCUSDT', INTERVAL) in store._dirty
+        assert store.stats['stream_gaps'] == 1
@@ -0,0 +1,156 @@
+# tests/test_market_recorder.py
+"""
+시세 기록기 테스트
+레코드 인코딩/복원, 일별 세그먼트 교체와 압축, 인덱스, 모니터 연동 검증
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+# 프로젝트 루트 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core import market_recorder
+from src.core.market_recorder import (
+    MarketRecorder, RECORD_DTYPE, DAY_MS, decode_record, read_segment, segment_path
+)
+from src.core.realtime_price_monitor import RealtimePriceMonitor
+
+DAY = 19_700  # 2023-12-09 (UTC)
+
+
+def kline_data(symbol: str, open_time: int, close: float, closed: bool) -> dict:
+    return {'e': 'kline', 'E': open_time + 1000, 's': symbol, 'k': {
+        't': open_time, 's': symbol, 'i': '1m', 'o': '100', 'h': '101',
+        'l': '99', 'c': str(close), 'v': '12.5', 'x': closed}}
+
+
+def trade_data(symbol: str, trade_time: int, price: float) -> dict:
+    return {'e': 'aggTrade', 'E': trade_time + 5, 's': symbol, 'a': 123456,
+            'p': str(price), 'q': '0.25', 'T': trade_time, 'm': True}
+
+
+def mark_data(symbol: str, event_time: int, price: float) -> dict:
+    return {'e': 'markPriceUpdate', 'E': event_time, 's': symbol, 'p': str(price),
+            'i': '100.5', 'r': '0.0001', 'T': event_time + 3_600_000}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """기록기의 수신 시각 고정"""
+    state = {'ms': DAY * DAY_MS + 1000}
+    monkeypatch.setattr(market_recorder.time, 'time', lambda: state['ms'] / 1000)
+    return state
+
+
+class TestMarketRecorder:
+    """세그먼트 기록 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self, tmp_path, clock):
+        """기록한 메시지를 세그먼트에서 그대로 복원"""
+        recorder = MarketRecorder(str(tmp_path), compress=False)
+        await recorder.start()
+        base = DAY * DAY_MS
+        messages = [
+            ('kline', kline_data('BTCUSDT', base, 100.5, False)),
+            ('aggTrade', trade_data('BTCUSDT', base + 10, 100.25)),
+            ('markPrice', mark_data('ETHUSDT', base + 20, 2000.75)),
+            ('kline', kline_data('BTCUSDT', base, 100.75, True)),
+        ]
+        for kind, data in messages:
+            recorder.record(kind, data)
+        await recorder.stop()
+
+        day_dir = tmp_path / '20231209'
+        btc = read_segment(str(day_dir / 'BTCUSDT.bin'))
+        assert btc.dtype == RECORD_DTYPE and len(btc) == 3
+
+        decoded = [decode_record('BTCUSDT', record) for record in btc]
+        assert [kind for kind, _ in decoded] == ['kline', 'aggTrade', 'kline']
+        assert decoded[2][1]['k']['x'] is True and float(decoded[2][1]['k']['c']) == 100.75
+        assert decoded[1][1]['m'] is True and decoded[1][1]['a'] == 123456
+        assert float(decoded[1][1]['p']) == 100.25
+
+        kind, mark = decode_record('ETHUSDT', read_segment(str(day_dir / 'ETHUSDT.bin'))[0])
+        assert kind == 'markPrice' and float(mark['p']) == 2000.75 and mark['T'] == base + 20 + 3_600_000
+
+        index = json.loads((day_dir / 'index.json').read_text())
+        assert index['BTCUSDT']['records'] == 3 and index['ETHUSDT']['records'] == 1
+        assert index['BTCUSDT']['record_size'] == RECORD_DTYPE.itemsize
+
+    @pytest.mark.asyncio
+    async def test_day_rotation_compresses_closed_segment(self, tmp_path, clock):
+        """날짜가 바뀌면 이전 세그먼트는 압축, 새 날짜 세그먼트에 이어서 기록"""
+        recorder = MarketRecorder(str(tmp_path))
+        await recorder.start()
+        recorder.record('aggTrade', trade_data('BTCUSDT', clock['ms'], 100.0))
+        await recorder.flush()
+
+        clock['ms'] += DAY_MS
+        recorder.record('aggTrade', trade_data('BTCUSDT', clock['ms'], 101.0))
+        await recorder.stop()
+
+        closed = segment_path(str(tmp_path), '20231209', 'BTCUSDT')
+        assert closed.endswith('.bin.gz')
+        assert len(read_segment(closed)) == 1
+        assert json.loads((tmp_path / '20231209' / 'index.json').read_text())['BTCUSDT']['compressed']
+
+        # 당일 세그먼트는 재시작 시 이어 쓰도록 압축하지 않음
+        current = segment_path(str(tmp_path), '20231210', 'BTCUSDT')
+        assert current.endswith('.bin')
+        assert recorder.stats['segments_closed'] == 2
+
+    @pytest.mark.asyncio
+    async def test_restart_appends_and_compresses_stale(self, tmp_path, clock):
+        """같은 날 재시작은 이어 쓰고, 이전 날짜의 남은 세그먼트는 시작 시 압축"""
+        recorder = MarketRecorder(str(tmp_path))
+        await recorder.start()
+        recorder.record('markPrice', mark_data('BTCUSDT', clock['ms'], 100.0))
+        await recorder.stop()
+
+        recorder = MarketRecorder(str(tmp_path))
+        await recorder.start()
+        recorder.record('markPrice', mark_data('BTCUSDT', clock['ms'], 100.5))
+        await recorder.stop()
+        path = segment_path(str(tmp_path), '20231209', 'BTCUSDT')
+        assert len(read_segment(path)) == 2
+        assert json.loads((tmp_path / '20231209' / 'index.json').read_text())['BTCUSDT']['records'] == 2
+
+        clock['ms'] += DAY_MS
+        recorder = MarketRecorder(str(tmp_path))
+        await recorder.start()
+        await recorder.stop()
+        assert segment_path(str(tmp_path), '20231209', 'BTCUSDT').endswith('.gz')
+
+    def test_pending_limit_drops(self, tmp_path):
+        """디스크가 밀려 대기 메시지가 상한을 넘으면 버림"""
+        recorder = MarketRecorder(str(tmp_path), max_pending=2)
+        for i in range(5):
+            recorder.record('aggTrade', trade_data('BTCUSDT', i, 100.0))
+        assert recorder.stats['recorded'] == 2 and recorder.stats['dropped'] == 3
+
+
+class TestMonitorRecording:
+    """모니터 연동 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_monitor_records_without_subscribers(self, tmp_path, clock):
+        """구독자가 없어도 기록 중이면 모든 스트림 종류를 처리"""
+        recorder = MarketRecorder(str(tmp_path), compress=False)
+        monitor = RealtimePriceMonitor(object(), recorder=recorder)
+        assert set(monitor.dispatcher.active_kinds()) == {'kline', 'aggTrade', 'markPrice'}
+
+        await recorder.start()
+        frame = json.dumps({'stream': 'btcusdt@aggTrade',
+                            'data': trade_data('BTCUSDT', clock['ms'], 100.0)},
+                           separators=(',', ':'))
+        await monitor.dispatcher.dispatch(frame)
+        await monitor._handle_mark_price(mark_data('BTCUSDT', clock['ms'], 100.1))
+        await recorder.stop()
+
+        records = read_segment(segment_path(str(tmp_path), '20231209', 'BTCUSDT'))
+        assert [decode_record('BTCUSDT', r)[0] for r in records] == ['aggTrade', 'markPrice']
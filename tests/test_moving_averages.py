@@ -0,0 +1,69 @@
+# tests/test_moving_averages.py
+"""
+WMA / HMA / ZLHMA 벡터 연산 테스트
+기존 rolling.apply 구현 / pandas_ta 와 값 / NaN 위치가 일치하는지 검증
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pandas_ta as ta
+import pytest
+
+# 프로젝트 루트 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.moving_averages import hma, wma, wma_array, zlhma
+
+
+def rolling_wma(values: pd.Series, period: int) -> pd.Series:
+    """변경 전 rolling.apply 구현"""
+    weights = np.arange(1, period + 1)
+    return values.rolling(period).apply(lambda x: np.dot(x, weights) / weights.sum(), raw=True)
+
+
+def rolling_zlhma(values: pd.Series, period: int) -> pd.Series:
+    raw_hma = 2 * rolling_wma(values, int(period / 2)) - rolling_wma(values, period)
+    hma_values = rolling_wma(raw_hma, int(np.sqrt(period)))
+    return hma_values + (hma_values - hma_values.shift(int((period - 1) / 2)))
+
+
+def assert_same(actual, expected, rtol: float = 1e-12, atol: float = 1e-8):
+    actual, expected = np.asarray(actual, dtype=float), np.asarray(expected, dtype=float)
+    np.testing.assert_array_equal(np.isnan(actual), np.isnan(expected))
+    np.testing.assert_allclose(actual, expected, rtol=rtol, atol=atol, equal_nan=True)
+
+
+@pytest.fixture(scope='module')
+def close():
+    rng = np.random.default_rng(3)
+    index = pd.date_range('2024-01-01', periods=5000, freq='15min')
+    return pd.Series(30000 + np.cumsum(rng.normal(0, 40, len(index))), index=index)
+
+
+class TestMovingAverages:
+    """기존 구현 / pandas_ta 와 일치"""
+
+    @pytest.mark.parametrize('period', [1, 3, 7, 14, 50])
+    def test_wma_matches_rolling_apply(self, close, period):
+        result = wma(close, period)
+        assert isinstance(result, pd.Series) and result.index.equals(close.index)
+        assert_same(result, rolling_wma(close, period))
+        assert_same(result, ta.wma(close, period))
+
+    @pytest.mark.parametrize('period', [9, 14, 21, 200])
+    def test_hma_and_zlhma(self, close, period):
+        assert_same(hma(close, period), ta.hma(close, period))
+        assert_same(zlhma(close, period), rolling_zlhma(close, period))
+
+    def test_nan_windows_and_short_input(self, close):
+        """중간 NaN 이 포함된 윈도우는 NaN (rolling 과 동일), 기간보다 짧으면 전부 NaN"""
+        gappy = close.copy()
+        gappy.iloc[100] = np.nan
+        assert_same(wma(gappy, 10), rolling_wma(gappy, 10))
+        assert np.isnan(wma_array(np.arange(5.0), 10)).all()
+        assert isinstance(zlhma(close.to_numpy(), 14), np.ndarray)
+        with pytest.raises(ValueError):
+            wma_array(np.arange(5.0), 0)
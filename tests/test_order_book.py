@@ -0,0 +1,146 @@
+# tests/test_order_book.py
+"""
+로컬 오더북 테스트
+정렬 호가 갱신, 스냅샷 + 차분 동기화 / 시퀀스 누락 재동기화, 깊이 / 슬리피지 계산 검증
+"""
+
+import asyncio
+import json
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# 프로젝트 루트 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.order_book import BookSide, LocalOrderBook, OrderBookManager
+from src.core.realtime_price_monitor import RealtimePriceMonitor
+
+
+def snapshot(last_update_id: int) -> dict:
+    return {
+        'lastUpdateId': last_update_id,
+        'bids': [[100.0, 1.0], [99.5, 2.0], [99.0, 3.0]],
+        'asks': [[100.5, 1.0], [101.0, 2.0], [101.5, 3.0]],
+    }
+
+
+def diff(first: int, last: int, prev: int, bids=(), asks=()) -> dict:
+    return {'e': 'depthUpdate', 'E': last, 's': 'BTCUSDT', 'U': first, 'u': last, 'pu': prev,
+            'b': [[str(p), str(q)] for p, q in bids], 'a': [[str(p), str(q)] for p, q in asks]}
+
+
+class FakeDepthAPI:
+    """get_order_book 만 제공하는 API 자리"""
+
+    def __init__(self, snapshots):
+        self.snapshots = list(snapshots)
+        self.calls = 0
+
+    async def get_order_book(self, symbol, limit=20):
+        self.calls += 1
+        return self.snapshots.pop(0)
+
+
+class TestBookSide:
+    """정렬 배열 호가 갱신"""
+
+    def test_matches_dict_reference(self):
+        """무작위 갱신 후 정렬 / 최우선 호가가 dict 기준과 일치"""
+        rng = np.random.default_rng(5)
+        for descending in (True, False):
+            side = BookSide(descending)
+            reference = {}
+            for _ in range(2000):
+                price = round(100 + rng.integers(-50, 50) * 0.1, 1)
+                qty = 0.0 if rng.random() < 0.3 else float(rng.integers(1, 10))
+                side.update(price, qty)
+                if qty:
+                    reference[price] = qty
+                else:
+                    reference.pop(price, None)
+            expected = sorted(reference.items(), reverse=descending)
+            assert side.levels() == [[p, q] for p, q in expected]
+            assert side.best() == expected[0][0]
+
+
+class TestLocalOrderBook:
+    """동기화 / 조회"""
+
+    def test_sync_skips_old_and_detects_gap(self):
+        book = LocalOrderBook('BTCUSDT')
+        buffered = [
+            diff(90, 95, 89, bids=[(100.0, 9.0)]),        # 스냅샷 이전 - 폐기
+            diff(98, 103, 95, asks=[(100.5, 0.0)]),       # U <= 100 <= u - 첫 이벤트
+            diff(104, 110, 103, bids=[(100.2, 4.0)]),
+        ]
+        assert book.sync(snapshot(100), buffered)
+        assert book.best_bid == 100.2 and book.best_ask == 101.0
+        assert book.bids.levels(2) == [[100.2, 4.0], [100.0, 1.0]]
+
+        assert book.apply_diff(diff(111, 115, 110, asks=[(100.8, 1.0)]))
+        assert book.best_ask == 100.8
+        # pu 불일치 - 누락
+        assert not book.apply_diff(diff(120, 125, 118))
+        assert not book.synced and book.best_bid is None
+
+    def test_sync_rejects_stale_snapshot(self):
+        """버퍼 첫 이벤트가 스냅샷 이후에서 시작하면 실패"""
+        book = LocalOrderBook('BTCUSDT')
+        assert not book.sync(snapshot(100), [diff(105, 110, 104)])
+        assert not book.synced
+
+    def test_depth_and_slippage(self):
+        book = LocalOrderBook('BTCUSDT')
+        book.sync(snapshot(1), [])
+        assert book.mid_price == 100.25
+        assert book.spread_bps == pytest.approx(0.5 / 100.25 * 10000)
+
+        depth = book.depth_within(80)  # 100.25 ± 0.802
+        assert depth['bid_qty'] == 3.0 and depth['ask_qty'] == 3.0
+        assert depth['ask_notional'] == pytest.approx(100.5 + 2 * 101.0)
+
+        buy = book.estimate_slippage('BUY', 2.0)
+        assert buy.avg_price == pytest.approx((100.5 + 101.0) / 2)
+        assert buy.slippage_bps == pytest.approx((buy.avg_price - 100.5) / 100.5 * 10000)
+        assert buy.levels == 2
+
+        sell = book.estimate_slippage('SELL', 10.0)  # 잔량 초과 - 체결 가능 수량만
+        assert sell.filled_qty == 6.0 and sell.levels == 3
+        assert book.estimate_slippage('SELL', 0) is None
+
+
+class TestOrderBookManager:
+    """모니터 연동 / 재동기화"""
+
+    @pytest.mark.asyncio
+    async def test_stream_sync_and_resync(self):
+        api = FakeDepthAPI([snapshot(100), snapshot(300)])
+        monitor = RealtimePriceMonitor(object())
+        manager = OrderBookManager(api, monitor, resync_delay=0.01)
+        manager.books['BTCUSDT'] = LocalOrderBook('BTCUSDT')
+        manager._buffers['BTCUSDT'] = []
+        assert 'depth' in monitor.dispatcher.active_kinds()
+
+        async def send(event):
+            frame = json.dumps({'stream': 'btcusdt@depth@100ms', 'data': event}, separators=(',', ':'))
+            await monitor.dispatcher.dispatch(frame)
+
+        await send(diff(98, 103, 95, bids=[(100.2, 4.0)]))
+        assert manager.get_book('BTCUSDT') is None  # 스냅샷 대기
+        await asyncio.sleep(0.05)
+        book = manager.get_book('BTCUSDT')
+        assert book is not None and book.best_bid == 100.2
+
+        # 누락 -> 스냅샷 재조회 후 복구
+        await send(diff(250, 260, 240))
+        assert manager.get_book('BTCUSDT') is None
+        await send(diff(261, 305, 260, asks=[(100.5, 0.0)]))
+        await asyncio.sleep(0.05)
+        book = manager.get_book('BTCUSDT')
+        assert book is not None and book.best_ask == 101.0 and book.last_update_id == 305
+        assert api.calls == 2
+        assert manager.get_stats()['resyncs'] == 1
+        await manager.stop()
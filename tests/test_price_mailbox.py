@@ -0,0 +1,107 @@
+# tests/test_price_mailbox.py
+"""
+최신 가격 우편함 테스트
+느린 소비자에 대한 병합, 용량 초과 처리, RealtimePriceMonitor 연동 검증
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+# 프로젝트 루트 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.price_mailbox import ConflatingMailbox
+from src.core.realtime_price_monitor import RealtimePriceMonitor
+
+
+class FakeAPI:
+    ws_url = 'ws://127.0.0.1:1'
+
+
+class TestConflatingMailbox:
+    """우편함 병합 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_slow_consumer_gets_latest_price(self):
+        """소비자가 밀린 동안 도착한 틱은 심볼별 최신 값 하나로 병합"""
+        received = []
+        release = asyncio.Event()
+
+        async def consumer(symbol, price):
+            received.append((symbol, price))
+            await release.wait()
+
+        mailbox = ConflatingMailbox(consumer)
+        mailbox.post('BTCUSDT', 100.0)
+        await asyncio.sleep(0)  # 첫 값 처리 중 (대기)
+
+        for price in (101.0, 102.0, 103.0):
+            mailbox.post('BTCUSDT', price)
+        mailbox.post('ETHUSDT', 10.0)
+        mailbox.post('ETHUSDT', 11.0)
+        assert mailbox.depth == 2
+
+        release.set()
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+        assert received == [('BTCUSDT', 100.0), ('BTCUSDT', 103.0), ('ETHUSDT', 11.0)]
+        stats = mailbox.get_stats()
+        assert stats['posted'] == 6
+        assert stats['delivered'] == 3
+        assert stats['coalesced'] == 3
+        assert stats['max_depth'] == 2
+        assert stats['depth'] == 0
+        await mailbox.stop()
+
+    @pytest.mark.asyncio
+    async def test_capacity_and_stop_drop(self):
+        """대기 심볼 수 상한 초과 / 종료 후 도착은 버림"""
+        received = []
+        mailbox = ConflatingMailbox(lambda symbol, price: received.append(symbol), capacity=2)
+        for symbol in ('A', 'B', 'C'):
+            mailbox.post(symbol, 1.0)
+        assert mailbox.stats['dropped'] == 1
+
+        await asyncio.sleep(0.01)
+        assert received == ['A', 'B']
+
+        await mailbox.stop()
+        mailbox.post('D', 1.0)
+        assert mailbox.stats['dropped'] == 2
+
+
+class TestMonitorConflation:
+    """RealtimePriceMonitor 의 conflate 등록 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_conflated_handler(self):
+        monitor = RealtimePriceMonitor(FakeAPI())
+        received = []
+
+        async def on_price(symbol, price):
+            received.append(price)
+
+        monitor.on('price_update', on_price, conflate=True)
+        for price in (1.0, 2.0, 3.0):
+            await monitor.emit('price_update', 'BTCUSDT', price)
+        await asyncio.sleep(0.01)
+
+        assert received == [3.0]
+        stats = monitor.get_stats()['mailboxes']
+        assert list(stats.values())[0]['coalesced'] == 2
+
+        mailbox = next(iter(monitor.mailboxes.values()))
+        task = mailbox._task
+        monitor.off('price_update', on_price)
+        assert not monitor.mailboxes
+        await asyncio.sleep(0)
+        assert task.done()  # 제거된 우편함의 소비 태스크가 남지 않음
+        assert 'aggTrade' not in monitor.dispatcher.active_kinds()
+
+        with pytest.raises(ValueError):
+            monitor.on('kline_closed', on_price, conflate=True)
+        await monitor.stop()
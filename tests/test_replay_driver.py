@@ -0,0 +1,185 @@
+# tests/test_replay_driver.py
+"""
+시세 재생 드라이버 테스트
+캐시 pickle / 기록 세그먼트 입력, 캔들 완성 콜백 전달, 재생 시계 주입, 결정적 재현, 배속 검증
+"""
+
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime
+
+import pytest
+
+# 프로젝트 루트 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core import market_recorder, realtime_signal_processor
+from src.core.candle_close_monitor import CandleCloseScheduler
+from src.core.kline_decoder import to_frame
+from src.core.market_recorder import MarketRecorder
+from src.core.realtime_price_monitor import RealtimePriceMonitor
+from src.core.realtime_signal_processor import RealtimeSignalProcessor
+from src.core.simulator import (
+    ReplayDriver, ReplayClock, ReplayMarket, load_cached_klines, market_events, recording_events
+)
+from src.strategies import base_strategy
+
+MINUTE_MS = 60_000
+
+
+class _AllPositions:
+    """모든 심볼 포지션 보유 - 신호 체크 없이 빠른 지표만 계산"""
+
+    def is_position_exist(self, symbol):
+        return True
+
+
+def make_market(tmp_path) -> ReplayMarket:
+    """합성 1분봉을 백테스트 캐시 형식 pickle 로 저장 후 다시 로드"""
+    source = ReplayMarket.synthetic(['BTCUSDT', 'ETHUSDT'], base_interval='1m', bars=200,
+                                    warmup_bars=100, seed=7)
+    paths = {}
+    for symbol, klines in source.candles.items():
+        path = tmp_path / f"{symbol}_1m.pkl"
+        to_frame(klines, include_timestamp=False).to_pickle(path)
+        paths[symbol] = str(path)
+    return ReplayMarket.from_cache_pickles(paths, base_interval='1m', warmup_bars=100)
+
+
+def make_monitor():
+    monitor = RealtimePriceMonitor(None)
+    scheduler = CandleCloseScheduler(None, price_monitor=monitor)
+    processor = RealtimeSignalProcessor(None, _AllPositions())
+    monitor.on('price_update', processor.on_price_update)
+    monitor.on('kline_closed', processor.on_kline_closed)
+    return monitor, scheduler, processor
+
+
+class TestReplayInputs:
+    """입력 변환 테스트"""
+
+    def test_cache_pickle_round_trip(self, tmp_path):
+        """백테스트 캐시 DataFrame(datetime 인덱스 / timestamp 열) 모두 로드"""
+        source = ReplayMarket.synthetic(['BTCUSDT'], bars=50, warmup_bars=10, seed=1).candles['BTCUSDT']
+        indexed = tmp_path / 'indexed.pkl'
+        to_frame(source, include_timestamp=False).to_pickle(indexed)
+        column = tmp_path / 'column.pkl'
+        to_frame(source).reset_index(drop=True).to_pickle(column)
+
+        for path in (indexed, column):
+            loaded = load_cached_klines(str(path))
+            assert (loaded.open_time == source.open_time).all()
+            assert (loaded.ohlcv == source.ohlcv).all()
+
+    def test_market_events_close_before_trades(self, tmp_path):
+        """캔들 경계에서는 완성 캔들이 먼저, 이벤트 시각은 단조 증가"""
+        market = make_market(tmp_path)
+        start = int(market.candles['BTCUSDT'].open_time[120])
+        events = list(market_events(market, ['BTCUSDT'], intervals=('1m',),
+                                    start_ms=start, end_ms=start + 3 * MINUTE_MS))
+        times = [event.time_ms for event in events]
+        assert times == sorted(times)
+
+        closes = [event for event in events if event.data.get('k', {}).get('x')]
+        assert [event.data['k']['t'] for event in closes] == [start, start + MINUTE_MS, start + 2 * MINUTE_MS]
+        boundary = [event for event in events if event.time_ms == start + MINUTE_MS]
+        assert boundary[0].data['k']['x'] is True
+        assert float(closes[0].data['k']['c']) == market.candles['BTCUSDT'].ohlcv[120, 3]
+
+
+class TestReplayDriver:
+    """재생 드라이버 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_replay_drives_closes_and_clock(self, tmp_path):
+        """재생 중 전략 모듈의 datetime.now() 는 이벤트 시각, 종료 후 복원"""
+        market = make_market(tmp_path)
+        monitor, scheduler, processor = make_monitor()
+        start = int(market.candles['BTCUSDT'].open_time[120])
+
+        seen = []
+        scheduler.subscribe('BTCUSDT', '15m', lambda *args: None)
+        scheduler.subscribe('BTCUSDT', '1m', lambda symbol, interval, candle_time:
+                            seen.append((candle_time, base_strategy.datetime.now())))
+
+        driver = ReplayDriver(monitor)
+        stats = await driver.run(market_events(market, intervals=('1m', '15m'),
+                                               start_ms=start, end_ms=start + 30 * MINUTE_MS))
+
+        assert len(seen) == 30
+        for candle_time, now in seen:
+            assert candle_time == now  # 완성 신호는 경계 시각에 도착
+        assert scheduler.stats['stream_closes'] == 30 + 2
+        assert scheduler.stats['last_lag_ms'] == 0
+        assert processor.stats['price_updates'] == 2 * (30 * 60 + 1)
+        assert stats['speedup'] > 1
+
+        assert base_strategy.datetime is datetime
+        assert realtime_signal_processor.asyncio is asyncio
+        assert abs(base_strategy.datetime.now().timestamp() - time.time()) < 5
+
+    @pytest.mark.asyncio
+    async def test_replay_is_deterministic(self, tmp_path):
+        """같은 입력을 두 번 재생하면 빠른 지표가 같음"""
+        market = make_market(tmp_path)
+        start = int(market.candles['BTCUSDT'].open_time[120])
+
+        async def replay():
+            monitor, _, processor = make_monitor()
+            samples = []
+            monitor.on('kline_closed', lambda symbol, interval, info: samples.append(
+                (symbol, processor.get_quick_indicators(symbol))))
+            await ReplayDriver(monitor).run(market_events(market, intervals=('1m',), start_ms=start,
+                                                          end_ms=start + 10 * MINUTE_MS))
+            return samples
+
+        first, second = await replay(), await replay()
+        assert len(first) == 20
+        assert first == second
+        assert all(indicators.price_change_1m is not None for _, indicators in first[2:])
+
+    @pytest.mark.asyncio
+    async def test_speed_paces_replay(self, tmp_path):
+        """배속 재생은 (이벤트 시간 / 배속) 만큼 걸림"""
+        market = make_market(tmp_path)
+        monitor, _, _ = make_monitor()
+        start = int(market.candles['BTCUSDT'].open_time[120])
+
+        stats = await ReplayDriver(monitor, speed=20).run(
+            market_events(market, ['BTCUSDT'], intervals=('1m',), start_ms=start, end_ms=start + 4000))
+        assert stats['wall_seconds'] >= 0.2 - 0.01
+        assert stats['speedup'] <= 20.5
+
+        with pytest.raises(ValueError):
+            ReplayDriver(monitor, speed=0)
+
+    @pytest.mark.asyncio
+    async def test_replay_recording(self, tmp_path, monkeypatch):
+        """기록 세그먼트를 수신 시각 순으로 병합해 재생"""
+        base = 19_700 * 86_400_000
+        clock = {'ms': base + 1000}
+        monkeypatch.setattr(market_recorder.time, 'time', lambda: clock['ms'] / 1000)
+
+        recorder = MarketRecorder(str(tmp_path), compress=False)
+        await recorder.start()
+        for i in range(6):
+            symbol = 'BTCUSDT' if i % 2 else 'ETHUSDT'
+            clock['ms'] += 500
+            recorder.record('aggTrade', {'e': 'aggTrade', 'E': clock['ms'], 's': symbol, 'a': i,
+                                         'p': str(100 + i), 'q': '1', 'T': clock['ms'], 'm': False})
+        await recorder.stop()
+        monkeypatch.undo()
+
+        events = list(recording_events(str(tmp_path)))
+        assert [float(event.data['p']) for event in events] == [100, 101, 102, 103, 104, 105]
+        assert events[0].stream == 'ethusdt@aggTrade'
+
+        monitor = RealtimePriceMonitor(None)
+        prices = []
+        monitor.on('price_update', lambda symbol, price: prices.append((symbol, price)))
+        clock = ReplayClock()
+        await ReplayDriver(monitor, clock=clock).run(events)
+        assert prices[-1] == ('BTCUSDT', 105.0)
+        assert clock.now_ms() == base + 4000
@@ -0,0 +1,66 @@
+# tests/test_rolling_extrema.py
+"""
+이동 최댓값 / 최솟값 테스트
+van Herk / Gil-Werman 배치 계산이 pandas rolling 과 값 / NaN 위치까지 같고
+스트리밍 단조 덱(RollingExtremum)과 매 캔들 일치하는지 검증
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# 프로젝트 루트 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.rolling_extrema import rolling_max, rolling_max_array, rolling_min, rolling_min_array
+from src.core.streaming_indicators import RollingExtremum
+
+
+@pytest.fixture(scope='module')
+def prices():
+    rng = np.random.default_rng(11)
+    index = pd.date_range('2024-01-01', periods=3001, freq='1h')
+    return pd.Series(30000 + np.cumsum(rng.normal(0, 40, len(index))), index=index)
+
+
+class TestBatch:
+    """pandas rolling(length).max() / min() 와 일치"""
+
+    @pytest.mark.parametrize('length', [1, 2, 9, 20, 26, 52, 3001])
+    def test_matches_pandas(self, prices, length):
+        np.testing.assert_array_equal(rolling_max_array(prices, length),
+                                      prices.rolling(length).max().to_numpy())
+        np.testing.assert_array_equal(rolling_min_array(prices, length),
+                                      prices.rolling(length).min().to_numpy())
+
+    def test_nan_windows_and_short_input(self, prices):
+        """NaN 이 포함된 윈도우는 NaN, 길이보다 짧으면 전부 NaN"""
+        gappy = prices.copy()
+        gappy.iloc[[0, 500, 1999]] = np.nan
+        expected = gappy.rolling(26).max().to_numpy()
+        np.testing.assert_array_equal(rolling_max_array(gappy, 26), expected)
+        assert np.isnan(rolling_min_array(np.arange(5.0), 9)).all()
+        with pytest.raises(ValueError):
+            rolling_max_array(np.arange(5.0), 0)
+
+    def test_series_wrapper(self, prices):
+        result = rolling_min(prices, 9)
+        assert isinstance(result, pd.Series) and result.index.equals(prices.index)
+        assert isinstance(rolling_max(prices.to_numpy(), 9), np.ndarray)
+
+
+class TestStreaming:
+    """단조 덱 스트리밍 값 = 배치 값"""
+
+    @pytest.mark.parametrize('length', [1, 9, 52])
+    def test_deque_matches_batch(self, prices, length):
+        highest, lowest = RollingExtremum(length, True), RollingExtremum(length, False)
+        streamed_max = [highest.update(x) for x in prices]
+        streamed_min = [lowest.update(x) for x in prices]
+        batch_max, batch_min = rolling_max_array(prices, length), rolling_min_array(prices, length)
+        assert all(value is None for value in streamed_max[:length - 1])
+        np.testing.assert_array_equal(streamed_max[length - 1:], batch_max[length - 1:])
+        np.testing.assert_array_equal(streamed_min[length - 1:], batch_min[length - 1:])
@@ -0,0 +1,141 @@
+# tests/test_rolling_stats.py
+"""
+증분 롤링 통계 테스트
+RollingWindow / LaggedValue 결과를 전체 재계산 결과와 비교
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pandas_ta as ta
+import pytest
+
+# 프로젝트 루트 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core import rolling_stats
+from src.core.kline_store import KlineRingBuffer, KlineStore
+from src.core.realtime_signal_processor import RealtimeSignalProcessor, SymbolPriceStats
+from src.core.rolling_stats import LaggedValue, RollingWindow
+
+
+def make_klines(n: int, seed: int = 3):
+    """무작위 15분봉 (open_time, ohlcv)"""
+    rng = np.random.default_rng(seed)
+    close = 2000 + np.cumsum(rng.normal(0, 4, n))
+    open_ = np.concatenate([[close[0]], close[:-1]])
+    high = np.maximum(open_, close) + rng.uniform(0, 3, n)
+    low = np.minimum(open_, close) - rng.uniform(0, 3, n)
+    ohlcv = np.column_stack([open_, high, low, close, rng.uniform(1, 10, n)])
+    return 1_700_000_100_000 // 900_000 * 900_000 + np.arange(n) * 900_000, ohlcv
+
+
+class _NoPositions:
+    def is_position_exist(self, symbol):
+        return False
+
+
+async def _noop_check(symbol, indicators=None, reason=""):
+    return None
+
+
+class TestRollingWindow:
+    """평균/분산/최대/최소 정확도"""
+
+    def test_matches_numpy(self, monkeypatch):
+        """매 갱신마다 numpy 전체 계산과 일치 (재동기화 구간 포함)"""
+        monkeypatch.setattr(rolling_stats, 'RESYNC_INTERVAL', 50)
+        rng = np.random.default_rng(1)
+        values = 60000 + np.cumsum(rng.normal(0, 5, 500))
+        window = RollingWindow(20)
+
+        for i, value in enumerate(values):
+            window.append(float(value))
+            recent = values[max(0, i - 19):i + 1]
+            assert window.mean == pytest.approx(recent.mean(), rel=1e-12)
+            assert window.std == pytest.approx(recent.std(), rel=1e-6, abs=1e-9)
+            assert window.max == recent.max()
+            assert window.min == recent.min()
+
+    def test_invalid_size(self):
+        with pytest.raises(ValueError):
+            RollingWindow(0)
+
+
+class TestLaggedValue:
+    """lag 초 전 시점 값"""
+
+    def test_last_value_at_or_before_cutoff(self):
+        lagged = LaggedValue(60)
+        lagged.update(0.0, 100.0)
+        lagged.update(30.0, 101.0)
+        assert lagged.value is None  # 60초 이전 데이터 없음
+
+        lagged.update(61.0, 102.0)
+        assert lagged.value == 100.0
+        lagged.update(95.0, 103.0)
+        assert lagged.value == 101.0
+
+        # 같은 초의 틱은 마지막 값만 보관
+        for i in range(100):
+            lagged.update(96.0 + i / 1000, 104.0 + i)
+        assert len(lagged) <= 62
+
+
+class TestQuickIndicators:
+    """RealtimeSignalProcessor 빠른 지표 (기존 전체 재계산 방식과 비교)"""
+
+    def test_indicators_match_full_scan(self):
+        processor = RealtimeSignalProcessor(strategy=None, position_manager=None)
+        stats = processor.price_history['BTCUSDT'] = SymbolPriceStats()
+        rng = np.random.default_rng(3)
+        history = []
+
+        for i in range(400):
+            now = i * 1.5
+            price = float(100 + np.sin(i / 10) + rng.normal(0, 0.1))
+            stats.update(now, price)
+            history.append((now, price))
+            indicators = processor._calculate_quick_indicators('BTCUSDT', price)
+
+            recent = [p for _, p in history[-20:]]
+            if i >= 1:
+                assert indicators.volatility == pytest.approx(np.std(recent) / np.mean(recent), rel=1e-6)
+            past = [p for t, p in history if t <= now - 60]
+            if past:
+                assert indicators.price_change_1m == pytest.approx((price - past[-1]) / past[-1])
+            else:
+                assert indicators.price_change_1m is None
+            if len(recent) >= 20 and max(recent) > min(recent):
+                assert indicators.price_position == pytest.approx(
+                    (price - min(recent)) / (max(recent) - min(recent)))
+
+    @pytest.mark.asyncio
+    async def test_rsi_atr_from_closed_klines(self):
+        """캔들 저장소 히스토리로 초기화 후 완성 캔들마다 갱신 - 전략의 ta.rsi / ta.atr 와 일치"""
+        open_times, ohlcv = make_klines(300)
+        store = KlineStore(binance_api=None)
+        buffer = store.buffers[('ETHUSDT', '15m')] = KlineRingBuffer(1500)
+        processor = RealtimeSignalProcessor(strategy=None, position_manager=_NoPositions(),
+                                            kline_store=store)
+        processor._trigger_full_check = _noop_check
+
+        for i in range(250):
+            buffer.append_closed(int(open_times[i]), ohlcv[i])
+        for i in range(250, 300):
+            buffer.append_closed(int(open_times[i]), ohlcv[i])
+            high, low, close = ohlcv[i, 1:4]
+            await processor.on_kline_closed('ETHUSDT', '15m', {
+                'open_time': int(open_times[i]), 'high': high, 'low': low, 'close': close})
+        # 이미 반영된 캔들 재전달은 무시
+        await processor.on_kline_closed('ETHUSDT', '15m', {
+            'open_time': int(open_times[299]), 'high': 1e9, 'low': 0.0, 'close': 1.0})
+
+        frame = pd.DataFrame(ohlcv, columns=['open', 'high', 'low', 'close', 'volume'])
+        indicators = processor._calculate_quick_indicators('ETHUSDT', float(ohlcv[-1, 3]))
+        assert indicators.rsi == pytest.approx(ta.rsi(frame['close'], length=14).iloc[-1], abs=1e-9)
+        assert indicators.atr == pytest.approx(
+            ta.atr(frame['high'], frame['low'], frame['close'], length=14).iloc[-1], abs=1e-9)
+
@@ -0,0 +1,106 @@
+# tests/test_stream_dispatch.py
+"""
+스트림 디스패치 테스트
+스트림 이름 라우팅, 구독자 없는 종류의 파싱 생략, 핸들러 동기/비동기 판별 검증
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+# 프로젝트 루트 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.realtime_price_monitor import RealtimePriceMonitor
+from src.core.stream_dispatch import StreamDispatcher, stream_kind
+
+
+def frame(stream: str, data: dict) -> str:
+    return json.dumps({'stream': stream, 'data': data}, separators=(',', ':'))
+
+
+def agg_trade(symbol: str, price: str) -> dict:
+    return {'e': 'aggTrade', 'E': 1, 's': symbol, 'a': 1, 'p': price, 'q': '0.5',
+            'f': 1, 'l': 1, 'T': 1700000000000, 'm': False}
+
+
+def mark_price(symbol: str, price: str) -> dict:
+    return {'e': 'markPriceUpdate', 'E': 1, 's': symbol, 'p': price, 'r': '0.0001', 'T': 1}
+
+
+class FakeAPI:
+    ws_url = 'ws://127.0.0.1:1'
+
+
+class TestStreamDispatcher:
+    """핸들러 표 라우팅 테스트"""
+
+    def test_stream_kind(self):
+        assert stream_kind('btcusdt@kline_15m') == 'kline'
+        assert stream_kind('btcusdt@markPrice@1s') == 'markPrice'
+        assert stream_kind('btcusdt@aggTrade') == 'aggTrade'
+
+    @pytest.mark.asyncio
+    async def test_inactive_kind_skipped_before_parse(self):
+        """비활성 종류는 본문이 깨져 있어도 파싱하지 않고 건너뜀"""
+        dispatcher = StreamDispatcher()
+        received = []
+        dispatcher.route('aggTrade', received.append)
+        dispatcher.route('markPrice', received.append, active=False)
+
+        await dispatcher.dispatch('{"stream":"btcusdt@markPrice","data":{not json')
+        await dispatcher.dispatch('{"stream":"btcusdt@depth","data":{}}')
+        await dispatcher.dispatch(frame('btcusdt@aggTrade', agg_trade('BTCUSDT', '100')))
+
+        assert [data['p'] for data in received] == ['100']
+        assert dispatcher.stats['skipped'] == 1
+        assert dispatcher.stats['unrouted'] == 1
+        assert dispatcher.stats['dispatched'] == 1
+
+    @pytest.mark.asyncio
+    async def test_async_route(self):
+        """비동기 핸들러는 등록 시 판별되어 await"""
+        dispatcher = StreamDispatcher()
+        received = []
+
+        async def handler(data):
+            received.append(data['s'])
+
+        dispatcher.route('aggTrade', handler)
+        await dispatcher.dispatch(frame('ethusdt@aggTrade', agg_trade('ETHUSDT', '1')))
+        assert received == ['ETHUSDT']
+
+
+class TestMonitorDispatch:
+    """RealtimePriceMonitor 이벤트 구독에 따른 경로 활성화 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_routes_follow_event_handlers(self):
+        monitor = RealtimePriceMonitor(FakeAPI())
+        assert monitor.dispatcher.active_kinds() == []
+
+        prices, marks = [], []
+
+        async def on_mark(symbol, price):
+            marks.append((symbol, price))
+
+        monitor.on('price_update', lambda symbol, price: prices.append((symbol, price)))
+        monitor.on('mark_price_update', on_mark)
+        assert sorted(monitor.dispatcher.active_kinds()) == ['aggTrade', 'markPrice']
+
+        await monitor.dispatcher.dispatch(frame('btcusdt@aggTrade', agg_trade('BTCUSDT', '101.5')))
+        await monitor.dispatcher.dispatch(frame('btcusdt@markPrice', mark_price('BTCUSDT', '101.2')))
+        assert prices == [('BTCUSDT', 101.5)]
+        assert marks == [('BTCUSDT', 101.2)]
+        assert monitor.get_cached_price('BTCUSDT') == 101.5
+
+        monitor.off('mark_price_update', on_mark)
+        await monitor.dispatcher.dispatch(frame('btcusdt@markPrice', mark_price('BTCUSDT', '99')))
+        assert marks == [('BTCUSDT', 101.2)]
+        assert monitor.dispatcher.stats['skipped'] == 1
+
+        # 캔들 저장소가 연결되면 캔들 경로 활성
+        monitor.kline_store = object()
+        assert 'kline' in monitor.dispatcher.active_kinds()
@@ -0,0 +1,198 @@
+# tests/test_stream_manager.py
+"""
+샤딩 스트림 관리자 테스트
+레인/샤드 분배, 구독 해제, 샤드별 무응답 재연결을 시뮬레이터로 검증
+재연결 백오프와 재연결 후 캔들 누락 구간 보충 순서 검증
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+
+import numpy as np
+import pytest
+
+# 프로젝트 루트 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.realtime_price_monitor import RealtimePriceMonitor
+from src.core.simulator import ExchangeSimulator, ReplayMarket
+from src.core.kline_decoder import KlineArrays
+from src.core.stream_manager import (
+    StreamManager, StreamShard, stream_lane, DEPTH_LANE, MARKET_LANE, TRADE_LANE
+)
+
+MINUTE_MS = 60_000
+
+
+class FakeAPI:
+    def __init__(self, ws_url: str):
+        self.ws_url = ws_url
+
+
+async def start_simulator() -> ExchangeSimulator:
+    market = ReplayMarket.synthetic(['BTCUSDT', 'ETHUSDT', 'XRPUSDT'], base_interval='15m',
+                                    bars=1200, warmup_bars=1000, seed=3)
+    simulator = ExchangeSimulator(market, tick_interval=0.02)
+    await simulator.start()
+    return simulator
+
+
+async def wait_until(condition, timeout: float = 3.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "시간 초과"
+        await asyncio.sleep(0.02)
+
+
+class TestStreamManager:
+    """샤드 분배 / 구독 관리 테스트"""
+
+    def test_stream_lane(self):
+        """체결 / 호가 차분 스트림은 별도 레인"""
+        assert stream_lane('btcusdt@aggTrade') == TRADE_LANE
+        assert stream_lane('btcusdt@kline_1m') == MARKET_LANE
+        assert stream_lane('btcusdt@markPrice') == MARKET_LANE
+        assert stream_lane('btcusdt@depth@100ms') == DEPTH_LANE
+
+    @pytest.mark.asyncio
+    async def test_monitor_shards_and_unsubscribes(self):
+        """연결당 스트림 수 제한으로 샤드 분할, 심볼 제거 시 거래소 구독도 해제"""
+        simulator = await start_simulator()
+        monitor = RealtimePriceMonitor(FakeAPI(simulator.ws_url),
+                                       stream_config={'max_streams_per_connection': 4})
+        prices = {}
+        monitor.on('mark_price_update', lambda symbol, price: prices.setdefault(symbol, price))
+        try:
+            await monitor.add_symbols(['BTCUSDT', 'ETHUSDT', 'XRPUSDT'])
+            task = asyncio.create_task(monitor.start())
+
+            # 캔들 2 + 마크 가격 1 = 심볼당 3 -> market 레인 3샤드, 체결 3개 -> trade 레인 1샤드
+            lanes = [shard.lane for shard in monitor.stream_manager.shards]
+            assert lanes.count(MARKET_LANE) == 3 and lanes.count(TRADE_LANE) == 1
+            assert all(len(shard.streams) <= 4 for shard in monitor.stream_manager.shards)
+
+            await wait_until(lambda: len(prices) == 3)
+            assert set(simulator._subscribers) == monitor.stream_manager.streams
+
+            await monitor.remove_symbols(['XRPUSDT'])
+            await wait_until(lambda: not any(s.startswith('xrpusdt') for s in simulator._subscribers))
+            assert len(simulator._subscribers) == 8
+            assert monitor.get_stats()['streams'] == 8
+
+            await monitor.stop()
+            await asyncio.wait_for(task, 2)
+        finally:
+            await simulator.stop()
+
+    @pytest.mark.asyncio
+    async def test_stale_shard_restarts_alone(self):
+        """메시지가 끊긴 샤드만 재연결, 다른 샤드는 유지"""
+        simulator = await start_simulator()
+        received = []
+
+        async def on_message(frame):
+            received.append(json.loads(frame)['data'])
+
+        manager = StreamManager(f"{simulator.ws_url}/stream", on_message,
+                                stale_timeouts={MARKET_LANE: 0.3, TRADE_LANE: 0.3})
+        # 시뮬레이터에 없는 심볼 -> 메시지 없음
+        await manager.add_streams(['btcusdt@aggTrade', 'nonexistusdt@markPrice'])
+        task = asyncio.create_task(manager.start())
+        try:
+            trade_shard, market_shard = sorted(manager.shards, key=lambda s: s.lane != TRADE_LANE)
+            await wait_until(lambda: market_shard.stats['stale_restarts'] >= 1)
+            await wait_until(lambda: market_shard.stats['connects'] >= 2)
+
+            assert trade_shard.stats['stale_restarts'] == 0
+            assert trade_shard.stats['connects'] == 1
+            assert received and all(data['e'] == 'aggTrade' for data in received)
+        finally:
+            await manager.stop()
+            await asyncio.wait_for(task, 2)
+            await simulator.stop()
+
+
+class BackfillAPI:
+    """누락 구간 REST 조회만 흉내 (open time 기준 1분봉, 진행 중 캔들 포함)"""
+
+    ws_url = 'ws://127.0.0.1:1'
+    time_offset = 0
+
+    def __init__(self):
+        self.calls = []
+
+    async def get_kline_arrays(self, symbol, interval, limit=500, start_time=None):
+        self.calls.append((symbol, interval, limit, start_time))
+        await asyncio.sleep(0.02)  # 보충 중 실시간 메시지 도착
+        now_ms = int(time.time() * 1000)
+        open_times = np.arange(start_time, now_ms + 1, MINUTE_MS, dtype=np.int64)[:limit + 1]
+        ohlcv = np.column_stack([open_times / 1e9] * 4 + [np.ones(len(open_times))])
+        return KlineArrays(open_times, ohlcv)
+
+
+def kline_message(open_time: int, closed: bool) -> dict:
+    return {'k': {'s': 'BTCUSDT', 'i': '1m', 't': open_time, 'o': '1', 'h': '1',
+                  'l': '1', 'c': '1', 'v': '1', 'x': closed}}
+
+
+class TestReconnect:
+    """재연결 백오프 / 누락 구간 보충 테스트"""
+
+    def test_backoff_is_jittered_and_capped(self):
+        """지수 증가, 상한 유지, 절반~전체 구간의 지터"""
+        shard = StreamShard('market-1', MARKET_LANE, 'ws://unused', None, None,
+                            reconnect_delay=1, max_reconnect_delay=8)
+        for attempts, ceiling in [(1, 1), (2, 2), (3, 4), (4, 8), (20, 8)]:
+            delays = [shard.backoff_delay(attempts) for _ in range(50)]
+            assert all(ceiling / 2 <= d <= ceiling for d in delays)
+            assert len(set(delays)) > 1
+
+    @pytest.mark.asyncio
+    async def test_no_hard_stop_after_failures(self):
+        """연속 실패 시 알림은 한 번, 재연결은 계속"""
+        states = []
+
+        async def on_state(shard, state):
+            states.append(state)
+
+        shard = StreamShard('market-1', MARKET_LANE, 'ws://127.0.0.1:1/stream', None, on_state,
+                            reconnect_delay=0.01, max_reconnect_delay=0.02, alert_after_attempts=3)
+        shard.streams.add('btcusdt@markPrice')
+        task = asyncio.create_task(shard.run())
+        try:
+            await wait_until(lambda: shard.stats['connect_failures'] >= 6)
+            assert states == ['failed']
+            assert shard.is_running and not task.done()
+        finally:
+            await shard.stop()
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    @pytest.mark.asyncio
+    async def test_reconnect_backfills_missed_klines_in_order(self):
+        """끊긴 동안 완성된 캔들을 REST 1회로 보충하고, 보충 중 도착한 실시간 메시지는 뒤에 처리"""
+        api = BackfillAPI()
+        monitor = RealtimePriceMonitor(api)
+        closed = []
+        monitor.on('kline_closed', lambda symbol, interval, info: closed.append(info['time']))
+
+        current = int(time.time() * 1000) // MINUTE_MS * MINUTE_MS
+        last_open = current - 6 * MINUTE_MS
+        await monitor._handle_kline(kline_message(last_open, True))
+
+        await monitor._on_stream_event('reconnected', ['btcusdt@kline_1m', 'btcusdt@aggTrade'])
+        # 수신 루프 재개 - 보충 대상 캔들의 완성 메시지(중복)와 진행 중 캔들
+        await monitor._handle_kline(kline_message(current - MINUTE_MS, True))
+        await monitor._handle_kline(kline_message(current, False))
+        await asyncio.gather(*monitor._backfill_tasks)
+
+        assert len(api.calls) == 1
+        assert api.calls[0][3] == last_open + MINUTE_MS
+        open_times = [int(t.timestamp() * 1000) for t in closed]
+        assert open_times == list(range(last_open, current, MINUTE_MS))
+        assert monitor.backfill_stats['deferred_messages'] == 2
+        assert monitor.get_cached_kline('BTCUSDT', '1m')['is_closed'] is False
+        assert not monitor._backfilling
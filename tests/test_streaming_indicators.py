@@ -0,0 +1,172 @@
+# tests/test_streaming_indicators.py
+"""
+스트리밍 지표 엔진 테스트
+완성 캔들 1개씩 갱신한 값이 배치 계산(pandas_ta / 전략 자체 계산)과 매 캔들 일치하는지,
+초기화 / 중복 캔들 / 체크포인트 복원 검증
+"""
+
+import json
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pandas_ta as ta
+import pytest
+
+# 프로젝트 루트 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core import streaming_indicators
+from src.core.streaming_indicators import (
+    EMA, HMA, WMA, ZLHMA, ZLMACD, Donchian, Ichimoku, IndicatorEngine, WilderADX, WilderATR, WilderRSI,
+    tfpe_indicators, zlmacd_ichimoku_indicators
+)
+from src.strategies.zlhma_ema_cross_strategy import ZLHMAEMACrossStrategy
+from src.strategies.zlmacd_ichimoku_strategy import ZLMACDIchimokuStrategy
+
+BARS = 1500
+
+
+def make_frame(n: int = BARS, seed: int = 11) -> pd.DataFrame:
+    """무작위 캔들 (가끔 고가/저가가 같은 캔들 포함)"""
+    rng = np.random.default_rng(seed)
+    close = 30000 + np.cumsum(rng.normal(0, 40, n))
+    open_ = np.concatenate([[close[0]], close[:-1]])
+    high = np.maximum(open_, close) + rng.uniform(0, 25, n) * (rng.random(n) > 0.05)
+    low = np.minimum(open_, close) - rng.uniform(0, 25, n) * (rng.random(n) > 0.05)
+    return pd.DataFrame({'open': open_, 'high': high, 'low': low, 'close': close,
+                         'volume': rng.uniform(1, 100, n)})
+
+
+def stream(indicator, frame: pd.DataFrame, output=None) -> np.ndarray:
+    """캔들마다 갱신한 값 (output 이 있으면 outputs()[output])"""
+    values = []
+    for high, low, close in frame[['high', 'low', 'close']].itertuples(index=False):
+        indicator.update_bar(high, low, close)
+        value = indicator.outputs()[output] if output else indicator.value
+        values.append(np.nan if value is None else value)
+    return np.array(values)
+
+
+def assert_parity(streamed: np.ndarray, batch, rtol: float = 1e-9, atol: float = 1e-9):
+    batch = np.asarray(batch, dtype=float)
+    np.testing.assert_array_equal(np.isnan(streamed), np.isnan(batch))
+    np.testing.assert_allclose(streamed, batch, rtol=rtol, atol=atol, equal_nan=True)
+
+
+@pytest.fixture(scope='module')
+def frame():
+    return make_frame()
+
+
+class TestPandasTAParity:
+    """pandas_ta 기본값과 매 캔들 일치"""
+
+    @pytest.mark.parametrize('length', [12, 50])
+    def test_ema_presma(self, frame, length):
+        assert_parity(stream(EMA(length, presma=True), frame), ta.ema(frame['close'], length))
+
+    def test_ema_first_value_seed(self, frame):
+        expected = frame['close'].ewm(span=200, adjust=False).mean()
+        assert_parity(stream(EMA(200), frame), expected)
+
+    @pytest.mark.parametrize('length', [3, 7, 14])
+    def test_wma(self, frame, length):
+        assert_parity(stream(WMA(length), frame), ta.wma(frame['close'], length))
+
+    @pytest.mark.parametrize('length', [9, 14, 21])
+    def test_hma(self, frame, length):
+        assert_parity(stream(HMA(length), frame), ta.hma(frame['close'], length))
+
+    def test_rsi(self, frame):
+        assert_parity(stream(WilderRSI(14), frame), ta.rsi(frame['close'], length=14))
+
+    def test_atr(self, frame):
+        assert_parity(stream(WilderATR(14), frame), ta.atr(frame['high'], frame['low'], frame['close'], length=14))
+
+    def test_adx(self, frame):
+        expected = ta.adx(frame['high'], frame['low'], frame['close'], length=14)
+        for column, output in (('ADX_14', 'adx'), ('DMP_14', 'plus_di'), ('DMN_14', 'minus_di')):
+            assert_parity(stream(WilderADX(14), frame, output), expected[column])
+
+    def test_donchian(self, frame):
+        expected = ta.donchian(frame['high'], frame['low'], lower_length=20, upper_length=20)
+        for column, output in (('DCL_20_20', 'dc_lower'), ('DCM_20_20', 'dc_middle'), ('DCU_20_20', 'dc_upper')):
+            assert_parity(stream(Donchian(20), frame, output), expected[column])
+
+
+class TestStrategyParity:
+    """전략 자체 계산(ZLHMA / ZLMACD / Ichimoku)과 매 캔들 일치"""
+
+    def test_zlhma(self, frame):
+        strategy = object.__new__(ZLHMAEMACrossStrategy)
+        expected = strategy.calculate_zlhma(frame.copy(), 14)
+        assert_parity(stream(ZLHMA(14), frame), expected, rtol=1e-9, atol=1e-7)
+
+    def test_zlmacd_and_ichimoku(self, frame):
+        strategy = object.__new__(ZLMACDIchimokuStrategy)
+        strategy.zlmacd_fast, strategy.zlmacd_slow, strategy.zlmacd_signal = 12, 26, 9
+        strategy.tenkan_period, strategy.kijun_period, strategy.senkou_b_period = 9, 26, 52
+        strategy.cloud_shift = strategy.chikou_shift = 26
+        expected = strategy.calculate_ichimoku(strategy.calculate_zlmacd(frame.copy()))
+
+        for column in ('zlmacd', 'zlmacd_signal', 'zlmacd_hist'):
+            assert_parity(stream(ZLMACD(12, 26, 9), frame, column), expected[column], atol=1e-7)
+        for column in ('tenkan_sen', 'kijun_sen', 'senkou_span_a', 'senkou_span_b'):
+            assert_parity(stream(Ichimoku(9, 26, 52, 26), frame, column), expected[column])
+
+
+class TestIndicatorEngine:
+    """초기화 / 중복 캔들 / 체크포인트"""
+
+    def test_seed_then_update_matches_batch(self, frame):
+        open_times = 1_700_000_000_000 + np.arange(len(frame)) * 900_000
+        ohlcv = frame[['open', 'high', 'low', 'close', 'volume']].to_numpy()
+        engine = IndicatorEngine(tfpe_indicators())
+        assert engine.seed(open_times[:1000], ohlcv[:1000]) == 1000
+        assert engine.seed(open_times[:1200], ohlcv[:1200]) == 200  # 겹치는 구간은 건너뜀
+        for open_time, row in zip(open_times[1200:], ohlcv[1200:]):
+            engine.update(int(open_time), row[1], row[2], row[3])
+        assert not engine.update(int(open_times[-1]), 1e9, 0.0, 1.0)
+
+        latest = engine.latest()
+        adx = ta.adx(frame['high'], frame['low'], frame['close'], length=14).iloc[-1]
+        assert latest['adx'] == pytest.approx(adx['ADX_14'], abs=1e-9)
+        assert latest['plus_di'] == pytest.approx(adx['DMP_14'], abs=1e-9)
+        assert latest['rsi'] == pytest.approx(ta.rsi(frame['close'], length=14).iloc[-1], abs=1e-9)
+        assert latest['ema12'] == pytest.approx(ta.ema(frame['close'], 12).iloc[-1], rel=1e-12)
+        assert latest['dc_upper'] == frame['high'].iloc[-20:].max()
+
+    def test_checkpoint_round_trip(self, frame):
+        """JSON 저장 후 복원한 엔진은 끊김 없이 갱신한 엔진과 같은 값"""
+        rows = frame[['high', 'low', 'close']].to_numpy()
+        continuous = IndicatorEngine(zlmacd_ichimoku_indicators())
+        saved = IndicatorEngine(zlmacd_ichimoku_indicators())
+        for i, (high, low, close) in enumerate(rows[:700]):
+            continuous.update(i, high, low, close)
+            saved.update(i, high, low, close)
+
+        restored = IndicatorEngine(zlmacd_ichimoku_indicators())
+        restored.restore(json.loads(json.dumps(saved.checkpoint())))
+        for i, (high, low, close) in enumerate(rows[700:], 700):
+            continuous.update(i, high, low, close)
+            restored.update(i, high, low, close)
+        assert restored.latest() == continuous.latest()
+        assert restored.bars == len(rows)
+
+        with pytest.raises(ValueError):
+            IndicatorEngine(tfpe_indicators()).restore(saved.checkpoint())
+
+    def test_wma_resync(self, frame, monkeypatch):
+        """누적 오차 재계산 구간을 지나도 배치와 일치"""
+        monkeypatch.setattr(streaming_indicators, 'RESYNC_INTERVAL', 100)
+        assert_parity(stream(WMA(10), frame), ta.wma(frame['close'], 10))
+
+    def test_flat_prices(self):
+        rsi = WilderRSI(14)
+        for _ in range(5):
+            rsi.update(100.0)
+        assert rsi.value is None
+        with pytest.raises(ValueError):
+            WilderATR(0)
@@ -0,0 +1,109 @@
+# tests/test_symbol_spec.py
+"""
+SymbolSpec 단위 테스트
+필터 컴파일, 정수 연산 검증, 디스크 캐시와 부분 갱신 검증
+"""
+
+import os
+import sys
+from unittest.mock import AsyncMock
+
+import pytest
+
+# 프로젝트 루트 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.binance_api import BinanceAPI
+from src.core.symbol_spec import compile_symbol_spec, load_spec_cache
+
+
+def symbol_info(symbol: str, tick: str = '0.10', step: str = '0.001', min_qty: str = '0.001',
+                notional: str = '100'):
+    """exchangeInfo 심볼 항목 생성"""
+    return {
+        'symbol': symbol,
+        'status': 'TRADING',
+        'filters': [
+            {'filterType': 'PRICE_FILTER', 'minPrice': '556.80', 'maxPrice': '4529764', 'tickSize': tick},
+            {'filterType': 'LOT_SIZE', 'minQty': min_qty, 'maxQty': '1000', 'stepSize': step},
+            {'filterType': 'MIN_NOTIONAL', 'notional': notional},
+        ]
+    }
+
+
+class TestSymbolSpec:
+    """규격 컴파일 및 정수 연산 검증"""
+
+    def test_compile_exponents(self):
+        """틱/스텝이 정수 배수와 지수로 변환"""
+        spec = compile_symbol_spec(symbol_info('BTCUSDT', tick='0.10', step='0.001'))
+        assert (spec.tick_units, spec.price_exp) == (1, 1)
+        assert (spec.step_units, spec.qty_exp) == (1, 3)
+        assert spec.min_price_units == 5568
+        assert spec.min_notional == 100.0
+
+        spec = compile_symbol_spec(symbol_info('XUSDT', tick='0.0500', step='10', min_qty='10'))
+        assert (spec.tick_units, spec.price_exp) == (5, 2)
+        assert (spec.step_units, spec.qty_exp) == (10, 0)
+
+    def test_quantize_quantity(self):
+        """스텝 단위 내림과 최소 수량 제한"""
+        spec = compile_symbol_spec(symbol_info('BTCUSDT', step='0.001'))
+        assert spec.quantize_quantity(0.0019) == 0.001
+        assert spec.quantize_quantity(0.1 + 0.2) == 0.3
+        assert spec.quantize_quantity(0.0001) == 0.001
+        assert spec.quantize_quantity(5000) == 1000.0
+
+        spec = compile_symbol_spec(symbol_info('ETHUSDT', step='0.01', min_qty='0.01'))
+        assert spec.quantize_quantity(0.29) == 0.29  # 0.29 * 100 = 28.999...
+
+    def test_quantize_price(self):
+        """가장 가까운 틱으로 반올림"""
+        spec = compile_symbol_spec(symbol_info('BTCUSDT', tick='0.10'))
+        assert spec.quantize_price(65432.14) == 65432.1
+        assert spec.quantize_price(65432.16) == 65432.2
+        assert spec.quantize_price(1.0) == 556.8
+
+        spec = compile_symbol_spec(symbol_info('XUSDT', tick='0.05'))
+        assert spec.quantize_price(1000.03) == 1000.05
+
+
+class TestExchangeInfoCache:
+    """거래소 정보 디스크 캐시 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_restart_uses_disk_cache(self, tmp_path):
+        """재시작 시 유효한 캐시가 있으면 exchangeInfo 요청 생략"""
+        api = BinanceAPI('key', 'secret', spec_cache_dir=str(tmp_path))
+        api._request = AsyncMock(return_value={'symbols': [symbol_info('BTCUSDT')]})
+        assert await api.load_exchange_info()
+        assert api._request.await_count == 1
+
+        restarted = BinanceAPI('key', 'secret', spec_cache_dir=str(tmp_path))
+        restarted._request = AsyncMock()
+        assert await restarted.validate_quantity('BTCUSDT', 0.0123) == 0.012
+        restarted._request.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_refresh_replaces_only_changed(self, tmp_path):
+        """필터가 바뀐 심볼만 교체하고 거래 중지 심볼은 제거"""
+        api = BinanceAPI('key', 'secret', spec_cache_dir=str(tmp_path))
+        api._request = AsyncMock(return_value={
+            'symbols': [symbol_info('BTCUSDT'), symbol_info('ETHUSDT'), symbol_info('XRPUSDT')]
+        })
+        await api.load_exchange_info()
+        btc = api.symbol_specs['BTCUSDT']
+
+        delisted = symbol_info('XRPUSDT')
+        delisted['status'] = 'SETTLING'
+        api._request = AsyncMock(return_value={
+            'symbols': [symbol_info('BTCUSDT'), symbol_info('ETHUSDT', tick='0.05'), delisted]
+        })
+        await api.load_exchange_info(force=True)
+
+        assert api.symbol_specs['BTCUSDT'] is btc
+        assert api.symbol_specs['ETHUSDT'].tick_units == 5
+        assert 'XRPUSDT' not in api.symbol_specs
+
+        specs, _ = load_spec_cache(api.spec_cache_path)
+        assert set(specs) == {'BTCUSDT', 'ETHUSDT'}
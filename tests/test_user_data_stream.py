@@ -0,0 +1,194 @@
+# tests/test_user_data_stream.py
+"""
+UserDataStream 단위 테스트
+ACCOUNT_UPDATE / ORDER_TRADE_UPDATE 이벤트의 PositionManager 증분 반영 검증
+"""
+
+import os
+import sys
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+# 프로젝트 루트 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.position_manager import PositionManager, PositionStatus
+from src.core.user_data_stream import UserDataStream
+
+
+def account_update(*positions):
+    """ACCOUNT_UPDATE 이벤트 생성 (symbol, positionAmt, entryPrice)"""
+    return {
+        'e': 'ACCOUNT_UPDATE',
+        'a': {
+            'm': 'ORDER',
+            'B': [],
+            'P': [
+                {'s': symbol, 'pa': str(amt), 'ep': str(price), 'up': '0', 'mt': 'isolated', 'ps': 'BOTH'}
+                for symbol, amt, price in positions
+            ]
+        }
+    }
+
+
+def order_fill(symbol: str, price: float, side: str = 'SELL', reduce_only: bool = True):
+    """체결 ORDER_TRADE_UPDATE 이벤트 생성"""
+    return {
+        'e': 'ORDER_TRADE_UPDATE',
+        'o': {'s': symbol, 'c': 'manual', 'S': side, 'o': 'MARKET', 'x': 'TRADE', 'X': 'FILLED',
+              'i': 1, 'L': str(price), 'ap': str(price), 'z': '1', 'rp': '0', 'R': reduce_only}
+    }
+
+
+class TestUserDataStream:
+    """사용자 데이터 스트림 이벤트 반영 테스트"""
+
+    @pytest.fixture
+    def stream(self):
+        api = Mock()
+        api.get_positions = AsyncMock(return_value=[])
+        api.get_current_price = AsyncMock(return_value=1.0)
+        state_manager = Mock()
+        state_manager.save_position_cache = AsyncMock()
+        position_manager = PositionManager(api, state_manager)
+
+        stream = UserDataStream(api, position_manager)
+        stream.leverages['ETHUSDT'] = 7
+        return stream
+
+    @pytest.mark.asyncio
+    async def test_new_position_applied_without_rest(self, stream):
+        """새 포지션이 REST 조회 없이 반영"""
+        await stream._handle_message(account_update(('ETHUSDT', -2.0, 2500.0)))
+
+        position = stream.position_manager.get_position('ETHUSDT')
+        assert position is not None
+        assert position.side == 'SHORT'
+        assert position.size == 2.0
+        assert position.leverage == 7
+        assert position.is_manual
+        stream.binance_api.get_positions.assert_not_awaited()
+        stream.binance_api.invalidate_read_cache.assert_called()
+
+    @pytest.mark.asyncio
+    async def test_update_only_touches_listed_symbols(self, stream):
+        """다른 심볼 이벤트가 기존 포지션을 청산 처리하지 않음"""
+        await stream._handle_message(account_update(('ETHUSDT', 2.0, 2500.0)))
+        await stream._handle_message(account_update(('BTCUSDT', 0.01, 60000.0)))
+
+        assert stream.position_manager.get_position('ETHUSDT').status == PositionStatus.ACTIVE.value
+        assert stream.position_manager.get_position('BTCUSDT') is not None
+
+    @pytest.mark.asyncio
+    async def test_close_uses_stream_fill_price(self, stream):
+        """청산은 스트림 체결가를 사용"""
+        closed = []
+        stream.position_manager.add_event_handler('position_closed', closed.append)
+        stream.position_manager.notification_manager = Mock(send_alert=AsyncMock())
+        await stream._handle_message(account_update(('ETHUSDT', 1.5, 2500.0)))
+        position = stream.position_manager.get_position('ETHUSDT')
+
+        await stream._handle_message(order_fill('ETHUSDT', 2550.0))
+        assert stream.position_manager._last_fill_prices['ETHUSDT'] == 2550.0
+
+        await stream._handle_message(account_update(('ETHUSDT', 0, 0)))
+        assert position.status == PositionStatus.CLOSED.value
+        assert len(closed) == 1
+        alert = stream.position_manager.notification_manager.send_alert.await_args_list[-1]
+        assert alert.kwargs['data']['current_price'] == 2550.0
+        stream.binance_api.get_current_price.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_close_before_fill_waits_for_fill_price(self, stream):
+        """청산 ACCOUNT_UPDATE 가 체결보다 먼저 오면 늦게 온 청산 체결가로 기록"""
+        stream.position_manager.notification_manager = Mock(send_alert=AsyncMock())
+
+        await stream._handle_message(order_fill('ETHUSDT', 2500.0, side='BUY', reduce_only=False))
+        await stream._handle_message(account_update(('ETHUSDT', 1.5, 2500.0)))
+        assert 'ETHUSDT' not in stream.position_manager._last_fill_prices
+        position = stream.position_manager.get_position('ETHUSDT')
+
+        await stream._handle_message(account_update(('ETHUSDT', 0, 0)))
+        assert position.status == PositionStatus.CLOSED.value
+        await stream._handle_message(order_fill('ETHUSDT', 2600.0, side='SELL', reduce_only=False))
+        await stream.position_manager.flush_exit_records()
+
+        alert = stream.position_manager.notification_manager.send_alert.await_args_list[-1]
+        assert alert.kwargs['data']['current_price'] == 2600.0
+        assert 'ETHUSDT' not in stream.position_manager._last_fill_prices
+        stream.binance_api.get_current_price.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_close_without_fill_falls_back_to_current_price(self, stream):
+        """체결가가 시간 내 오지 않으면 현재가로 기록"""
+        stream.position_manager.notification_manager = Mock(send_alert=AsyncMock())
+        stream.position_manager.config['exit_fill_timeout'] = 0.01
+        stream.binance_api.get_current_price = AsyncMock(return_value=2600.0)
+
+        await stream._handle_message(account_update(('ETHUSDT', 1.5, 2500.0)))
+        await stream._handle_message(account_update(('ETHUSDT', 0, 0)))
+        await stream.position_manager.flush_exit_records()
+
+        alert = stream.position_manager.notification_manager.send_alert.await_args_list[-1]
+        assert alert.kwargs['data']['current_price'] == 2600.0
+        stream.binance_api.get_current_price.assert_awaited_with('ETHUSDT')
+
+    @pytest.mark.asyncio
+    async def test_late_fill_after_close_not_cached(self, stream):
+        """청산 기록이 끝난 뒤 온 체결은 다음 포지션 청산가로 남지 않음"""
+        await stream._handle_message(order_fill('ETHUSDT', 2600.0))
+        assert 'ETHUSDT' not in stream.position_manager._last_fill_prices
+
+        await stream._handle_message(account_update(('ETHUSDT', 1.0, 2700.0)))
+        assert 'ETHUSDT' not in stream.position_manager._last_fill_prices
+
+    @pytest.mark.asyncio
+    async def test_entry_update_before_add_position(self, stream):
+        """전략 진입 체결의 ACCOUNT_UPDATE 가 add_position 보다 먼저 와도 MANUAL 포지션을 만들지 않음"""
+        pm = stream.position_manager
+        client_order_id = pm.register_pending_order('ETHUSDT', 'TFPE', 'BUY')
+        assert client_order_id
+
+        await stream._handle_message(account_update(('ETHUSDT', 1.5, 2500.0)))
+        assert pm.get_position('ETHUSDT') is None
+        assert 'ETHUSDT_MANUAL' not in pm.positions
+
+        await pm.add_position('ETHUSDT', 'LONG', 1.5, 2500.0, 7, 'TFPE')
+        await pm.release_pending_order('ETHUSDT')
+
+        active = [key for key, pos in pm.positions.items() if pos.status == PositionStatus.ACTIVE.value]
+        assert active == ['ETHUSDT_TFPE']
+        assert not pm.get_position('ETHUSDT').is_manual
+
+    @pytest.mark.asyncio
+    async def test_failed_entry_replays_deferred_update(self, stream):
+        """전략 진입이 포지션 반영 없이 끝나면 보류한 업데이트를 반영"""
+        pm = stream.position_manager
+        pm.register_pending_order('ETHUSDT', 'TFPE', 'BUY')
+
+        await stream._handle_message(account_update(('ETHUSDT', 1.5, 2500.0)))
+        assert pm.get_position('ETHUSDT') is None
+
+        await pm.release_pending_order('ETHUSDT')
+        position = pm.get_position('ETHUSDT')
+        assert position is not None
+        assert position.is_manual
+
+    @pytest.mark.asyncio
+    async def test_exit_update_before_remove_position(self, stream):
+        """전략 청산의 ACCOUNT_UPDATE 가 remove_position 보다 먼저 와도 중복 청산 처리하지 않음"""
+        pm = stream.position_manager
+        closed = []
+        pm.add_event_handler('position_closed', closed.append)
+        await pm.add_position('ETHUSDT', 'LONG', 1.5, 2500.0, 7, 'TFPE')
+
+        pm.register_pending_order('ETHUSDT', 'TFPE', 'SELL', action='EXIT')
+        await stream._handle_message(account_update(('ETHUSDT', 0, 0)))
+        assert pm.get_position('ETHUSDT').status == PositionStatus.ACTIVE.value
+        assert closed == []
+
+        await pm.remove_position('ETHUSDT', reason='test', exit_price=2550.0, strategy_name='TFPE')
+        await pm.release_pending_order('ETHUSDT')
+        assert pm.positions['ETHUSDT_TFPE'].status == PositionStatus.CLOSED.value
+        assert len(closed) == 1  # remove_position 의 이벤트만
@@ -14,6 +14,7 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from src.core.symbol_spec import compile_symbol_spec
 from src.strategies.zlmacd_ichimoku_strategy import ZLMACDIchimokuStrategy
 
 class TestZLMACDIchimokuStrategy:
@@ -26,6 +27,14 @@ class TestZLMACDIchimokuStrategy:
         api.get_account_balance = AsyncMock(return_value=10000.0)
         api.get_current_price = AsyncMock(return_value=50000.0)
         api.round_quantity = AsyncMock(side_effect=lambda symbol, qty: round(qty, 6))
+        api.get_symbol_spec = AsyncMock(return_value=compile_symbol_spec({
+            'symbol': 'BTCUSDT',
+            'filters': [
+                {'filterType': 'PRICE_FILTER', 'minPrice': '0.10', 'maxPrice': '4529764', 'tickSize': '0.10'},
+                {'filterType': 'LOT_SIZE', 'minQty': '0.001', 'maxQty': '1000', 'stepSize': '0.001'},
+                {'filterType': 'MIN_NOTIONAL', 'notional': '100'},
+            ]
+        }))
         api.place_order = AsyncMock(return_value={
             'orderId': 12345,
             'status': 'FILLED',
@@ -18,6 +18,9 @@ import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 from collections import deque
 
+from src.core import indicators
+from src.core.moving_averages import wma
+
 
 class MultiTimeframeDataFetcher:
     """멀티타임프레임 데이터 생성기"""
@@ -164,8 +167,7 @@ class TrendFollowingHMACrossStrategy:
         
     def calculate_wma(self, prices: pd.Series, period: int) -> pd.Series:
         """가중이동평균 (Weighted Moving Average) 계산"""
-        weights = np.arange(1, period + 1)
-        return prices.rolling(period).apply(lambda x: np.dot(x, weights) / weights.sum(), raw=True)
+        return wma(prices, period)
     
     def calculate_zlhma(self, prices: pd.Series, period: int) -> pd.Series:
         """Zero Lag HMA 계산"""
@@ -190,17 +192,10 @@ class TrendFollowingHMACrossStrategy:
         return zlhma.fillna(prices.mean())
     
     def calculate_atr(self, df: pd.DataFrame, period: int = 14) -> pd.Series:
-        """ATR 계산"""
-        high = df['high']
-        low = df['low']
-        close = df['close']
-        
-        tr1 = high - low
-        tr2 = abs(high - close.shift(1))
-        tr3 = abs(low - close.shift(1))
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-        
-        return tr.rolling(window=period).mean().fillna(tr.mean())
+        """ATR 계산 (Wilder, 준비 구간은 TR 평균)"""
+        tr = indicators.true_range(df['high'], df['low'], df['close'])
+        atr = indicators.atr(df['high'], df['low'], df['close'], period)
+        return pd.Series(atr, index=df.index).fillna(tr.mean())
     
     def calculate_indicators_4h(self, df: pd.DataFrame) -> pd.DataFrame:
         """4시간봉 지표 계산 (추세 판단용)"""
@@ -17,6 +17,9 @@ from matplotlib.patches import Rectangle
 import pickle
 import ccxt
 
+from src.core import indicators
+from src.core.moving_averages import zlhma
+
 # 스크립트 디렉토리 확인
 if __file__:
     script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -182,25 +185,8 @@ class ZLHMAEMACrossStrategy:
         }
     
     def calculate_zlhma(self, close_prices: pd.Series) -> pd.Series:
-        """Zero Lag Hull Moving Average 계산"""
-        period = self.zlhma_period
-        
-        # Hull Moving Average 계산
-        wma_half = close_prices.rolling(window=period//2).mean()
-        wma_full = close_prices.rolling(window=period).mean()
-        
-        # Weighted Moving Average of the difference
-        diff = 2 * wma_half - wma_full
-        
-        # Square root period WMA
-        sqrt_period = int(np.sqrt(period))
-        hma = diff.rolling(window=sqrt_period).mean()
-        
-        # Zero Lag 적용 (추가 보정)
-        lag = (period - 1) // 2
-        zlhma = hma + (hma - hma.shift(lag))
-        
-        return zlhma
+        """Zero Lag Hull Moving Average 계산 (실전 전략과 같은 WMA 기반 HMA)"""
+        return zlhma(close_prices, self.zlhma_period)
     
     def calculate_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
         """지표 계산"""
@@ -210,41 +196,19 @@ class ZLHMAEMACrossStrategy:
         df['zlhma'] = self.calculate_zlhma(df['close'])
         
         # EMA 계산
-        df['ema_fast'] = df['close'].ewm(span=self.ema_fast, adjust=False).mean()
-        df['ema_slow'] = df['close'].ewm(span=self.ema_slow, adjust=False).mean()
+        df['ema_fast'] = indicators.ema(df['close'], self.ema_fast)
+        df['ema_slow'] = indicators.ema(df['close'], self.ema_slow)
         
         # EMA 크로스 신호
         df['ema_cross_up'] = (df['ema_fast'] > df['ema_slow']) & (df['ema_fast'].shift(1) <= df['ema_slow'].shift(1))
         df['ema_cross_down'] = (df['ema_fast'] < df['ema_slow']) & (df['ema_fast'].shift(1) >= df['ema_slow'].shift(1))
         
-        # ADX 계산
-        high = df['high']
-        low = df['low']
-        close = df['close']
-        
-        # True Range
-        tr1 = high - low
-        tr2 = abs(high - close.shift(1))
-        tr3 = abs(low - close.shift(1))
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-        atr = tr.rolling(window=14).mean()
-        
-        # Directional Movement
-        up_move = high - high.shift(1)
-        down_move = low.shift(1) - low
-        
-        pos_dm = pd.Series(np.where((up_move > down_move) & (up_move > 0), up_move, 0), index=df.index)
-        neg_dm = pd.Series(np.where((down_move > up_move) & (down_move > 0), down_move, 0), index=df.index)
-        
-        pos_di = 100 * pos_dm.rolling(window=14).mean() / atr
-        neg_di = 100 * neg_dm.rolling(window=14).mean() / atr
-        
-        dx = 100 * abs(pos_di - neg_di) / (pos_di + neg_di)
-        df['adx'] = dx.rolling(window=14).mean()
+        # ADX 계산 (실전 전략과 같은 Wilder 평활)
+        df['adx'] = indicators.adx(df['high'], df['low'], df['close'], 14)['adx']
         
         # ATR (포지션 사이징용)
-        df['atr'] = atr
-        df['atr_pct'] = (atr / close) * 100
+        df['atr'] = indicators.atr(df['high'], df['low'], df['close'], 14)
+        df['atr_pct'] = (df['atr'] / df['close']) * 100
         
         # ZLHMA 기울기 (모멘텀)
         df['zlhma_slope'] = df['zlhma'].diff() / df['zlhma'].shift(1) * 100
@@ -253,18 +217,10 @@ class ZLHMAEMACrossStrategy:
         df['price_position_zlhma'] = (df['close'] - df['zlhma']) / df['zlhma'] * 100
         
         # RSI 계산
-        delta = df['close'].diff()
-        gain = delta.where(delta > 0, 0)
-        loss = -delta.where(delta < 0, 0)
-        
-        avg_gain = gain.rolling(window=14).mean()
-        avg_loss = loss.rolling(window=14).mean()
-        
-        rs = avg_gain / avg_loss
-        df['rsi'] = 100 - (100 / (1 + rs))
+        df['rsi'] = indicators.rsi(df['close'], 14)
         
         # 볼륨 분석
-        df['volume_ma'] = df['volume'].rolling(window=20).mean()
+        df['volume_ma'] = indicators.sma(df['volume'], 20)
         df['volume_ratio'] = df['volume'] / df['volume_ma']
         
         # NaN 처리
@@ -38,6 +38,8 @@ else:
 sys.path.append(os.path.join(script_dir, 'backtest_modules'))
 sys.path.append(script_dir)
 
+from src.core import indicators
+
 # 디버깅 정보 추가
 print(f"Current directory: {os.getcwd()}")
 print(f"Script directory: {script_dir}")
@@ -150,41 +152,24 @@ class ZLMACDIchimokuDayTradingStrategy:
     
     def calculate_zlema(self, series: pd.Series, period: int) -> pd.Series:
         """Zero Lag EMA 계산"""
-        ema1 = series.ewm(span=period, adjust=False).mean()
-        ema2 = ema1.ewm(span=period, adjust=False).mean()
-        zlema = 2 * ema1 - ema2
-        return zlema
+        return pd.Series(indicators.zlema(series, period), index=series.index)
     
     def calculate_zlmacd(self, df: pd.DataFrame) -> pd.DataFrame:
         """ZL MACD 계산"""
-        zlema_fast = self.calculate_zlema(df['close'], self.zlmacd_fast)
-        zlema_slow = self.calculate_zlema(df['close'], self.zlmacd_slow)
-        
-        df['zlmacd'] = zlema_fast - zlema_slow
-        df['zlmacd_signal'] = df['zlmacd'].ewm(span=self.zlmacd_signal, adjust=False).mean()
-        df['zlmacd_histogram'] = df['zlmacd'] - df['zlmacd_signal']
+        result = indicators.zlmacd(df['close'], self.zlmacd_fast, self.zlmacd_slow, self.zlmacd_signal)
+        df['zlmacd'] = result['zlmacd']
+        df['zlmacd_signal'] = result['zlmacd_signal']
+        df['zlmacd_histogram'] = result['zlmacd_hist']
         
         return df
     
     def calculate_ichimoku(self, df: pd.DataFrame) -> pd.DataFrame:
         """Ichimoku Cloud 계산"""
-        # Tenkan-sen (전환선)
-        high_9 = df['high'].rolling(self.tenkan_period).max()
-        low_9 = df['low'].rolling(self.tenkan_period).min()
-        df['tenkan_sen'] = (high_9 + low_9) / 2
-        
-        # Kijun-sen (기준선)
-        high_26 = df['high'].rolling(self.kijun_period).max()
-        low_26 = df['low'].rolling(self.kijun_period).min()
-        df['kijun_sen'] = (high_26 + low_26) / 2
-        
-        # Senkou Span A (선행스팬 A)
-        df['senkou_span_a'] = ((df['tenkan_sen'] + df['kijun_sen']) / 2).shift(self.cloud_shift)
-        
-        # Senkou Span B (선행스팬 B)
-        high_52 = df['high'].rolling(self.senkou_b_period).max()
-        low_52 = df['low'].rolling(self.senkou_b_period).min()
-        df['senkou_span_b'] = ((high_52 + low_52) / 2).shift(self.cloud_shift)
+        # 전환선 / 기준선 / 선행스팬 A, B (선행스팬은 cloud_shift 만큼 앞으로)
+        result = indicators.ichimoku(df['high'], df['low'], self.tenkan_period, self.kijun_period,
+                                     self.senkou_b_period, self.cloud_shift)
+        for column, values in result.items():
+            df[column] = values
         
         # Chikou Span (후행스팬)
         df['chikou_span'] = df['close'].shift(-self.chikou_shift)
@@ -199,13 +184,9 @@ class ZLMACDIchimokuDayTradingStrategy:
         return df
     
     def calculate_atr(self, df: pd.DataFrame, period: int = 14) -> pd.DataFrame:
-        """ATR 계산"""
-        high_low = df['high'] - df['low']
-        high_close = abs(df['high'] - df['close'].shift(1))
-        low_close = abs(df['low'] - df['close'].shift(1))
-        
-        df['tr'] = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-        df['atr'] = df['tr'].rolling(period).mean()
+        """ATR 계산 (실전 전략과 같은 Wilder 평활)"""
+        df['tr'] = indicators.true_range(df['high'], df['low'], df['close'])
+        df['atr'] = indicators.atr(df['high'], df['low'], df['close'], period)
         
         return df
     
@@ -26,6 +26,8 @@ else:
 sys.path.append(os.path.join(script_dir, 'backtest_modules'))
 sys.path.append(script_dir)
 
+from src.core import indicators
+
 # 디버깅 정보 추가
 print(f"Current directory: {os.getcwd()}")
 print(f"Script directory: {script_dir}")
@@ -161,47 +163,23 @@ class ZLMACDIchimokuStrategy:
     
     def calculate_zlema(self, df: pd.DataFrame, period: int) -> pd.Series:
         """Zero Lag EMA 계산"""
-        ema1 = df['close'].ewm(span=period, adjust=False).mean()
-        ema2 = ema1.ewm(span=period, adjust=False).mean()
-        zlema = 2 * ema1 - ema2
-        return zlema
+        return pd.Series(indicators.zlema(df['close'], period), index=df.index)
     
     def calculate_zlmacd(self, df: pd.DataFrame) -> pd.DataFrame:
         """ZL MACD 계산"""
-        # Zero Lag EMA 계산
-        zlema_fast = self.calculate_zlema(df, self.zlmacd_fast)
-        zlema_slow = self.calculate_zlema(df, self.zlmacd_slow)
-        
-        # MACD line
-        df['zlmacd'] = zlema_fast - zlema_slow
-        
-        # Signal line (9-period EMA of MACD)
-        df['zlmacd_signal'] = df['zlmacd'].ewm(span=self.zlmacd_signal, adjust=False).mean()
-        
-        # Histogram
-        df['zlmacd_hist'] = df['zlmacd'] - df['zlmacd_signal']
+        result = indicators.zlmacd(df['close'], self.zlmacd_fast, self.zlmacd_slow, self.zlmacd_signal)
+        for column, values in result.items():
+            df[column] = values
         
         return df
     
     def calculate_ichimoku(self, df: pd.DataFrame) -> pd.DataFrame:
         """Ichimoku Cloud 계산"""
-        # Tenkan-sen (Conversion Line)
-        high_9 = df['high'].rolling(self.tenkan_period).max()
-        low_9 = df['low'].rolling(self.tenkan_period).min()
-        df['tenkan_sen'] = (high_9 + low_9) / 2
-        
-        # Kijun-sen (Base Line)
-        high_26 = df['high'].rolling(self.kijun_period).max()
-        low_26 = df['low'].rolling(self.kijun_period).min()
-        df['kijun_sen'] = (high_26 + low_26) / 2
-        
-        # Senkou Span A (Leading Span A)
-        df['senkou_span_a'] = ((df['tenkan_sen'] + df['kijun_sen']) / 2).shift(self.cloud_shift)
-        
-        # Senkou Span B (Leading Span B)
-        high_52 = df['high'].rolling(self.senkou_b_period).max()
-        low_52 = df['low'].rolling(self.senkou_b_period).min()
-        df['senkou_span_b'] = ((high_52 + low_52) / 2).shift(self.cloud_shift)
+        # 전환선 / 기준선 / 선행스팬 A, B (선행스팬은 cloud_shift 만큼 앞으로)
+        result = indicators.ichimoku(df['high'], df['low'], self.tenkan_period, self.kijun_period,
+                                     self.senkou_b_period, self.cloud_shift)
+        for column, values in result.items():
+            df[column] = values
         
         # Chikou Span (Lagging Span)
         df['chikou_span'] = df['close'].shift(-self.chikou_shift)
@@ -216,32 +194,11 @@ class ZLMACDIchimokuStrategy:
         return df
     
     def calculate_adx(self, df: pd.DataFrame, period: int = 14) -> pd.DataFrame:
-        """ADX (Average Directional Index) 계산"""
-        # True Range 계산
-        high_low = df['high'] - df['low']
-        high_close = abs(df['high'] - df['close'].shift(1))
-        low_close = abs(df['low'] - df['close'].shift(1))
-        
-        df['tr'] = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-        
-        # Directional Movement 계산
-        df['dm_plus'] = np.where(
-            (df['high'] - df['high'].shift(1)) > (df['low'].shift(1) - df['low']),
-            np.maximum(df['high'] - df['high'].shift(1), 0), 0
-        )
-        df['dm_minus'] = np.where(
-            (df['low'].shift(1) - df['low']) > (df['high'] - df['high'].shift(1)),
-            np.maximum(df['low'].shift(1) - df['low'], 0), 0
-        )
-        
-        # Smoothed indicators
-        atr = df['tr'].rolling(period).mean()
-        di_plus = 100 * (df['dm_plus'].rolling(period).mean() / atr)
-        di_minus = 100 * (df['dm_minus'].rolling(period).mean() / atr)
-        
-        # ADX 계산
-        dx = 100 * abs(di_plus - di_minus) / (di_plus + di_minus)
-        df['adx'] = dx.rolling(period).mean()
+        """ADX (Average Directional Index) 계산 - 실전 전략과 같은 Wilder 평활"""
+        result = indicators.adx(df['high'], df['low'], df['close'], period)
+        df['adx'] = result['adx']
+        df['plus_di'] = result['plus_di']
+        df['minus_di'] = result['minus_di']
         
         return df
     
@@ -410,11 +367,7 @@ class ZLMACDIchimokuStrategy:
         df = self.calculate_adx(df, self.adx_period)  # ADX
         
         # ATR 계산 추가
-        high_low = df['high'] - df['low']
-        high_close = abs(df['high'] - df['close'].shift(1))
-        low_close = abs(df['low'] - df['close'].shift(1))
-        tr = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-        df['atr'] = tr.rolling(self.atr_period).mean()
+        df['atr'] = indicators.atr(df['high'], df['low'], df['close'], self.atr_period)
         
         # 초기화
         self.capital = self.initial_capital